@@ -15,55 +15,185 @@ Learnings:
   have many clauses it would affect
 
 TODO:
-    - validate results
     - sprayers - session pool that suports unordered data, but also indexing cause it is MERGE
 """
 import argparse
+import hashlib
+import pickle
+from itertools import chain
 from argparse import RawDescriptionHelpFormatter
 from timeit import default_timer as timer
-from typing import List
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
 
-from generator import CASE_INFO, cypher_file
+from neobolt.exceptions import CypherError
+
+import history
+import planner
+import profiler
+import verify
+from generator import ALONE, CASE_INFO, GROUP_HEADER, cypher_file, open_artifact, pickle_file, records_file
+from merge_buffer import MergeBuffer
+from node import WIDE_CHUNK
+from queries import CATALOG, DIMENSION_CATALOG
+from query_bench import QueryBench
 from trinity import Trinity
 
 
 class Bench:
     
-    def __init__(self, strategy: int, iterations: int, batch_size: int, cases: List[str]):
-        self.trinity = Trinity().clean()
-        self.strategy = f"i{strategy}"
+    def __init__(self, strategy: int, iterations: int, batch_size: int, cases: List[str], commit_size: int=10_000,
+                 resume: bool=False, model: str="flat", buffered: bool=False, batch_bytes: Optional[int]=None,
+                 validate: bool=False):
+        # Resuming means keeping whatever the interrupted run committed
+        self.resume = resume
+        # only --resume runs checkpoint their batches - the extra write per batch would skew every other timing
+        self.checkpointing = resume
+        # the last batch() picked up after a checkpoint - it timed only part of the case
+        self.resumed = False
+        self.trinity = Trinity() if resume else Trinity().clean()
+        # the dimension model has its own artifacts: i4d, i8d
+        self.model = model
+        self.strategy = f"i{strategy}d" if "dims" == model else f"i{strategy}"
         self.iterations = iterations
         self.batch_size = batch_size
+        # with directory groups in the file, pack to about this many characters instead of batch_size statements
+        self.batch_bytes = batch_bytes
+        self.commit_size = commit_size
         self.cases = [f"case_{x}" for x in cases]
         self.stats = ["Case\tNodes\tDuration\tNodes/sec"]
+        self.strategy_num = strategy
+        # buffered runs feed ingest 4's partial json records through a MergeBuffer, flushing batch_size ids at a time
+        self.buffered = buffered
+        # check the last iteration's graph against the case pickle - untimed, but it loads the whole pickle
+        self.validate = validate
+        self.server = self.trinity.server_config()
         
         # TODO: ingest 1 is the only thing we want gulped at the moment
         if 1 == strategy:
             self.ingest_func = self.gulp
+        elif 8 == strategy:
+            self.ingest_func = self.statements
+        elif buffered:
+            self.ingest_func = self.merge_buffered
         else:
             self.ingest_func = self.batch
-        # ingest 6 requires constraints
-        if strategy in (4,6):
+        # ingest 6 requires constraints, ingest 2 and 4 look parents up by id
+        if strategy in (2,4,6,8):
             self.trinity.create_constraints()
         
+    def artifact(self, case: str) -> str:
+        """ The file our ingest_func reads for a case """
+        return records_file(case, self.strategy) if self.buffered else cypher_file(case, self.strategy)
+
+    def batches(self, f) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (index of the batch's last line, statements) for each batch in f
+
+        Files with directory group headers (generator.print_group) are packed a group at a time, older files
+        are cut every batch_size lines.
+        """
+        first = f.readline()
+        lines = chain([first], f)
+        if first.startswith(GROUP_HEADER):
+            yield from self.packed_batches(lines)
+        else:
+            yield from self.line_batches(lines)
+
+    def line_batches(self, lines: Iterator[str]) -> Iterator[Tuple[int, str]]:
+        """ Cut every batch_size lines, wherever that falls """
+        stmts = ""
+        index = 0
+        for index, line in enumerate(lines):
+            stmts += line
+            if index > 0 and index % self.batch_size == 0:
+                yield index, stmts
+                stmts = ""
+        # overflow stmts
+        if stmts.strip():
+            yield index, stmts
+
+    def packed_batches(self, lines: Iterator[str]) -> Iterator[Tuple[int, str]]:
+        """
+        Pack whole directory groups into batches of up to batch_size statements (or batch_bytes characters)
+
+        Groups are packed in file order - depth first - so consecutive small groups are sibling subtrees. A group
+        is never cut: its lines share variables, and a variable only lives for one run(). A group bigger than a
+        batch becomes a batch of its own. Anything that refers to another group - a directory's edge to its
+        parent - looks it up by id, so batch boundaries between groups are always safe.
+
+        Each line of an "alone" group (a supernode's edge chunks) is a batch by itself.
+        """
+        target = self.batch_bytes or self.batch_size
+        stmts = []
+        used = 0
+        last = 0
+        alone = 0  # lines left in the current alone group
+        for index, line in enumerate(lines):
+            if line.startswith(GROUP_HEADER):
+                count, chars, *flags = line[len(GROUP_HEADER):].split()
+                cost = int(chars) if self.batch_bytes else int(count)
+                # close the batch if this group won't fit - the group then starts the next one, however big
+                if stmts and (used + cost > target or ALONE in flags):
+                    yield last, "".join(stmts)
+                    stmts = []
+                    used = 0
+                alone = int(count) if ALONE in flags else 0
+                continue
+            if alone:
+                alone -= 1
+                yield index, line
+                continue
+            stmts.append(line)
+            used += len(line) if self.batch_bytes else 1
+            last = index
+        if stmts:
+            yield last, "".join(stmts)
+
     def batch(self, filename: str) -> float:
         """
         Given a filename, iterate over it, collecting batch_size elements, execute
         each batch and return the time the entire process took.
+
+        Compressed files are decompressed as a stream - a line at a time, never the whole file.
+
+        Batches run in auto-commit transactions. With --resume, each batch instead commits in a transaction that
+        also records a checkpoint (last line index + batch hash) in the graph - so a batch and its checkpoint
+        commit together or not at all. When resuming, batches up to the checkpoint are skipped: a crash costs one
+        batch and nothing in flight is applied twice. USING PERIODIC COMMIT batches (ingest 6) can't run in an
+        explicit transaction - they always auto-commit, without a checkpoint.
         """
-        self.trinity.clean()
+        key = f"{Path(filename).name}_{self.batch_size}" + (f"_{self.batch_bytes}c" if self.batch_bytes else "")
+        committed = None
+        self.resumed = False
+        if self.resume:
+            committed = self.trinity.checkpoint(key)
+            self.resume = False  # only the first run resumes - later iterations start clean
+            if committed:
+                print(f"  resuming {key} after line {committed[0]}")
+        if committed:
+            self.resumed = True
+        else:
+            # edges to a parent in an earlier group look the parent up by id - clean() drops the indexes
+            self.trinity.clean().create_constraints()
         start = timer()
         with self.trinity.session() as session:
-            with open(filename, "r") as f:
-                stmts = ""
-                for index, line in enumerate(f):
-                    stmts += line
-                    if index > 0 and index % self.batch_size == 0:
-                        session.run(stmts)
-                        stmts = ""
-            # run overflow stmts
-            if stmts.strip():
-                session.run(stmts)
+            with open_artifact(filename) as f:
+                for index, stmts in self.batches(f):
+                    batch_hash = hashlib.sha1(stmts.encode()).hexdigest()
+                    if committed and index <= committed[0]:
+                        if index == committed[0] and batch_hash != committed[1]:
+                            raise ValueError(f"{filename} changed since checkpoint at line {index} - cannot resume")
+                        continue
+                    if not self.checkpointing or "PERIODIC COMMIT" in stmts:
+                        session.run(stmts).consume()
+                        continue
+                    with session.begin_transaction() as tx:
+                        tx.run(stmts)
+                        self.trinity.save_checkpoint(tx, key, index, batch_hash)
+        if self.checkpointing:
+            self.trinity.clear_checkpoint(key)
+        self.trinity.wrote()
         return timer() - start
 
     def gulp(self, filename: str) -> float:
@@ -72,19 +202,72 @@ class Bench:
 
         This works as long as there is 0, or 1 semicolon at the end
         """
-        with open(filename, "r") as f:
+        with open_artifact(filename) as f:
             stmts = f.read()
         
         self.trinity.clean()
         start = timer()
         with self.trinity.session() as session:
             session.run(stmts)
+        self.trinity.wrote()
+        return timer() - start
+
+    def statements(self, filename: str) -> float:
+        """
+        Run each ';' terminated statement in a file in its own run() and return the time they took
+
+        Each statement is a USING PERIODIC COMMIT LOAD CSV - it must run in an auto-commit transaction,
+        and its ~COMMIT_SIZE~ placeholder is replaced with our commit_size.
+        """
+        with open_artifact(filename) as f:
+            stmts = f.read().replace("~COMMIT_SIZE~", str(self.commit_size))
+        # supernode edge rows hold WIDE_CHUNK children each - commit about commit_size edges at a time
+        stmts = stmts.replace("~WIDE_COMMIT_SIZE~", str(max(1, self.commit_size // WIDE_CHUNK)))
+        stmts = [x.strip() for x in stmts.split(";")]
+
+        # MATCHing both ends of each edge needs the id indexes - and clean() drops them
+        self.trinity.clean().create_constraints()
+        start = timer()
+        with self.trinity.session() as session:
+            for stmt in [x for x in stmts if x]:
+                session.run(stmt).consume()
+        self.trinity.wrote()
         return timer() - start
 
-    def add_stat(self, case: str, duration: float) -> None:
+    def merge_buffered(self, filename: str) -> float:
+        """ Stream partial json records through a MergeBuffer and return the time it took """
+        # MERGE on id needs the id indexes - and clean() drops them
+        self.trinity.clean().create_constraints()
+        start = timer()
+        with open_artifact(filename) as f:
+            with MergeBuffer(self.trinity, max_records=self.batch_size) as buffer:
+                buffer.ingest(f)
+        print(f"  {buffer.received} records merged into {buffer.written} node writes, {buffer.flushes} flushes, "
+              f"{buffer.dropped} dropped without a tag, {buffer.rejected} rejected for an unknown tag")
+        return timer() - start
+
+    def add_stat(self, case: str, durations: List[float]) -> None:
         nc = CASE_INFO[case]['nodes']
+        duration = sum(durations) / len(durations)
         nps = int(nc / duration)
         self.stats.append(f"{self.strategy}_{case}\t{nc}\t{duration:.4f}\t{nps}")
+        self.save_result(case, durations)
+
+    def save_result(self, case: str, durations: List[float], error: Optional[str]=None) -> None:
+        """ Store the result in the history so the planner can learn from it - failures included """
+        history.save_run({
+            "strategy": self.strategy_num,
+            "case": case,
+            "nodes": CASE_INFO[case]['nodes'],
+            "batch_size": self.batch_size,
+            "batch_bytes": self.batch_bytes,
+            "commit_size": self.commit_size,
+            "model": self.model,
+            "buffered": self.buffered,
+            "failed": error is not None,
+            "error": error,
+            "server": self.server,
+        }, durations)
 
     def report(self):
         print("\n".join(self.stats))
@@ -93,37 +276,67 @@ class Bench:
         # ingest is the only strategy that can be gulped
         for case in self.cases:
             print(f"Intermediate times for {self.strategy} {case}:")
-            fn = cypher_file(case, self.strategy)
-            duration = 0
-            for _ in range(self.iterations):
-                # TODO: sometimes the initial run is MUCH slower - why?, how to avoid that?, should we?
-                temp = self.ingest_func(fn)
-                print(f"  {temp:.3f}")
-                duration += temp
+            fn = self.artifact(case)
+            durations = []
+            try:
+                for _ in range(self.iterations):
+                    # TODO: sometimes the initial run is MUCH slower - why?, how to avoid that?, should we?
+                    with profiler.phase("ingest"):
+                        temp = self.ingest_func(fn)
+                    if self.resumed:
+                        # only the batches after the checkpoint were timed - not a full case duration
+                        print(f"  {temp:.3f} (resumed - partial, not recorded)")
+                        self.resumed = False
+                        continue
+                    print(f"  {temp:.3f}")
+                    durations.append(temp)
+            except CypherError as ce:
+                # e.g. heap exhaustion - record it so the planner knows this strategy fails at this size
+                print(f"  failed: {ce}")
+                self.save_result(case, [], f"{ce}")
+                continue
         
-            self.add_stat(case, duration / self.iterations)
-            # TODO: error in ./bench.py -s2 -i3 -c 5000 2mil
-            #       Unexpected end state: too many node types: 3 - probably a null
-            # self.validate_run(case)
+            if durations:
+                self.add_stat(case, durations)
+            self.index_names(case)
+            if self.validate:
+                self.validate_run(case)
             
+    def query(self, plan_dir: Optional[str]=None) -> None:
+        """ Load each case once with our strategy and time the read query catalog against it """
+        qb = QueryBench(self.trinity, self.iterations, plan_dir=plan_dir)
+        for case in self.cases:
+            print(f"Loading {case} with {self.strategy}, running queries:")
+            with profiler.phase("ingest"):
+                self.ingest_func(self.artifact(case))
+            self.index_names(case)
+            qb.run(case, CATALOG + DIMENSION_CATALOG if "dims" == self.model else CATALOG)
+        self.stats = qb.stats
+
+    def index_names(self, case: str) -> None:
+        """
+        Index the name tokens the last ingest wrote - outside the timings. clean() drops the index.
+        Ingest 2 only writes tokens when generated with -t
+        """
+        if 8 == self.strategy_num or self.buffered or (2 == self.strategy_num and self.has_tokens(case)):
+            with profiler.phase("index"):
+                self.trinity.ensure_name_index()
+
+    def has_tokens(self, case: str) -> bool:
+        """ Whether the case's artifact writes tokens - they are on every node or none, so the first says """
+        with open_artifact(self.artifact(case)) as f:
+            for line in f:
+                if line.startswith("CREATE"):
+                    return "tokens:" in line
+        return False
+
     def validate_run(self, case: str) -> None:
-        labels = {"File": "files", "Directory": "dirs"}
-        
-        # Validate the run
-        with self.trinity.session() as session:
-            result = session.run("match (n) return head(labels(n)) as label, count(*);").values()
-        
-        error = False
-        if len(result) > 2:
-            print(f"Unexpected end state: too many node types: {len(result)}")
-            error = True
-        for item in result:
-            if CASE_INFO[case][labels[item[0]]] != item[1]:
-                print(f"Incorrect number of {item[0]} generated: {item[1]}")
-                error = True
-        if error:
-            print(result)
-        # TODO: check no disconnected nodes
+        """ Compare the graph with the case pickle, directory by directory - see verify.py """
+        with profiler.phase("validate"):
+            with open(pickle_file(case), "rb") as f:
+                root = pickle.load(f)
+            report = verify.verify(self.trinity, root)
+        verify.print_report(report)
 
 
 def help() -> str:
@@ -145,21 +358,92 @@ USE:
       ./bench.py -s2 -i3 -c 5000
       ./bench.py -s4 -i3 -c 5000
       ./bench.py -s6 -i3 -c 5000 -b29
+      ./bench.py -s8 -i3 -c 5000 -p 20000
+
+    Ingest 2 and 4 files mark each directory's statements as a group. Batches are packed with whole groups, up
+    to -b statements or -B characters, so a directory commits with its files:
+      ./bench.py -s2 -i3 -c 5000 -B 400000
+
+    Check that batching loses nothing - no unbound variables, no unlabeled nodes:
+      ./bench.py -s2 -c 5000 -b1000 --validate
+
+    Measure supernodes - case_wide is case_5000 plus one directory of 20,000 files (./generator.py --wide):
+      ./bench.py -s2 -i3 -c wide
+      ./bench.py -s8 -i3 -c wide
+
+    Ingest 8 loads all nodes, then all edges, running each LOAD CSV statement separately. The
+    periodic commit size is set with -p; batch size does not apply.
       
+    Cypher files generated with -z (e.g. ./ingest_2.py -z gz) are found and decompressed automatically.
+
+    A batch ingest started with --resume checkpoints every batch. If it dies partway (heap exhaustion, dropped
+    connection), run it again - same strategy, batch size and case - to pick up after its last committed batch.
+    The resumed run only times part of the case, so it is not recorded:
+      ./bench.py -s2 -b1000 -c 2mil --resume
+
+    Compare graph models - shared Extension/Owner/Group nodes (./ingest_8.py -d) vs flat properties:
+      ./bench.py -s8 -i3 -c 5000
+      ./bench.py -s8 -i3 -c 5000 -m dims
+      ./bench.py -q -s8 -i20 -c 5000 -m dims
+
+    Feed ingest 4's shuffled partial json records (./ingest_4.py -j) through the write-coalescing MergeBuffer,
+    flushing up to -b distinct ids per transaction:
+      ./bench.py -s4 -i3 -c 5000 -b5000 --buffered
+
+    Check the ingested graph against the dataset after each case - missing, extra and changed nodes, orphans:
+      ./bench.py -s2 -c 5000 --validate
+
+    Every bench run adds its results - failures too - to the history store (./results/history.sqlite) with the
+    git commit and environment. Let the planner choose strategy and batch size from them:
+      ./bench.py -s auto -c 5000 2mil
+
+    or check the current commit for throughput regressions (see ./history.py -h):
+      ./bench.py -s2 -i5 -c 5000
+      ./history.py -c <baseline commit>
+
+    Benchmark read queries (queries.CATALOG) instead of ingestion - the strategy only loads the case:
+      ./bench.py -q -s2 -i20 -c 5000
+      ./bench.py -q -s2 -i20 -c 5000 --plans ./plans
+
 NOTES:
 - you cannot run 2mil test case with default tuning
   check dbms.memory.heap.max_size, etc.
 '''
 
 
+def auto(args) -> None:
+    """ Let the planner pick strategy and batch size for each case, then ingest it that way """
+    server = Trinity().server_config()
+    for case in args.cases:
+        if f"case_{case}" not in CASE_INFO:
+            print(f"Case not found: {case}.")
+            exit(1)
+        nodes = CASE_INFO[f"case_{case}"]['nodes']
+        available = []
+        for s in (1, 2, 4, 6, 8):
+            try:
+                cypher_file(f"case_{case}", f"i{s}")
+                available.append(s)
+            except ValueError:
+                pass
+        plan = planner.choose(nodes, server, strategies=tuple(available))
+        if not plan:
+            print(f"auto: no bench results for strategies {available} - run some benchmarks first")
+            exit(1)
+        batch_size = plan.batch_size or args.batch_size
+        print(f"auto: case_{case} ({nodes} nodes) -> strategy {plan.strategy}, batch size {batch_size}, "
+              f"predicted {plan.predicted:.2f}s (fit on {plan.runs} results)")
+        b = Bench(plan.strategy, args.iterations, batch_size, [case], args.commit_size, args.resume,
+                  validate=args.validate)
+        b.timeit()
+        b.report()
+
+
 def main():
-    # TODO: use this to verify case info: match (n) return head(labels(n)) as label, count(*);
-    
     parser = argparse.ArgumentParser(description=help(), formatter_class=RawDescriptionHelpFormatter)
     parser.add_argument('-s', '--strategy',
-                        type=int,
-                        default=1,
-                        help='Ingestion strategy: [1..7]')
+                        default="1",
+                        help='Ingestion strategy: [1..8] or auto')
     parser.add_argument('-i', '--iterations',
                         type=int,
                         default=1,
@@ -168,15 +452,65 @@ def main():
                         type=int,
                         default=1000,
                         help='How many statements to include in each run()')
+    parser.add_argument('-B', '--batch_bytes',
+                        type=int,
+                        help='Pack directory groups into batches of about this many characters instead of -b statements')
+    parser.add_argument('-p', '--commit_size',
+                        type=int,
+                        default=10_000,
+                        help='USING PERIODIC COMMIT size for LOAD CSV strategies')
     parser.add_argument('-c', '--cases',
                         nargs='+',
                         default=[100],
                         help='Which use cases, e.g. 100 1750')
+    parser.add_argument('-m', '--model',
+                        choices=('flat', 'dims'),
+                        default='flat',
+                        help='Graph model: flat properties, or shared Extension/Owner/Group nodes (strategies 4, 8)')
+    parser.add_argument('-r', '--resume',
+                        action='store_true',
+                        default=False,
+                        help='Checkpoint every batch, and resume an interrupted --resume ingest from its last committed batch')
+    parser.add_argument('--buffered',
+                        action='store_true',
+                        default=False,
+                        help='Strategy 4 only: ingest partial json records through a MergeBuffer')
+    parser.add_argument('--validate',
+                        action='store_true',
+                        default=False,
+                        help='After each case, verify the graph against its dataset with per-directory checksums')
+    parser.add_argument('--profile',
+                        action='store_true',
+                        default=False,
+                        help='Profile CPU and memory by phase, writing stats to ./profiles')
+    parser.add_argument('-q', '--queries',
+                        action='store_true',
+                        default=False,
+                        help='Benchmark the read query catalog on each case instead of ingestion')
+    parser.add_argument('--plans',
+                        help='With -q, write PROFILE plans to this directory')
     args = parser.parse_args()
+    if args.profile:
+        profiler.enable("bench")
     
-    if args.strategy not in (1,2,4,6):
+    if "auto" == args.strategy:
+        # the planner only models flat, unbuffered, statement-count batches - it can't plan the others
+        if "dims" == args.model or args.buffered or args.batch_bytes is not None:
+            print("auto plans flat, unbuffered ingests with statement batches - drop --model, --buffered and -B")
+            exit(1)
+        auto(args)
+        profiler.report()
+        exit(0)
+    args.strategy = int(args.strategy) if args.strategy.isdigit() else 0
+    if args.strategy not in (1,2,4,6,8):
         print(f"Strategy not available: {args.strategy}")
         exit(1)
+    if "dims" == args.model and args.strategy not in (4,8):
+        print("The dims model is only generated by strategies 4 and 8")
+        exit(1)
+    if args.buffered and (args.strategy != 4 or "dims" == args.model):
+        print("Only flat strategy 4 has partial json records")
+        exit(1)
     if args.batch_size < 25 or args.batch_size > 10_000:
         print(f"Batch size inappropriate: {args.batch_size}")
         exit(1)
@@ -186,17 +520,31 @@ def main():
             print(f"Valid cases are {', '.join(CASE_INFO)}")
             exit(1)
         try:
-            cypher_file(f"case_{case}", f"i{args.strategy}")
+            if args.buffered:
+                records_file(f"case_{case}", "i4")
+            else:
+                cypher_file(f"case_{case}", f"i{args.strategy}d" if "dims" == args.model else f"i{args.strategy}")
         except Exception as e:
             print(f"Case {case} not available: {e}")
             exit(1)
+    if args.batch_bytes is not None and args.batch_bytes < 1000:
+        print(f"Batch bytes inappropriate: {args.batch_bytes}")
+        exit(1)
+    if args.commit_size < 100:
+        print(f"Commit size inappropriate: {args.commit_size}")
+        exit(1)
     if args.iterations < 1:
         print(f"Invalid iterations: {args.iterations}")
         exit(1)
 
-    b = Bench(args.strategy, args.iterations, args.batch_size, args.cases)
-    b.timeit()
+    b = Bench(args.strategy, args.iterations, args.batch_size, args.cases, args.commit_size, args.resume, args.model,
+              args.buffered, args.batch_bytes, args.validate)
+    if args.queries:
+        b.query(args.plans)
+    else:
+        b.timeit()
     b.report()
+    profiler.report()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Classify files as PII by their content instead of their names
+
+example.class_pii classifies by filename regex, which misses nearly all real PII. This reads file content:
+- files are memory mapped - whole, or just the head with --head - and scanned by a process pool
+- one precompiled regex with a named group per PII type scans each file in a single pass
+- card number candidates must also pass the Luhn check
+- empty, huge (--max-size) and binary (NUL byte in the first block) files are skipped
+
+Matches are written as IS_CLASSIFIED edges to the existing PII hierarchy (queries.PII_EDGES) in UNWIND batches.
+With --names, the filename rules (queries.PII_NAME_RULES) are applied too - through Trinity.classify_names(),
+which uses the name index when it can.
+
+NOTES:
+- pickled cases hold the paths of the machine they were scanned on - use -r to scan local files
+- the patterns are US centric and tuned for recall - expect some false positives on phone numbers
+"""
+import argparse
+import mmap
+import pickle
+import re
+from argparse import RawDescriptionHelpFormatter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Iterator, List, Optional, Tuple
+
+from generator import collect_data, pickle_file
+from node import TreeNode
+from queries import PII_HIERARCHY, PII_NAME_RULES
+from trinity import Trinity
+
+SNIFF_BYTES = 8192
+
+# classification id -> pattern. Group names must be classification ids in the PII hierarchy
+PII_PATTERNS = {
+    "ssn": rb"\b(?!000|666|9\d\d)\d{3}-(?!00)\d{2}-(?!0000)\d{4}\b",
+    "credit_card": rb"\b\d(?:[ -]?\d){12,18}\b",
+    "phone": rb"(?:\+?1[ .-]?)?(?:\(\d{3}\)|\b\d{3})[ .-]?\d{3}[ .-]\d{4}\b",
+    "address": rb"\b\d{1,6}\s+(?:[A-Z][a-z]+\s+){1,4}"
+               rb"(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Way|Place|Pl)\b",
+    "passport": rb"(?i:passport(?:\s*(?:no|number|#))?[:.]?)\s*[A-Z0-9]{6,9}\b",
+}
+PII_REGEX = re.compile(b"|".join(b"(?P<%s>%s)" % (k.encode(), v) for k, v in PII_PATTERNS.items()))
+
+WRITE_EDGES = """
+    UNWIND $rows AS row
+    MATCH (f:File {id: row[0]})
+    MATCH (c:Classification {id: row[1]})
+    MERGE (f) - [:IS_CLASSIFIED] -> (c)"""
+
+
+def luhn(digits: bytes) -> bool:
+    """ The card number checksum - weeds out most digit runs that are not card numbers """
+    total = 0
+    for i, c in enumerate(reversed(digits)):
+        d = c - 48  # ord('0')
+        if i % 2:
+            d = d * 2 - 9 if d > 4 else d * 2
+        total += d
+    return total % 10 == 0
+
+
+def classify(data) -> List[str]:
+    """ The classification ids whose patterns match somewhere in data (bytes or mmap) """
+    found = set()
+    for m in PII_REGEX.finditer(data):
+        kind = m.lastgroup
+        if kind in found:
+            continue
+        if "credit_card" == kind and not luhn(re.sub(rb"[ -]", b"", m.group())):
+            continue
+        found.add(kind)
+        if len(found) == len(PII_PATTERNS):
+            break
+    return sorted(found)
+
+
+def scan_file(item: Tuple[int, str], max_size: int, head: Optional[int]) -> Tuple[int, List[str]]:
+    """
+    Classify one file - runs in a pool worker
+    :param item: (node id, path)
+    :param max_size: skip files larger than this, unless only scanning the head
+    :param head: scan only the first head bytes
+    :return: (node id, classification ids)
+    """
+    node_id, path = item
+    try:
+        with open(path, "rb") as f:
+            size = Path(path).stat().st_size
+            if 0 == size or (size > max_size and not head):
+                return node_id, []
+            length = min(size, head) if head else size
+            with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ) as data:
+                if b"\0" in data[:SNIFF_BYTES]:
+                    return node_id, []  # binary
+                return node_id, classify(data)
+    except (OSError, ValueError):
+        # vanished, unreadable, or special files
+        return node_id, []
+
+
+def files(root: TreeNode) -> Iterator[Tuple[int, str]]:
+    for item in root.iter():
+        if not item.is_dir():
+            yield item.id, str(item.path)
+
+
+def scan(root: TreeNode, workers: Optional[int]=None, max_size: int=16 * 2**20,
+         head: Optional[int]=None) -> Iterator[Tuple[int, str]]:
+    """ Yield (file id, classification id) for every PII match under root """
+    func = partial(scan_file, max_size=max_size, head=head)
+    with ProcessPoolExecutor(workers) as pool:
+        for node_id, kinds in pool.map(func, files(root), chunksize=256):
+            for kind in kinds:
+                yield node_id, kind
+
+
+def write(trinity: Trinity, matches: Iterator[Tuple[int, str]], batch_size: int=5000, names: bool=False) -> int:
+    """
+    Write IS_CLASSIFIED edges in UNWIND batches, return how many - only to files in trinity's partition
+    :param names: also classify by the filename rules
+    """
+    edges = trinity.scope(WRITE_EDGES)
+    with trinity.session() as session:
+        session.run(trinity.scope(PII_HIERARCHY.cypher), PII_HIERARCHY.params).consume()
+        count = 0
+        rows = []
+        for row in matches:
+            rows.append(list(row))
+            if len(rows) == batch_size:
+                session.run(edges, {"rows": rows}).consume()
+                count += len(rows)
+                rows = []
+        if rows:
+            session.run(edges, {"rows": rows}).consume()
+            count += len(rows)
+    trinity.wrote()
+    if names:
+        trinity.classify_names(PII_NAME_RULES)
+    return count
+
+
+def help() -> str:
+    return """Classify files as PII by content
+
+Scan a local tree (nodes must already be ingested - ids are inodes):
+  ./classifier.py -r ~/shares/finance
+
+Scan a root ingested as partition home (./generator.py -r ~ -p home) - files of other roots are left alone:
+  ./classifier.py -r ~ -p home
+
+Scan the files of a pickled case, only the first 64KiB of each, print counts without writing:
+  ./classifier.py -c case_5000 --head 65536 --dry-run
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=help(), formatter_class=RawDescriptionHelpFormatter)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('-c', '--case', help='scan the files of a pickled case')
+    group.add_argument('-r', '--root', help='scan the files under this directory')
+    parser.add_argument('-w', '--workers', type=int, help='scanner processes, default one per cpu')
+    parser.add_argument('--max-size', type=int, default=16 * 2**20, help='skip larger files (bytes)')
+    parser.add_argument('--head', type=int, help='only scan the first HEAD bytes of each file')
+    parser.add_argument('-b', '--batch_size', type=int, default=5000, help='edges per write')
+    parser.add_argument('-p', '--partition', help='classify only files of this partition')
+    parser.add_argument('--names', action='store_true', default=False,
+                        help='also classify by the filename rules, through the name index')
+    parser.add_argument('--dry-run', action='store_true', default=False, help='count matches, write nothing')
+    args = parser.parse_args()
+
+    if args.case:
+        with open(pickle_file(args.case), "rb") as f:
+            root = pickle.load(f)
+    else:
+        root = collect_data(Path(args.root))
+
+    start = timer()
+    matches = scan(root, args.workers, args.max_size, args.head)
+    if args.dry_run:
+        counts = {}
+        for _, kind in matches:
+            counts[kind] = counts.get(kind, 0) + 1
+        print(counts)
+    else:
+        written = write(Trinity(partition=args.partition), matches, args.batch_size, args.names)
+        print(f"wrote {written} IS_CLASSIFIED edges")
+    print(f"classified in {timer() - start:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+// group 31 5957
 CREATE (n9768633:Directory {id: 9768633, tag: "Directory", name: "cpython", parent_id: "None", stem: "cpython", extension: "", path: "/Users/starver/code/public/cpython", size: 1120, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9770924:File {id: 9770924, tag: "File", name: "CODE_OF_CONDUCT.md", parent_id: 9768633, stem: "CODE_OF_CONDUCT", extension: "md", path: "/Users/starver/code/public/cpython/CODE_OF_CONDUCT.md", size: 609, owner: 501, group: 20, created: 1545241636, accessed: 1545267129, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775969:File {id: 9775969, tag: "File", name: "install-sh", parent_id: 9768633, stem: "install-sh", extension: "", path: "/Users/starver/code/public/cpython/install-sh", size: 15368, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
@@ -29,10 +30,14 @@ CREATE (n9768633) - [:PARENT_OF] -> (n9770915)
 CREATE (n9768633) - [:PARENT_OF] -> (n9775623)
 CREATE (n9768633) - [:PARENT_OF] -> (n9770923)
 CREATE (n9768633) - [:PARENT_OF] -> (n9775964)
+// group 3 399
 CREATE (n9775304:Directory {id: 9775304, tag: "Directory", name: "PC", parent_id: 9768633, stem: "PC", extension: "", path: "/Users/starver/code/public/cpython/PC", size: 1440, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9775304)
+MERGE (p9775304:Directory {id: 9768633})
+CREATE (p9775304) - [:PARENT_OF] -> (n9775304)
+// group 45 8449
 CREATE (n9773911:Directory {id: 9773911, tag: "Directory", name: "Misc", parent_id: 9768633, stem: "Misc", extension: "", path: "/Users/starver/code/public/cpython/Misc", size: 768, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9773911)
+MERGE (p9773911:Directory {id: 9768633})
+CREATE (p9773911) - [:PARENT_OF] -> (n9773911)
 CREATE (n9774791:File {id: 9774791, tag: "File", name: "svnmap.txt", parent_id: 9773911, stem: "svnmap", extension: "txt", path: "/Users/starver/code/public/cpython/Misc/svnmap.txt", size: 4289021, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773912:File {id: 9773912, tag: "File", name: "ACKS", parent_id: 9773911, stem: "ACKS", extension: "", path: "/Users/starver/code/public/cpython/Misc/ACKS", size: 27121, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774779:File {id: 9774779, tag: "File", name: "README.valgrind", parent_id: 9773911, stem: "README", extension: "valgrind", path: "/Users/starver/code/public/cpython/Misc/README.valgrind", size: 4901, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -75,8 +80,10 @@ CREATE (n9773911) - [:PARENT_OF] -> (n9773913)
 CREATE (n9773911) - [:PARENT_OF] -> (n9774792)
 CREATE (n9773911) - [:PARENT_OF] -> (n9774790)
 CREATE (n9773911) - [:PARENT_OF] -> (n9774775)
+// group 119 22788
 CREATE (n9773914:Directory {id: 9773914, tag: "Directory", name: "NEWS.d", parent_id: 9773911, stem: "NEWS", extension: "d", path: "/Users/starver/code/public/cpython/Misc/NEWS.d", size: 1952, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773911) - [:PARENT_OF] -> (n9773914)
+MERGE (p9773914:Directory {id: 9773911})
+CREATE (p9773914) - [:PARENT_OF] -> (n9773914)
 CREATE (n9773919:File {id: 9773919, tag: "File", name: "3.5.0a4.rst", parent_id: 9773914, stem: "3.5.0a4", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/3.5.0a4.rst", size: 12355, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773957:File {id: 9773957, tag: "File", name: "3.6.4rc1.rst", parent_id: 9773914, stem: "3.6.4rc1", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/3.6.4rc1.rst", size: 24398, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773918:File {id: 9773918, tag: "File", name: "3.5.0a3.rst", parent_id: 9773914, stem: "3.5.0a3", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/3.5.0a3.rst", size: 9743, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -193,10 +200,14 @@ CREATE (n9773914) - [:PARENT_OF] -> (n9773927)
 CREATE (n9773914) - [:PARENT_OF] -> (n9773956)
 CREATE (n9773914) - [:PARENT_OF] -> (n9773958)
 CREATE (n9773914) - [:PARENT_OF] -> (n9773923)
+// group 3 416
 CREATE (n9773973:Directory {id: 9773973, tag: "Directory", name: "next", parent_id: 9773914, stem: "next", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next", size: 416, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773914) - [:PARENT_OF] -> (n9773973)
+MERGE (p9773973:Directory {id: 9773914})
+CREATE (p9773973) - [:PARENT_OF] -> (n9773973)
+// group 95 22488
 CREATE (n9774228:Directory {id: 9774228, tag: "Directory", name: "IDLE", parent_id: 9773973, stem: "IDLE", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/IDLE", size: 1536, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774228)
+MERGE (p9774228:Directory {id: 9773973})
+CREATE (p9774228) - [:PARENT_OF] -> (n9774228)
 CREATE (n9774249:File {id: 9774249, tag: "File", name: "2018-06-14-13-23-55.bpo-33839.ZlJzHa.rst", parent_id: 9774228, stem: "2018-06-14-13-23-55.bpo-33839.ZlJzHa", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/IDLE/2018-06-14-13-23-55.bpo-33839.ZlJzHa.rst", size: 67, owner: 501, group: 20, created: 1545241637, accessed: 1545267148, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774271:File {id: 9774271, tag: "File", name: "2018-11-10-21-27-25.bpo-34864.Ci-G2q.rst", parent_id: 9774228, stem: "2018-11-10-21-27-25.bpo-34864.Ci-G2q", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/IDLE/2018-11-10-21-27-25.bpo-34864.Ci-G2q.rst", size: 189, owner: 501, group: 20, created: 1545241637, accessed: 1545267148, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774259:File {id: 9774259, tag: "File", name: "2018-08-02-22-16-42.bpo-34275.Iu0d7t.rst", parent_id: 9774228, stem: "2018-08-02-22-16-42.bpo-34275.Iu0d7t", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/IDLE/2018-08-02-22-16-42.bpo-34275.Iu0d7t.rst", size: 118, owner: 501, group: 20, created: 1545241637, accessed: 1545267148, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -289,8 +300,10 @@ CREATE (n9774228) - [:PARENT_OF] -> (n9774265)
 CREATE (n9774228) - [:PARENT_OF] -> (n9774232)
 CREATE (n9774228) - [:PARENT_OF] -> (n9774231)
 CREATE (n9774228) - [:PARENT_OF] -> (n9774234)
+// group 287 70609
 CREATE (n9774029:Directory {id: 9774029, tag: "Directory", name: "Core and Builtins", parent_id: 9773973, stem: "Core and Builtins", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Core and Builtins", size: 4608, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774029)
+MERGE (p9774029:Directory {id: 9773973})
+CREATE (p9774029) - [:PARENT_OF] -> (n9774029)
 CREATE (n9774039:File {id: 9774039, tag: "File", name: "2018-01-03-23-12-43.bpo-32489.SDEPHB.rst", parent_id: 9774029, stem: "2018-01-03-23-12-43.bpo-32489.SDEPHB", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Core and Builtins/2018-01-03-23-12-43.bpo-32489.SDEPHB.rst", size: 81, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774103:File {id: 9774103, tag: "File", name: "2018-07-14-08-58-46.bpo-34068.9xfM55.rst", parent_id: 9774029, stem: "2018-07-14-08-58-46.bpo-34068.9xfM55", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Core and Builtins/2018-07-14-08-58-46.bpo-34068.9xfM55.rst", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545267148, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774129:File {id: 9774129, tag: "File", name: "2018-09-05-22-56-52.bpo-34588.UIuPmL.rst", parent_id: 9774029, stem: "2018-09-05-22-56-52.bpo-34588.UIuPmL", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Core and Builtins/2018-09-05-22-56-52.bpo-34588.UIuPmL.rst", size: 81, owner: 501, group: 20, created: 1545241637, accessed: 1545267148, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -575,8 +588,10 @@ CREATE (n9774029) - [:PARENT_OF] -> (n9774067)
 CREATE (n9774029) - [:PARENT_OF] -> (n9774083)
 CREATE (n9774029) - [:PARENT_OF] -> (n9774148)
 CREATE (n9774029) - [:PARENT_OF] -> (n9774045)
+// group 113 27322
 CREATE (n9774172:Directory {id: 9774172, tag: "Directory", name: "Documentation", parent_id: 9773973, stem: "Documentation", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Documentation", size: 1824, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774172)
+MERGE (p9774172:Directory {id: 9773973})
+CREATE (p9774172) - [:PARENT_OF] -> (n9774172)
 CREATE (n9774186:File {id: 9774186, tag: "File", name: "2018-02-14-11-10-41.bpo-32436.TTJ2jb.rst", parent_id: 9774172, stem: "2018-02-14-11-10-41.bpo-32436.TTJ2jb", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Documentation/2018-02-14-11-10-41.bpo-32436.TTJ2jb.rst", size: 56, owner: 501, group: 20, created: 1545241637, accessed: 1545267148, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774201:File {id: 9774201, tag: "File", name: "2018-05-21-14-36-12.bpo-33594.-HRcyX.rst", parent_id: 9774172, stem: "2018-05-21-14-36-12.bpo-33594.-HRcyX", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Documentation/2018-05-21-14-36-12.bpo-33594.-HRcyX.rst", size: 178, owner: 501, group: 20, created: 1545241637, accessed: 1545267148, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774224:File {id: 9774224, tag: "File", name: "2018-10-28-16-51-31.bpo-35089._stCpS.rst", parent_id: 9774172, stem: "2018-10-28-16-51-31.bpo-35089._stCpS", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Documentation/2018-10-28-16-51-31.bpo-35089._stCpS.rst", size: 108, owner: 501, group: 20, created: 1545241637, accessed: 1545267148, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -687,8 +702,10 @@ CREATE (n9774172) - [:PARENT_OF] -> (n9774203)
 CREATE (n9774172) - [:PARENT_OF] -> (n9774212)
 CREATE (n9774172) - [:PARENT_OF] -> (n9774210)
 CREATE (n9774172) - [:PARENT_OF] -> (n9774214)
+// group 27 6122
 CREATE (n9774762:Directory {id: 9774762, tag: "Directory", name: "macOS", parent_id: 9773973, stem: "macOS", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/macOS", size: 448, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774762)
+MERGE (p9774762:Directory {id: 9773973})
+CREATE (p9774762) - [:PARENT_OF] -> (n9774762)
 CREATE (n9774768:File {id: 9774768, tag: "File", name: "2018-07-31-09-51-01.bpo-33635.KiscE-.rst", parent_id: 9774762, stem: "2018-07-31-09-51-01.bpo-33635.KiscE-", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/macOS/2018-07-31-09-51-01.bpo-33635.KiscE-.rst", size: 331, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774765:File {id: 9774765, tag: "File", name: "2018-03-29-06-56-12.bpo-32726.urS9uX.rst", parent_id: 9774762, stem: "2018-03-29-06-56-12.bpo-32726.urS9uX", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/macOS/2018-03-29-06-56-12.bpo-32726.urS9uX.rst", size: 317, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774770:File {id: 9774770, tag: "File", name: "2018-10-17-14-36-08.bpo-24658.Naddgx.rst", parent_id: 9774762, stem: "2018-10-17-14-36-08.bpo-24658.Naddgx", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/macOS/2018-10-17-14-36-08.bpo-24658.Naddgx.rst", size: 81, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -713,8 +730,10 @@ CREATE (n9774762) - [:PARENT_OF] -> (n9774766)
 CREATE (n9774762) - [:PARENT_OF] -> (n9774772)
 CREATE (n9774762) - [:PARENT_OF] -> (n9774774)
 CREATE (n9774762) - [:PARENT_OF] -> (n9774769)
+// group 27 6171
 CREATE (n9774665:Directory {id: 9774665, tag: "Directory", name: "Security", parent_id: 9773973, stem: "Security", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Security", size: 448, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774665)
+MERGE (p9774665:Directory {id: 9773973})
+CREATE (p9774665) - [:PARENT_OF] -> (n9774665)
 CREATE (n9774674:File {id: 9774674, tag: "File", name: "2018-09-11-18-30-55.bpo-17239.kOpwK2.rst", parent_id: 9774665, stem: "2018-09-11-18-30-55.bpo-17239.kOpwK2", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Security/2018-09-11-18-30-55.bpo-17239.kOpwK2.rst", size: 179, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774675:File {id: 9774675, tag: "File", name: "2018-09-24-18-49-25.bpo-34791.78GmIG.rst", parent_id: 9774665, stem: "2018-09-24-18-49-25.bpo-34791.78GmIG", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Security/2018-09-24-18-49-25.bpo-34791.78GmIG.rst", size: 166, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774667:File {id: 9774667, tag: "File", name: "2018-03-02-10-24-52.bpo-32981.O_qDyj.rst", parent_id: 9774665, stem: "2018-03-02-10-24-52.bpo-32981.O_qDyj", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Security/2018-03-02-10-24-52.bpo-32981.O_qDyj.rst", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -739,8 +758,10 @@ CREATE (n9774665) - [:PARENT_OF] -> (n9774672)
 CREATE (n9774665) - [:PARENT_OF] -> (n9774668)
 CREATE (n9774665) - [:PARENT_OF] -> (n9774669)
 CREATE (n9774665) - [:PARENT_OF] -> (n9774677)
+// group 83 19619
 CREATE (n9774678:Directory {id: 9774678, tag: "Directory", name: "Tests", parent_id: 9773973, stem: "Tests", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Tests", size: 1344, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774678)
+MERGE (p9774678:Directory {id: 9773973})
+CREATE (p9774678) - [:PARENT_OF] -> (n9774678)
 CREATE (n9774689:File {id: 9774689, tag: "File", name: "2018-06-19-14-04-21.bpo-33901.OFW1Sr.rst", parent_id: 9774678, stem: "2018-06-19-14-04-21.bpo-33901.OFW1Sr", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Tests/2018-06-19-14-04-21.bpo-33901.OFW1Sr.rst", size: 102, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774707:File {id: 9774707, tag: "File", name: "2018-11-04-20-17-09.bpo-21263.T3qo9r.rst", parent_id: 9774678, stem: "2018-11-04-20-17-09.bpo-21263.T3qo9r", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Tests/2018-11-04-20-17-09.bpo-21263.T3qo9r.rst", size: 227, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774682:File {id: 9774682, tag: "File", name: "2018-03-09-07-05-12.bpo-32517.ugc1iW.rst", parent_id: 9774678, stem: "2018-03-09-07-05-12.bpo-32517.ugc1iW", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Tests/2018-03-09-07-05-12.bpo-32517.ugc1iW.rst", size: 113, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -821,8 +842,10 @@ CREATE (n9774678) - [:PARENT_OF] -> (n9774690)
 CREATE (n9774678) - [:PARENT_OF] -> (n9774693)
 CREATE (n9774678) - [:PARENT_OF] -> (n9774714)
 CREATE (n9774678) - [:PARENT_OF] -> (n9774705)
+// group 41 9504
 CREATE (n9774009:Directory {id: 9774009, tag: "Directory", name: "C API", parent_id: 9773973, stem: "C API", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/C API", size: 672, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774009)
+MERGE (p9774009:Directory {id: 9773973})
+CREATE (p9774009) - [:PARENT_OF] -> (n9774009)
 CREATE (n9774012:File {id: 9774012, tag: "File", name: "2018-03-20-21-43-09.bpo-33042.FPFp64.rst", parent_id: 9774009, stem: "2018-03-20-21-43-09.bpo-33042.FPFp64", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/C API/2018-03-20-21-43-09.bpo-33042.FPFp64.rst", size: 140, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774017:File {id: 9774017, tag: "File", name: "2018-07-09-11-39-54.bpo-23927.pDFkxb.rst", parent_id: 9774009, stem: "2018-07-09-11-39-54.bpo-23927.pDFkxb", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/C API/2018-07-09-11-39-54.bpo-23927.pDFkxb.rst", size: 126, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774011:File {id: 9774011, tag: "File", name: "2018-01-09-17-03-54.bpo-32374.SwwLoz.rst", parent_id: 9774009, stem: "2018-01-09-17-03-54.bpo-32374.SwwLoz", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/C API/2018-01-09-17-03-54.bpo-32374.SwwLoz.rst", size: 117, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -861,8 +884,10 @@ CREATE (n9774009) - [:PARENT_OF] -> (n9774025)
 CREATE (n9774009) - [:PARENT_OF] -> (n9774028)
 CREATE (n9774009) - [:PARENT_OF] -> (n9774021)
 CREATE (n9774009) - [:PARENT_OF] -> (n9774019)
+// group 781 188792
 CREATE (n9774275:Directory {id: 9774275, tag: "Directory", name: "Library", parent_id: 9773973, stem: "Library", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Library", size: 12512, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774275)
+MERGE (p9774275:Directory {id: 9773973})
+CREATE (p9774275) - [:PARENT_OF] -> (n9774275)
 CREATE (n9774488:File {id: 9774488, tag: "File", name: "2018-07-04-07-36-53.bpo-34010.VNDkde.rst", parent_id: 9774275, stem: "2018-07-04-07-36-53.bpo-34010.VNDkde", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Library/2018-07-04-07-36-53.bpo-34010.VNDkde.rst", size: 142, owner: 501, group: 20, created: 1545241637, accessed: 1545267149, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774610:File {id: 9774610, tag: "File", name: "2018-10-17-11-54-04.bpo-35008.dotef_.rst", parent_id: 9774275, stem: "2018-10-17-11-54-04.bpo-35008.dotef_", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Library/2018-10-17-11-54-04.bpo-35008.dotef_.rst", size: 162, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774312:File {id: 9774312, tag: "File", name: "2018-02-11-15-54-41.bpo-32819.ZTRX2Q.rst", parent_id: 9774275, stem: "2018-02-11-15-54-41.bpo-32819.ZTRX2Q", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Library/2018-02-11-15-54-41.bpo-32819.ZTRX2Q.rst", size: 178, owner: 501, group: 20, created: 1545241637, accessed: 1545267149, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1641,8 +1666,10 @@ CREATE (n9774275) - [:PARENT_OF] -> (n9774662)
 CREATE (n9774275) - [:PARENT_OF] -> (n9774602)
 CREATE (n9774275) - [:PARENT_OF] -> (n9774510)
 CREATE (n9774275) - [:PARENT_OF] -> (n9774640)
+// group 27 6215
 CREATE (n9774719:Directory {id: 9774719, tag: "Directory", name: "Tools-Demos", parent_id: 9773973, stem: "Tools-Demos", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Tools-Demos", size: 448, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774719)
+MERGE (p9774719:Directory {id: 9773973})
+CREATE (p9774719) - [:PARENT_OF] -> (n9774719)
 CREATE (n9774724:File {id: 9774724, tag: "File", name: "2018-03-16-17-25-05.bpo-29673.m8QtaW.rst", parent_id: 9774719, stem: "2018-03-16-17-25-05.bpo-29673.m8QtaW", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Tools-Demos/2018-03-16-17-25-05.bpo-29673.m8QtaW.rst", size: 41, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774721:File {id: 9774721, tag: "File", name: "2017-12-07-20-51-20.bpo-32222.hPBcGT.rst", parent_id: 9774719, stem: "2017-12-07-20-51-20.bpo-32222.hPBcGT", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Tools-Demos/2017-12-07-20-51-20.bpo-32222.hPBcGT.rst", size: 110, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774725:File {id: 9774725, tag: "File", name: "2018-03-26-18-54-24.bpo-31920.u_WKsT.rst", parent_id: 9774719, stem: "2018-03-26-18-54-24.bpo-31920.u_WKsT", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Tools-Demos/2018-03-26-18-54-24.bpo-31920.u_WKsT.rst", size: 103, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1667,8 +1694,10 @@ CREATE (n9774719) - [:PARENT_OF] -> (n9774722)
 CREATE (n9774719) - [:PARENT_OF] -> (n9774731)
 CREATE (n9774719) - [:PARENT_OF] -> (n9774728)
 CREATE (n9774719) - [:PARENT_OF] -> (n9774729)
+// group 71 16737
 CREATE (n9773974:Directory {id: 9773974, tag: "Directory", name: "Build", parent_id: 9773973, stem: "Build", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Build", size: 1152, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9773974)
+MERGE (p9773974:Directory {id: 9773973})
+CREATE (p9773974) - [:PARENT_OF] -> (n9773974)
 CREATE (n9773998:File {id: 9773998, tag: "File", name: "2018-09-17-13-56-12.bpo-34710.ARqIAK.rst", parent_id: 9773974, stem: "2018-09-17-13-56-12.bpo-34710.ARqIAK", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Build/2018-09-17-13-56-12.bpo-34710.ARqIAK.rst", size: 55, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773979:File {id: 9773979, tag: "File", name: "2018-03-30-14-55-48.bpo-33182.CePczb.rst", parent_id: 9773974, stem: "2018-03-30-14-55-48.bpo-33182.CePczb", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Build/2018-03-30-14-55-48.bpo-33182.CePczb.rst", size: 59, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773999:File {id: 9773999, tag: "File", name: "2018-09-18-16-28-31.bpo-34585.CGMu0h.rst", parent_id: 9773974, stem: "2018-09-18-16-28-31.bpo-34585.CGMu0h", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Build/2018-09-18-16-28-31.bpo-34585.CGMu0h.rst", size: 155, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1737,8 +1766,10 @@ CREATE (n9773974) - [:PARENT_OF] -> (n9773977)
 CREATE (n9773974) - [:PARENT_OF] -> (n9773988)
 CREATE (n9773974) - [:PARENT_OF] -> (n9774006)
 CREATE (n9773974) - [:PARENT_OF] -> (n9774003)
+// group 61 14383
 CREATE (n9774732:Directory {id: 9774732, tag: "Directory", name: "Windows", parent_id: 9773973, stem: "Windows", extension: "", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Windows", size: 992, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773973) - [:PARENT_OF] -> (n9774732)
+MERGE (p9774732:Directory {id: 9773973})
+CREATE (p9774732) - [:PARENT_OF] -> (n9774732)
 CREATE (n9774751:File {id: 9774751, tag: "File", name: "2018-09-03-01-23-52.bpo-34532.N1HEbE.rst", parent_id: 9774732, stem: "2018-09-03-01-23-52.bpo-34532.N1HEbE", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Windows/2018-09-03-01-23-52.bpo-34532.N1HEbE.rst", size: 54, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774760:File {id: 9774760, tag: "File", name: "2018-12-13-13-30-04.bpo-35402.n_mXb2.rst", parent_id: 9774732, stem: "2018-12-13-13-30-04.bpo-35402.n_mXb2", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Windows/2018-12-13-13-30-04.bpo-35402.n_mXb2.rst", size: 45, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774747:File {id: 9774747, tag: "File", name: "2018-07-02-14-19-32.bpo-34006.7SgBT_.rst", parent_id: 9774732, stem: "2018-07-02-14-19-32.bpo-34006.7SgBT_", extension: "rst", path: "/Users/starver/code/public/cpython/Misc/NEWS.d/next/Windows/2018-07-02-14-19-32.bpo-34006.7SgBT_.rst", size: 207, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1797,16 +1828,22 @@ CREATE (n9774732) - [:PARENT_OF] -> (n9774735)
 CREATE (n9774732) - [:PARENT_OF] -> (n9774752)
 CREATE (n9774732) - [:PARENT_OF] -> (n9774740)
 CREATE (n9774732) - [:PARENT_OF] -> (n9774753)
+// group 5 783
 CREATE (n9771506:Directory {id: 9771506, tag: "Directory", name: "Grammar", parent_id: 9768633, stem: "Grammar", extension: "", path: "/Users/starver/code/public/cpython/Grammar", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9771506)
+MERGE (p9771506:Directory {id: 9768633})
+CREATE (p9771506) - [:PARENT_OF] -> (n9771506)
 CREATE (n9771507:File {id: 9771507, tag: "File", name: "Grammar", parent_id: 9771506, stem: "Grammar", extension: "", path: "/Users/starver/code/public/cpython/Grammar/Grammar", size: 6520, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771506) - [:PARENT_OF] -> (n9771507)
+// group 5 773
 CREATE (n9775624:Directory {id: 9775624, tag: "Directory", name: "Tools", parent_id: 9768633, stem: "Tools", extension: "", path: "/Users/starver/code/public/cpython/Tools", size: 768, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9775624)
+MERGE (p9775624:Directory {id: 9768633})
+CREATE (p9775624) - [:PARENT_OF] -> (n9775624)
 CREATE (n9775625:File {id: 9775625, tag: "File", name: "README", parent_id: 9775624, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Tools/README", size: 1831, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775624) - [:PARENT_OF] -> (n9775625)
+// group 31 5696
 CREATE (n9775640:Directory {id: 9775640, tag: "Directory", name: "demo", parent_id: 9775624, stem: "demo", extension: "", path: "/Users/starver/code/public/cpython/Tools/demo", size: 512, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775640)
+MERGE (p9775640:Directory {id: 9775624})
+CREATE (p9775640) - [:PARENT_OF] -> (n9775640)
 CREATE (n9775642:File {id: 9775642, tag: "File", name: "beer.py", parent_id: 9775640, stem: "beer", extension: "py", path: "/Users/starver/code/public/cpython/Tools/demo/beer.py", size: 566, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775654:File {id: 9775654, tag: "File", name: "vector.py", parent_id: 9775640, stem: "vector", extension: "py", path: "/Users/starver/code/public/cpython/Tools/demo/vector.py", size: 1452, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775644:File {id: 9775644, tag: "File", name: "hanoi.py", parent_id: 9775640, stem: "hanoi", extension: "py", path: "/Users/starver/code/public/cpython/Tools/demo/hanoi.py", size: 4601, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
@@ -1835,26 +1872,34 @@ CREATE (n9775640) - [:PARENT_OF] -> (n9775645)
 CREATE (n9775640) - [:PARENT_OF] -> (n9775643)
 CREATE (n9775640) - [:PARENT_OF] -> (n9775651)
 CREATE (n9775640) - [:PARENT_OF] -> (n9775647)
+// group 9 1627
 CREATE (n9775631:Directory {id: 9775631, tag: "Directory", name: "c-globals", parent_id: 9775624, stem: "c-globals", extension: "", path: "/Users/starver/code/public/cpython/Tools/c-globals", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775631)
+MERGE (p9775631:Directory {id: 9775624})
+CREATE (p9775631) - [:PARENT_OF] -> (n9775631)
 CREATE (n9775632:File {id: 9775632, tag: "File", name: "README", parent_id: 9775631, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Tools/c-globals/README", size: 1844, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775633:File {id: 9775633, tag: "File", name: "check-c-globals.py", parent_id: 9775631, stem: "check-c-globals", extension: "py", path: "/Users/starver/code/public/cpython/Tools/c-globals/check-c-globals.py", size: 12836, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775634:File {id: 9775634, tag: "File", name: "ignored-globals.txt", parent_id: 9775631, stem: "ignored-globals", extension: "txt", path: "/Users/starver/code/public/cpython/Tools/c-globals/ignored-globals.txt", size: 7852, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775631) - [:PARENT_OF] -> (n9775632)
 CREATE (n9775631) - [:PARENT_OF] -> (n9775633)
 CREATE (n9775631) - [:PARENT_OF] -> (n9775634)
+// group 7 1206
 CREATE (n9775928:Directory {id: 9775928, tag: "Directory", name: "ssl", parent_id: 9775624, stem: "ssl", extension: "", path: "/Users/starver/code/public/cpython/Tools/ssl", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775928)
+MERGE (p9775928:Directory {id: 9775624})
+CREATE (p9775928) - [:PARENT_OF] -> (n9775928)
 CREATE (n9775929:File {id: 9775929, tag: "File", name: "make_ssl_data.py", parent_id: 9775928, stem: "make_ssl_data", extension: "py", path: "/Users/starver/code/public/cpython/Tools/ssl/make_ssl_data.py", size: 3064, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775930:File {id: 9775930, tag: "File", name: "multissltests.py", parent_id: 9775928, stem: "multissltests", extension: "py", path: "/Users/starver/code/public/cpython/Tools/ssl/multissltests.py", size: 13984, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775928) - [:PARENT_OF] -> (n9775929)
 CREATE (n9775928) - [:PARENT_OF] -> (n9775930)
+// group 5 794
 CREATE (n9775673:Directory {id: 9775673, tag: "Directory", name: "gdb", parent_id: 9775624, stem: "gdb", extension: "", path: "/Users/starver/code/public/cpython/Tools/gdb", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775673)
+MERGE (p9775673:Directory {id: 9775624})
+CREATE (p9775673) - [:PARENT_OF] -> (n9775673)
 CREATE (n9775674:File {id: 9775674, tag: "File", name: "libpython.py", parent_id: 9775673, stem: "libpython", extension: "py", path: "/Users/starver/code/public/cpython/Tools/gdb/libpython.py", size: 65372, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775673) - [:PARENT_OF] -> (n9775674)
+// group 31 5918
 CREATE (n9775655:Directory {id: 9775655, tag: "Directory", name: "freeze", parent_id: 9775624, stem: "freeze", extension: "", path: "/Users/starver/code/public/cpython/Tools/freeze", size: 544, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775655)
+MERGE (p9775655:Directory {id: 9775624})
+CREATE (p9775655) - [:PARENT_OF] -> (n9775655)
 CREATE (n9775663:File {id: 9775663, tag: "File", name: "hello.py", parent_id: 9775655, stem: "hello", extension: "py", path: "/Users/starver/code/public/cpython/Tools/freeze/hello.py", size: 24, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775661:File {id: 9775661, tag: "File", name: "flag.py", parent_id: 9775655, stem: "flag", extension: "py", path: "/Users/starver/code/public/cpython/Tools/freeze/flag.py", size: 41, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775672:File {id: 9775672, tag: "File", name: "winmakemakefile.py", parent_id: 9775655, stem: "winmakemakefile", extension: "py", path: "/Users/starver/code/public/cpython/Tools/freeze/winmakemakefile.py", size: 4992, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1883,14 +1928,18 @@ CREATE (n9775655) - [:PARENT_OF] -> (n9775671)
 CREATE (n9775655) - [:PARENT_OF] -> (n9775658)
 CREATE (n9775655) - [:PARENT_OF] -> (n9775660)
 CREATE (n9775655) - [:PARENT_OF] -> (n9775664)
+// group 7 1172
 CREATE (n9775668:Directory {id: 9775668, tag: "Directory", name: "test", parent_id: 9775655, stem: "test", extension: "", path: "/Users/starver/code/public/cpython/Tools/freeze/test", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775655) - [:PARENT_OF] -> (n9775668)
+MERGE (p9775668:Directory {id: 9775655})
+CREATE (p9775668) - [:PARENT_OF] -> (n9775668)
 CREATE (n9775669:File {id: 9775669, tag: "File", name: "Makefile", parent_id: 9775668, stem: "Makefile", extension: "", path: "/Users/starver/code/public/cpython/Tools/freeze/test/Makefile", size: 235, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775670:File {id: 9775670, tag: "File", name: "ok.py", parent_id: 9775668, stem: "ok", extension: "py", path: "/Users/starver/code/public/cpython/Tools/freeze/test/ok.py", size: 23, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775668) - [:PARENT_OF] -> (n9775669)
 CREATE (n9775668) - [:PARENT_OF] -> (n9775670)
+// group 21 3995
 CREATE (n9775946:Directory {id: 9775946, tag: "Directory", name: "unicode", parent_id: 9775624, stem: "unicode", extension: "", path: "/Users/starver/code/public/cpython/Tools/unicode", size: 384, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775946)
+MERGE (p9775946:Directory {id: 9775624})
+CREATE (p9775946) - [:PARENT_OF] -> (n9775946)
 CREATE (n9775950:File {id: 9775950, tag: "File", name: "gencodec.py", parent_id: 9775946, stem: "gencodec", extension: "py", path: "/Users/starver/code/public/cpython/Tools/unicode/gencodec.py", size: 12337, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775947:File {id: 9775947, tag: "File", name: "Makefile", parent_id: 9775946, stem: "Makefile", extension: "", path: "/Users/starver/code/public/cpython/Tools/unicode/Makefile", size: 1757, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775955:File {id: 9775955, tag: "File", name: "mkstringprep.py", parent_id: 9775946, stem: "mkstringprep", extension: "py", path: "/Users/starver/code/public/cpython/Tools/unicode/mkstringprep.py", size: 10262, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1909,8 +1958,10 @@ CREATE (n9775946) - [:PARENT_OF] -> (n9775948)
 CREATE (n9775946) - [:PARENT_OF] -> (n9775954)
 CREATE (n9775946) - [:PARENT_OF] -> (n9775949)
 CREATE (n9775946) - [:PARENT_OF] -> (n9775953)
+// group 11 2056
 CREATE (n9775956:Directory {id: 9775956, tag: "Directory", name: "python-mappings", parent_id: 9775946, stem: "python-mappings", extension: "", path: "/Users/starver/code/public/cpython/Tools/unicode/python-mappings", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775946) - [:PARENT_OF] -> (n9775956)
+MERGE (p9775956:Directory {id: 9775946})
+CREATE (p9775956) - [:PARENT_OF] -> (n9775956)
 CREATE (n9775957:File {id: 9775957, tag: "File", name: "CP1140.TXT", parent_id: 9775956, stem: "CP1140", extension: "TXT", path: "/Users/starver/code/public/cpython/Tools/unicode/python-mappings/CP1140.TXT", size: 9829, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775959:File {id: 9775959, tag: "File", name: "KOI8-U.TXT", parent_id: 9775956, stem: "KOI8-U", extension: "TXT", path: "/Users/starver/code/public/cpython/Tools/unicode/python-mappings/KOI8-U.TXT", size: 11267, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775958:File {id: 9775958, tag: "File", name: "CP273.TXT", parent_id: 9775956, stem: "CP273", extension: "TXT", path: "/Users/starver/code/public/cpython/Tools/unicode/python-mappings/CP273.TXT", size: 9268, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1919,8 +1970,10 @@ CREATE (n9775956) - [:PARENT_OF] -> (n9775957)
 CREATE (n9775956) - [:PARENT_OF] -> (n9775959)
 CREATE (n9775956) - [:PARENT_OF] -> (n9775958)
 CREATE (n9775956) - [:PARENT_OF] -> (n9775960)
+// group 47 9082
 CREATE (n9775684:Directory {id: 9775684, tag: "Directory", name: "msi", parent_id: 9775624, stem: "msi", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi", size: 1184, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775684)
+MERGE (p9775684:Directory {id: 9775624})
+CREATE (p9775684) - [:PARENT_OF] -> (n9775684)
 CREATE (n9775761:File {id: 9775761, tag: "File", name: "get_externals.bat", parent_id: 9775684, stem: "get_externals", extension: "bat", path: "/Users/starver/code/public/cpython/Tools/msi/get_externals.bat", size: 2729, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775825:File {id: 9775825, tag: "File", name: "wix.props", parent_id: 9775684, stem: "wix", extension: "props", path: "/Users/starver/code/public/cpython/Tools/msi/wix.props", size: 966, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775687:File {id: 9775687, tag: "File", name: "buildrelease.bat", parent_id: 9775684, stem: "buildrelease", extension: "bat", path: "/Users/starver/code/public/cpython/Tools/msi/buildrelease.bat", size: 9399, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1965,8 +2018,10 @@ CREATE (n9775684) - [:PARENT_OF] -> (n9775685)
 CREATE (n9775684) - [:PARENT_OF] -> (n9775792)
 CREATE (n9775684) - [:PARENT_OF] -> (n9775723)
 CREATE (n9775684) - [:PARENT_OF] -> (n9775777)
+// group 13 2466
 CREATE (n9775762:Directory {id: 9775762, tag: "Directory", name: "launcher", parent_id: 9775684, stem: "launcher", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/launcher", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775762)
+MERGE (p9775762:Directory {id: 9775684})
+CREATE (p9775762) - [:PARENT_OF] -> (n9775762)
 CREATE (n9775764:File {id: 9775764, tag: "File", name: "launcher.wxs", parent_id: 9775762, stem: "launcher", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/launcher/launcher.wxs", size: 2909, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775765:File {id: 9775765, tag: "File", name: "launcher_en-US.wxl", parent_id: 9775762, stem: "launcher_en-US", extension: "wxl", path: "/Users/starver/code/public/cpython/Tools/msi/launcher/launcher_en-US.wxl", size: 1135, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775763:File {id: 9775763, tag: "File", name: "launcher.wixproj", parent_id: 9775762, stem: "launcher", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/launcher/launcher.wixproj", size: 1912, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1977,8 +2032,10 @@ CREATE (n9775762) - [:PARENT_OF] -> (n9775765)
 CREATE (n9775762) - [:PARENT_OF] -> (n9775763)
 CREATE (n9775762) - [:PARENT_OF] -> (n9775766)
 CREATE (n9775762) - [:PARENT_OF] -> (n9775767)
+// group 11 1998
 CREATE (n9775813:Directory {id: 9775813, tag: "Directory", name: "tools", parent_id: 9775684, stem: "tools", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/tools", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775813)
+MERGE (p9775813:Directory {id: 9775684})
+CREATE (p9775813) - [:PARENT_OF] -> (n9775813)
 CREATE (n9775816:File {id: 9775816, tag: "File", name: "tools_en-US.wxl", parent_id: 9775813, stem: "tools_en-US", extension: "wxl", path: "/Users/starver/code/public/cpython/Tools/msi/tools/tools_en-US.wxl", size: 255, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775814:File {id: 9775814, tag: "File", name: "tools.wixproj", parent_id: 9775813, stem: "tools", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/tools/tools.wixproj", size: 2014, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775815:File {id: 9775815, tag: "File", name: "tools.wxs", parent_id: 9775813, stem: "tools", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/tools/tools.wxs", size: 842, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -1987,8 +2044,10 @@ CREATE (n9775813) - [:PARENT_OF] -> (n9775816)
 CREATE (n9775813) - [:PARENT_OF] -> (n9775814)
 CREATE (n9775813) - [:PARENT_OF] -> (n9775815)
 CREATE (n9775813) - [:PARENT_OF] -> (n9775817)
+// group 19 3555
 CREATE (n9775725:Directory {id: 9775725, tag: "Directory", name: "core", parent_id: 9775684, stem: "core", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/core", size: 320, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775725)
+MERGE (p9775725:Directory {id: 9775684})
+CREATE (p9775725) - [:PARENT_OF] -> (n9775725)
 CREATE (n9775731:File {id: 9775731, tag: "File", name: "core_files.wxs", parent_id: 9775725, stem: "core_files", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/core/core_files.wxs", size: 1644, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775729:File {id: 9775729, tag: "File", name: "core_d.wxs", parent_id: 9775725, stem: "core_d", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/core/core_d.wxs", size: 747, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775728:File {id: 9775728, tag: "File", name: "core_d.wixproj", parent_id: 9775725, stem: "core_d", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/core/core_d.wixproj", size: 676, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2005,8 +2064,10 @@ CREATE (n9775725) - [:PARENT_OF] -> (n9775732)
 CREATE (n9775725) - [:PARENT_OF] -> (n9775727)
 CREATE (n9775725) - [:PARENT_OF] -> (n9775730)
 CREATE (n9775725) - [:PARENT_OF] -> (n9775733)
+// group 19 3556
 CREATE (n9775803:Directory {id: 9775803, tag: "Directory", name: "test", parent_id: 9775684, stem: "test", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/test", size: 320, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775803)
+MERGE (p9775803:Directory {id: 9775684})
+CREATE (p9775803) - [:PARENT_OF] -> (n9775803)
 CREATE (n9775808:File {id: 9775808, tag: "File", name: "test_en-US.wxl", parent_id: 9775803, stem: "test_en-US", extension: "wxl", path: "/Users/starver/code/public/cpython/Tools/msi/test/test_en-US.wxl", size: 422, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775805:File {id: 9775805, tag: "File", name: "test.wxs", parent_id: 9775803, stem: "test", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/test/test.wxs", size: 835, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775806:File {id: 9775806, tag: "File", name: "test_d.wixproj", parent_id: 9775803, stem: "test_d", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/test/test_d.wixproj", size: 680, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2023,24 +2084,30 @@ CREATE (n9775803) - [:PARENT_OF] -> (n9775811)
 CREATE (n9775803) - [:PARENT_OF] -> (n9775809)
 CREATE (n9775803) - [:PARENT_OF] -> (n9775810)
 CREATE (n9775803) - [:PARENT_OF] -> (n9775804)
+// group 9 1582
 CREATE (n9775782:Directory {id: 9775782, tag: "Directory", name: "path", parent_id: 9775684, stem: "path", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/path", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775782)
+MERGE (p9775782:Directory {id: 9775684})
+CREATE (p9775782) - [:PARENT_OF] -> (n9775782)
 CREATE (n9775784:File {id: 9775784, tag: "File", name: "path.wxs", parent_id: 9775782, stem: "path", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/path/path.wxs", size: 2471, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775785:File {id: 9775785, tag: "File", name: "path_en-US.wxl", parent_id: 9775782, stem: "path_en-US", extension: "wxl", path: "/Users/starver/code/public/cpython/Tools/msi/path/path_en-US.wxl", size: 334, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775783:File {id: 9775783, tag: "File", name: "path.wixproj", parent_id: 9775782, stem: "path", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/path/path.wixproj", size: 671, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775782) - [:PARENT_OF] -> (n9775784)
 CREATE (n9775782) - [:PARENT_OF] -> (n9775785)
 CREATE (n9775782) - [:PARENT_OF] -> (n9775783)
+// group 9 1582
 CREATE (n9775818:Directory {id: 9775818, tag: "Directory", name: "ucrt", parent_id: 9775684, stem: "ucrt", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/ucrt", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775818)
+MERGE (p9775818:Directory {id: 9775684})
+CREATE (p9775818) - [:PARENT_OF] -> (n9775818)
 CREATE (n9775820:File {id: 9775820, tag: "File", name: "ucrt.wxs", parent_id: 9775818, stem: "ucrt", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/ucrt/ucrt.wxs", size: 731, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775819:File {id: 9775819, tag: "File", name: "ucrt.wixproj", parent_id: 9775818, stem: "ucrt", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/ucrt/ucrt.wixproj", size: 1031, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775821:File {id: 9775821, tag: "File", name: "ucrt_en-US.wxl", parent_id: 9775818, stem: "ucrt_en-US", extension: "wxl", path: "/Users/starver/code/public/cpython/Tools/msi/ucrt/ucrt_en-US.wxl", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775818) - [:PARENT_OF] -> (n9775820)
 CREATE (n9775818) - [:PARENT_OF] -> (n9775819)
 CREATE (n9775818) - [:PARENT_OF] -> (n9775821)
+// group 21 4016
 CREATE (n9775793:Directory {id: 9775793, tag: "Directory", name: "tcltk", parent_id: 9775684, stem: "tcltk", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/tcltk", size: 352, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775793)
+MERGE (p9775793:Directory {id: 9775684})
+CREATE (p9775793) - [:PARENT_OF] -> (n9775793)
 CREATE (n9775798:File {id: 9775798, tag: "File", name: "tcltk_en-US.wxl_template", parent_id: 9775793, stem: "tcltk_en-US", extension: "wxl_template", path: "/Users/starver/code/public/cpython/Tools/msi/tcltk/tcltk_en-US.wxl_template", size: 868, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775799:File {id: 9775799, tag: "File", name: "tcltk_files.wxs", parent_id: 9775793, stem: "tcltk_files", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/tcltk/tcltk_files.wxs", size: 1668, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775800:File {id: 9775800, tag: "File", name: "tcltk_pdb.wixproj", parent_id: 9775793, stem: "tcltk_pdb", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/tcltk/tcltk_pdb.wixproj", size: 691, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2059,8 +2126,10 @@ CREATE (n9775793) - [:PARENT_OF] -> (n9775794)
 CREATE (n9775793) - [:PARENT_OF] -> (n9775802)
 CREATE (n9775793) - [:PARENT_OF] -> (n9775801)
 CREATE (n9775793) - [:PARENT_OF] -> (n9775795)
+// group 23 4397
 CREATE (n9775688:Directory {id: 9775688, tag: "Directory", name: "bundle", parent_id: 9775684, stem: "bundle", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/bundle", size: 448, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775688)
+MERGE (p9775688:Directory {id: 9775684})
+CREATE (p9775688) - [:PARENT_OF] -> (n9775688)
 CREATE (n9775722:File {id: 9775722, tag: "File", name: "snapshot.wixproj", parent_id: 9775688, stem: "snapshot", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/snapshot.wixproj", size: 888, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775720:File {id: 9775720, tag: "File", name: "releaselocal.wixproj", parent_id: 9775688, stem: "releaselocal", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/releaselocal.wixproj", size: 651, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775702:File {id: 9775702, tag: "File", name: "bundle.targets", parent_id: 9775688, stem: "bundle", extension: "targets", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/bundle.targets", size: 5028, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2081,8 +2150,10 @@ CREATE (n9775688) - [:PARENT_OF] -> (n9775721)
 CREATE (n9775688) - [:PARENT_OF] -> (n9775703)
 CREATE (n9775688) - [:PARENT_OF] -> (n9775689)
 CREATE (n9775688) - [:PARENT_OF] -> (n9775691)
+// group 21 4099
 CREATE (n9775692:Directory {id: 9775692, tag: "Directory", name: "bootstrap", parent_id: 9775688, stem: "bootstrap", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/bootstrap", size: 352, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775688) - [:PARENT_OF] -> (n9775692)
+MERGE (p9775692:Directory {id: 9775688})
+CREATE (p9775692) - [:PARENT_OF] -> (n9775692)
 CREATE (n9775699:File {id: 9775699, tag: "File", name: "pythonba.sln", parent_id: 9775692, stem: "pythonba", extension: "sln", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/bootstrap/pythonba.sln", size: 961, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775696:File {id: 9775696, tag: "File", name: "pch.h", parent_id: 9775692, stem: "pch", extension: "h", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/bootstrap/pch.h", size: 1647, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775700:File {id: 9775700, tag: "File", name: "pythonba.vcxproj", parent_id: 9775692, stem: "pythonba", extension: "vcxproj", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/bootstrap/pythonba.vcxproj", size: 3686, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2101,8 +2172,10 @@ CREATE (n9775692) - [:PARENT_OF] -> (n9775695)
 CREATE (n9775692) - [:PARENT_OF] -> (n9775701)
 CREATE (n9775692) - [:PARENT_OF] -> (n9775693)
 CREATE (n9775692) - [:PARENT_OF] -> (n9775698)
+// group 29 5647
 CREATE (n9775706:Directory {id: 9775706, tag: "Directory", name: "packagegroups", parent_id: 9775688, stem: "packagegroups", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/packagegroups", size: 480, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775688) - [:PARENT_OF] -> (n9775706)
+MERGE (p9775706:Directory {id: 9775688})
+CREATE (p9775706) - [:PARENT_OF] -> (n9775706)
 CREATE (n9775712:File {id: 9775712, tag: "File", name: "launcher.wxs", parent_id: 9775706, stem: "launcher", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/packagegroups/launcher.wxs", size: 1351, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775710:File {id: 9775710, tag: "File", name: "doc.wxs", parent_id: 9775706, stem: "doc", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/packagegroups/doc.wxs", size: 1379, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775709:File {id: 9775709, tag: "File", name: "dev.wxs", parent_id: 9775706, stem: "dev", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/bundle/packagegroups/dev.wxs", size: 2399, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2129,16 +2202,20 @@ CREATE (n9775706) - [:PARENT_OF] -> (n9775715)
 CREATE (n9775706) - [:PARENT_OF] -> (n9775707)
 CREATE (n9775706) - [:PARENT_OF] -> (n9775714)
 CREATE (n9775706) - [:PARENT_OF] -> (n9775717)
+// group 9 1567
 CREATE (n9775786:Directory {id: 9775786, tag: "Directory", name: "pip", parent_id: 9775684, stem: "pip", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/pip", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775786)
+MERGE (p9775786:Directory {id: 9775684})
+CREATE (p9775786) - [:PARENT_OF] -> (n9775786)
 CREATE (n9775787:File {id: 9775787, tag: "File", name: "pip.wixproj", parent_id: 9775786, stem: "pip", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/pip/pip.wixproj", size: 670, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775789:File {id: 9775789, tag: "File", name: "pip_en-US.wxl", parent_id: 9775786, stem: "pip_en-US", extension: "wxl", path: "/Users/starver/code/public/cpython/Tools/msi/pip/pip_en-US.wxl", size: 335, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775788:File {id: 9775788, tag: "File", name: "pip.wxs", parent_id: 9775786, stem: "pip", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/pip/pip.wxs", size: 2069, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775786) - [:PARENT_OF] -> (n9775787)
 CREATE (n9775786) - [:PARENT_OF] -> (n9775789)
 CREATE (n9775786) - [:PARENT_OF] -> (n9775788)
+// group 19 3521
 CREATE (n9775768:Directory {id: 9775768, tag: "Directory", name: "lib", parent_id: 9775684, stem: "lib", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/lib", size: 320, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775768)
+MERGE (p9775768:Directory {id: 9775684})
+CREATE (p9775768) - [:PARENT_OF] -> (n9775768)
 CREATE (n9775774:File {id: 9775774, tag: "File", name: "lib_files.wxs", parent_id: 9775768, stem: "lib_files", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/lib/lib_files.wxs", size: 5035, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775769:File {id: 9775769, tag: "File", name: "lib.wixproj", parent_id: 9775768, stem: "lib", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/lib/lib.wixproj", size: 1518, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775776:File {id: 9775776, tag: "File", name: "lib_pdb.wxs", parent_id: 9775768, stem: "lib_pdb", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/lib/lib_pdb.wxs", size: 706, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2155,8 +2232,10 @@ CREATE (n9775768) - [:PARENT_OF] -> (n9775770)
 CREATE (n9775768) - [:PARENT_OF] -> (n9775773)
 CREATE (n9775768) - [:PARENT_OF] -> (n9775775)
 CREATE (n9775768) - [:PARENT_OF] -> (n9775772)
+// group 15 2735
 CREATE (n9775735:Directory {id: 9775735, tag: "Directory", name: "dev", parent_id: 9775684, stem: "dev", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/dev", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775735)
+MERGE (p9775735:Directory {id: 9775684})
+CREATE (p9775735) - [:PARENT_OF] -> (n9775735)
 CREATE (n9775738:File {id: 9775738, tag: "File", name: "dev_d.wixproj", parent_id: 9775735, stem: "dev_d", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/dev/dev_d.wixproj", size: 673, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775741:File {id: 9775741, tag: "File", name: "dev_files.wxs", parent_id: 9775735, stem: "dev_files", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/dev/dev_files.wxs", size: 1850, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775737:File {id: 9775737, tag: "File", name: "dev.wxs", parent_id: 9775735, stem: "dev", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/dev/dev.wxs", size: 930, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2169,8 +2248,10 @@ CREATE (n9775735) - [:PARENT_OF] -> (n9775737)
 CREATE (n9775735) - [:PARENT_OF] -> (n9775739)
 CREATE (n9775735) - [:PARENT_OF] -> (n9775740)
 CREATE (n9775735) - [:PARENT_OF] -> (n9775736)
+// group 13 2390
 CREATE (n9775743:Directory {id: 9775743, tag: "Directory", name: "doc", parent_id: 9775684, stem: "doc", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/doc", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775743)
+MERGE (p9775743:Directory {id: 9775684})
+CREATE (p9775743) - [:PARENT_OF] -> (n9775743)
 CREATE (n9775747:File {id: 9775747, tag: "File", name: "doc_files.wxs", parent_id: 9775743, stem: "doc_files", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/doc/doc_files.wxs", size: 620, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775745:File {id: 9775745, tag: "File", name: "doc.wxs", parent_id: 9775743, stem: "doc", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/doc/doc.wxs", size: 2114, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775746:File {id: 9775746, tag: "File", name: "doc_en-US.wxl_template", parent_id: 9775743, stem: "doc_en-US", extension: "wxl_template", path: "/Users/starver/code/public/cpython/Tools/msi/doc/doc_en-US.wxl_template", size: 425, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2181,8 +2262,10 @@ CREATE (n9775743) - [:PARENT_OF] -> (n9775745)
 CREATE (n9775743) - [:PARENT_OF] -> (n9775746)
 CREATE (n9775743) - [:PARENT_OF] -> (n9775744)
 CREATE (n9775743) - [:PARENT_OF] -> (n9775748)
+// group 23 4334
 CREATE (n9775749:Directory {id: 9775749, tag: "Directory", name: "exe", parent_id: 9775684, stem: "exe", extension: "", path: "/Users/starver/code/public/cpython/Tools/msi/exe", size: 384, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775684) - [:PARENT_OF] -> (n9775749)
+MERGE (p9775749:Directory {id: 9775684})
+CREATE (p9775749) - [:PARENT_OF] -> (n9775749)
 CREATE (n9775750:File {id: 9775750, tag: "File", name: "crtlicense.txt", parent_id: 9775749, stem: "crtlicense", extension: "txt", path: "/Users/starver/code/public/cpython/Tools/msi/exe/crtlicense.txt", size: 1738, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775756:File {id: 9775756, tag: "File", name: "exe_files.wxs", parent_id: 9775749, stem: "exe_files", extension: "wxs", path: "/Users/starver/code/public/cpython/Tools/msi/exe/exe_files.wxs", size: 3616, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775753:File {id: 9775753, tag: "File", name: "exe_d.wixproj", parent_id: 9775749, stem: "exe_d", extension: "wixproj", path: "/Users/starver/code/public/cpython/Tools/msi/exe/exe_d.wixproj", size: 764, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2203,26 +2286,36 @@ CREATE (n9775749) - [:PARENT_OF] -> (n9775751)
 CREATE (n9775749) - [:PARENT_OF] -> (n9775759)
 CREATE (n9775749) - [:PARENT_OF] -> (n9775758)
 CREATE (n9775749) - [:PARENT_OF] -> (n9775757)
+// group 5 804
 CREATE (n9775682:Directory {id: 9775682, tag: "Directory", name: "iobench", parent_id: 9775624, stem: "iobench", extension: "", path: "/Users/starver/code/public/cpython/Tools/iobench", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775682)
+MERGE (p9775682:Directory {id: 9775624})
+CREATE (p9775682) - [:PARENT_OF] -> (n9775682)
 CREATE (n9775683:File {id: 9775683, tag: "File", name: "iobench.py", parent_id: 9775682, stem: "iobench", extension: "py", path: "/Users/starver/code/public/cpython/Tools/iobench/iobench.py", size: 17779, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775682) - [:PARENT_OF] -> (n9775683)
+// group 7 1211
 CREATE (n9775931:Directory {id: 9775931, tag: "Directory", name: "stringbench", parent_id: 9775624, stem: "stringbench", extension: "", path: "/Users/starver/code/public/cpython/Tools/stringbench", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775931)
+MERGE (p9775931:Directory {id: 9775624})
+CREATE (p9775931) - [:PARENT_OF] -> (n9775931)
 CREATE (n9775933:File {id: 9775933, tag: "File", name: "stringbench.py", parent_id: 9775931, stem: "stringbench", extension: "py", path: "/Users/starver/code/public/cpython/Tools/stringbench/stringbench.py", size: 44018, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775932:File {id: 9775932, tag: "File", name: "README", parent_id: 9775931, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Tools/stringbench/README", size: 2516, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775931) - [:PARENT_OF] -> (n9775933)
 CREATE (n9775931) - [:PARENT_OF] -> (n9775932)
+// group 5 800
 CREATE (n9775833:Directory {id: 9775833, tag: "Directory", name: "parser", parent_id: 9775624, stem: "parser", extension: "", path: "/Users/starver/code/public/cpython/Tools/parser", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775833)
+MERGE (p9775833:Directory {id: 9775624})
+CREATE (p9775833) - [:PARENT_OF] -> (n9775833)
 CREATE (n9775834:File {id: 9775834, tag: "File", name: "unparse.py", parent_id: 9775833, stem: "unparse", extension: "py", path: "/Users/starver/code/public/cpython/Tools/parser/unparse.py", size: 19741, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775833) - [:PARENT_OF] -> (n9775834)
+// group 5 804
 CREATE (n9775635:Directory {id: 9775635, tag: "Directory", name: "ccbench", parent_id: 9775624, stem: "ccbench", extension: "", path: "/Users/starver/code/public/cpython/Tools/ccbench", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775635)
+MERGE (p9775635:Directory {id: 9775624})
+CREATE (p9775635) - [:PARENT_OF] -> (n9775635)
 CREATE (n9775636:File {id: 9775636, tag: "File", name: "ccbench.py", parent_id: 9775635, stem: "ccbench", extension: "py", path: "/Users/starver/code/public/cpython/Tools/ccbench/ccbench.py", size: 18448, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775635) - [:PARENT_OF] -> (n9775636)
+// group 15 2813
 CREATE (n9775826:Directory {id: 9775826, tag: "Directory", name: "nuget", parent_id: 9775624, stem: "nuget", extension: "", path: "/Users/starver/code/public/cpython/Tools/nuget", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775826)
+MERGE (p9775826:Directory {id: 9775624})
+CREATE (p9775826) - [:PARENT_OF] -> (n9775826)
 CREATE (n9775829:File {id: 9775829, tag: "File", name: "python.nuspec", parent_id: 9775826, stem: "python", extension: "nuspec", path: "/Users/starver/code/public/cpython/Tools/nuget/python.nuspec", size: 690, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775832:File {id: 9775832, tag: "File", name: "pythonx86.nuspec", parent_id: 9775826, stem: "pythonx86", extension: "nuspec", path: "/Users/starver/code/public/cpython/Tools/nuget/pythonx86.nuspec", size: 702, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775828:File {id: 9775828, tag: "File", name: "make_pkg.proj", parent_id: 9775826, stem: "make_pkg", extension: "proj", path: "/Users/starver/code/public/cpython/Tools/nuget/make_pkg.proj", size: 4299, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2235,8 +2328,10 @@ CREATE (n9775826) - [:PARENT_OF] -> (n9775828)
 CREATE (n9775826) - [:PARENT_OF] -> (n9775831)
 CREATE (n9775826) - [:PARENT_OF] -> (n9775830)
 CREATE (n9775826) - [:PARENT_OF] -> (n9775827)
+// group 141 27241
 CREATE (n9775858:Directory {id: 9775858, tag: "Directory", name: "scripts", parent_id: 9775624, stem: "scripts", extension: "", path: "/Users/starver/code/public/cpython/Tools/scripts", size: 2272, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775858)
+MERGE (p9775858:Directory {id: 9775624})
+CREATE (p9775858) - [:PARENT_OF] -> (n9775858)
 CREATE (n9775917:File {id: 9775917, tag: "File", name: "reindent.py", parent_id: 9775858, stem: "reindent", extension: "py", path: "/Users/starver/code/public/cpython/Tools/scripts/reindent.py", size: 11647, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775879:File {id: 9775879, tag: "File", name: "findlinksto.py", parent_id: 9775858, stem: "findlinksto", extension: "py", path: "/Users/starver/code/public/cpython/Tools/scripts/findlinksto.py", size: 1071, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775875:File {id: 9775875, tag: "File", name: "eptags.py", parent_id: 9775858, stem: "eptags", extension: "py", path: "/Users/starver/code/public/cpython/Tools/scripts/eptags.py", size: 1493, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
@@ -2375,14 +2470,18 @@ CREATE (n9775858) - [:PARENT_OF] -> (n9775901)
 CREATE (n9775858) - [:PARENT_OF] -> (n9775912)
 CREATE (n9775858) - [:PARENT_OF] -> (n9775883)
 CREATE (n9775858) - [:PARENT_OF] -> (n9775922)
+// group 7 1209
 CREATE (n9775679:Directory {id: 9775679, tag: "Directory", name: "importbench", parent_id: 9775624, stem: "importbench", extension: "", path: "/Users/starver/code/public/cpython/Tools/importbench", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775679)
+MERGE (p9775679:Directory {id: 9775624})
+CREATE (p9775679) - [:PARENT_OF] -> (n9775679)
 CREATE (n9775680:File {id: 9775680, tag: "File", name: "README", parent_id: 9775679, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Tools/importbench/README", size: 322, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775681:File {id: 9775681, tag: "File", name: "importbench.py", parent_id: 9775679, stem: "importbench", extension: "py", path: "/Users/starver/code/public/cpython/Tools/importbench/importbench.py", size: 9140, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775679) - [:PARENT_OF] -> (n9775680)
 CREATE (n9775679) - [:PARENT_OF] -> (n9775681)
+// group 11 1956
 CREATE (n9775626:Directory {id: 9775626, tag: "Directory", name: "buildbot", parent_id: 9775624, stem: "buildbot", extension: "", path: "/Users/starver/code/public/cpython/Tools/buildbot", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775626)
+MERGE (p9775626:Directory {id: 9775624})
+CREATE (p9775626) - [:PARENT_OF] -> (n9775626)
 CREATE (n9775629:File {id: 9775629, tag: "File", name: "clean.bat", parent_id: 9775626, stem: "clean", extension: "bat", path: "/Users/starver/code/public/cpython/Tools/buildbot/clean.bat", size: 403, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775630:File {id: 9775630, tag: "File", name: "test.bat", parent_id: 9775626, stem: "test", extension: "bat", path: "/Users/starver/code/public/cpython/Tools/buildbot/test.bat", size: 748, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775628:File {id: 9775628, tag: "File", name: "buildmsi.bat", parent_id: 9775626, stem: "buildmsi", extension: "bat", path: "/Users/starver/code/public/cpython/Tools/buildbot/buildmsi.bat", size: 142, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2391,22 +2490,28 @@ CREATE (n9775626) - [:PARENT_OF] -> (n9775629)
 CREATE (n9775626) - [:PARENT_OF] -> (n9775630)
 CREATE (n9775626) - [:PARENT_OF] -> (n9775628)
 CREATE (n9775626) - [:PARENT_OF] -> (n9775627)
+// group 7 1221
 CREATE (n9775961:Directory {id: 9775961, tag: "Directory", name: "unittestgui", parent_id: 9775624, stem: "unittestgui", extension: "", path: "/Users/starver/code/public/cpython/Tools/unittestgui", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775961)
+MERGE (p9775961:Directory {id: 9775624})
+CREATE (p9775961) - [:PARENT_OF] -> (n9775961)
 CREATE (n9775963:File {id: 9775963, tag: "File", name: "unittestgui.py", parent_id: 9775961, stem: "unittestgui", extension: "py", path: "/Users/starver/code/public/cpython/Tools/unittestgui/unittestgui.py", size: 18560, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775962:File {id: 9775962, tag: "File", name: "README.txt", parent_id: 9775961, stem: "README", extension: "txt", path: "/Users/starver/code/public/cpython/Tools/unittestgui/README.txt", size: 556, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775961) - [:PARENT_OF] -> (n9775963)
 CREATE (n9775961) - [:PARENT_OF] -> (n9775962)
+// group 9 1584
 CREATE (n9775675:Directory {id: 9775675, tag: "Directory", name: "i18n", parent_id: 9775624, stem: "i18n", extension: "", path: "/Users/starver/code/public/cpython/Tools/i18n", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775675)
+MERGE (p9775675:Directory {id: 9775624})
+CREATE (p9775675) - [:PARENT_OF] -> (n9775675)
 CREATE (n9775677:File {id: 9775677, tag: "File", name: "msgfmt.py", parent_id: 9775675, stem: "msgfmt", extension: "py", path: "/Users/starver/code/public/cpython/Tools/i18n/msgfmt.py", size: 7592, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775676:File {id: 9775676, tag: "File", name: "makelocalealias.py", parent_id: 9775675, stem: "makelocalealias", extension: "py", path: "/Users/starver/code/public/cpython/Tools/i18n/makelocalealias.py", size: 5029, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775678:File {id: 9775678, tag: "File", name: "pygettext.py", parent_id: 9775675, stem: "pygettext", extension: "py", path: "/Users/starver/code/public/cpython/Tools/i18n/pygettext.py", size: 21549, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775675) - [:PARENT_OF] -> (n9775677)
 CREATE (n9775675) - [:PARENT_OF] -> (n9775676)
 CREATE (n9775675) - [:PARENT_OF] -> (n9775678)
+// group 41 7848
 CREATE (n9775835:Directory {id: 9775835, tag: "Directory", name: "pynche", parent_id: 9775624, stem: "pynche", extension: "", path: "/Users/starver/code/public/cpython/Tools/pynche", size: 704, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775835)
+MERGE (p9775835:Directory {id: 9775624})
+CREATE (p9775835) - [:PARENT_OF] -> (n9775835)
 CREATE (n9775855:File {id: 9775855, tag: "File", name: "pynche.pyw", parent_id: 9775835, stem: "pynche", extension: "pyw", path: "/Users/starver/code/public/cpython/Tools/pynche/pynche.pyw", size: 181, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775836:File {id: 9775836, tag: "File", name: "ChipViewer.py", parent_id: 9775835, stem: "ChipViewer", extension: "py", path: "/Users/starver/code/public/cpython/Tools/pynche/ChipViewer.py", size: 4998, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775851:File {id: 9775851, tag: "File", name: "html40colors.txt", parent_id: 9775835, stem: "html40colors", extension: "txt", path: "/Users/starver/code/public/cpython/Tools/pynche/html40colors.txt", size: 245, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2445,44 +2550,58 @@ CREATE (n9775835) - [:PARENT_OF] -> (n9775854)
 CREATE (n9775835) - [:PARENT_OF] -> (n9775837)
 CREATE (n9775835) - [:PARENT_OF] -> (n9775838)
 CREATE (n9775835) - [:PARENT_OF] -> (n9775845)
+// group 7 1178
 CREATE (n9775847:Directory {id: 9775847, tag: "Directory", name: "X", parent_id: 9775835, stem: "X", extension: "", path: "/Users/starver/code/public/cpython/Tools/pynche/X", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775835) - [:PARENT_OF] -> (n9775847)
+MERGE (p9775847:Directory {id: 9775835})
+CREATE (p9775847) - [:PARENT_OF] -> (n9775847)
 CREATE (n9775848:File {id: 9775848, tag: "File", name: "rgb.txt", parent_id: 9775847, stem: "rgb", extension: "txt", path: "/Users/starver/code/public/cpython/Tools/pynche/X/rgb.txt", size: 17375, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775849:File {id: 9775849, tag: "File", name: "xlicense.txt", parent_id: 9775847, stem: "xlicense", extension: "txt", path: "/Users/starver/code/public/cpython/Tools/pynche/X/xlicense.txt", size: 1352, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775847) - [:PARENT_OF] -> (n9775848)
 CREATE (n9775847) - [:PARENT_OF] -> (n9775849)
+// group 7 1171
 CREATE (n9775637:Directory {id: 9775637, tag: "Directory", name: "clinic", parent_id: 9775624, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Tools/clinic", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775637)
+MERGE (p9775637:Directory {id: 9775624})
+CREATE (p9775637) - [:PARENT_OF] -> (n9775637)
 CREATE (n9775638:File {id: 9775638, tag: "File", name: "clinic.py", parent_id: 9775637, stem: "clinic", extension: "py", path: "/Users/starver/code/public/cpython/Tools/clinic/clinic.py", size: 155890, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775639:File {id: 9775639, tag: "File", name: "cpp.py", parent_id: 9775637, stem: "cpp", extension: "py", path: "/Users/starver/code/public/cpython/Tools/clinic/cpp.py", size: 5984, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775637) - [:PARENT_OF] -> (n9775638)
 CREATE (n9775637) - [:PARENT_OF] -> (n9775639)
+// group 5 777
 CREATE (n9775944:Directory {id: 9775944, tag: "Directory", name: "tz", parent_id: 9775624, stem: "tz", extension: "", path: "/Users/starver/code/public/cpython/Tools/tz", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775944)
+MERGE (p9775944:Directory {id: 9775624})
+CREATE (p9775944) - [:PARENT_OF] -> (n9775944)
 CREATE (n9775945:File {id: 9775945, tag: "File", name: "zdump.py", parent_id: 9775944, stem: "zdump", extension: "py", path: "/Users/starver/code/public/cpython/Tools/tz/zdump.py", size: 2770, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775944) - [:PARENT_OF] -> (n9775945)
+// group 9 1563
 CREATE (n9775934:Directory {id: 9775934, tag: "Directory", name: "test2to3", parent_id: 9775624, stem: "test2to3", extension: "", path: "/Users/starver/code/public/cpython/Tools/test2to3", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775624) - [:PARENT_OF] -> (n9775934)
+MERGE (p9775934:Directory {id: 9775624})
+CREATE (p9775934) - [:PARENT_OF] -> (n9775934)
 CREATE (n9775935:File {id: 9775935, tag: "File", name: "README", parent_id: 9775934, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Tools/test2to3/README", size: 124, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775937:File {id: 9775937, tag: "File", name: "setup.py", parent_id: 9775934, stem: "setup", extension: "py", path: "/Users/starver/code/public/cpython/Tools/test2to3/setup.py", size: 753, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775936:File {id: 9775936, tag: "File", name: "maintest.py", parent_id: 9775934, stem: "maintest", extension: "py", path: "/Users/starver/code/public/cpython/Tools/test2to3/maintest.py", size: 250, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9775934) - [:PARENT_OF] -> (n9775935)
 CREATE (n9775934) - [:PARENT_OF] -> (n9775937)
 CREATE (n9775934) - [:PARENT_OF] -> (n9775936)
+// group 7 1205
 CREATE (n9775938:Directory {id: 9775938, tag: "Directory", name: "test", parent_id: 9775934, stem: "test", extension: "", path: "/Users/starver/code/public/cpython/Tools/test2to3/test", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775934) - [:PARENT_OF] -> (n9775938)
+MERGE (p9775938:Directory {id: 9775934})
+CREATE (p9775938) - [:PARENT_OF] -> (n9775938)
 CREATE (n9775940:File {id: 9775940, tag: "File", name: "test_foo.py", parent_id: 9775938, stem: "test_foo", extension: "py", path: "/Users/starver/code/public/cpython/Tools/test2to3/test/test_foo.py", size: 238, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775939:File {id: 9775939, tag: "File", name: "runtests.py", parent_id: 9775938, stem: "runtests", extension: "py", path: "/Users/starver/code/public/cpython/Tools/test2to3/test/runtests.py", size: 509, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775938) - [:PARENT_OF] -> (n9775940)
 CREATE (n9775938) - [:PARENT_OF] -> (n9775939)
+// group 7 1213
 CREATE (n9775941:Directory {id: 9775941, tag: "Directory", name: "test2to3", parent_id: 9775934, stem: "test2to3", extension: "", path: "/Users/starver/code/public/cpython/Tools/test2to3/test2to3", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775934) - [:PARENT_OF] -> (n9775941)
+MERGE (p9775941:Directory {id: 9775934})
+CREATE (p9775941) - [:PARENT_OF] -> (n9775941)
 CREATE (n9775943:File {id: 9775943, tag: "File", name: "hello.py", parent_id: 9775941, stem: "hello", extension: "py", path: "/Users/starver/code/public/cpython/Tools/test2to3/test2to3/hello.py", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775942:File {id: 9775942, tag: "File", name: "__init__.py", parent_id: 9775941, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Tools/test2to3/test2to3/__init__.py", size: 8, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775941) - [:PARENT_OF] -> (n9775943)
 CREATE (n9775941) - [:PARENT_OF] -> (n9775942)
+// group 23 4444
 CREATE (n9770904:Directory {id: 9770904, tag: "Directory", name: ".azure-pipelines", parent_id: 9768633, stem: ".azure-pipelines", extension: "", path: "/Users/starver/code/public/cpython/.azure-pipelines", size: 384, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9770904)
+MERGE (p9770904:Directory {id: 9768633})
+CREATE (p9770904) - [:PARENT_OF] -> (n9770904)
 CREATE (n9770906:File {id: 9770906, tag: "File", name: "docker-steps.yml", parent_id: 9770904, stem: "docker-steps", extension: "yml", path: "/Users/starver/code/public/cpython/.azure-pipelines/docker-steps.yml", size: 2258, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770907:File {id: 9770907, tag: "File", name: "docs-steps.yml", parent_id: 9770904, stem: "docs-steps", extension: "yml", path: "/Users/starver/code/public/cpython/.azure-pipelines/docs-steps.yml", size: 1351, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770910:File {id: 9770910, tag: "File", name: "posix-steps.yml", parent_id: 9770904, stem: "posix-steps", extension: "yml", path: "/Users/starver/code/public/cpython/.azure-pipelines/posix-steps.yml", size: 1964, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2503,8 +2622,10 @@ CREATE (n9770904) - [:PARENT_OF] -> (n9770909)
 CREATE (n9770904) - [:PARENT_OF] -> (n9770913)
 CREATE (n9770904) - [:PARENT_OF] -> (n9770912)
 CREATE (n9770904) - [:PARENT_OF] -> (n9770905)
+// group 151 28661
 CREATE (n9775540:Directory {id: 9775540, tag: "Directory", name: "Python", parent_id: 9768633, stem: "Python", extension: "", path: "/Users/starver/code/public/cpython/Python", size: 2464, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9775540)
+MERGE (p9775540:Directory {id: 9768633})
+CREATE (p9775540) - [:PARENT_OF] -> (n9775540)
 CREATE (n9775569:File {id: 9775569, tag: "File", name: "dynload_dl.c", parent_id: 9775540, stem: "dynload_dl", extension: "c", path: "/Users/starver/code/public/cpython/Python/dynload_dl.c", size: 581, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775560:File {id: 9775560, tag: "File", name: "codecs.c", parent_id: 9775540, stem: "codecs", extension: "c", path: "/Users/starver/code/public/cpython/Python/codecs.c", size: 45809, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775568:File {id: 9775568, tag: "File", name: "dynload_aix.c", parent_id: 9775540, stem: "dynload_aix", extension: "c", path: "/Users/starver/code/public/cpython/Python/dynload_aix.c", size: 5839, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2653,8 +2774,10 @@ CREATE (n9775540) - [:PARENT_OF] -> (n9775585)
 CREATE (n9775540) - [:PARENT_OF] -> (n9775619)
 CREATE (n9775540) - [:PARENT_OF] -> (n9775606)
 CREATE (n9775540) - [:PARENT_OF] -> (n9775574)
+// group 17 3162
 CREATE (n9775552:Directory {id: 9775552, tag: "Directory", name: "clinic", parent_id: 9775540, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Python/clinic", size: 288, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775540) - [:PARENT_OF] -> (n9775552)
+MERGE (p9775552:Directory {id: 9775540})
+CREATE (p9775552) - [:PARENT_OF] -> (n9775552)
 CREATE (n9775555:File {id: 9775555, tag: "File", name: "context.c.h", parent_id: 9775552, stem: "context.c", extension: "h", path: "/Users/starver/code/public/cpython/Python/clinic/context.c.h", size: 5308, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775553:File {id: 9775553, tag: "File", name: "_warnings.c.h", parent_id: 9775552, stem: "_warnings.c", extension: "h", path: "/Users/starver/code/public/cpython/Python/clinic/_warnings.c.h", size: 1325, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775558:File {id: 9775558, tag: "File", name: "sysmodule.c.h", parent_id: 9775552, stem: "sysmodule.c", extension: "h", path: "/Users/starver/code/public/cpython/Python/clinic/sysmodule.c.h", size: 2361, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2669,8 +2792,10 @@ CREATE (n9775552) - [:PARENT_OF] -> (n9775559)
 CREATE (n9775552) - [:PARENT_OF] -> (n9775554)
 CREATE (n9775552) - [:PARENT_OF] -> (n9775556)
 CREATE (n9775552) - [:PARENT_OF] -> (n9775557)
+// group 203 38513
 CREATE (n9771508:Directory {id: 9771508, tag: "Directory", name: "Include", parent_id: 9768633, stem: "Include", extension: "", path: "/Users/starver/code/public/cpython/Include", size: 3328, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9771508)
+MERGE (p9771508:Directory {id: 9768633})
+CREATE (p9771508) - [:PARENT_OF] -> (n9771508)
 CREATE (n9771522:File {id: 9771522, tag: "File", name: "classobject.h", parent_id: 9771508, stem: "classobject", extension: "h", path: "/Users/starver/code/public/cpython/Include/classobject.h", size: 1679, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771520:File {id: 9771520, tag: "File", name: "cellobject.h", parent_id: 9771508, stem: "cellobject", extension: "h", path: "/Users/starver/code/public/cpython/Include/cellobject.h", size: 713, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771574:File {id: 9771574, tag: "File", name: "intrcheck.h", parent_id: 9771508, stem: "intrcheck", extension: "h", path: "/Users/starver/code/public/cpython/Include/intrcheck.h", size: 861, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2871,8 +2996,10 @@ CREATE (n9771508) - [:PARENT_OF] -> (n9771553)
 CREATE (n9771508) - [:PARENT_OF] -> (n9771601)
 CREATE (n9771508) - [:PARENT_OF] -> (n9771518)
 CREATE (n9771508) - [:PARENT_OF] -> (n9771543)
+// group 37 7310
 CREATE (n9771556:Directory {id: 9771556, tag: "Directory", name: "internal", parent_id: 9771508, stem: "internal", extension: "", path: "/Users/starver/code/public/cpython/Include/internal", size: 608, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771508) - [:PARENT_OF] -> (n9771556)
+MERGE (p9771556:Directory {id: 9771508})
+CREATE (p9771556) - [:PARENT_OF] -> (n9771556)
 CREATE (n9771573:File {id: 9771573, tag: "File", name: "pycore_warnings.h", parent_id: 9771556, stem: "pycore_warnings", extension: "h", path: "/Users/starver/code/public/cpython/Include/internal/pycore_warnings.h", size: 657, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771563:File {id: 9771563, tag: "File", name: "pycore_getopt.h", parent_id: 9771556, stem: "pycore_getopt", extension: "h", path: "/Users/starver/code/public/cpython/Include/internal/pycore_getopt.h", size: 607, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771565:File {id: 9771565, tag: "File", name: "pycore_hamt.h", parent_id: 9771556, stem: "pycore_hamt", extension: "h", path: "/Users/starver/code/public/cpython/Include/internal/pycore_hamt.h", size: 3194, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2907,8 +3034,10 @@ CREATE (n9771556) - [:PARENT_OF] -> (n9771566)
 CREATE (n9771556) - [:PARENT_OF] -> (n9771559)
 CREATE (n9771556) - [:PARENT_OF] -> (n9771567)
 CREATE (n9771556) - [:PARENT_OF] -> (n9771561)
+// group 21 3934
 CREATE (n9771529:Directory {id: 9771529, tag: "Directory", name: "cpython", parent_id: 9771508, stem: "cpython", extension: "", path: "/Users/starver/code/public/cpython/Include/cpython", size: 352, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771508) - [:PARENT_OF] -> (n9771529)
+MERGE (p9771529:Directory {id: 9771508})
+CREATE (p9771529) - [:PARENT_OF] -> (n9771529)
 CREATE (n9771537:File {id: 9771537, tag: "File", name: "tupleobject.h", parent_id: 9771529, stem: "tupleobject", extension: "h", path: "/Users/starver/code/public/cpython/Include/cpython/tupleobject.h", size: 1036, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771534:File {id: 9771534, tag: "File", name: "pyerrors.h", parent_id: 9771529, stem: "pyerrors", extension: "h", path: "/Users/starver/code/public/cpython/Include/cpython/pyerrors.h", size: 4476, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771531:File {id: 9771531, tag: "File", name: "dictobject.h", parent_id: 9771529, stem: "dictobject", extension: "h", path: "/Users/starver/code/public/cpython/Include/cpython/dictobject.h", size: 3764, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -2927,8 +3056,10 @@ CREATE (n9771529) - [:PARENT_OF] -> (n9771535)
 CREATE (n9771529) - [:PARENT_OF] -> (n9771532)
 CREATE (n9771529) - [:PARENT_OF] -> (n9771538)
 CREATE (n9771529) - [:PARENT_OF] -> (n9771533)
+// group 99 18987
 CREATE (n9775213:Directory {id: 9775213, tag: "Directory", name: "Objects", parent_id: 9768633, stem: "Objects", extension: "", path: "/Users/starver/code/public/cpython/Objects", size: 1664, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9775213)
+MERGE (p9775213:Directory {id: 9768633})
+CREATE (p9775213) - [:PARENT_OF] -> (n9775213)
 CREATE (n9775268:File {id: 9775268, tag: "File", name: "setobject.c", parent_id: 9775213, stem: "setobject", extension: "c", path: "/Users/starver/code/public/cpython/Objects/setobject.c", size: 74982, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775258:File {id: 9775258, tag: "File", name: "lnotab_notes.txt", parent_id: 9775213, stem: "lnotab_notes", extension: "txt", path: "/Users/starver/code/public/cpython/Objects/lnotab_notes.txt", size: 5855, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775266:File {id: 9775266, tag: "File", name: "odictobject.c", parent_id: 9775213, stem: "odictobject", extension: "c", path: "/Users/starver/code/public/cpython/Objects/odictobject.c", size: 75328, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3025,8 +3156,10 @@ CREATE (n9775213) - [:PARENT_OF] -> (n9775221)
 CREATE (n9775213) - [:PARENT_OF] -> (n9775254)
 CREATE (n9775213) - [:PARENT_OF] -> (n9775261)
 CREATE (n9775213) - [:PARENT_OF] -> (n9775217)
+// group 47 8965
 CREATE (n9775270:Directory {id: 9775270, tag: "Directory", name: "stringlib", parent_id: 9775213, stem: "stringlib", extension: "", path: "/Users/starver/code/public/cpython/Objects/stringlib", size: 800, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775213) - [:PARENT_OF] -> (n9775270)
+MERGE (p9775270:Directory {id: 9775213})
+CREATE (p9775270) - [:PARENT_OF] -> (n9775270)
 CREATE (n9775289:File {id: 9775289, tag: "File", name: "ucs1lib.h", parent_id: 9775270, stem: "ucs1lib", extension: "h", path: "/Users/starver/code/public/cpython/Objects/stringlib/ucs1lib.h", size: 1233, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775279:File {id: 9775279, tag: "File", name: "fastsearch.h", parent_id: 9775270, stem: "fastsearch", extension: "h", path: "/Users/starver/code/public/cpython/Objects/stringlib/fastsearch.h", size: 8728, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775276:File {id: 9775276, tag: "File", name: "count.h", parent_id: 9775270, stem: "count", extension: "h", path: "/Users/starver/code/public/cpython/Objects/stringlib/count.h", size: 666, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3071,12 +3204,16 @@ CREATE (n9775270) - [:PARENT_OF] -> (n9775283)
 CREATE (n9775270) - [:PARENT_OF] -> (n9775293)
 CREATE (n9775270) - [:PARENT_OF] -> (n9775286)
 CREATE (n9775270) - [:PARENT_OF] -> (n9775290)
+// group 5 841
 CREATE (n9775273:Directory {id: 9775273, tag: "Directory", name: "clinic", parent_id: 9775270, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Objects/stringlib/clinic", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775270) - [:PARENT_OF] -> (n9775273)
+MERGE (p9775273:Directory {id: 9775270})
+CREATE (p9775273) - [:PARENT_OF] -> (n9775273)
 CREATE (n9775274:File {id: 9775274, tag: "File", name: "transmogrify.h.h", parent_id: 9775273, stem: "transmogrify.h", extension: "h", path: "/Users/starver/code/public/cpython/Objects/stringlib/clinic/transmogrify.h.h", size: 4289, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775273) - [:PARENT_OF] -> (n9775274)
+// group 35 6837
 CREATE (n9775225:Directory {id: 9775225, tag: "Directory", name: "clinic", parent_id: 9775213, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Objects/clinic", size: 576, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775213) - [:PARENT_OF] -> (n9775225)
+MERGE (p9775225:Directory {id: 9775213})
+CREATE (p9775225) - [:PARENT_OF] -> (n9775225)
 CREATE (n9775241:File {id: 9775241, tag: "File", name: "unicodeobject.c.h", parent_id: 9775225, stem: "unicodeobject.c", extension: "h", path: "/Users/starver/code/public/cpython/Objects/clinic/unicodeobject.c.h", size: 27466, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775240:File {id: 9775240, tag: "File", name: "typeobject.c.h", parent_id: 9775225, stem: "typeobject.c", extension: "h", path: "/Users/starver/code/public/cpython/Objects/clinic/typeobject.c.h", size: 5869, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775239:File {id: 9775239, tag: "File", name: "tupleobject.c.h", parent_id: 9775225, stem: "tupleobject.c", extension: "h", path: "/Users/starver/code/public/cpython/Objects/clinic/tupleobject.c.h", size: 2573, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3109,8 +3246,10 @@ CREATE (n9775225) - [:PARENT_OF] -> (n9775229)
 CREATE (n9775225) - [:PARENT_OF] -> (n9775228)
 CREATE (n9775225) - [:PARENT_OF] -> (n9775236)
 CREATE (n9775225) - [:PARENT_OF] -> (n9775231)
+// group 47 8741
 CREATE (n9775512:Directory {id: 9775512, tag: "Directory", name: "Parser", parent_id: 9768633, stem: "Parser", extension: "", path: "/Users/starver/code/public/cpython/Parser", size: 768, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9775512)
+MERGE (p9775512:Directory {id: 9768633})
+CREATE (p9775512) - [:PARENT_OF] -> (n9775512)
 CREATE (n9775521:File {id: 9775521, tag: "File", name: "listnode.c", parent_id: 9775512, stem: "listnode", extension: "c", path: "/Users/starver/code/public/cpython/Parser/listnode.c", size: 1283, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775530:File {id: 9775530, tag: "File", name: "pgenmain.c", parent_id: 9775512, stem: "pgenmain", extension: "c", path: "/Users/starver/code/public/cpython/Parser/pgenmain.c", size: 4150, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775518:File {id: 9775518, tag: "File", name: "firstsets.c", parent_id: 9775512, stem: "firstsets", extension: "c", path: "/Users/starver/code/public/cpython/Parser/firstsets.c", size: 2854, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3155,16 +3294,20 @@ CREATE (n9775512) - [:PARENT_OF] -> (n9775532)
 CREATE (n9775512) - [:PARENT_OF] -> (n9775524)
 CREATE (n9775512) - [:PARENT_OF] -> (n9775516)
 CREATE (n9775512) - [:PARENT_OF] -> (n9775513)
+// group 9 1540
 CREATE (n9773821:Directory {id: 9773821, tag: "Directory", name: "Mac", parent_id: 9768633, stem: "Mac", extension: "", path: "/Users/starver/code/public/cpython/Mac", size: 352, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9773821)
+MERGE (p9773821:Directory {id: 9768633})
+CREATE (p9773821) - [:PARENT_OF] -> (n9773821)
 CREATE (n9773838:File {id: 9773838, tag: "File", name: "Extras.install.py", parent_id: 9773821, stem: "Extras.install", extension: "py", path: "/Users/starver/code/public/cpython/Mac/Extras.install.py", size: 1652, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773889:File {id: 9773889, tag: "File", name: "README", parent_id: 9773821, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Mac/README", size: 16063, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773859:File {id: 9773859, tag: "File", name: "Makefile.in", parent_id: 9773821, stem: "Makefile", extension: "in", path: "/Users/starver/code/public/cpython/Mac/Makefile.in", size: 8091, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773821) - [:PARENT_OF] -> (n9773838)
 CREATE (n9773821) - [:PARENT_OF] -> (n9773889)
 CREATE (n9773821) - [:PARENT_OF] -> (n9773859)
+// group 31 6107
 CREATE (n9773860:Directory {id: 9773860, tag: "Directory", name: "PythonLauncher", parent_id: 9773821, stem: "PythonLauncher", extension: "", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher", size: 544, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773821) - [:PARENT_OF] -> (n9773860)
+MERGE (p9773860:Directory {id: 9773821})
+CREATE (p9773860) - [:PARENT_OF] -> (n9773860)
 CREATE (n9773879:File {id: 9773879, tag: "File", name: "MyAppDelegate.h", parent_id: 9773860, stem: "MyAppDelegate", extension: "h", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/MyAppDelegate.h", size: 290, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773875:File {id: 9773875, tag: "File", name: "FileSettings.h", parent_id: 9773860, stem: "FileSettings", extension: "h", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/FileSettings.h", size: 1890, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773882:File {id: 9773882, tag: "File", name: "MyDocument.m", parent_id: 9773860, stem: "MyDocument", extension: "m", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/MyDocument.m", size: 4652, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3193,50 +3336,68 @@ CREATE (n9773860) - [:PARENT_OF] -> (n9773876)
 CREATE (n9773860) - [:PARENT_OF] -> (n9773878)
 CREATE (n9773860) - [:PARENT_OF] -> (n9773877)
 CREATE (n9773860) - [:PARENT_OF] -> (n9773884)
+// group 5 855
 CREATE (n9773861:Directory {id: 9773861, tag: "Directory", name: "English.lproj", parent_id: 9773860, stem: "English", extension: "lproj", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773860) - [:PARENT_OF] -> (n9773861)
+MERGE (p9773861:Directory {id: 9773860})
+CREATE (p9773861) - [:PARENT_OF] -> (n9773861)
 CREATE (n9773862:File {id: 9773862, tag: "File", name: "Credits.rtf", parent_id: 9773861, stem: "Credits", extension: "rtf", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/Credits.rtf", size: 544, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773861) - [:PARENT_OF] -> (n9773862)
+// group 9 1721
 CREATE (n9773867:Directory {id: 9773867, tag: "Directory", name: "MyDocument.nib", parent_id: 9773861, stem: "MyDocument", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/MyDocument.nib", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773861) - [:PARENT_OF] -> (n9773867)
+MERGE (p9773867:Directory {id: 9773861})
+CREATE (p9773867) - [:PARENT_OF] -> (n9773867)
 CREATE (n9773868:File {id: 9773868, tag: "File", name: "classes.nib", parent_id: 9773867, stem: "classes", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/MyDocument.nib/classes.nib", size: 857, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773869:File {id: 9773869, tag: "File", name: "info.nib", parent_id: 9773867, stem: "info", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/MyDocument.nib/info.nib", size: 451, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773870:File {id: 9773870, tag: "File", name: "objects.nib", parent_id: 9773867, stem: "objects", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/MyDocument.nib/objects.nib", size: 4845, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773867) - [:PARENT_OF] -> (n9773868)
 CREATE (n9773867) - [:PARENT_OF] -> (n9773869)
 CREATE (n9773867) - [:PARENT_OF] -> (n9773870)
+// group 9 1709
 CREATE (n9773863:Directory {id: 9773863, tag: "Directory", name: "MainMenu.nib", parent_id: 9773861, stem: "MainMenu", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/MainMenu.nib", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773861) - [:PARENT_OF] -> (n9773863)
+MERGE (p9773863:Directory {id: 9773861})
+CREATE (p9773863) - [:PARENT_OF] -> (n9773863)
 CREATE (n9773864:File {id: 9773864, tag: "File", name: "classes.nib", parent_id: 9773863, stem: "classes", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/MainMenu.nib/classes.nib", size: 297, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773865:File {id: 9773865, tag: "File", name: "info.nib", parent_id: 9773863, stem: "info", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/MainMenu.nib/info.nib", size: 527, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773866:File {id: 9773866, tag: "File", name: "objects.nib", parent_id: 9773863, stem: "objects", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/MainMenu.nib/objects.nib", size: 5016, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773863) - [:PARENT_OF] -> (n9773864)
 CREATE (n9773863) - [:PARENT_OF] -> (n9773865)
 CREATE (n9773863) - [:PARENT_OF] -> (n9773866)
+// group 9 1757
 CREATE (n9773871:Directory {id: 9773871, tag: "Directory", name: "PreferenceWindow.nib", parent_id: 9773861, stem: "PreferenceWindow", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/PreferenceWindow.nib", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773861) - [:PARENT_OF] -> (n9773871)
+MERGE (p9773871:Directory {id: 9773861})
+CREATE (p9773871) - [:PARENT_OF] -> (n9773871)
 CREATE (n9773872:File {id: 9773872, tag: "File", name: "classes.nib", parent_id: 9773871, stem: "classes", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/PreferenceWindow.nib/classes.nib", size: 869, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773873:File {id: 9773873, tag: "File", name: "info.nib", parent_id: 9773871, stem: "info", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/PreferenceWindow.nib/info.nib", size: 453, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773874:File {id: 9773874, tag: "File", name: "objects.nib", parent_id: 9773871, stem: "objects", extension: "nib", path: "/Users/starver/code/public/cpython/Mac/PythonLauncher/English.lproj/PreferenceWindow.nib/objects.nib", size: 5882, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773871) - [:PARENT_OF] -> (n9773872)
 CREATE (n9773871) - [:PARENT_OF] -> (n9773873)
 CREATE (n9773871) - [:PARENT_OF] -> (n9773874)
+// group 3 407
 CREATE (n9773839:Directory {id: 9773839, tag: "Directory", name: "IDLE", parent_id: 9773821, stem: "IDLE", extension: "", path: "/Users/starver/code/public/cpython/Mac/IDLE", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773821) - [:PARENT_OF] -> (n9773839)
+MERGE (p9773839:Directory {id: 9773821})
+CREATE (p9773839) - [:PARENT_OF] -> (n9773839)
+// group 3 423
 CREATE (n9773840:Directory {id: 9773840, tag: "Directory", name: "IDLE.app", parent_id: 9773839, stem: "IDLE", extension: "app", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773839) - [:PARENT_OF] -> (n9773840)
+MERGE (p9773840:Directory {id: 9773839})
+CREATE (p9773840) - [:PARENT_OF] -> (n9773840)
+// group 7 1219
 CREATE (n9773841:Directory {id: 9773841, tag: "Directory", name: "Contents", parent_id: 9773840, stem: "Contents", extension: "", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773840) - [:PARENT_OF] -> (n9773841)
+MERGE (p9773841:Directory {id: 9773840})
+CREATE (p9773841) - [:PARENT_OF] -> (n9773841)
 CREATE (n9773842:File {id: 9773842, tag: "File", name: "Info.plist", parent_id: 9773841, stem: "Info", extension: "plist", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents/Info.plist", size: 1643, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773845:File {id: 9773845, tag: "File", name: "PkgInfo", parent_id: 9773841, stem: "PkgInfo", extension: "", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents/PkgInfo", size: 8, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773841) - [:PARENT_OF] -> (n9773842)
 CREATE (n9773841) - [:PARENT_OF] -> (n9773845)
+// group 5 819
 CREATE (n9773843:Directory {id: 9773843, tag: "Directory", name: "MacOS", parent_id: 9773841, stem: "MacOS", extension: "", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents/MacOS", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773841) - [:PARENT_OF] -> (n9773843)
+MERGE (p9773843:Directory {id: 9773841})
+CREATE (p9773843) - [:PARENT_OF] -> (n9773843)
 CREATE (n9773844:File {id: 9773844, tag: "File", name: "IDLE", parent_id: 9773843, stem: "IDLE", extension: "", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents/MacOS/IDLE", size: 771, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9773843) - [:PARENT_OF] -> (n9773844)
+// group 11 2129
 CREATE (n9773846:Directory {id: 9773846, tag: "Directory", name: "Resources", parent_id: 9773841, stem: "Resources", extension: "", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents/Resources", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773841) - [:PARENT_OF] -> (n9773846)
+MERGE (p9773846:Directory {id: 9773841})
+CREATE (p9773846) - [:PARENT_OF] -> (n9773846)
 CREATE (n9773850:File {id: 9773850, tag: "File", name: "idlemain.py", parent_id: 9773846, stem: "idlemain", extension: "py", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents/Resources/idlemain.py", size: 2801, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773849:File {id: 9773849, tag: "File", name: "PythonSource.icns", parent_id: 9773846, stem: "PythonSource", extension: "icns", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents/Resources/PythonSource.icns", size: 54522, owner: 501, group: 20, created: 1545241637, accessed: 1545241664, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773848:File {id: 9773848, tag: "File", name: "PythonCompiled.icns", parent_id: 9773846, stem: "PythonCompiled", extension: "icns", path: "/Users/starver/code/public/cpython/Mac/IDLE/IDLE.app/Contents/Resources/PythonCompiled.icns", size: 60777, owner: 501, group: 20, created: 1545241637, accessed: 1545241664, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3245,32 +3406,44 @@ CREATE (n9773846) - [:PARENT_OF] -> (n9773850)
 CREATE (n9773846) - [:PARENT_OF] -> (n9773849)
 CREATE (n9773846) - [:PARENT_OF] -> (n9773848)
 CREATE (n9773846) - [:PARENT_OF] -> (n9773847)
+// group 7 1227
 CREATE (n9773907:Directory {id: 9773907, tag: "Directory", name: "Tools", parent_id: 9773821, stem: "Tools", extension: "", path: "/Users/starver/code/public/cpython/Mac/Tools", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773821) - [:PARENT_OF] -> (n9773907)
+MERGE (p9773907:Directory {id: 9773821})
+CREATE (p9773907) - [:PARENT_OF] -> (n9773907)
 CREATE (n9773908:File {id: 9773908, tag: "File", name: "plistlib_generate_testdata.py", parent_id: 9773907, stem: "plistlib_generate_testdata", extension: "py", path: "/Users/starver/code/public/cpython/Mac/Tools/plistlib_generate_testdata.py", size: 3932, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9773909:File {id: 9773909, tag: "File", name: "pythonw.c", parent_id: 9773907, stem: "pythonw", extension: "c", path: "/Users/starver/code/public/cpython/Mac/Tools/pythonw.c", size: 5977, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773907) - [:PARENT_OF] -> (n9773908)
 CREATE (n9773907) - [:PARENT_OF] -> (n9773909)
+// group 3 423
 CREATE (n9773890:Directory {id: 9773890, tag: "Directory", name: "Resources", parent_id: 9773821, stem: "Resources", extension: "", path: "/Users/starver/code/public/cpython/Mac/Resources", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773821) - [:PARENT_OF] -> (n9773890)
+MERGE (p9773890:Directory {id: 9773821})
+CREATE (p9773890) - [:PARENT_OF] -> (n9773890)
+// group 7 1191
 CREATE (n9773891:Directory {id: 9773891, tag: "Directory", name: "app", parent_id: 9773890, stem: "app", extension: "", path: "/Users/starver/code/public/cpython/Mac/Resources/app", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773890) - [:PARENT_OF] -> (n9773891)
+MERGE (p9773891:Directory {id: 9773890})
+CREATE (p9773891) - [:PARENT_OF] -> (n9773891)
 CREATE (n9773892:File {id: 9773892, tag: "File", name: "Info.plist.in", parent_id: 9773891, stem: "Info.plist", extension: "in", path: "/Users/starver/code/public/cpython/Mac/Resources/app/Info.plist.in", size: 1789, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773893:File {id: 9773893, tag: "File", name: "PkgInfo", parent_id: 9773891, stem: "PkgInfo", extension: "", path: "/Users/starver/code/public/cpython/Mac/Resources/app/PkgInfo", size: 8, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773891) - [:PARENT_OF] -> (n9773892)
 CREATE (n9773891) - [:PARENT_OF] -> (n9773893)
+// group 7 1294
 CREATE (n9773894:Directory {id: 9773894, tag: "Directory", name: "Resources", parent_id: 9773891, stem: "Resources", extension: "", path: "/Users/starver/code/public/cpython/Mac/Resources/app/Resources", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773891) - [:PARENT_OF] -> (n9773894)
+MERGE (p9773894:Directory {id: 9773891})
+CREATE (p9773894) - [:PARENT_OF] -> (n9773894)
 CREATE (n9773895:File {id: 9773895, tag: "File", name: "PythonApplet.icns", parent_id: 9773894, stem: "PythonApplet", extension: "icns", path: "/Users/starver/code/public/cpython/Mac/Resources/app/Resources/PythonApplet.icns", size: 63136, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773896:File {id: 9773896, tag: "File", name: "PythonInterpreter.icns", parent_id: 9773894, stem: "PythonInterpreter", extension: "icns", path: "/Users/starver/code/public/cpython/Mac/Resources/app/Resources/PythonInterpreter.icns", size: 42658, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773894) - [:PARENT_OF] -> (n9773895)
 CREATE (n9773894) - [:PARENT_OF] -> (n9773896)
+// group 5 835
 CREATE (n9773897:Directory {id: 9773897, tag: "Directory", name: "framework", parent_id: 9773890, stem: "framework", extension: "", path: "/Users/starver/code/public/cpython/Mac/Resources/framework", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773890) - [:PARENT_OF] -> (n9773897)
+MERGE (p9773897:Directory {id: 9773890})
+CREATE (p9773897) - [:PARENT_OF] -> (n9773897)
 CREATE (n9773898:File {id: 9773898, tag: "File", name: "Info.plist.in", parent_id: 9773897, stem: "Info.plist", extension: "in", path: "/Users/starver/code/public/cpython/Mac/Resources/framework/Info.plist.in", size: 938, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773897) - [:PARENT_OF] -> (n9773898)
+// group 17 3293
 CREATE (n9773899:Directory {id: 9773899, tag: "Directory", name: "iconsrc", parent_id: 9773890, stem: "iconsrc", extension: "", path: "/Users/starver/code/public/cpython/Mac/Resources/iconsrc", size: 288, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773890) - [:PARENT_OF] -> (n9773899)
+MERGE (p9773899:Directory {id: 9773890})
+CREATE (p9773899) - [:PARENT_OF] -> (n9773899)
 CREATE (n9773903:File {id: 9773903, tag: "File", name: "PythonCompiled.psd", parent_id: 9773899, stem: "PythonCompiled", extension: "psd", path: "/Users/starver/code/public/cpython/Mac/Resources/iconsrc/PythonCompiled.psd", size: 76118, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9773905:File {id: 9773905, tag: "File", name: "PythonSource.psd", parent_id: 9773899, stem: "PythonSource", extension: "psd", path: "/Users/starver/code/public/cpython/Mac/Resources/iconsrc/PythonSource.psd", size: 62075, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9773906:File {id: 9773906, tag: "File", name: "PythonWSource.psd", parent_id: 9773899, stem: "PythonWSource", extension: "psd", path: "/Users/starver/code/public/cpython/Mac/Resources/iconsrc/PythonWSource.psd", size: 64185, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3285,8 +3458,10 @@ CREATE (n9773899) - [:PARENT_OF] -> (n9773904)
 CREATE (n9773899) - [:PARENT_OF] -> (n9773901)
 CREATE (n9773899) - [:PARENT_OF] -> (n9773902)
 CREATE (n9773899) - [:PARENT_OF] -> (n9773900)
+// group 17 3195
 CREATE (n9773851:Directory {id: 9773851, tag: "Directory", name: "Icons", parent_id: 9773821, stem: "Icons", extension: "", path: "/Users/starver/code/public/cpython/Mac/Icons", size: 288, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773821) - [:PARENT_OF] -> (n9773851)
+MERGE (p9773851:Directory {id: 9773821})
+CREATE (p9773851) - [:PARENT_OF] -> (n9773851)
 CREATE (n9773857:File {id: 9773857, tag: "File", name: "PythonSource.icns", parent_id: 9773851, stem: "PythonSource", extension: "icns", path: "/Users/starver/code/public/cpython/Mac/Icons/PythonSource.icns", size: 54522, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773852:File {id: 9773852, tag: "File", name: "Disk Image.icns", parent_id: 9773851, stem: "Disk Image", extension: "icns", path: "/Users/starver/code/public/cpython/Mac/Icons/Disk Image.icns", size: 50703, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773856:File {id: 9773856, tag: "File", name: "PythonLauncher.icns", parent_id: 9773851, stem: "PythonLauncher", extension: "icns", path: "/Users/starver/code/public/cpython/Mac/Icons/PythonLauncher.icns", size: 42658, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3301,16 +3476,20 @@ CREATE (n9773851) - [:PARENT_OF] -> (n9773854)
 CREATE (n9773851) - [:PARENT_OF] -> (n9773858)
 CREATE (n9773851) - [:PARENT_OF] -> (n9773855)
 CREATE (n9773851) - [:PARENT_OF] -> (n9773853)
+// group 9 1611
 CREATE (n9773822:Directory {id: 9773822, tag: "Directory", name: "BuildScript", parent_id: 9773821, stem: "BuildScript", extension: "", path: "/Users/starver/code/public/cpython/Mac/BuildScript", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773821) - [:PARENT_OF] -> (n9773822)
+MERGE (p9773822:Directory {id: 9773821})
+CREATE (p9773822) - [:PARENT_OF] -> (n9773822)
 CREATE (n9773837:File {id: 9773837, tag: "File", name: "seticon.m", parent_id: 9773822, stem: "seticon", extension: "m", path: "/Users/starver/code/public/cpython/Mac/BuildScript/seticon.m", size: 598, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773824:File {id: 9773824, tag: "File", name: "build-installer.py", parent_id: 9773822, stem: "build-installer", extension: "py", path: "/Users/starver/code/public/cpython/Mac/BuildScript/build-installer.py", size: 60668, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9773823:File {id: 9773823, tag: "File", name: "README.txt", parent_id: 9773822, stem: "README", extension: "txt", path: "/Users/starver/code/public/cpython/Mac/BuildScript/README.txt", size: 8662, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773822) - [:PARENT_OF] -> (n9773837)
 CREATE (n9773822) - [:PARENT_OF] -> (n9773824)
 CREATE (n9773822) - [:PARENT_OF] -> (n9773823)
+// group 15 2902
 CREATE (n9773825:Directory {id: 9773825, tag: "Directory", name: "resources", parent_id: 9773822, stem: "resources", extension: "", path: "/Users/starver/code/public/cpython/Mac/BuildScript/resources", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773822) - [:PARENT_OF] -> (n9773825)
+MERGE (p9773825:Directory {id: 9773822})
+CREATE (p9773825) - [:PARENT_OF] -> (n9773825)
 CREATE (n9773826:File {id: 9773826, tag: "File", name: "Conclusion.rtf", parent_id: 9773825, stem: "Conclusion", extension: "rtf", path: "/Users/starver/code/public/cpython/Mac/BuildScript/resources/Conclusion.rtf", size: 1190, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773830:File {id: 9773830, tag: "File", name: "background.jpg", parent_id: 9773825, stem: "background", extension: "jpg", path: "/Users/starver/code/public/cpython/Mac/BuildScript/resources/background.jpg", size: 45421, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773829:File {id: 9773829, tag: "File", name: "Welcome.rtf", parent_id: 9773825, stem: "Welcome", extension: "rtf", path: "/Users/starver/code/public/cpython/Mac/BuildScript/resources/Welcome.rtf", size: 873, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3323,8 +3502,10 @@ CREATE (n9773825) - [:PARENT_OF] -> (n9773829)
 CREATE (n9773825) - [:PARENT_OF] -> (n9773828)
 CREATE (n9773825) - [:PARENT_OF] -> (n9773831)
 CREATE (n9773825) - [:PARENT_OF] -> (n9773827)
+// group 11 2151
 CREATE (n9773832:Directory {id: 9773832, tag: "Directory", name: "scripts", parent_id: 9773822, stem: "scripts", extension: "", path: "/Users/starver/code/public/cpython/Mac/BuildScript/scripts", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773822) - [:PARENT_OF] -> (n9773832)
+MERGE (p9773832:Directory {id: 9773822})
+CREATE (p9773832) - [:PARENT_OF] -> (n9773832)
 CREATE (n9773836:File {id: 9773836, tag: "File", name: "postflight.patch-profile", parent_id: 9773832, stem: "postflight", extension: "patch-profile", path: "/Users/starver/code/public/cpython/Mac/BuildScript/scripts/postflight.patch-profile", size: 2540, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9773835:File {id: 9773835, tag: "File", name: "postflight.framework", parent_id: 9773832, stem: "postflight", extension: "framework", path: "/Users/starver/code/public/cpython/Mac/BuildScript/scripts/postflight.framework", size: 895, owner: 501, group: 20, created: 1545241637, accessed: 1545267473, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9773834:File {id: 9773834, tag: "File", name: "postflight.ensurepip", parent_id: 9773832, stem: "postflight", extension: "ensurepip", path: "/Users/starver/code/public/cpython/Mac/BuildScript/scripts/postflight.ensurepip", size: 2452, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
@@ -3333,8 +3514,10 @@ CREATE (n9773832) - [:PARENT_OF] -> (n9773836)
 CREATE (n9773832) - [:PARENT_OF] -> (n9773835)
 CREATE (n9773832) - [:PARENT_OF] -> (n9773834)
 CREATE (n9773832) - [:PARENT_OF] -> (n9773833)
+// group 11 1950
 CREATE (n9775535:Directory {id: 9775535, tag: "Directory", name: "Programs", parent_id: 9768633, stem: "Programs", extension: "", path: "/Users/starver/code/public/cpython/Programs", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9775535)
+MERGE (p9775535:Directory {id: 9768633})
+CREATE (p9775535) - [:PARENT_OF] -> (n9775535)
 CREATE (n9775537:File {id: 9775537, tag: "File", name: "_freeze_importlib.c", parent_id: 9775535, stem: "_freeze_importlib", extension: "c", path: "/Users/starver/code/public/cpython/Programs/_freeze_importlib.c", size: 4722, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775538:File {id: 9775538, tag: "File", name: "_testembed.c", parent_id: 9775535, stem: "_testembed", extension: "c", path: "/Users/starver/code/public/cpython/Programs/_testembed.c", size: 19671, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775539:File {id: 9775539, tag: "File", name: "python.c", parent_id: 9775535, stem: "python", extension: "c", path: "/Users/starver/code/public/cpython/Programs/python.c", size: 298, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3343,8 +3526,10 @@ CREATE (n9775535) - [:PARENT_OF] -> (n9775537)
 CREATE (n9775535) - [:PARENT_OF] -> (n9775538)
 CREATE (n9775535) - [:PARENT_OF] -> (n9775539)
 CREATE (n9775535) - [:PARENT_OF] -> (n9775536)
+// group 219 44138
 CREATE (n9775403:Directory {id: 9775403, tag: "Directory", name: "PCbuild", parent_id: 9768633, stem: "PCbuild", extension: "", path: "/Users/starver/code/public/cpython/PCbuild", size: 3520, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9775403)
+MERGE (p9775403:Directory {id: 9768633})
+CREATE (p9775403) - [:PARENT_OF] -> (n9775403)
 CREATE (n9775505:File {id: 9775505, tag: "File", name: "urlretrieve.py", parent_id: 9775403, stem: "urlretrieve", extension: "py", path: "/Users/starver/code/public/cpython/PCbuild/urlretrieve.py", size: 1188, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775432:File {id: 9775432, tag: "File", name: "_socket.vcxproj", parent_id: 9775403, stem: "_socket", extension: "vcxproj", path: "/Users/starver/code/public/cpython/PCbuild/_socket.vcxproj", size: 3388, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775483:File {id: 9775483, tag: "File", name: "python3dll.vcxproj.filters", parent_id: 9775403, stem: "python3dll.vcxproj", extension: "filters", path: "/Users/starver/code/public/cpython/PCbuild/python3dll.vcxproj.filters", size: 1217, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3561,8 +3746,10 @@ CREATE (n9775403) - [:PARENT_OF] -> (n9775471)
 CREATE (n9775403) - [:PARENT_OF] -> (n9775465)
 CREATE (n9775403) - [:PARENT_OF] -> (n9775407)
 CREATE (n9775403) - [:PARENT_OF] -> (n9775458)
+// group 13 2376
 CREATE (n9770916:Directory {id: 9770916, tag: "Directory", name: ".github", parent_id: 9768633, stem: ".github", extension: "", path: "/Users/starver/code/public/cpython/.github", size: 224, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9770916)
+MERGE (p9770916:Directory {id: 9768633})
+CREATE (p9770916) - [:PARENT_OF] -> (n9770916)
 CREATE (n9770921:File {id: 9770921, tag: "File", name: "codecov.yml", parent_id: 9770916, stem: "codecov", extension: "yml", path: "/Users/starver/code/public/cpython/.github/codecov.yml", size: 482, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770918:File {id: 9770918, tag: "File", name: "CONTRIBUTING.rst", parent_id: 9770916, stem: "CONTRIBUTING", extension: "rst", path: "/Users/starver/code/public/cpython/.github/CONTRIBUTING.rst", size: 2412, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770917:File {id: 9770917, tag: "File", name: "CODEOWNERS", parent_id: 9770916, stem: "CODEOWNERS", extension: "", path: "/Users/starver/code/public/cpython/.github/CODEOWNERS", size: 2144, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3573,8 +3760,10 @@ CREATE (n9770916) - [:PARENT_OF] -> (n9770918)
 CREATE (n9770916) - [:PARENT_OF] -> (n9770917)
 CREATE (n9770916) - [:PARENT_OF] -> (n9770919)
 CREATE (n9770916) - [:PARENT_OF] -> (n9770920)
+// group 345 64724
 CREATE (n9771638:Directory {id: 9771638, tag: "Directory", name: "Lib", parent_id: 9768633, stem: "Lib", extension: "", path: "/Users/starver/code/public/cpython/Lib", size: 6528, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9771638)
+MERGE (p9771638:Directory {id: 9768633})
+CREATE (p9771638) - [:PARENT_OF] -> (n9771638)
 CREATE (n9773819:File {id: 9773819, tag: "File", name: "zipfile.py", parent_id: 9771638, stem: "zipfile", extension: "py", path: "/Users/starver/code/public/cpython/Lib/zipfile.py", size: 80777, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772477:File {id: 9772477, tag: "File", name: "shutil.py", parent_id: 9771638, stem: "shutil", extension: "py", path: "/Users/starver/code/public/cpython/Lib/shutil.py", size: 47269, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772519:File {id: 9772519, tag: "File", name: "tempfile.py", parent_id: 9771638, stem: "tempfile", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tempfile.py", size: 26696, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -3917,8 +4106,10 @@ CREATE (n9771638) - [:PARENT_OF] -> (n9772504)
 CREATE (n9771638) - [:PARENT_OF] -> (n9771655)
 CREATE (n9771638) - [:PARENT_OF] -> (n9772471)
 CREATE (n9771638) - [:PARENT_OF] -> (n9771641)
+// group 253 48897
 CREATE (n9771950:Directory {id: 9771950, tag: "Directory", name: "encodings", parent_id: 9771638, stem: "encodings", extension: "", path: "/Users/starver/code/public/cpython/Lib/encodings", size: 4064, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771950)
+MERGE (p9771950:Directory {id: 9771638})
+CREATE (p9771950) - [:PARENT_OF] -> (n9771950)
 CREATE (n9772048:File {id: 9772048, tag: "File", name: "mac_romanian.py", parent_id: 9771950, stem: "mac_romanian", extension: "py", path: "/Users/starver/code/public/cpython/Lib/encodings/mac_romanian.py", size: 13661, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772043:File {id: 9772043, tag: "File", name: "mac_farsi.py", parent_id: 9771950, stem: "mac_farsi", extension: "py", path: "/Users/starver/code/public/cpython/Lib/encodings/mac_farsi.py", size: 15170, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772010:File {id: 9772010, tag: "File", name: "idna.py", parent_id: 9771950, stem: "idna", extension: "py", path: "/Users/starver/code/public/cpython/Lib/encodings/idna.py", size: 9170, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4169,8 +4360,10 @@ CREATE (n9771950) - [:PARENT_OF] -> (n9771958)
 CREATE (n9771950) - [:PARENT_OF] -> (n9772028)
 CREATE (n9771950) - [:PARENT_OF] -> (n9772021)
 CREATE (n9771950) - [:PARENT_OF] -> (n9772011)
+// group 61 11729
 CREATE (n9771806:Directory {id: 9771806, tag: "Directory", name: "distutils", parent_id: 9771638, stem: "distutils", extension: "", path: "/Users/starver/code/public/cpython/Lib/distutils", size: 1056, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771806)
+MERGE (p9771806:Directory {id: 9771638})
+CREATE (p9771806) - [:PARENT_OF] -> (n9771806)
 CREATE (n9771809:File {id: 9771809, tag: "File", name: "_msvccompiler.py", parent_id: 9771806, stem: "_msvccompiler", extension: "py", path: "/Users/starver/code/public/cpython/Lib/distutils/_msvccompiler.py", size: 21590, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771912:File {id: 9771912, tag: "File", name: "unixccompiler.py", parent_id: 9771806, stem: "unixccompiler", extension: "py", path: "/Users/starver/code/public/cpython/Lib/distutils/unixccompiler.py", size: 14373, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771859:File {id: 9771859, tag: "File", name: "filelist.py", parent_id: 9771806, stem: "filelist", extension: "py", path: "/Users/starver/code/public/cpython/Lib/distutils/filelist.py", size: 12832, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4229,8 +4422,10 @@ CREATE (n9771806) - [:PARENT_OF] -> (n9771853)
 CREATE (n9771806) - [:PARENT_OF] -> (n9771864)
 CREATE (n9771806) - [:PARENT_OF] -> (n9771854)
 CREATE (n9771806) - [:PARENT_OF] -> (n9771811)
+// group 93 18879
 CREATE (n9771865:Directory {id: 9771865, tag: "Directory", name: "tests", parent_id: 9771806, stem: "tests", extension: "", path: "/Users/starver/code/public/cpython/Lib/distutils/tests", size: 1504, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771806) - [:PARENT_OF] -> (n9771865)
+MERGE (p9771865:Directory {id: 9771806})
+CREATE (p9771865) - [:PARENT_OF] -> (n9771865)
 CREATE (n9771870:File {id: 9771870, tag: "File", name: "test_bdist.py", parent_id: 9771865, stem: "test_bdist", extension: "py", path: "/Users/starver/code/public/cpython/Lib/distutils/tests/test_bdist.py", size: 1680, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771905:File {id: 9771905, tag: "File", name: "test_text_file.py", parent_id: 9771865, stem: "test_text_file", extension: "py", path: "/Users/starver/code/public/cpython/Lib/distutils/tests/test_text_file.py", size: 3436, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771874:File {id: 9771874, tag: "File", name: "test_bdist_wininst.py", parent_id: 9771865, stem: "test_bdist_wininst", extension: "py", path: "/Users/starver/code/public/cpython/Lib/distutils/tests/test_bdist_wininst.py", size: 1158, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4321,8 +4516,10 @@ CREATE (n9771865) - [:PARENT_OF] -> (n9771893)
 CREATE (n9771865) - [:PARENT_OF] -> (n9771884)
 CREATE (n9771865) - [:PARENT_OF] -> (n9771902)
 CREATE (n9771865) - [:PARENT_OF] -> (n9771869)
+// group 69 13786
 CREATE (n9771814:Directory {id: 9771814, tag: "Directory", name: "command", parent_id: 9771806, stem: "command", extension: "", path: "/Users/starver/code/public/cpython/Lib/distutils/command", size: 1120, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771806) - [:PARENT_OF] -> (n9771814)
+MERGE (p9771814:Directory {id: 9771806})
+CREATE (p9771814) - [:PARENT_OF] -> (n9771814)
 CREATE (n9771844:File {id: 9771844, tag: "File", name: "wininst-7.1.exe", parent_id: 9771814, stem: "wininst-7.1", extension: "exe", path: "/Users/starver/code/public/cpython/Lib/distutils/command/wininst-7.1.exe", size: 65536, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771821:File {id: 9771821, tag: "File", name: "build.py", parent_id: 9771814, stem: "build", extension: "py", path: "/Users/starver/code/public/cpython/Lib/distutils/command/build.py", size: 5748, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771823:File {id: 9771823, tag: "File", name: "build_ext.py", parent_id: 9771814, stem: "build_ext", extension: "py", path: "/Users/starver/code/public/cpython/Lib/distutils/command/build_ext.py", size: 30358, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4389,8 +4586,10 @@ CREATE (n9771814) - [:PARENT_OF] -> (n9771818)
 CREATE (n9771814) - [:PARENT_OF] -> (n9771847)
 CREATE (n9771814) - [:PARENT_OF] -> (n9771832)
 CREATE (n9771814) - [:PARENT_OF] -> (n9771831)
+// group 13 2315
 CREATE (n9771722:Directory {id: 9771722, tag: "Directory", name: "ctypes", parent_id: 9771638, stem: "ctypes", extension: "", path: "/Users/starver/code/public/cpython/Lib/ctypes", size: 288, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771722)
+MERGE (p9771722:Directory {id: 9771638})
+CREATE (p9771722) - [:PARENT_OF] -> (n9771722)
 CREATE (n9771724:File {id: 9771724, tag: "File", name: "_aix.py", parent_id: 9771722, stem: "_aix", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ctypes/_aix.py", size: 12567, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771789:File {id: 9771789, tag: "File", name: "wintypes.py", parent_id: 9771722, stem: "wintypes", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ctypes/wintypes.py", size: 5628, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771788:File {id: 9771788, tag: "File", name: "util.py", parent_id: 9771722, stem: "util", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ctypes/util.py", size: 13079, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4401,8 +4600,10 @@ CREATE (n9771722) - [:PARENT_OF] -> (n9771789)
 CREATE (n9771722) - [:PARENT_OF] -> (n9771788)
 CREATE (n9771722) - [:PARENT_OF] -> (n9771723)
 CREATE (n9771722) - [:PARENT_OF] -> (n9771725)
+// group 109 21929
 CREATE (n9771734:Directory {id: 9771734, tag: "Directory", name: "test", parent_id: 9771722, stem: "test", extension: "", path: "/Users/starver/code/public/cpython/Lib/ctypes/test", size: 1760, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771722) - [:PARENT_OF] -> (n9771734)
+MERGE (p9771734:Directory {id: 9771722})
+CREATE (p9771734) - [:PARENT_OF] -> (n9771734)
 CREATE (n9771738:File {id: 9771738, tag: "File", name: "test_array_in_pointer.py", parent_id: 9771734, stem: "test_array_in_pointer", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ctypes/test/test_array_in_pointer.py", size: 1738, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771771:File {id: 9771771, tag: "File", name: "test_random_things.py", parent_id: 9771734, stem: "test_random_things", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ctypes/test/test_random_things.py", size: 2827, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771753:File {id: 9771753, tag: "File", name: "test_funcptr.py", parent_id: 9771734, stem: "test_funcptr", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ctypes/test/test_funcptr.py", size: 4026, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4509,8 +4710,10 @@ CREATE (n9771734) - [:PARENT_OF] -> (n9771736)
 CREATE (n9771734) - [:PARENT_OF] -> (n9771764)
 CREATE (n9771734) - [:PARENT_OF] -> (n9771776)
 CREATE (n9771734) - [:PARENT_OF] -> (n9771786)
+// group 17 3198
 CREATE (n9771726:Directory {id: 9771726, tag: "Directory", name: "macholib", parent_id: 9771722, stem: "macholib", extension: "", path: "/Users/starver/code/public/cpython/Lib/ctypes/macholib", size: 288, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771722) - [:PARENT_OF] -> (n9771726)
+MERGE (p9771726:Directory {id: 9771722})
+CREATE (p9771726) - [:PARENT_OF] -> (n9771726)
 CREATE (n9771729:File {id: 9771729, tag: "File", name: "dyld.py", parent_id: 9771726, stem: "dyld", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ctypes/macholib/dyld.py", size: 4933, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771733:File {id: 9771733, tag: "File", name: "framework.py", parent_id: 9771726, stem: "framework", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ctypes/macholib/framework.py", size: 2201, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771731:File {id: 9771731, tag: "File", name: "fetch_macholib", parent_id: 9771726, stem: "fetch_macholib", extension: "", path: "/Users/starver/code/public/cpython/Lib/ctypes/macholib/fetch_macholib", size: 84, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
@@ -4525,8 +4728,10 @@ CREATE (n9771726) - [:PARENT_OF] -> (n9771728)
 CREATE (n9771726) - [:PARENT_OF] -> (n9771727)
 CREATE (n9771726) - [:PARENT_OF] -> (n9771732)
 CREATE (n9771726) - [:PARENT_OF] -> (n9771730)
+// group 25 4603
 CREATE (n9773711:Directory {id: 9773711, tag: "Directory", name: "unittest", parent_id: 9771638, stem: "unittest", extension: "", path: "/Users/starver/code/public/cpython/Lib/unittest", size: 448, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9773711)
+MERGE (p9773711:Directory {id: 9771638})
+CREATE (p9773711) - [:PARENT_OF] -> (n9773711)
 CREATE (n9773720:File {id: 9773720, tag: "File", name: "signals.py", parent_id: 9773711, stem: "signals", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/signals.py", size: 2403, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773719:File {id: 9773719, tag: "File", name: "runner.py", parent_id: 9773711, stem: "runner", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/runner.py", size: 7767, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773721:File {id: 9773721, tag: "File", name: "suite.py", parent_id: 9773711, stem: "suite", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/suite.py", size: 12815, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4549,8 +4754,10 @@ CREATE (n9773711) - [:PARENT_OF] -> (n9773714)
 CREATE (n9773711) - [:PARENT_OF] -> (n9773716)
 CREATE (n9773711) - [:PARENT_OF] -> (n9773713)
 CREATE (n9773711) - [:PARENT_OF] -> (n9773717)
+// group 37 7248
 CREATE (n9773722:Directory {id: 9773722, tag: "Directory", name: "test", parent_id: 9773711, stem: "test", extension: "", path: "/Users/starver/code/public/cpython/Lib/unittest/test", size: 640, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773711) - [:PARENT_OF] -> (n9773722)
+MERGE (p9773722:Directory {id: 9773711})
+CREATE (p9773722) - [:PARENT_OF] -> (n9773722)
 CREATE (n9773735:File {id: 9773735, tag: "File", name: "test_result.py", parent_id: 9773722, stem: "test_result", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/test/test_result.py", size: 25000, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773727:File {id: 9773727, tag: "File", name: "support.py", parent_id: 9773722, stem: "support", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/test/support.py", size: 3752, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773733:File {id: 9773733, tag: "File", name: "test_loader.py", parent_id: 9773722, stem: "test_loader", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/test/test_loader.py", size: 62687, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4585,8 +4792,10 @@ CREATE (n9773722) - [:PARENT_OF] -> (n9773728)
 CREATE (n9773722) - [:PARENT_OF] -> (n9773725)
 CREATE (n9773722) - [:PARENT_OF] -> (n9773726)
 CREATE (n9773722) - [:PARENT_OF] -> (n9773724)
+// group 25 4916
 CREATE (n9773740:Directory {id: 9773740, tag: "Directory", name: "testmock", parent_id: 9773722, stem: "testmock", extension: "", path: "/Users/starver/code/public/cpython/Lib/unittest/test/testmock", size: 416, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773722) - [:PARENT_OF] -> (n9773740)
+MERGE (p9773740:Directory {id: 9773722})
+CREATE (p9773740) - [:PARENT_OF] -> (n9773740)
 CREATE (n9773743:File {id: 9773743, tag: "File", name: "support.py", parent_id: 9773740, stem: "support", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/test/testmock/support.py", size: 250, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773744:File {id: 9773744, tag: "File", name: "testcallable.py", parent_id: 9773740, stem: "testcallable", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/test/testmock/testcallable.py", size: 4283, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773741:File {id: 9773741, tag: "File", name: "__init__.py", parent_id: 9773740, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/unittest/test/testmock/__init__.py", size: 465, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4609,8 +4818,10 @@ CREATE (n9773740) - [:PARENT_OF] -> (n9773748)
 CREATE (n9773740) - [:PARENT_OF] -> (n9773749)
 CREATE (n9773740) - [:PARENT_OF] -> (n9773750)
 CREATE (n9773740) - [:PARENT_OF] -> (n9773742)
+// group 13 2313
 CREATE (n9771790:Directory {id: 9771790, tag: "Directory", name: "curses", parent_id: 9771638, stem: "curses", extension: "", path: "/Users/starver/code/public/cpython/Lib/curses", size: 224, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771790)
+MERGE (p9771790:Directory {id: 9771638})
+CREATE (p9771790) - [:PARENT_OF] -> (n9771790)
 CREATE (n9771795:File {id: 9771795, tag: "File", name: "textpad.py", parent_id: 9771790, stem: "textpad", extension: "py", path: "/Users/starver/code/public/cpython/Lib/curses/textpad.py", size: 7657, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771792:File {id: 9771792, tag: "File", name: "ascii.py", parent_id: 9771790, stem: "ascii", extension: "py", path: "/Users/starver/code/public/cpython/Lib/curses/ascii.py", size: 2547, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771791:File {id: 9771791, tag: "File", name: "__init__.py", parent_id: 9771790, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/curses/__init__.py", size: 3366, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -4621,8 +4832,10 @@ CREATE (n9771790) - [:PARENT_OF] -> (n9771792)
 CREATE (n9771790) - [:PARENT_OF] -> (n9771791)
 CREATE (n9771790) - [:PARENT_OF] -> (n9771793)
 CREATE (n9771790) - [:PARENT_OF] -> (n9771794)
+// group 1095 218095
 CREATE (n9772520:Directory {id: 9772520, tag: "Directory", name: "test", parent_id: 9771638, stem: "test", extension: "", path: "/Users/starver/code/public/cpython/Lib/test", size: 18304, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772520)
+MERGE (p9772520:Directory {id: 9771638})
+CREATE (p9772520) - [:PARENT_OF] -> (n9772520)
 CREATE (n9773550:File {id: 9773550, tag: "File", name: "test_tracemalloc.py", parent_id: 9772520, stem: "test_tracemalloc", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_tracemalloc.py", size: 38304, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773452:File {id: 9773452, tag: "File", name: "test_quopri.py", parent_id: 9772520, stem: "test_quopri", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_quopri.py", size: 7962, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773597:File {id: 9773597, tag: "File", name: "test_winreg.py", parent_id: 9772520, stem: "test_winreg", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_winreg.py", size: 21678, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5715,12 +5928,16 @@ CREATE (n9772520) - [:PARENT_OF] -> (n9773405)
 CREATE (n9772520) - [:PARENT_OF] -> (n9772802)
 CREATE (n9772520) - [:PARENT_OF] -> (n9772773)
 CREATE (n9772520) - [:PARENT_OF] -> (n9773170)
+// group 5 833
 CREATE (n9772791:Directory {id: 9772791, tag: "Directory", name: "eintrdata", parent_id: 9772520, stem: "eintrdata", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/eintrdata", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772791)
+MERGE (p9772791:Directory {id: 9772520})
+CREATE (p9772791) - [:PARENT_OF] -> (n9772791)
 CREATE (n9772792:File {id: 9772792, tag: "File", name: "eintr_tester.py", parent_id: 9772791, stem: "eintr_tester", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/eintrdata/eintr_tester.py", size: 17948, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772791) - [:PARENT_OF] -> (n9772792)
+// group 19 3730
 CREATE (n9772610:Directory {id: 9772610, tag: "Directory", name: "crashers", parent_id: 9772520, stem: "crashers", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/crashers", size: 320, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772610)
+MERGE (p9772610:Directory {id: 9772520})
+CREATE (p9772610) - [:PARENT_OF] -> (n9772610)
 CREATE (n9772613:File {id: 9772613, tag: "File", name: "gc_inspection.py", parent_id: 9772610, stem: "gc_inspection", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/crashers/gc_inspection.py", size: 1092, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772617:File {id: 9772617, tag: "File", name: "trace_at_recursion_limit.py", parent_id: 9772610, stem: "trace_at_recursion_limit", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/crashers/trace_at_recursion_limit.py", size: 376, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772618:File {id: 9772618, tag: "File", name: "underlying_dict.py", parent_id: 9772610, stem: "underlying_dict", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/crashers/underlying_dict.py", size: 282, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5737,8 +5954,10 @@ CREATE (n9772610) - [:PARENT_OF] -> (n9772615)
 CREATE (n9772610) - [:PARENT_OF] -> (n9772611)
 CREATE (n9772610) - [:PARENT_OF] -> (n9772612)
 CREATE (n9772610) - [:PARENT_OF] -> (n9772616)
+// group 41 8103
 CREATE (n9773355:Directory {id: 9773355, tag: "Directory", name: "test_json", parent_id: 9772520, stem: "test_json", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_json", size: 672, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9773355)
+MERGE (p9773355:Directory {id: 9772520})
+CREATE (p9773355) - [:PARENT_OF] -> (n9773355)
 CREATE (n9773365:File {id: 9773365, tag: "File", name: "test_indent.py", parent_id: 9773355, stem: "test_indent", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_json/test_indent.py", size: 1824, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773374:File {id: 9773374, tag: "File", name: "test_unicode.py", parent_id: 9773355, stem: "test_unicode", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_json/test_unicode.py", size: 4132, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773368:File {id: 9773368, tag: "File", name: "test_pass3.py", parent_id: 9773355, stem: "test_pass3", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_json/test_pass3.py", size: 544, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5777,8 +5996,10 @@ CREATE (n9773355) - [:PARENT_OF] -> (n9773364)
 CREATE (n9773355) - [:PARENT_OF] -> (n9773373)
 CREATE (n9773355) - [:PARENT_OF] -> (n9773357)
 CREATE (n9773355) - [:PARENT_OF] -> (n9773362)
+// group 25 4856
 CREATE (n9773536:Directory {id: 9773536, tag: "Directory", name: "test_tools", parent_id: 9772520, stem: "test_tools", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_tools", size: 416, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9773536)
+MERGE (p9773536:Directory {id: 9772520})
+CREATE (p9773536) - [:PARENT_OF] -> (n9773536)
 CREATE (n9773547:File {id: 9773547, tag: "File", name: "test_unparse.py", parent_id: 9773536, stem: "test_unparse", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_tools/test_unparse.py", size: 8393, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773540:File {id: 9773540, tag: "File", name: "test_gprof2html.py", parent_id: 9773536, stem: "test_gprof2html", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_tools/test_gprof2html.py", size: 919, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773545:File {id: 9773545, tag: "File", name: "test_reindent.py", parent_id: 9773536, stem: "test_reindent", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_tools/test_reindent.py", size: 1006, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5801,8 +6022,10 @@ CREATE (n9773536) - [:PARENT_OF] -> (n9773543)
 CREATE (n9773536) - [:PARENT_OF] -> (n9773544)
 CREATE (n9773536) - [:PARENT_OF] -> (n9773539)
 CREATE (n9773536) - [:PARENT_OF] -> (n9773538)
+// group 33 6497
 CREATE (n9772529:Directory {id: 9772529, tag: "Directory", name: "audiodata", parent_id: 9772520, stem: "audiodata", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/audiodata", size: 544, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772529)
+MERGE (p9772529:Directory {id: 9772520})
+CREATE (p9772529) - [:PARENT_OF] -> (n9772529)
 CREATE (n9772531:File {id: 9772531, tag: "File", name: "pluck-pcm16.aiff", parent_id: 9772529, stem: "pluck-pcm16", extension: "aiff", path: "/Users/starver/code/public/cpython/Lib/test/audiodata/pluck-pcm16.aiff", size: 13506, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772536:File {id: 9772536, tag: "File", name: "pluck-pcm24.wav", parent_id: 9772529, stem: "pluck-pcm24", extension: "wav", path: "/Users/starver/code/public/cpython/Lib/test/audiodata/pluck-pcm24.wav", size: 19984, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772539:File {id: 9772539, tag: "File", name: "pluck-pcm32.wav", parent_id: 9772529, stem: "pluck-pcm32", extension: "wav", path: "/Users/starver/code/public/cpython/Lib/test/audiodata/pluck-pcm32.wav", size: 26598, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5833,8 +6056,10 @@ CREATE (n9772529) - [:PARENT_OF] -> (n9772530)
 CREATE (n9772529) - [:PARENT_OF] -> (n9772538)
 CREATE (n9772529) - [:PARENT_OF] -> (n9772532)
 CREATE (n9772529) - [:PARENT_OF] -> (n9772541)
+// group 35 6871
 CREATE (n9773226:Directory {id: 9773226, tag: "Directory", name: "test_importlib", parent_id: 9772520, stem: "test_importlib", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib", size: 928, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9773226)
+MERGE (p9773226:Directory {id: 9772520})
+CREATE (p9773226) - [:PARENT_OF] -> (n9773226)
 CREATE (n9773333:File {id: 9773333, tag: "File", name: "test_resource.py", parent_id: 9773226, stem: "test_resource", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/test_resource.py", size: 6243, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773337:File {id: 9773337, tag: "File", name: "util.py", parent_id: 9773226, stem: "util", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/util.py", size: 18206, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773334:File {id: 9773334, tag: "File", name: "test_spec.py", parent_id: 9773226, stem: "test_spec", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/test_spec.py", size: 30498, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5867,8 +6092,10 @@ CREATE (n9773226) - [:PARENT_OF] -> (n9773336)
 CREATE (n9773226) - [:PARENT_OF] -> (n9773228)
 CREATE (n9773226) - [:PARENT_OF] -> (n9773328)
 CREATE (n9773226) - [:PARENT_OF] -> (n9773229)
+// group 15 2963
 CREATE (n9773259:Directory {id: 9773259, tag: "Directory", name: "extension", parent_id: 9773226, stem: "extension", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/extension", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773259)
+MERGE (p9773259:Directory {id: 9773226})
+CREATE (p9773259) - [:PARENT_OF] -> (n9773259)
 CREATE (n9773264:File {id: 9773264, tag: "File", name: "test_loader.py", parent_id: 9773259, stem: "test_loader", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/extension/test_loader.py", size: 11897, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773260:File {id: 9773260, tag: "File", name: "__init__.py", parent_id: 9773259, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/extension/__init__.py", size: 142, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773263:File {id: 9773263, tag: "File", name: "test_finder.py", parent_id: 9773259, stem: "test_finder", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/extension/test_finder.py", size: 1272, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5881,14 +6108,18 @@ CREATE (n9773259) - [:PARENT_OF] -> (n9773263)
 CREATE (n9773259) - [:PARENT_OF] -> (n9773262)
 CREATE (n9773259) - [:PARENT_OF] -> (n9773265)
 CREATE (n9773259) - [:PARENT_OF] -> (n9773261)
+// group 7 1267
 CREATE (n9773338:Directory {id: 9773338, tag: "Directory", name: "zipdata01", parent_id: 9773226, stem: "zipdata01", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/zipdata01", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773338)
+MERGE (p9773338:Directory {id: 9773226})
+CREATE (p9773338) - [:PARENT_OF] -> (n9773338)
 CREATE (n9773340:File {id: 9773340, tag: "File", name: "ziptestdata.zip", parent_id: 9773338, stem: "ziptestdata", extension: "zip", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/zipdata01/ziptestdata.zip", size: 876, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773339:File {id: 9773339, tag: "File", name: "__init__.py", parent_id: 9773338, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/zipdata01/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773338) - [:PARENT_OF] -> (n9773340)
 CREATE (n9773338) - [:PARENT_OF] -> (n9773339)
+// group 17 3393
 CREATE (n9773317:Directory {id: 9773317, tag: "Directory", name: "source", parent_id: 9773226, stem: "source", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/source", size: 288, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773317)
+MERGE (p9773317:Directory {id: 9773226})
+CREATE (p9773317) - [:PARENT_OF] -> (n9773317)
 CREATE (n9773324:File {id: 9773324, tag: "File", name: "test_source_encoding.py", parent_id: 9773317, stem: "test_source_encoding", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/source/test_source_encoding.py", size: 5330, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773321:File {id: 9773321, tag: "File", name: "test_file_loader.py", parent_id: 9773317, stem: "test_file_loader", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/source/test_file_loader.py", size: 32450, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773318:File {id: 9773318, tag: "File", name: "__init__.py", parent_id: 9773317, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/source/__init__.py", size: 142, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5903,40 +6134,56 @@ CREATE (n9773317) - [:PARENT_OF] -> (n9773322)
 CREATE (n9773317) - [:PARENT_OF] -> (n9773320)
 CREATE (n9773317) - [:PARENT_OF] -> (n9773323)
 CREATE (n9773317) - [:PARENT_OF] -> (n9773319)
+// group 5 836
 CREATE (n9773243:Directory {id: 9773243, tag: "Directory", name: "data02", parent_id: 9773226, stem: "data02", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data02", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773243)
+MERGE (p9773243:Directory {id: 9773226})
+CREATE (p9773243) - [:PARENT_OF] -> (n9773243)
 CREATE (n9773244:File {id: 9773244, tag: "File", name: "__init__.py", parent_id: 9773243, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data02/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773243) - [:PARENT_OF] -> (n9773244)
+// group 7 1251
 CREATE (n9773245:Directory {id: 9773245, tag: "Directory", name: "one", parent_id: 9773243, stem: "one", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data02/one", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773243) - [:PARENT_OF] -> (n9773245)
+MERGE (p9773245:Directory {id: 9773243})
+CREATE (p9773245) - [:PARENT_OF] -> (n9773245)
 CREATE (n9773246:File {id: 9773246, tag: "File", name: "__init__.py", parent_id: 9773245, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data02/one/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773247:File {id: 9773247, tag: "File", name: "resource1.txt", parent_id: 9773245, stem: "resource1", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data02/one/resource1.txt", size: 13, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773245) - [:PARENT_OF] -> (n9773246)
 CREATE (n9773245) - [:PARENT_OF] -> (n9773247)
+// group 7 1251
 CREATE (n9773248:Directory {id: 9773248, tag: "Directory", name: "two", parent_id: 9773243, stem: "two", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data02/two", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773243) - [:PARENT_OF] -> (n9773248)
+MERGE (p9773248:Directory {id: 9773243})
+CREATE (p9773248) - [:PARENT_OF] -> (n9773248)
 CREATE (n9773249:File {id: 9773249, tag: "File", name: "__init__.py", parent_id: 9773248, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data02/two/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773250:File {id: 9773250, tag: "File", name: "resource2.txt", parent_id: 9773248, stem: "resource2", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data02/two/resource2.txt", size: 13, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773248) - [:PARENT_OF] -> (n9773249)
 CREATE (n9773248) - [:PARENT_OF] -> (n9773250)
+// group 5 836
 CREATE (n9773251:Directory {id: 9773251, tag: "Directory", name: "data03", parent_id: 9773226, stem: "data03", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data03", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773251)
+MERGE (p9773251:Directory {id: 9773226})
+CREATE (p9773251) - [:PARENT_OF] -> (n9773251)
 CREATE (n9773252:File {id: 9773252, tag: "File", name: "__init__.py", parent_id: 9773251, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data03/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773251) - [:PARENT_OF] -> (n9773252)
+// group 5 868
 CREATE (n9773253:Directory {id: 9773253, tag: "Directory", name: "namespace", parent_id: 9773251, stem: "namespace", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data03/namespace", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773251) - [:PARENT_OF] -> (n9773253)
+MERGE (p9773253:Directory {id: 9773251})
+CREATE (p9773253) - [:PARENT_OF] -> (n9773253)
 CREATE (n9773258:File {id: 9773258, tag: "File", name: "resource1.txt", parent_id: 9773253, stem: "resource1", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data03/namespace/resource1.txt", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773253) - [:PARENT_OF] -> (n9773258)
+// group 5 877
 CREATE (n9773256:Directory {id: 9773256, tag: "Directory", name: "portion2", parent_id: 9773253, stem: "portion2", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data03/namespace/portion2", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773253) - [:PARENT_OF] -> (n9773256)
+MERGE (p9773256:Directory {id: 9773253})
+CREATE (p9773256) - [:PARENT_OF] -> (n9773256)
 CREATE (n9773257:File {id: 9773257, tag: "File", name: "__init__.py", parent_id: 9773256, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data03/namespace/portion2/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773256) - [:PARENT_OF] -> (n9773257)
+// group 5 877
 CREATE (n9773254:Directory {id: 9773254, tag: "Directory", name: "portion1", parent_id: 9773253, stem: "portion1", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data03/namespace/portion1", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773253) - [:PARENT_OF] -> (n9773254)
+MERGE (p9773254:Directory {id: 9773253})
+CREATE (p9773254) - [:PARENT_OF] -> (n9773254)
 CREATE (n9773255:File {id: 9773255, tag: "File", name: "__init__.py", parent_id: 9773254, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data03/namespace/portion1/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773254) - [:PARENT_OF] -> (n9773255)
+// group 25 5048
 CREATE (n9773271:Directory {id: 9773271, tag: "Directory", name: "import_", parent_id: 9773226, stem: "import_", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/import_", size: 416, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773271)
+MERGE (p9773271:Directory {id: 9773226})
+CREATE (p9773271) - [:PARENT_OF] -> (n9773271)
 CREATE (n9773280:File {id: 9773280, tag: "File", name: "test_packages.py", parent_id: 9773271, stem: "test_packages", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/import_/test_packages.py", size: 4544, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773274:File {id: 9773274, tag: "File", name: "test___loader__.py", parent_id: 9773271, stem: "test___loader__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/import_/test___loader__.py", size: 1861, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773272:File {id: 9773272, tag: "File", name: "__init__.py", parent_id: 9773271, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/import_/__init__.py", size: 142, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -5959,82 +6206,126 @@ CREATE (n9773271) - [:PARENT_OF] -> (n9773277)
 CREATE (n9773271) - [:PARENT_OF] -> (n9773276)
 CREATE (n9773271) - [:PARENT_OF] -> (n9773281)
 CREATE (n9773271) - [:PARENT_OF] -> (n9773273)
+// group 9 1781
 CREATE (n9773283:Directory {id: 9773283, tag: "Directory", name: "namespace_pkgs", parent_id: 9773226, stem: "namespace_pkgs", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs", size: 416, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773283)
+MERGE (p9773283:Directory {id: 9773226})
+CREATE (p9773283) - [:PARENT_OF] -> (n9773283)
 CREATE (n9773288:File {id: 9773288, tag: "File", name: "missing_directory.zip", parent_id: 9773283, stem: "missing_directory", extension: "zip", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/missing_directory.zip", size: 515, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773293:File {id: 9773293, tag: "File", name: "nested_portion1.zip", parent_id: 9773283, stem: "nested_portion1", extension: "zip", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/nested_portion1.zip", size: 556, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773316:File {id: 9773316, tag: "File", name: "top_level_portion1.zip", parent_id: 9773283, stem: "top_level_portion1", extension: "zip", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/top_level_portion1.zip", size: 332, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773283) - [:PARENT_OF] -> (n9773288)
 CREATE (n9773283) - [:PARENT_OF] -> (n9773293)
 CREATE (n9773283) - [:PARENT_OF] -> (n9773316)
+// group 3 454
 CREATE (n9773304:Directory {id: 9773304, tag: "Directory", name: "project1", parent_id: 9773283, stem: "project1", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project1", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773283) - [:PARENT_OF] -> (n9773304)
+MERGE (p9773304:Directory {id: 9773283})
+CREATE (p9773304) - [:PARENT_OF] -> (n9773304)
+// group 3 457
 CREATE (n9773305:Directory {id: 9773305, tag: "Directory", name: "parent", parent_id: 9773304, stem: "parent", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project1/parent", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773304) - [:PARENT_OF] -> (n9773305)
+MERGE (p9773305:Directory {id: 9773304})
+CREATE (p9773305) - [:PARENT_OF] -> (n9773305)
+// group 5 879
 CREATE (n9773306:Directory {id: 9773306, tag: "Directory", name: "child", parent_id: 9773305, stem: "child", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project1/parent/child", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773305) - [:PARENT_OF] -> (n9773306)
+MERGE (p9773306:Directory {id: 9773305})
+CREATE (p9773306) - [:PARENT_OF] -> (n9773306)
 CREATE (n9773307:File {id: 9773307, tag: "File", name: "one.py", parent_id: 9773306, stem: "one", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project1/parent/child/one.py", size: 26, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773306) - [:PARENT_OF] -> (n9773307)
+// group 3 454
 CREATE (n9773301:Directory {id: 9773301, tag: "Directory", name: "portion2", parent_id: 9773283, stem: "portion2", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/portion2", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773283) - [:PARENT_OF] -> (n9773301)
+MERGE (p9773301:Directory {id: 9773283})
+CREATE (p9773301) - [:PARENT_OF] -> (n9773301)
+// group 5 857
 CREATE (n9773302:Directory {id: 9773302, tag: "Directory", name: "foo", parent_id: 9773301, stem: "foo", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/portion2/foo", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773301) - [:PARENT_OF] -> (n9773302)
+MERGE (p9773302:Directory {id: 9773301})
+CREATE (p9773302) - [:PARENT_OF] -> (n9773302)
 CREATE (n9773303:File {id: 9773303, tag: "File", name: "two.py", parent_id: 9773302, stem: "two", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/portion2/foo/two.py", size: 26, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773302) - [:PARENT_OF] -> (n9773303)
+// group 3 487
 CREATE (n9773294:Directory {id: 9773294, tag: "Directory", name: "not_a_namespace_pkg", parent_id: 9773283, stem: "not_a_namespace_pkg", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/not_a_namespace_pkg", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773283) - [:PARENT_OF] -> (n9773294)
+MERGE (p9773294:Directory {id: 9773283})
+CREATE (p9773294) - [:PARENT_OF] -> (n9773294)
+// group 7 1314
 CREATE (n9773295:Directory {id: 9773295, tag: "Directory", name: "foo", parent_id: 9773294, stem: "foo", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/not_a_namespace_pkg/foo", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773294) - [:PARENT_OF] -> (n9773295)
+MERGE (p9773295:Directory {id: 9773294})
+CREATE (p9773295) - [:PARENT_OF] -> (n9773295)
 CREATE (n9773297:File {id: 9773297, tag: "File", name: "one.py", parent_id: 9773295, stem: "one", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/not_a_namespace_pkg/foo/one.py", size: 26, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773296:File {id: 9773296, tag: "File", name: "__init__.py", parent_id: 9773295, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/not_a_namespace_pkg/foo/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773295) - [:PARENT_OF] -> (n9773297)
 CREATE (n9773295) - [:PARENT_OF] -> (n9773296)
+// group 3 454
 CREATE (n9773312:Directory {id: 9773312, tag: "Directory", name: "project3", parent_id: 9773283, stem: "project3", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project3", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773283) - [:PARENT_OF] -> (n9773312)
+MERGE (p9773312:Directory {id: 9773283})
+CREATE (p9773312) - [:PARENT_OF] -> (n9773312)
+// group 3 457
 CREATE (n9773313:Directory {id: 9773313, tag: "Directory", name: "parent", parent_id: 9773312, stem: "parent", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project3/parent", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773312) - [:PARENT_OF] -> (n9773313)
+MERGE (p9773313:Directory {id: 9773312})
+CREATE (p9773313) - [:PARENT_OF] -> (n9773313)
+// group 5 885
 CREATE (n9773314:Directory {id: 9773314, tag: "Directory", name: "child", parent_id: 9773313, stem: "child", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project3/parent/child", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773313) - [:PARENT_OF] -> (n9773314)
+MERGE (p9773314:Directory {id: 9773313})
+CREATE (p9773314) - [:PARENT_OF] -> (n9773314)
 CREATE (n9773315:File {id: 9773315, tag: "File", name: "three.py", parent_id: 9773314, stem: "three", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project3/parent/child/three.py", size: 28, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773314) - [:PARENT_OF] -> (n9773315)
+// group 3 454
 CREATE (n9773308:Directory {id: 9773308, tag: "Directory", name: "project2", parent_id: 9773283, stem: "project2", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project2", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773283) - [:PARENT_OF] -> (n9773308)
+MERGE (p9773308:Directory {id: 9773283})
+CREATE (p9773308) - [:PARENT_OF] -> (n9773308)
+// group 3 457
 CREATE (n9773309:Directory {id: 9773309, tag: "Directory", name: "parent", parent_id: 9773308, stem: "parent", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project2/parent", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773308) - [:PARENT_OF] -> (n9773309)
+MERGE (p9773309:Directory {id: 9773308})
+CREATE (p9773309) - [:PARENT_OF] -> (n9773309)
+// group 5 879
 CREATE (n9773310:Directory {id: 9773310, tag: "Directory", name: "child", parent_id: 9773309, stem: "child", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project2/parent/child", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773309) - [:PARENT_OF] -> (n9773310)
+MERGE (p9773310:Directory {id: 9773309})
+CREATE (p9773310) - [:PARENT_OF] -> (n9773310)
 CREATE (n9773311:File {id: 9773311, tag: "File", name: "two.py", parent_id: 9773310, stem: "two", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/project2/parent/child/two.py", size: 26, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773310) - [:PARENT_OF] -> (n9773311)
+// group 5 949
 CREATE (n9773289:Directory {id: 9773289, tag: "Directory", name: "module_and_namespace_package", parent_id: 9773283, stem: "module_and_namespace_package", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/module_and_namespace_package", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773283) - [:PARENT_OF] -> (n9773289)
+MERGE (p9773289:Directory {id: 9773283})
+CREATE (p9773289) - [:PARENT_OF] -> (n9773289)
 CREATE (n9773290:File {id: 9773290, tag: "File", name: "a_test.py", parent_id: 9773289, stem: "a_test", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/module_and_namespace_package/a_test.py", size: 19, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773289) - [:PARENT_OF] -> (n9773290)
+// group 5 906
 CREATE (n9773291:Directory {id: 9773291, tag: "Directory", name: "a_test", parent_id: 9773289, stem: "a_test", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/module_and_namespace_package/a_test", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773289) - [:PARENT_OF] -> (n9773291)
+MERGE (p9773291:Directory {id: 9773289})
+CREATE (p9773291) - [:PARENT_OF] -> (n9773291)
 CREATE (n9773292:File {id: 9773292, tag: "File", name: "empty", parent_id: 9773291, stem: "empty", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/module_and_namespace_package/a_test/empty", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773291) - [:PARENT_OF] -> (n9773292)
+// group 3 469
 CREATE (n9773284:Directory {id: 9773284, tag: "Directory", name: "both_portions", parent_id: 9773283, stem: "both_portions", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/both_portions", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773283) - [:PARENT_OF] -> (n9773284)
+MERGE (p9773284:Directory {id: 9773283})
+CREATE (p9773284) - [:PARENT_OF] -> (n9773284)
+// group 7 1282
 CREATE (n9773285:Directory {id: 9773285, tag: "Directory", name: "foo", parent_id: 9773284, stem: "foo", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/both_portions/foo", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773284) - [:PARENT_OF] -> (n9773285)
+MERGE (p9773285:Directory {id: 9773284})
+CREATE (p9773285) - [:PARENT_OF] -> (n9773285)
 CREATE (n9773286:File {id: 9773286, tag: "File", name: "one.py", parent_id: 9773285, stem: "one", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/both_portions/foo/one.py", size: 31, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773287:File {id: 9773287, tag: "File", name: "two.py", parent_id: 9773285, stem: "two", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/both_portions/foo/two.py", size: 31, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773285) - [:PARENT_OF] -> (n9773286)
 CREATE (n9773285) - [:PARENT_OF] -> (n9773287)
+// group 3 454
 CREATE (n9773298:Directory {id: 9773298, tag: "Directory", name: "portion1", parent_id: 9773283, stem: "portion1", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/portion1", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773283) - [:PARENT_OF] -> (n9773298)
+MERGE (p9773298:Directory {id: 9773283})
+CREATE (p9773298) - [:PARENT_OF] -> (n9773298)
+// group 5 857
 CREATE (n9773299:Directory {id: 9773299, tag: "Directory", name: "foo", parent_id: 9773298, stem: "foo", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/portion1/foo", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773298) - [:PARENT_OF] -> (n9773299)
+MERGE (p9773299:Directory {id: 9773298})
+CREATE (p9773299) - [:PARENT_OF] -> (n9773299)
 CREATE (n9773300:File {id: 9773300, tag: "File", name: "one.py", parent_id: 9773299, stem: "one", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/namespace_pkgs/portion1/foo/one.py", size: 26, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773299) - [:PARENT_OF] -> (n9773300)
+// group 7 1267
 CREATE (n9773341:Directory {id: 9773341, tag: "Directory", name: "zipdata02", parent_id: 9773226, stem: "zipdata02", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/zipdata02", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773341)
+MERGE (p9773341:Directory {id: 9773226})
+CREATE (p9773341) - [:PARENT_OF] -> (n9773341)
 CREATE (n9773343:File {id: 9773343, tag: "File", name: "ziptestdata.zip", parent_id: 9773341, stem: "ziptestdata", extension: "zip", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/zipdata02/ziptestdata.zip", size: 698, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773342:File {id: 9773342, tag: "File", name: "__init__.py", parent_id: 9773341, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/zipdata02/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773341) - [:PARENT_OF] -> (n9773343)
 CREATE (n9773341) - [:PARENT_OF] -> (n9773342)
+// group 11 2069
 CREATE (n9773266:Directory {id: 9773266, tag: "Directory", name: "frozen", parent_id: 9773226, stem: "frozen", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/frozen", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773266)
+MERGE (p9773266:Directory {id: 9773226})
+CREATE (p9773266) - [:PARENT_OF] -> (n9773266)
 CREATE (n9773270:File {id: 9773270, tag: "File", name: "test_loader.py", parent_id: 9773266, stem: "test_loader", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/frozen/test_loader.py", size: 9339, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773267:File {id: 9773267, tag: "File", name: "__init__.py", parent_id: 9773266, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/frozen/__init__.py", size: 142, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773269:File {id: 9773269, tag: "File", name: "test_finder.py", parent_id: 9773266, stem: "test_finder", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/frozen/test_finder.py", size: 2105, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6043,8 +6334,10 @@ CREATE (n9773266) - [:PARENT_OF] -> (n9773270)
 CREATE (n9773266) - [:PARENT_OF] -> (n9773267)
 CREATE (n9773266) - [:PARENT_OF] -> (n9773269)
 CREATE (n9773266) - [:PARENT_OF] -> (n9773268)
+// group 11 2076
 CREATE (n9773230:Directory {id: 9773230, tag: "Directory", name: "builtin", parent_id: 9773226, stem: "builtin", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/builtin", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773230)
+MERGE (p9773230:Directory {id: 9773226})
+CREATE (p9773230) - [:PARENT_OF] -> (n9773230)
 CREATE (n9773234:File {id: 9773234, tag: "File", name: "test_loader.py", parent_id: 9773230, stem: "test_loader", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/builtin/test_loader.py", size: 3741, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773231:File {id: 9773231, tag: "File", name: "__init__.py", parent_id: 9773230, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/builtin/__init__.py", size: 142, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773233:File {id: 9773233, tag: "File", name: "test_finder.py", parent_id: 9773230, stem: "test_finder", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/builtin/test_finder.py", size: 2891, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6053,8 +6346,10 @@ CREATE (n9773230) - [:PARENT_OF] -> (n9773234)
 CREATE (n9773230) - [:PARENT_OF] -> (n9773231)
 CREATE (n9773230) - [:PARENT_OF] -> (n9773233)
 CREATE (n9773230) - [:PARENT_OF] -> (n9773232)
+// group 11 2041
 CREATE (n9773235:Directory {id: 9773235, tag: "Directory", name: "data01", parent_id: 9773226, stem: "data01", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data01", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773226) - [:PARENT_OF] -> (n9773235)
+MERGE (p9773235:Directory {id: 9773226})
+CREATE (p9773235) - [:PARENT_OF] -> (n9773235)
 CREATE (n9773241:File {id: 9773241, tag: "File", name: "utf-16.file", parent_id: 9773235, stem: "utf-16", extension: "file", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data01/utf-16.file", size: 44, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773242:File {id: 9773242, tag: "File", name: "utf-8.file", parent_id: 9773235, stem: "utf-8", extension: "file", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data01/utf-8.file", size: 20, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773236:File {id: 9773236, tag: "File", name: "__init__.py", parent_id: 9773235, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data01/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6063,14 +6358,18 @@ CREATE (n9773235) - [:PARENT_OF] -> (n9773241)
 CREATE (n9773235) - [:PARENT_OF] -> (n9773242)
 CREATE (n9773235) - [:PARENT_OF] -> (n9773236)
 CREATE (n9773235) - [:PARENT_OF] -> (n9773237)
+// group 7 1289
 CREATE (n9773238:Directory {id: 9773238, tag: "Directory", name: "subdirectory", parent_id: 9773235, stem: "subdirectory", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data01/subdirectory", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773235) - [:PARENT_OF] -> (n9773238)
+MERGE (p9773238:Directory {id: 9773235})
+CREATE (p9773238) - [:PARENT_OF] -> (n9773238)
 CREATE (n9773239:File {id: 9773239, tag: "File", name: "__init__.py", parent_id: 9773238, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data01/subdirectory/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773240:File {id: 9773240, tag: "File", name: "binary.file", parent_id: 9773238, stem: "binary", extension: "file", path: "/Users/starver/code/public/cpython/Lib/test/test_importlib/data01/subdirectory/binary.file", size: 4, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773238) - [:PARENT_OF] -> (n9773239)
 CREATE (n9773238) - [:PARENT_OF] -> (n9773240)
+// group 35 6778
 CREATE (n9772774:Directory {id: 9772774, tag: "Directory", name: "dtracedata", parent_id: 9772520, stem: "dtracedata", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/dtracedata", size: 576, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772774)
+MERGE (p9772774:Directory {id: 9772520})
+CREATE (p9772774) - [:PARENT_OF] -> (n9772774)
 CREATE (n9772787:File {id: 9772787, tag: "File", name: "instance.py", parent_id: 9772774, stem: "instance", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/dtracedata/instance.py", size: 317, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772783:File {id: 9772783, tag: "File", name: "gc.d.expected", parent_id: 9772774, stem: "gc.d", extension: "expected", path: "/Users/starver/code/public/cpython/Lib/test/dtracedata/gc.d.expected", size: 84, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772779:File {id: 9772779, tag: "File", name: "call_stack.py", parent_id: 9772774, stem: "call_stack", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/dtracedata/call_stack.py", size: 492, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6103,14 +6402,18 @@ CREATE (n9772774) - [:PARENT_OF] -> (n9772777)
 CREATE (n9772774) - [:PARENT_OF] -> (n9772776)
 CREATE (n9772774) - [:PARENT_OF] -> (n9772778)
 CREATE (n9772774) - [:PARENT_OF] -> (n9772782)
+// group 7 1229
 CREATE (n9773625:Directory {id: 9773625, tag: "Directory", name: "tracedmodules", parent_id: 9772520, stem: "tracedmodules", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/tracedmodules", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9773625)
+MERGE (p9773625:Directory {id: 9772520})
+CREATE (p9773625) - [:PARENT_OF] -> (n9773625)
 CREATE (n9773626:File {id: 9773626, tag: "File", name: "__init__.py", parent_id: 9773625, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/tracedmodules/__init__.py", size: 203, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773627:File {id: 9773627, tag: "File", name: "testmod.py", parent_id: 9773625, stem: "testmod", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/tracedmodules/testmod.py", size: 143, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773625) - [:PARENT_OF] -> (n9773626)
 CREATE (n9773625) - [:PARENT_OF] -> (n9773627)
+// group 289 59724
 CREATE (n9772627:Directory {id: 9772627, tag: "Directory", name: "decimaltestdata", parent_id: 9772520, stem: "decimaltestdata", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/decimaltestdata", size: 4640, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772627)
+MERGE (p9772627:Directory {id: 9772520})
+CREATE (p9772627) - [:PARENT_OF] -> (n9772627)
 CREATE (n9772764:File {id: 9772764, tag: "File", name: "shift.decTest", parent_id: 9772627, stem: "shift", extension: "decTest", path: "/Users/starver/code/public/cpython/Lib/test/decimaltestdata/shift.decTest", size: 11672, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772685:File {id: 9772685, tag: "File", name: "decSingle.decTest", parent_id: 9772627, stem: "decSingle", extension: "decTest", path: "/Users/starver/code/public/cpython/Lib/test/decimaltestdata/decSingle.decTest", size: 1456, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772653:File {id: 9772653, tag: "File", name: "ddCopyNegate.decTest", parent_id: 9772627, stem: "ddCopyNegate", extension: "decTest", path: "/Users/starver/code/public/cpython/Lib/test/decimaltestdata/ddCopyNegate.decTest", size: 3882, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6397,8 +6700,10 @@ CREATE (n9772627) - [:PARENT_OF] -> (n9772726)
 CREATE (n9772627) - [:PARENT_OF] -> (n9772704)
 CREATE (n9772627) - [:PARENT_OF] -> (n9772760)
 CREATE (n9772627) - [:PARENT_OF] -> (n9772708)
+// group 13 2434
 CREATE (n9773629:Directory {id: 9773629, tag: "Directory", name: "xmltestdata", parent_id: 9772520, stem: "xmltestdata", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/xmltestdata", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9773629)
+MERGE (p9773629:Directory {id: 9772520})
+CREATE (p9773629) - [:PARENT_OF] -> (n9773629)
 CREATE (n9773631:File {id: 9773631, tag: "File", name: "simple-ns.xml", parent_id: 9773629, stem: "simple-ns", extension: "xml", path: "/Users/starver/code/public/cpython/Lib/test/xmltestdata/simple-ns.xml", size: 152, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773633:File {id: 9773633, tag: "File", name: "test.xml", parent_id: 9773629, stem: "test", extension: "xml", path: "/Users/starver/code/public/cpython/Lib/test/xmltestdata/test.xml", size: 1388, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773632:File {id: 9773632, tag: "File", name: "simple.xml", parent_id: 9773629, stem: "simple", extension: "xml", path: "/Users/starver/code/public/cpython/Lib/test/xmltestdata/simple.xml", size: 122, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6409,16 +6714,20 @@ CREATE (n9773629) - [:PARENT_OF] -> (n9773633)
 CREATE (n9773629) - [:PARENT_OF] -> (n9773632)
 CREATE (n9773629) - [:PARENT_OF] -> (n9773630)
 CREATE (n9773629) - [:PARENT_OF] -> (n9773634)
+// group 9 1683
 CREATE (n9772794:Directory {id: 9772794, tag: "Directory", name: "encoded_modules", parent_id: 9772520, stem: "encoded_modules", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/encoded_modules", size: 160, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772794)
+MERGE (p9772794:Directory {id: 9772520})
+CREATE (p9772794) - [:PARENT_OF] -> (n9772794)
 CREATE (n9772797:File {id: 9772797, tag: "File", name: "module_koi8_r.py", parent_id: 9772794, stem: "module_koi8_r", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/encoded_modules/module_koi8_r.py", size: 113, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772795:File {id: 9772795, tag: "File", name: "__init__.py", parent_id: 9772794, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/encoded_modules/__init__.py", size: 1274, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772796:File {id: 9772796, tag: "File", name: "module_iso_8859_1.py", parent_id: 9772794, stem: "module_iso_8859_1", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/encoded_modules/module_iso_8859_1.py", size: 238, owner: 501, group: 20, created: 1545241636, accessed: 1545267143, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772794) - [:PARENT_OF] -> (n9772797)
 CREATE (n9772794) - [:PARENT_OF] -> (n9772795)
 CREATE (n9772794) - [:PARENT_OF] -> (n9772796)
+// group 63 12534
 CREATE (n9772577:Directory {id: 9772577, tag: "Directory", name: "cjkencodings", parent_id: 9772520, stem: "cjkencodings", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/cjkencodings", size: 1024, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772577)
+MERGE (p9772577:Directory {id: 9772520})
+CREATE (p9772577) - [:PARENT_OF] -> (n9772577)
 CREATE (n9772592:File {id: 9772592, tag: "File", name: "gb2312-utf8.txt", parent_id: 9772577, stem: "gb2312-utf8", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/cjkencodings/gb2312-utf8.txt", size: 480, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772606:File {id: 9772606, tag: "File", name: "shift_jisx0213-utf8.txt", parent_id: 9772577, stem: "shift_jisx0213-utf8", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/cjkencodings/shift_jisx0213-utf8.txt", size: 1144, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772599:File {id: 9772599, tag: "File", name: "iso2022_jp.txt", parent_id: 9772577, stem: "iso2022_jp", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/cjkencodings/iso2022_jp.txt", size: 868, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6479,34 +6788,46 @@ CREATE (n9772577) - [:PARENT_OF] -> (n9772607)
 CREATE (n9772577) - [:PARENT_OF] -> (n9772600)
 CREATE (n9772577) - [:PARENT_OF] -> (n9772595)
 CREATE (n9772577) - [:PARENT_OF] -> (n9772581)
+// group 7 1233
 CREATE (n9773586:Directory {id: 9773586, tag: "Directory", name: "test_warnings", parent_id: 9772520, stem: "test_warnings", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_warnings", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9773586)
+MERGE (p9773586:Directory {id: 9772520})
+CREATE (p9773586) - [:PARENT_OF] -> (n9773586)
 CREATE (n9773587:File {id: 9773587, tag: "File", name: "__init__.py", parent_id: 9773586, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_warnings/__init__.py", size: 51424, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773588:File {id: 9773588, tag: "File", name: "__main__.py", parent_id: 9773586, stem: "__main__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_warnings/__main__.py", size: 53, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773586) - [:PARENT_OF] -> (n9773587)
 CREATE (n9773586) - [:PARENT_OF] -> (n9773588)
+// group 7 1252
 CREATE (n9773589:Directory {id: 9773589, tag: "Directory", name: "data", parent_id: 9773586, stem: "data", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_warnings/data", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773586) - [:PARENT_OF] -> (n9773589)
+MERGE (p9773589:Directory {id: 9773586})
+CREATE (p9773589) - [:PARENT_OF] -> (n9773589)
 CREATE (n9773590:File {id: 9773590, tag: "File", name: "import_warning.py", parent_id: 9773589, stem: "import_warning", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_warnings/data/import_warning.py", size: 89, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773591:File {id: 9773591, tag: "File", name: "stacklevel.py", parent_id: 9773589, stem: "stacklevel", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_warnings/data/stacklevel.py", size: 240, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773589) - [:PARENT_OF] -> (n9773590)
 CREATE (n9773589) - [:PARENT_OF] -> (n9773591)
+// group 7 1223
 CREATE (n9773201:Directory {id: 9773201, tag: "Directory", name: "test_import", parent_id: 9772520, stem: "test_import", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_import", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9773201)
+MERGE (p9773201:Directory {id: 9772520})
+CREATE (p9773201) - [:PARENT_OF] -> (n9773201)
 CREATE (n9773202:File {id: 9773202, tag: "File", name: "__init__.py", parent_id: 9773201, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/__init__.py", size: 49236, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773203:File {id: 9773203, tag: "File", name: "__main__.py", parent_id: 9773201, stem: "__main__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/__main__.py", size: 51, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773201) - [:PARENT_OF] -> (n9773202)
 CREATE (n9773201) - [:PARENT_OF] -> (n9773203)
+// group 3 425
 CREATE (n9773204:Directory {id: 9773204, tag: "Directory", name: "data", parent_id: 9773201, stem: "data", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773201) - [:PARENT_OF] -> (n9773204)
+MERGE (p9773204:Directory {id: 9773201})
+CREATE (p9773204) - [:PARENT_OF] -> (n9773204)
+// group 7 1267
 CREATE (n9773223:Directory {id: 9773223, tag: "Directory", name: "package2", parent_id: 9773204, stem: "package2", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/package2", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773204) - [:PARENT_OF] -> (n9773223)
+MERGE (p9773223:Directory {id: 9773204})
+CREATE (p9773223) - [:PARENT_OF] -> (n9773223)
 CREATE (n9773225:File {id: 9773225, tag: "File", name: "submodule2.py", parent_id: 9773223, stem: "submodule2", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/package2/submodule2.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773224:File {id: 9773224, tag: "File", name: "submodule1.py", parent_id: 9773223, stem: "submodule1", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/package2/submodule1.py", size: 71, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773223) - [:PARENT_OF] -> (n9773225)
 CREATE (n9773223) - [:PARENT_OF] -> (n9773224)
+// group 25 4996
 CREATE (n9773205:Directory {id: 9773205, tag: "Directory", name: "circular_imports", parent_id: 9773204, stem: "circular_imports", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/circular_imports", size: 448, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773204) - [:PARENT_OF] -> (n9773205)
+MERGE (p9773205:Directory {id: 9773204})
+CREATE (p9773205) - [:PARENT_OF] -> (n9773205)
 CREATE (n9773218:File {id: 9773218, tag: "File", name: "use.py", parent_id: 9773205, stem: "use", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/circular_imports/use.py", size: 33, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773219:File {id: 9773219, tag: "File", name: "util.py", parent_id: 9773205, stem: "util", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/circular_imports/util.py", size: 21, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773212:File {id: 9773212, tag: "File", name: "rebinding2.py", parent_id: 9773205, stem: "rebinding2", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/circular_imports/rebinding2.py", size: 66, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6529,28 +6850,36 @@ CREATE (n9773205) - [:PARENT_OF] -> (n9773213)
 CREATE (n9773205) - [:PARENT_OF] -> (n9773207)
 CREATE (n9773205) - [:PARENT_OF] -> (n9773214)
 CREATE (n9773205) - [:PARENT_OF] -> (n9773211)
+// group 7 1294
 CREATE (n9773215:Directory {id: 9773215, tag: "Directory", name: "subpkg", parent_id: 9773205, stem: "subpkg", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/circular_imports/subpkg", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773205) - [:PARENT_OF] -> (n9773215)
+MERGE (p9773215:Directory {id: 9773205})
+CREATE (p9773215) - [:PARENT_OF] -> (n9773215)
 CREATE (n9773217:File {id: 9773217, tag: "File", name: "util.py", parent_id: 9773215, stem: "util", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/circular_imports/subpkg/util.py", size: 21, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773216:File {id: 9773216, tag: "File", name: "subpackage2.py", parent_id: 9773215, stem: "subpackage2", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/circular_imports/subpkg/subpackage2.py", size: 50, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773215) - [:PARENT_OF] -> (n9773217)
 CREATE (n9773215) - [:PARENT_OF] -> (n9773216)
+// group 7 1253
 CREATE (n9773220:Directory {id: 9773220, tag: "Directory", name: "package", parent_id: 9773204, stem: "package", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/package", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773204) - [:PARENT_OF] -> (n9773220)
+MERGE (p9773220:Directory {id: 9773204})
+CREATE (p9773220) - [:PARENT_OF] -> (n9773220)
 CREATE (n9773221:File {id: 9773221, tag: "File", name: "__init__.py", parent_id: 9773220, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/package/__init__.py", size: 43, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773222:File {id: 9773222, tag: "File", name: "submodule.py", parent_id: 9773220, stem: "submodule", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_import/data/package/submodule.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773220) - [:PARENT_OF] -> (n9773221)
 CREATE (n9773220) - [:PARENT_OF] -> (n9773222)
+// group 9 1619
 CREATE (n9772914:Directory {id: 9772914, tag: "Directory", name: "support", parent_id: 9772520, stem: "support", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/support", size: 160, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772914)
+MERGE (p9772914:Directory {id: 9772520})
+CREATE (p9772914) - [:PARENT_OF] -> (n9772914)
 CREATE (n9772915:File {id: 9772915, tag: "File", name: "__init__.py", parent_id: 9772914, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/support/__init__.py", size: 102745, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772917:File {id: 9772917, tag: "File", name: "testresult.py", parent_id: 9772914, stem: "testresult", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/support/testresult.py", size: 6669, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772916:File {id: 9772916, tag: "File", name: "script_helper.py", parent_id: 9772914, stem: "script_helper", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/support/script_helper.py", size: 10631, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772914) - [:PARENT_OF] -> (n9772915)
 CREATE (n9772914) - [:PARENT_OF] -> (n9772917)
 CREATE (n9772914) - [:PARENT_OF] -> (n9772916)
+// group 29 5512
 CREATE (n9772811:Directory {id: 9772811, tag: "Directory", name: "imghdrdata", parent_id: 9772520, stem: "imghdrdata", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/imghdrdata", size: 480, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772811)
+MERGE (p9772811:Directory {id: 9772520})
+CREATE (p9772811) - [:PARENT_OF] -> (n9772811)
 CREATE (n9772819:File {id: 9772819, tag: "File", name: "python.ppm", parent_id: 9772811, stem: "python", extension: "ppm", path: "/Users/starver/code/public/cpython/Lib/test/imghdrdata/python.ppm", size: 781, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772823:File {id: 9772823, tag: "File", name: "python.webp", parent_id: 9772811, stem: "python", extension: "webp", path: "/Users/starver/code/public/cpython/Lib/test/imghdrdata/python.webp", size: 432, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772813:File {id: 9772813, tag: "File", name: "python.exr", parent_id: 9772811, stem: "python", extension: "exr", path: "/Users/starver/code/public/cpython/Lib/test/imghdrdata/python.exr", size: 2635, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6577,8 +6906,10 @@ CREATE (n9772811) - [:PARENT_OF] -> (n9772822)
 CREATE (n9772811) - [:PARENT_OF] -> (n9772814)
 CREATE (n9772811) - [:PARENT_OF] -> (n9772824)
 CREATE (n9772811) - [:PARENT_OF] -> (n9772817)
+// group 21 3939
 CREATE (n9772891:Directory {id: 9772891, tag: "Directory", name: "sndhdrdata", parent_id: 9772520, stem: "sndhdrdata", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/sndhdrdata", size: 352, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772891)
+MERGE (p9772891:Directory {id: 9772520})
+CREATE (p9772891) - [:PARENT_OF] -> (n9772891)
 CREATE (n9772893:File {id: 9772893, tag: "File", name: "sndhdr.8svx", parent_id: 9772891, stem: "sndhdr", extension: "8svx", path: "/Users/starver/code/public/cpython/Lib/test/sndhdrdata/sndhdr.8svx", size: 110, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772894:File {id: 9772894, tag: "File", name: "sndhdr.aifc", parent_id: 9772891, stem: "sndhdr", extension: "aifc", path: "/Users/starver/code/public/cpython/Lib/test/sndhdrdata/sndhdr.aifc", size: 106, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772898:File {id: 9772898, tag: "File", name: "sndhdr.sndt", parent_id: 9772891, stem: "sndhdr", extension: "sndt", path: "/Users/starver/code/public/cpython/Lib/test/sndhdrdata/sndhdr.sndt", size: 129, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6597,8 +6928,10 @@ CREATE (n9772891) - [:PARENT_OF] -> (n9772897)
 CREATE (n9772891) - [:PARENT_OF] -> (n9772895)
 CREATE (n9772891) - [:PARENT_OF] -> (n9772896)
 CREATE (n9772891) - [:PARENT_OF] -> (n9772899)
+// group 11 2002
 CREATE (n9772834:Directory {id: 9772834, tag: "Directory", name: "leakers", parent_id: 9772520, stem: "leakers", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/leakers", size: 192, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772834)
+MERGE (p9772834:Directory {id: 9772520})
+CREATE (p9772834) - [:PARENT_OF] -> (n9772834)
 CREATE (n9772836:File {id: 9772836, tag: "File", name: "__init__.py", parent_id: 9772834, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/leakers/__init__.py", size: 0, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772837:File {id: 9772837, tag: "File", name: "test_ctypes.py", parent_id: 9772834, stem: "test_ctypes", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/leakers/test_ctypes.py", size: 329, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772835:File {id: 9772835, tag: "File", name: "README.txt", parent_id: 9772834, stem: "README", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/leakers/README.txt", size: 1090, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6607,8 +6940,10 @@ CREATE (n9772834) - [:PARENT_OF] -> (n9772836)
 CREATE (n9772834) - [:PARENT_OF] -> (n9772837)
 CREATE (n9772834) - [:PARENT_OF] -> (n9772835)
 CREATE (n9772834) - [:PARENT_OF] -> (n9772838)
+// group 37 7461
 CREATE (n9773068:Directory {id: 9773068, tag: "Directory", name: "test_email", parent_id: 9772520, stem: "test_email", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_email", size: 640, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9773068)
+MERGE (p9773068:Directory {id: 9772520})
+CREATE (p9773068) - [:PARENT_OF] -> (n9773068)
 CREATE (n9773131:File {id: 9773131, tag: "File", name: "test_parser.py", parent_id: 9773068, stem: "test_parser", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_email/test_parser.py", size: 4333, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773134:File {id: 9773134, tag: "File", name: "test_utils.py", parent_id: 9773068, stem: "test_utils", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_email/test_utils.py", size: 6662, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773127:File {id: 9773127, tag: "File", name: "test_generator.py", parent_id: 9773068, stem: "test_generator", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_email/test_generator.py", size: 11233, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6643,8 +6978,10 @@ CREATE (n9773068) - [:PARENT_OF] -> (n9773122)
 CREATE (n9773068) - [:PARENT_OF] -> (n9773133)
 CREATE (n9773068) - [:PARENT_OF] -> (n9773070)
 CREATE (n9773068) - [:PARENT_OF] -> (n9773121)
+// group 101 19818
 CREATE (n9773071:Directory {id: 9773071, tag: "Directory", name: "data", parent_id: 9773068, stem: "data", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_email/data", size: 1632, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773068) - [:PARENT_OF] -> (n9773071)
+MERGE (p9773071:Directory {id: 9773068})
+CREATE (p9773071) - [:PARENT_OF] -> (n9773071)
 CREATE (n9773096:File {id: 9773096, tag: "File", name: "msg_22.txt", parent_id: 9773071, stem: "msg_22", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/test_email/data/msg_22.txt", size: 1894, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773110:File {id: 9773110, tag: "File", name: "msg_36.txt", parent_id: 9773071, stem: "msg_36", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/test/test_email/data/msg_36.txt", size: 816, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773072:File {id: 9773072, tag: "File", name: "PyBanner048.gif", parent_id: 9773071, stem: "PyBanner048", extension: "gif", path: "/Users/starver/code/public/cpython/Lib/test/test_email/data/PyBanner048.gif", size: 954, owner: 501, group: 20, created: 1545241637, accessed: 1545267144, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6743,8 +7080,10 @@ CREATE (n9773071) - [:PARENT_OF] -> (n9773079)
 CREATE (n9773071) - [:PARENT_OF] -> (n9773085)
 CREATE (n9773071) - [:PARENT_OF] -> (n9773087)
 CREATE (n9773071) - [:PARENT_OF] -> (n9773080)
+// group 65 13204
 CREATE (n9772933:Directory {id: 9772933, tag: "Directory", name: "test_asyncio", parent_id: 9772520, stem: "test_asyncio", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/test_asyncio", size: 1056, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772933)
+MERGE (p9772933:Directory {id: 9772520})
+CREATE (p9772933) - [:PARENT_OF] -> (n9772933)
 CREATE (n9772957:File {id: 9772957, tag: "File", name: "test_streams.py", parent_id: 9772933, stem: "test_streams", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_asyncio/test_streams.py", size: 37948, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772940:File {id: 9772940, tag: "File", name: "test_base_events.py", parent_id: 9772933, stem: "test_base_events", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_asyncio/test_base_events.py", size: 77376, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772960:File {id: 9772960, tag: "File", name: "test_transports.py", parent_id: 9772933, stem: "test_transports", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/test_asyncio/test_transports.py", size: 3540, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6807,8 +7146,10 @@ CREATE (n9772933) - [:PARENT_OF] -> (n9772936)
 CREATE (n9772933) - [:PARENT_OF] -> (n9772935)
 CREATE (n9772933) - [:PARENT_OF] -> (n9772946)
 CREATE (n9772933) - [:PARENT_OF] -> (n9772949)
+// group 21 3958
 CREATE (n9772839:Directory {id: 9772839, tag: "Directory", name: "libregrtest", parent_id: 9772520, stem: "libregrtest", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/libregrtest", size: 352, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772839)
+MERGE (p9772839:Directory {id: 9772520})
+CREATE (p9772839) - [:PARENT_OF] -> (n9772839)
 CREATE (n9772844:File {id: 9772844, tag: "File", name: "runtest.py", parent_id: 9772839, stem: "runtest", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/libregrtest/runtest.py", size: 8920, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772843:File {id: 9772843, tag: "File", name: "refleak.py", parent_id: 9772839, stem: "refleak", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/libregrtest/refleak.py", size: 7696, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772841:File {id: 9772841, tag: "File", name: "cmdline.py", parent_id: 9772839, stem: "cmdline", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/libregrtest/cmdline.py", size: 17918, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6827,12 +7168,16 @@ CREATE (n9772839) - [:PARENT_OF] -> (n9772848)
 CREATE (n9772839) - [:PARENT_OF] -> (n9772845)
 CREATE (n9772839) - [:PARENT_OF] -> (n9772846)
 CREATE (n9772839) - [:PARENT_OF] -> (n9772842)
+// group 5 785
 CREATE (n9772620:Directory {id: 9772620, tag: "Directory", name: "data", parent_id: 9772520, stem: "data", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/data", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772620)
+MERGE (p9772620:Directory {id: 9772520})
+CREATE (p9772620) - [:PARENT_OF] -> (n9772620)
 CREATE (n9772621:File {id: 9772621, tag: "File", name: "README", parent_id: 9772620, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/data/README", size: 129, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772620) - [:PARENT_OF] -> (n9772621)
+// group 15 2739
 CREATE (n9772567:Directory {id: 9772567, tag: "Directory", name: "capath", parent_id: 9772520, stem: "capath", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/capath", size: 256, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772567)
+MERGE (p9772567:Directory {id: 9772520})
+CREATE (p9772567) - [:PARENT_OF] -> (n9772567)
 CREATE (n9772568:File {id: 9772568, tag: "File", name: "4e1295a3.0", parent_id: 9772567, stem: "4e1295a3", extension: "0", path: "/Users/starver/code/public/cpython/Lib/test/capath/4e1295a3.0", size: 814, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772569:File {id: 9772569, tag: "File", name: "5ed36f99.0", parent_id: 9772567, stem: "5ed36f99", extension: "0", path: "/Users/starver/code/public/cpython/Lib/test/capath/5ed36f99.0", size: 2569, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772571:File {id: 9772571, tag: "File", name: "99d0fa06.0", parent_id: 9772567, stem: "99d0fa06", extension: "0", path: "/Users/starver/code/public/cpython/Lib/test/capath/99d0fa06.0", size: 2569, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6845,8 +7190,10 @@ CREATE (n9772567) - [:PARENT_OF] -> (n9772571)
 CREATE (n9772567) - [:PARENT_OF] -> (n9772570)
 CREATE (n9772567) - [:PARENT_OF] -> (n9772573)
 CREATE (n9772567) - [:PARENT_OF] -> (n9772572)
+// group 13 2443
 CREATE (n9772908:Directory {id: 9772908, tag: "Directory", name: "subprocessdata", parent_id: 9772520, stem: "subprocessdata", extension: "", path: "/Users/starver/code/public/cpython/Lib/test/subprocessdata", size: 224, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772520) - [:PARENT_OF] -> (n9772908)
+MERGE (p9772908:Directory {id: 9772520})
+CREATE (p9772908) - [:PARENT_OF] -> (n9772908)
 CREATE (n9772909:File {id: 9772909, tag: "File", name: "fd_status.py", parent_id: 9772908, stem: "fd_status", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/subprocessdata/fd_status.py", size: 835, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772911:File {id: 9772911, tag: "File", name: "qcat.py", parent_id: 9772908, stem: "qcat", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/subprocessdata/qcat.py", size: 159, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772913:File {id: 9772913, tag: "File", name: "sigchild_ignore.py", parent_id: 9772908, stem: "sigchild_ignore", extension: "py", path: "/Users/starver/code/public/cpython/Lib/test/subprocessdata/sigchild_ignore.py", size: 757, owner: 501, group: 20, created: 1545241636, accessed: 1545267144, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6857,8 +7204,10 @@ CREATE (n9772908) - [:PARENT_OF] -> (n9772911)
 CREATE (n9772908) - [:PARENT_OF] -> (n9772913)
 CREATE (n9772908) - [:PARENT_OF] -> (n9772910)
 CREATE (n9772908) - [:PARENT_OF] -> (n9772912)
+// group 47 9014
 CREATE (n9773686:Directory {id: 9773686, tag: "Directory", name: "turtledemo", parent_id: 9771638, stem: "turtledemo", extension: "", path: "/Users/starver/code/public/cpython/Lib/turtledemo", size: 768, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9773686)
+MERGE (p9773686:Directory {id: 9771638})
+CREATE (p9773686) - [:PARENT_OF] -> (n9773686)
 CREATE (n9773706:File {id: 9773706, tag: "File", name: "turtle.cfg", parent_id: 9773686, stem: "turtle", extension: "cfg", path: "/Users/starver/code/public/cpython/Lib/turtledemo/turtle.cfg", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773705:File {id: 9773705, tag: "File", name: "tree.py", parent_id: 9773686, stem: "tree", extension: "py", path: "/Users/starver/code/public/cpython/Lib/turtledemo/tree.py", size: 1401, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9773703:File {id: 9773703, tag: "File", name: "round_dance.py", parent_id: 9773686, stem: "round_dance", extension: "py", path: "/Users/starver/code/public/cpython/Lib/turtledemo/round_dance.py", size: 1804, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6903,8 +7252,10 @@ CREATE (n9773686) - [:PARENT_OF] -> (n9773693)
 CREATE (n9773686) - [:PARENT_OF] -> (n9773707)
 CREATE (n9773686) - [:PARENT_OF] -> (n9773688)
 CREATE (n9773686) - [:PARENT_OF] -> (n9773696)
+// group 43 8441
 CREATE (n9772411:Directory {id: 9772411, tag: "Directory", name: "multiprocessing", parent_id: 9771638, stem: "multiprocessing", extension: "", path: "/Users/starver/code/public/cpython/Lib/multiprocessing", size: 736, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772411)
+MERGE (p9772411:Directory {id: 9771638})
+CREATE (p9772411) - [:PARENT_OF] -> (n9772411)
 CREATE (n9772430:File {id: 9772430, tag: "File", name: "semaphore_tracker.py", parent_id: 9772411, stem: "semaphore_tracker", extension: "py", path: "/Users/starver/code/public/cpython/Lib/multiprocessing/semaphore_tracker.py", size: 6556, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772427:File {id: 9772427, tag: "File", name: "queues.py", parent_id: 9772411, stem: "queues", extension: "py", path: "/Users/starver/code/public/cpython/Lib/multiprocessing/queues.py", size: 11690, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772419:File {id: 9772419, tag: "File", name: "heap.py", parent_id: 9772411, stem: "heap", extension: "py", path: "/Users/starver/code/public/cpython/Lib/multiprocessing/heap.py", size: 11626, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6945,14 +7296,18 @@ CREATE (n9772411) - [:PARENT_OF] -> (n9772423)
 CREATE (n9772411) - [:PARENT_OF] -> (n9772424)
 CREATE (n9772411) - [:PARENT_OF] -> (n9772420)
 CREATE (n9772411) - [:PARENT_OF] -> (n9772429)
+// group 7 1233
 CREATE (n9772415:Directory {id: 9772415, tag: "Directory", name: "dummy", parent_id: 9772411, stem: "dummy", extension: "", path: "/Users/starver/code/public/cpython/Lib/multiprocessing/dummy", size: 128, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772411) - [:PARENT_OF] -> (n9772415)
+MERGE (p9772415:Directory {id: 9772411})
+CREATE (p9772415) - [:PARENT_OF] -> (n9772415)
 CREATE (n9772416:File {id: 9772416, tag: "File", name: "__init__.py", parent_id: 9772415, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/multiprocessing/dummy/__init__.py", size: 3058, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772417:File {id: 9772417, tag: "File", name: "connection.py", parent_id: 9772415, stem: "connection", extension: "py", path: "/Users/starver/code/public/cpython/Lib/multiprocessing/dummy/connection.py", size: 1598, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772415) - [:PARENT_OF] -> (n9772416)
 CREATE (n9772415) - [:PARENT_OF] -> (n9772417)
+// group 11 1938
 CREATE (n9772406:Directory {id: 9772406, tag: "Directory", name: "msilib", parent_id: 9771638, stem: "msilib", extension: "", path: "/Users/starver/code/public/cpython/Lib/msilib", size: 192, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772406)
+MERGE (p9772406:Directory {id: 9771638})
+CREATE (p9772406) - [:PARENT_OF] -> (n9772406)
 CREATE (n9772409:File {id: 9772409, tag: "File", name: "sequence.py", parent_id: 9772406, stem: "sequence", extension: "py", path: "/Users/starver/code/public/cpython/Lib/msilib/sequence.py", size: 3929, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772407:File {id: 9772407, tag: "File", name: "__init__.py", parent_id: 9772406, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/msilib/__init__.py", size: 17611, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772410:File {id: 9772410, tag: "File", name: "text.py", parent_id: 9772406, stem: "text", extension: "py", path: "/Users/starver/code/public/cpython/Lib/msilib/text.py", size: 9018, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6961,8 +7316,10 @@ CREATE (n9772406) - [:PARENT_OF] -> (n9772409)
 CREATE (n9772406) - [:PARENT_OF] -> (n9772407)
 CREATE (n9772406) - [:PARENT_OF] -> (n9772410)
 CREATE (n9772406) - [:PARENT_OF] -> (n9772408)
+// group 15 2711
 CREATE (n9773753:Directory {id: 9773753, tag: "Directory", name: "urllib", parent_id: 9771638, stem: "urllib", extension: "", path: "/Users/starver/code/public/cpython/Lib/urllib", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9773753)
+MERGE (p9773753:Directory {id: 9771638})
+CREATE (p9773753) - [:PARENT_OF] -> (n9773753)
 CREATE (n9773755:File {id: 9773755, tag: "File", name: "error.py", parent_id: 9773753, stem: "error", extension: "py", path: "/Users/starver/code/public/cpython/Lib/urllib/error.py", size: 2632, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773757:File {id: 9773757, tag: "File", name: "request.py", parent_id: 9773753, stem: "request", extension: "py", path: "/Users/starver/code/public/cpython/Lib/urllib/request.py", size: 99983, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773754:File {id: 9773754, tag: "File", name: "__init__.py", parent_id: 9773753, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/urllib/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -6975,20 +7332,26 @@ CREATE (n9773753) - [:PARENT_OF] -> (n9773754)
 CREATE (n9773753) - [:PARENT_OF] -> (n9773758)
 CREATE (n9773753) - [:PARENT_OF] -> (n9773759)
 CREATE (n9773753) - [:PARENT_OF] -> (n9773756)
+// group 5 822
 CREATE (n9772479:Directory {id: 9772479, tag: "Directory", name: "site-packages", parent_id: 9771638, stem: "site-packages", extension: "", path: "/Users/starver/code/public/cpython/Lib/site-packages", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772479)
+MERGE (p9772479:Directory {id: 9771638})
+CREATE (p9772479) - [:PARENT_OF] -> (n9772479)
 CREATE (n9772480:File {id: 9772480, tag: "File", name: "README.txt", parent_id: 9772479, stem: "README", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/site-packages/README.txt", size: 119, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772479) - [:PARENT_OF] -> (n9772480)
+// group 9 1553
 CREATE (n9772100:Directory {id: 9772100, tag: "Directory", name: "html", parent_id: 9771638, stem: "html", extension: "", path: "/Users/starver/code/public/cpython/Lib/html", size: 160, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772100)
+MERGE (p9772100:Directory {id: 9771638})
+CREATE (p9772100) - [:PARENT_OF] -> (n9772100)
 CREATE (n9772101:File {id: 9772101, tag: "File", name: "__init__.py", parent_id: 9772100, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/html/__init__.py", size: 4756, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772103:File {id: 9772103, tag: "File", name: "parser.py", parent_id: 9772100, stem: "parser", extension: "py", path: "/Users/starver/code/public/cpython/Lib/html/parser.py", size: 17721, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772102:File {id: 9772102, tag: "File", name: "entities.py", parent_id: 9772100, stem: "entities", extension: "py", path: "/Users/starver/code/public/cpython/Lib/html/entities.py", size: 75315, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772100) - [:PARENT_OF] -> (n9772101)
 CREATE (n9772100) - [:PARENT_OF] -> (n9772103)
 CREATE (n9772100) - [:PARENT_OF] -> (n9772102)
+// group 31 5827
 CREATE (n9773642:Directory {id: 9773642, tag: "Directory", name: "tkinter", parent_id: 9771638, stem: "tkinter", extension: "", path: "/Users/starver/code/public/cpython/Lib/tkinter", size: 544, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9773642)
+MERGE (p9773642:Directory {id: 9771638})
+CREATE (p9773642) - [:PARENT_OF] -> (n9773642)
 CREATE (n9773653:File {id: 9773653, tag: "File", name: "scrolledtext.py", parent_id: 9773642, stem: "scrolledtext", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/scrolledtext.py", size: 1816, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773645:File {id: 9773645, tag: "File", name: "colorchooser.py", parent_id: 9773642, stem: "colorchooser", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/colorchooser.py", size: 1791, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773646:File {id: 9773646, tag: "File", name: "commondialog.py", parent_id: 9773642, stem: "commondialog", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/commondialog.py", size: 1248, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7017,8 +7380,10 @@ CREATE (n9773642) - [:PARENT_OF] -> (n9773651)
 CREATE (n9773642) - [:PARENT_OF] -> (n9773677)
 CREATE (n9773642) - [:PARENT_OF] -> (n9773644)
 CREATE (n9773642) - [:PARENT_OF] -> (n9773654)
+// group 13 2369
 CREATE (n9773655:Directory {id: 9773655, tag: "Directory", name: "test", parent_id: 9773642, stem: "test", extension: "", path: "/Users/starver/code/public/cpython/Lib/tkinter/test", size: 288, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773642) - [:PARENT_OF] -> (n9773655)
+MERGE (p9773655:Directory {id: 9773642})
+CREATE (p9773655) - [:PARENT_OF] -> (n9773655)
 CREATE (n9773659:File {id: 9773659, tag: "File", name: "support.py", parent_id: 9773655, stem: "support", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/support.py", size: 3722, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773657:File {id: 9773657, tag: "File", name: "__init__.py", parent_id: 9773655, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773656:File {id: 9773656, tag: "File", name: "README", parent_id: 9773655, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/README", size: 566, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7029,8 +7394,10 @@ CREATE (n9773655) - [:PARENT_OF] -> (n9773657)
 CREATE (n9773655) - [:PARENT_OF] -> (n9773656)
 CREATE (n9773655) - [:PARENT_OF] -> (n9773676)
 CREATE (n9773655) - [:PARENT_OF] -> (n9773658)
+// group 13 2490
 CREATE (n9773670:Directory {id: 9773670, tag: "Directory", name: "test_ttk", parent_id: 9773655, stem: "test_ttk", extension: "", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/test_ttk", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773655) - [:PARENT_OF] -> (n9773670)
+MERGE (p9773670:Directory {id: 9773655})
+CREATE (p9773670) - [:PARENT_OF] -> (n9773670)
 CREATE (n9773672:File {id: 9773672, tag: "File", name: "test_extensions.py", parent_id: 9773670, stem: "test_extensions", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/test_ttk/test_extensions.py", size: 11717, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773671:File {id: 9773671, tag: "File", name: "__init__.py", parent_id: 9773670, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/test_ttk/__init__.py", size: 0, owner: 501, group: 20, created: 1545241637, accessed: 1545241637, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773675:File {id: 9773675, tag: "File", name: "test_widgets.py", parent_id: 9773670, stem: "test_widgets", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/test_ttk/test_widgets.py", size: 67145, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7041,8 +7408,10 @@ CREATE (n9773670) - [:PARENT_OF] -> (n9773671)
 CREATE (n9773670) - [:PARENT_OF] -> (n9773675)
 CREATE (n9773670) - [:PARENT_OF] -> (n9773673)
 CREATE (n9773670) - [:PARENT_OF] -> (n9773674)
+// group 21 4180
 CREATE (n9773660:Directory {id: 9773660, tag: "Directory", name: "test_tkinter", parent_id: 9773655, stem: "test_tkinter", extension: "", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/test_tkinter", size: 352, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773655) - [:PARENT_OF] -> (n9773660)
+MERGE (p9773660:Directory {id: 9773655})
+CREATE (p9773660) - [:PARENT_OF] -> (n9773660)
 CREATE (n9773666:File {id: 9773666, tag: "File", name: "test_misc.py", parent_id: 9773660, stem: "test_misc", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/test_tkinter/test_misc.py", size: 5787, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773664:File {id: 9773664, tag: "File", name: "test_images.py", parent_id: 9773660, stem: "test_images", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/test_tkinter/test_images.py", size: 13355, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773665:File {id: 9773665, tag: "File", name: "test_loadtk.py", parent_id: 9773660, stem: "test_loadtk", extension: "py", path: "/Users/starver/code/public/cpython/Lib/tkinter/test/test_tkinter/test_loadtk.py", size: 1503, owner: 501, group: 20, created: 1545241637, accessed: 1545267145, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7061,18 +7430,24 @@ CREATE (n9773660) - [:PARENT_OF] -> (n9773667)
 CREATE (n9773660) - [:PARENT_OF] -> (n9773669)
 CREATE (n9773660) - [:PARENT_OF] -> (n9773663)
 CREATE (n9773660) - [:PARENT_OF] -> (n9773668)
+// group 5 786
 CREATE (n9773787:Directory {id: 9773787, tag: "Directory", name: "xml", parent_id: 9771638, stem: "xml", extension: "", path: "/Users/starver/code/public/cpython/Lib/xml", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9773787)
+MERGE (p9773787:Directory {id: 9771638})
+CREATE (p9773787) - [:PARENT_OF] -> (n9773787)
 CREATE (n9773788:File {id: 9773788, tag: "File", name: "__init__.py", parent_id: 9773787, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/__init__.py", size: 557, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773787) - [:PARENT_OF] -> (n9773788)
+// group 7 1190
 CREATE (n9773804:Directory {id: 9773804, tag: "Directory", name: "parsers", parent_id: 9773787, stem: "parsers", extension: "", path: "/Users/starver/code/public/cpython/Lib/xml/parsers", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773787) - [:PARENT_OF] -> (n9773804)
+MERGE (p9773804:Directory {id: 9773787})
+CREATE (p9773804) - [:PARENT_OF] -> (n9773804)
 CREATE (n9773806:File {id: 9773806, tag: "File", name: "expat.py", parent_id: 9773804, stem: "expat", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/parsers/expat.py", size: 248, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773805:File {id: 9773805, tag: "File", name: "__init__.py", parent_id: 9773804, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/parsers/__init__.py", size: 167, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773804) - [:PARENT_OF] -> (n9773806)
 CREATE (n9773804) - [:PARENT_OF] -> (n9773805)
+// group 15 2747
 CREATE (n9773807:Directory {id: 9773807, tag: "Directory", name: "sax", parent_id: 9773787, stem: "sax", extension: "", path: "/Users/starver/code/public/cpython/Lib/xml/sax", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773787) - [:PARENT_OF] -> (n9773807)
+MERGE (p9773807:Directory {id: 9773787})
+CREATE (p9773807) - [:PARENT_OF] -> (n9773807)
 CREATE (n9773811:File {id: 9773811, tag: "File", name: "handler.py", parent_id: 9773807, stem: "handler", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/sax/handler.py", size: 13922, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773808:File {id: 9773808, tag: "File", name: "__init__.py", parent_id: 9773807, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/sax/__init__.py", size: 3647, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773812:File {id: 9773812, tag: "File", name: "saxutils.py", parent_id: 9773807, stem: "saxutils", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/sax/saxutils.py", size: 12205, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7085,8 +7460,10 @@ CREATE (n9773807) - [:PARENT_OF] -> (n9773812)
 CREATE (n9773807) - [:PARENT_OF] -> (n9773813)
 CREATE (n9773807) - [:PARENT_OF] -> (n9773810)
 CREATE (n9773807) - [:PARENT_OF] -> (n9773809)
+// group 19 3518
 CREATE (n9773789:Directory {id: 9773789, tag: "Directory", name: "dom", parent_id: 9773787, stem: "dom", extension: "", path: "/Users/starver/code/public/cpython/Lib/xml/dom", size: 320, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773787) - [:PARENT_OF] -> (n9773789)
+MERGE (p9773789:Directory {id: 9773787})
+CREATE (p9773789) - [:PARENT_OF] -> (n9773789)
 CREATE (n9773796:File {id: 9773796, tag: "File", name: "pulldom.py", parent_id: 9773789, stem: "pulldom", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/dom/pulldom.py", size: 11997, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773793:File {id: 9773793, tag: "File", name: "expatbuilder.py", parent_id: 9773789, stem: "expatbuilder", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/dom/expatbuilder.py", size: 35756, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773792:File {id: 9773792, tag: "File", name: "domreg.py", parent_id: 9773789, stem: "domreg", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/dom/domreg.py", size: 3451, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7103,8 +7480,10 @@ CREATE (n9773789) - [:PARENT_OF] -> (n9773791)
 CREATE (n9773789) - [:PARENT_OF] -> (n9773790)
 CREATE (n9773789) - [:PARENT_OF] -> (n9773797)
 CREATE (n9773789) - [:PARENT_OF] -> (n9773795)
+// group 13 2403
 CREATE (n9773798:Directory {id: 9773798, tag: "Directory", name: "etree", parent_id: 9773787, stem: "etree", extension: "", path: "/Users/starver/code/public/cpython/Lib/xml/etree", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773787) - [:PARENT_OF] -> (n9773798)
+MERGE (p9773798:Directory {id: 9773787})
+CREATE (p9773798) - [:PARENT_OF] -> (n9773798)
 CREATE (n9773800:File {id: 9773800, tag: "File", name: "ElementPath.py", parent_id: 9773798, stem: "ElementPath", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/etree/ElementPath.py", size: 10301, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773803:File {id: 9773803, tag: "File", name: "cElementTree.py", parent_id: 9773798, stem: "cElementTree", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/etree/cElementTree.py", size: 82, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773802:File {id: 9773802, tag: "File", name: "__init__.py", parent_id: 9773798, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xml/etree/__init__.py", size: 1604, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7115,8 +7494,10 @@ CREATE (n9773798) - [:PARENT_OF] -> (n9773803)
 CREATE (n9773798) - [:PARENT_OF] -> (n9773802)
 CREATE (n9773798) - [:PARENT_OF] -> (n9773799)
 CREATE (n9773798) - [:PARENT_OF] -> (n9773801)
+// group 15 2734
 CREATE (n9773779:Directory {id: 9773779, tag: "Directory", name: "wsgiref", parent_id: 9771638, stem: "wsgiref", extension: "", path: "/Users/starver/code/public/cpython/Lib/wsgiref", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9773779)
+MERGE (p9773779:Directory {id: 9771638})
+CREATE (p9773779) - [:PARENT_OF] -> (n9773779)
 CREATE (n9773784:File {id: 9773784, tag: "File", name: "util.py", parent_id: 9773779, stem: "util", extension: "py", path: "/Users/starver/code/public/cpython/Lib/wsgiref/util.py", size: 5867, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773781:File {id: 9773781, tag: "File", name: "handlers.py", parent_id: 9773779, stem: "handlers", extension: "py", path: "/Users/starver/code/public/cpython/Lib/wsgiref/handlers.py", size: 21001, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773780:File {id: 9773780, tag: "File", name: "__init__.py", parent_id: 9773779, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/wsgiref/__init__.py", size: 587, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7129,8 +7510,10 @@ CREATE (n9773779) - [:PARENT_OF] -> (n9773780)
 CREATE (n9773779) - [:PARENT_OF] -> (n9773785)
 CREATE (n9773779) - [:PARENT_OF] -> (n9773783)
 CREATE (n9773779) - [:PARENT_OF] -> (n9773782)
+// group 13 2305
 CREATE (n9772278:Directory {id: 9772278, tag: "Directory", name: "json", parent_id: 9771638, stem: "json", extension: "", path: "/Users/starver/code/public/cpython/Lib/json", size: 224, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772278)
+MERGE (p9772278:Directory {id: 9771638})
+CREATE (p9772278) - [:PARENT_OF] -> (n9772278)
 CREATE (n9772280:File {id: 9772280, tag: "File", name: "decoder.py", parent_id: 9772278, stem: "decoder", extension: "py", path: "/Users/starver/code/public/cpython/Lib/json/decoder.py", size: 12472, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772282:File {id: 9772282, tag: "File", name: "scanner.py", parent_id: 9772278, stem: "scanner", extension: "py", path: "/Users/starver/code/public/cpython/Lib/json/scanner.py", size: 2425, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772279:File {id: 9772279, tag: "File", name: "__init__.py", parent_id: 9772278, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/json/__init__.py", size: 14090, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7141,8 +7524,10 @@ CREATE (n9772278) - [:PARENT_OF] -> (n9772282)
 CREATE (n9772278) - [:PARENT_OF] -> (n9772279)
 CREATE (n9772278) - [:PARENT_OF] -> (n9772281)
 CREATE (n9772278) - [:PARENT_OF] -> (n9772283)
+// group 13 2315
 CREATE (n9772104:Directory {id: 9772104, tag: "Directory", name: "http", parent_id: 9771638, stem: "http", extension: "", path: "/Users/starver/code/public/cpython/Lib/http", size: 224, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772104)
+MERGE (p9772104:Directory {id: 9771638})
+CREATE (p9772104) - [:PARENT_OF] -> (n9772104)
 CREATE (n9772108:File {id: 9772108, tag: "File", name: "cookies.py", parent_id: 9772104, stem: "cookies", extension: "py", path: "/Users/starver/code/public/cpython/Lib/http/cookies.py", size: 20412, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772109:File {id: 9772109, tag: "File", name: "server.py", parent_id: 9772104, stem: "server", extension: "py", path: "/Users/starver/code/public/cpython/Lib/http/server.py", size: 46093, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772106:File {id: 9772106, tag: "File", name: "client.py", parent_id: 9772104, stem: "client", extension: "py", path: "/Users/starver/code/public/cpython/Lib/http/client.py", size: 53914, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7153,16 +7538,20 @@ CREATE (n9772104) - [:PARENT_OF] -> (n9772109)
 CREATE (n9772104) - [:PARENT_OF] -> (n9772106)
 CREATE (n9772104) - [:PARENT_OF] -> (n9772105)
 CREATE (n9772104) - [:PARENT_OF] -> (n9772107)
+// group 9 1557
 CREATE (n9772487:Directory {id: 9772487, tag: "Directory", name: "sqlite3", parent_id: 9771638, stem: "sqlite3", extension: "", path: "/Users/starver/code/public/cpython/Lib/sqlite3", size: 192, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772487)
+MERGE (p9772487:Directory {id: 9771638})
+CREATE (p9772487) - [:PARENT_OF] -> (n9772487)
 CREATE (n9772488:File {id: 9772488, tag: "File", name: "__init__.py", parent_id: 9772487, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/sqlite3/__init__.py", size: 1018, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772490:File {id: 9772490, tag: "File", name: "dump.py", parent_id: 9772487, stem: "dump", extension: "py", path: "/Users/starver/code/public/cpython/Lib/sqlite3/dump.py", size: 2825, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772489:File {id: 9772489, tag: "File", name: "dbapi2.py", parent_id: 9772487, stem: "dbapi2", extension: "py", path: "/Users/starver/code/public/cpython/Lib/sqlite3/dbapi2.py", size: 2687, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772487) - [:PARENT_OF] -> (n9772488)
 CREATE (n9772487) - [:PARENT_OF] -> (n9772490)
 CREATE (n9772487) - [:PARENT_OF] -> (n9772489)
+// group 23 4314
 CREATE (n9772491:Directory {id: 9772491, tag: "Directory", name: "test", parent_id: 9772487, stem: "test", extension: "", path: "/Users/starver/code/public/cpython/Lib/sqlite3/test", size: 384, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772487) - [:PARENT_OF] -> (n9772491)
+MERGE (p9772491:Directory {id: 9772487})
+CREATE (p9772491) - [:PARENT_OF] -> (n9772491)
 CREATE (n9772493:File {id: 9772493, tag: "File", name: "backup.py", parent_id: 9772491, stem: "backup", extension: "py", path: "/Users/starver/code/public/cpython/Lib/sqlite3/test/backup.py", size: 5671, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772497:File {id: 9772497, tag: "File", name: "hooks.py", parent_id: 9772491, stem: "hooks", extension: "py", path: "/Users/starver/code/public/cpython/Lib/sqlite3/test/hooks.py", size: 10546, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772498:File {id: 9772498, tag: "File", name: "regression.py", parent_id: 9772491, stem: "regression", extension: "py", path: "/Users/starver/code/public/cpython/Lib/sqlite3/test/regression.py", size: 16538, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7183,26 +7572,34 @@ CREATE (n9772491) - [:PARENT_OF] -> (n9772500)
 CREATE (n9772491) - [:PARENT_OF] -> (n9772496)
 CREATE (n9772491) - [:PARENT_OF] -> (n9772495)
 CREATE (n9772491) - [:PARENT_OF] -> (n9772501)
+// group 9 1590
 CREATE (n9772076:Directory {id: 9772076, tag: "Directory", name: "ensurepip", parent_id: 9771638, stem: "ensurepip", extension: "", path: "/Users/starver/code/public/cpython/Lib/ensurepip", size: 192, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772076)
+MERGE (p9772076:Directory {id: 9771638})
+CREATE (p9772076) - [:PARENT_OF] -> (n9772076)
 CREATE (n9772077:File {id: 9772077, tag: "File", name: "__init__.py", parent_id: 9772076, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ensurepip/__init__.py", size: 6413, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772078:File {id: 9772078, tag: "File", name: "__main__.py", parent_id: 9772076, stem: "__main__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ensurepip/__main__.py", size: 88, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772082:File {id: 9772082, tag: "File", name: "_uninstall.py", parent_id: 9772076, stem: "_uninstall", extension: "py", path: "/Users/starver/code/public/cpython/Lib/ensurepip/_uninstall.py", size: 808, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772076) - [:PARENT_OF] -> (n9772077)
 CREATE (n9772076) - [:PARENT_OF] -> (n9772078)
 CREATE (n9772076) - [:PARENT_OF] -> (n9772082)
+// group 7 1364
 CREATE (n9772079:Directory {id: 9772079, tag: "Directory", name: "_bundled", parent_id: 9772076, stem: "_bundled", extension: "", path: "/Users/starver/code/public/cpython/Lib/ensurepip/_bundled", size: 128, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772076) - [:PARENT_OF] -> (n9772079)
+MERGE (p9772079:Directory {id: 9772076})
+CREATE (p9772079) - [:PARENT_OF] -> (n9772079)
 CREATE (n9772080:File {id: 9772080, tag: "File", name: "pip-18.1-py2.py3-none-any.whl", parent_id: 9772079, stem: "pip-18.1-py2.py3-none-any", extension: "whl", path: "/Users/starver/code/public/cpython/Lib/ensurepip/_bundled/pip-18.1-py2.py3-none-any.whl", size: 1323545, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772081:File {id: 9772081, tag: "File", name: "setuptools-40.6.2-py2.py3-none-any.whl", parent_id: 9772079, stem: "setuptools-40.6.2-py2.py3-none-any", extension: "whl", path: "/Users/starver/code/public/cpython/Lib/ensurepip/_bundled/setuptools-40.6.2-py2.py3-none-any.whl", size: 573107, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772079) - [:PARENT_OF] -> (n9772080)
 CREATE (n9772079) - [:PARENT_OF] -> (n9772081)
+// group 5 813
 CREATE (n9771708:Directory {id: 9771708, tag: "Directory", name: "concurrent", parent_id: 9771638, stem: "concurrent", extension: "", path: "/Users/starver/code/public/cpython/Lib/concurrent", size: 128, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771708)
+MERGE (p9771708:Directory {id: 9771638})
+CREATE (p9771708) - [:PARENT_OF] -> (n9771708)
 CREATE (n9771709:File {id: 9771709, tag: "File", name: "__init__.py", parent_id: 9771708, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/concurrent/__init__.py", size: 38, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771708) - [:PARENT_OF] -> (n9771709)
+// group 11 2000
 CREATE (n9771710:Directory {id: 9771710, tag: "Directory", name: "futures", parent_id: 9771708, stem: "futures", extension: "", path: "/Users/starver/code/public/cpython/Lib/concurrent/futures", size: 192, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771708) - [:PARENT_OF] -> (n9771710)
+MERGE (p9771710:Directory {id: 9771708})
+CREATE (p9771710) - [:PARENT_OF] -> (n9771710)
 CREATE (n9771712:File {id: 9771712, tag: "File", name: "_base.py", parent_id: 9771710, stem: "_base", extension: "py", path: "/Users/starver/code/public/cpython/Lib/concurrent/futures/_base.py", size: 21772, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771714:File {id: 9771714, tag: "File", name: "thread.py", parent_id: 9771710, stem: "thread", extension: "py", path: "/Users/starver/code/public/cpython/Lib/concurrent/futures/thread.py", size: 7554, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771711:File {id: 9771711, tag: "File", name: "__init__.py", parent_id: 9771710, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/concurrent/futures/__init__.py", size: 1554, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7211,34 +7608,46 @@ CREATE (n9771710) - [:PARENT_OF] -> (n9771712)
 CREATE (n9771710) - [:PARENT_OF] -> (n9771714)
 CREATE (n9771710) - [:PARENT_OF] -> (n9771711)
 CREATE (n9771710) - [:PARENT_OF] -> (n9771713)
+// group 7 1174
 CREATE (n9773762:Directory {id: 9773762, tag: "Directory", name: "venv", parent_id: 9771638, stem: "venv", extension: "", path: "/Users/starver/code/public/cpython/Lib/venv", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9773762)
+MERGE (p9773762:Directory {id: 9771638})
+CREATE (p9773762) - [:PARENT_OF] -> (n9773762)
 CREATE (n9773763:File {id: 9773763, tag: "File", name: "__init__.py", parent_id: 9773762, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/venv/__init__.py", size: 18486, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773764:File {id: 9773764, tag: "File", name: "__main__.py", parent_id: 9773762, stem: "__main__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/venv/__main__.py", size: 145, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773762) - [:PARENT_OF] -> (n9773763)
 CREATE (n9773762) - [:PARENT_OF] -> (n9773764)
+// group 3 422
 CREATE (n9773765:Directory {id: 9773765, tag: "Directory", name: "scripts", parent_id: 9773762, stem: "scripts", extension: "", path: "/Users/starver/code/public/cpython/Lib/venv/scripts", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773762) - [:PARENT_OF] -> (n9773765)
+MERGE (p9773765:Directory {id: 9773762})
+CREATE (p9773765) - [:PARENT_OF] -> (n9773765)
+// group 7 1227
 CREATE (n9773772:Directory {id: 9773772, tag: "Directory", name: "posix", parent_id: 9773765, stem: "posix", extension: "", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/posix", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773765) - [:PARENT_OF] -> (n9773772)
+MERGE (p9773772:Directory {id: 9773765})
+CREATE (p9773772) - [:PARENT_OF] -> (n9773772)
 CREATE (n9773774:File {id: 9773774, tag: "File", name: "activate.fish", parent_id: 9773772, stem: "activate", extension: "fish", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/posix/activate.fish", size: 2426, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773773:File {id: 9773773, tag: "File", name: "activate.csh", parent_id: 9773772, stem: "activate", extension: "csh", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/posix/activate.csh", size: 1276, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773772) - [:PARENT_OF] -> (n9773774)
 CREATE (n9773772) - [:PARENT_OF] -> (n9773773)
+// group 7 1214
 CREATE (n9773769:Directory {id: 9773769, tag: "Directory", name: "nt", parent_id: 9773765, stem: "nt", extension: "", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/nt", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773765) - [:PARENT_OF] -> (n9773769)
+MERGE (p9773769:Directory {id: 9773765})
+CREATE (p9773769) - [:PARENT_OF] -> (n9773769)
 CREATE (n9773770:File {id: 9773770, tag: "File", name: "activate.bat", parent_id: 9773769, stem: "activate", extension: "bat", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/nt/activate.bat", size: 1027, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773771:File {id: 9773771, tag: "File", name: "deactivate.bat", parent_id: 9773769, stem: "deactivate", extension: "bat", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/nt/deactivate.bat", size: 368, owner: 501, group: 20, created: 1545241637, accessed: 1545267147, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773769) - [:PARENT_OF] -> (n9773770)
 CREATE (n9773769) - [:PARENT_OF] -> (n9773771)
+// group 7 1218
 CREATE (n9773766:Directory {id: 9773766, tag: "Directory", name: "common", parent_id: 9773765, stem: "common", extension: "", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/common", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9773765) - [:PARENT_OF] -> (n9773766)
+MERGE (p9773766:Directory {id: 9773765})
+CREATE (p9773766) - [:PARENT_OF] -> (n9773766)
 CREATE (n9773767:File {id: 9773767, tag: "File", name: "Activate.ps1", parent_id: 9773766, stem: "Activate", extension: "ps1", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/common/Activate.ps1", size: 1663, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773768:File {id: 9773768, tag: "File", name: "activate", parent_id: 9773766, stem: "activate", extension: "", path: "/Users/starver/code/public/cpython/Lib/venv/scripts/common/activate", size: 2218, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773766) - [:PARENT_OF] -> (n9773767)
 CREATE (n9773766) - [:PARENT_OF] -> (n9773768)
+// group 11 1891
 CREATE (n9771798:Directory {id: 9771798, tag: "Directory", name: "dbm", parent_id: 9771638, stem: "dbm", extension: "", path: "/Users/starver/code/public/cpython/Lib/dbm", size: 192, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771798)
+MERGE (p9771798:Directory {id: 9771638})
+CREATE (p9771798) - [:PARENT_OF] -> (n9771798)
 CREATE (n9771802:File {id: 9771802, tag: "File", name: "ndbm.py", parent_id: 9771798, stem: "ndbm", extension: "py", path: "/Users/starver/code/public/cpython/Lib/dbm/ndbm.py", size: 70, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771801:File {id: 9771801, tag: "File", name: "gnu.py", parent_id: 9771798, stem: "gnu", extension: "py", path: "/Users/starver/code/public/cpython/Lib/dbm/gnu.py", size: 72, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771799:File {id: 9771799, tag: "File", name: "__init__.py", parent_id: 9771798, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/dbm/__init__.py", size: 5783, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7247,8 +7656,10 @@ CREATE (n9771798) - [:PARENT_OF] -> (n9771802)
 CREATE (n9771798) - [:PARENT_OF] -> (n9771801)
 CREATE (n9771798) - [:PARENT_OF] -> (n9771799)
 CREATE (n9771798) - [:PARENT_OF] -> (n9771800)
+// group 17 3160
 CREATE (n9772267:Directory {id: 9772267, tag: "Directory", name: "importlib", parent_id: 9771638, stem: "importlib", extension: "", path: "/Users/starver/code/public/cpython/Lib/importlib", size: 288, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772267)
+MERGE (p9772267:Directory {id: 9771638})
+CREATE (p9772267) - [:PARENT_OF] -> (n9772267)
 CREATE (n9772274:File {id: 9772274, tag: "File", name: "util.py", parent_id: 9772267, stem: "util", extension: "py", path: "/Users/starver/code/public/cpython/Lib/importlib/util.py", size: 11319, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772269:File {id: 9772269, tag: "File", name: "_bootstrap.py", parent_id: 9772267, stem: "_bootstrap", extension: "py", path: "/Users/starver/code/public/cpython/Lib/importlib/_bootstrap.py", size: 39560, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772268:File {id: 9772268, tag: "File", name: "__init__.py", parent_id: 9772267, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/importlib/__init__.py", size: 6061, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7263,16 +7674,20 @@ CREATE (n9772267) - [:PARENT_OF] -> (n9772270)
 CREATE (n9772267) - [:PARENT_OF] -> (n9772273)
 CREATE (n9772267) - [:PARENT_OF] -> (n9772272)
 CREATE (n9772267) - [:PARENT_OF] -> (n9772271)
+// group 9 1557
 CREATE (n9773814:Directory {id: 9773814, tag: "Directory", name: "xmlrpc", parent_id: 9771638, stem: "xmlrpc", extension: "", path: "/Users/starver/code/public/cpython/Lib/xmlrpc", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9773814)
+MERGE (p9773814:Directory {id: 9771638})
+CREATE (p9773814) - [:PARENT_OF] -> (n9773814)
 CREATE (n9773817:File {id: 9773817, tag: "File", name: "server.py", parent_id: 9773814, stem: "server", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xmlrpc/server.py", size: 36640, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773816:File {id: 9773816, tag: "File", name: "client.py", parent_id: 9773814, stem: "client", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xmlrpc/client.py", size: 48993, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773815:File {id: 9773815, tag: "File", name: "__init__.py", parent_id: 9773814, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/xmlrpc/__init__.py", size: 38, owner: 501, group: 20, created: 1545241637, accessed: 1545267146, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9773814) - [:PARENT_OF] -> (n9773817)
 CREATE (n9773814) - [:PARENT_OF] -> (n9773816)
 CREATE (n9773814) - [:PARENT_OF] -> (n9773815)
+// group 29 5451
 CREATE (n9772285:Directory {id: 9772285, tag: "Directory", name: "lib2to3", parent_id: 9771638, stem: "lib2to3", extension: "", path: "/Users/starver/code/public/cpython/Lib/lib2to3", size: 576, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772285)
+MERGE (p9772285:Directory {id: 9771638})
+CREATE (p9772285) - [:PARENT_OF] -> (n9772285)
 CREATE (n9772286:File {id: 9772286, tag: "File", name: "Grammar.txt", parent_id: 9772285, stem: "Grammar", extension: "txt", path: "/Users/starver/code/public/cpython/Lib/lib2to3/Grammar.txt", size: 6562, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772362:File {id: 9772362, tag: "File", name: "refactor.py", parent_id: 9772285, stem: "refactor", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/refactor.py", size: 27440, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772292:File {id: 9772292, tag: "File", name: "fixer_base.py", parent_id: 9772285, stem: "fixer_base", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/fixer_base.py", size: 6690, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7299,8 +7714,10 @@ CREATE (n9772285) - [:PARENT_OF] -> (n9772289)
 CREATE (n9772285) - [:PARENT_OF] -> (n9772293)
 CREATE (n9772285) - [:PARENT_OF] -> (n9772290)
 CREATE (n9772285) - [:PARENT_OF] -> (n9772361)
+// group 109 21649
 CREATE (n9772294:Directory {id: 9772294, tag: "Directory", name: "fixes", parent_id: 9772285, stem: "fixes", extension: "", path: "/Users/starver/code/public/cpython/Lib/lib2to3/fixes", size: 1760, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772285) - [:PARENT_OF] -> (n9772294)
+MERGE (p9772294:Directory {id: 9772285})
+CREATE (p9772294) - [:PARENT_OF] -> (n9772294)
 CREATE (n9772339:File {id: 9772339, tag: "File", name: "fix_throw.py", parent_id: 9772294, stem: "fix_throw", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/fixes/fix_throw.py", size: 1582, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772329:File {id: 9772329, tag: "File", name: "fix_print.py", parent_id: 9772294, stem: "fix_print", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/fixes/fix_print.py", size: 2844, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772314:File {id: 9772314, tag: "File", name: "fix_input.py", parent_id: 9772294, stem: "fix_input", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/fixes/fix_input.py", size: 708, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7407,8 +7824,10 @@ CREATE (n9772294) - [:PARENT_OF] -> (n9772317)
 CREATE (n9772294) - [:PARENT_OF] -> (n9772304)
 CREATE (n9772294) - [:PARENT_OF] -> (n9772344)
 CREATE (n9772294) - [:PARENT_OF] -> (n9772345)
+// group 25 4829
 CREATE (n9772363:Directory {id: 9772363, tag: "Directory", name: "tests", parent_id: 9772285, stem: "tests", extension: "", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests", size: 448, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772285) - [:PARENT_OF] -> (n9772363)
+MERGE (p9772363:Directory {id: 9772285})
+CREATE (p9772363) - [:PARENT_OF] -> (n9772363)
 CREATE (n9772391:File {id: 9772391, tag: "File", name: "test_parser.py", parent_id: 9772363, stem: "test_parser", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/test_parser.py", size: 21361, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772387:File {id: 9772387, tag: "File", name: "support.py", parent_id: 9772363, stem: "support", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/support.py", size: 1948, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772389:File {id: 9772389, tag: "File", name: "test_fixers.py", parent_id: 9772363, stem: "test_fixers", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/test_fixers.py", size: 122562, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7431,8 +7850,10 @@ CREATE (n9772363) - [:PARENT_OF] -> (n9772393)
 CREATE (n9772363) - [:PARENT_OF] -> (n9772386)
 CREATE (n9772363) - [:PARENT_OF] -> (n9772390)
 CREATE (n9772363) - [:PARENT_OF] -> (n9772365)
+// group 19 3678
 CREATE (n9772366:Directory {id: 9772366, tag: "Directory", name: "data", parent_id: 9772363, stem: "data", extension: "", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data", size: 352, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772363) - [:PARENT_OF] -> (n9772366)
+MERGE (p9772366:Directory {id: 9772363})
+CREATE (p9772366) - [:PARENT_OF] -> (n9772366)
 CREATE (n9772370:File {id: 9772370, tag: "File", name: "different_encoding.py", parent_id: 9772366, stem: "different_encoding", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/different_encoding.py", size: 230, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9772371:File {id: 9772371, tag: "File", name: "false_encoding.py", parent_id: 9772366, stem: "false_encoding", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/false_encoding.py", size: 40, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9772383:File {id: 9772383, tag: "File", name: "infinite_recursion.py", parent_id: 9772366, stem: "infinite_recursion", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/infinite_recursion.py", size: 93071, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7449,16 +7870,20 @@ CREATE (n9772366) - [:PARENT_OF] -> (n9772368)
 CREATE (n9772366) - [:PARENT_OF] -> (n9772384)
 CREATE (n9772366) - [:PARENT_OF] -> (n9772369)
 CREATE (n9772366) - [:PARENT_OF] -> (n9772385)
+// group 9 1672
 CREATE (n9772372:Directory {id: 9772372, tag: "Directory", name: "fixers", parent_id: 9772366, stem: "fixers", extension: "", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/fixers", size: 192, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772366) - [:PARENT_OF] -> (n9772372)
+MERGE (p9772372:Directory {id: 9772366})
+CREATE (p9772372) - [:PARENT_OF] -> (n9772372)
 CREATE (n9772373:File {id: 9772373, tag: "File", name: "bad_order.py", parent_id: 9772372, stem: "bad_order", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/fixers/bad_order.py", size: 89, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772382:File {id: 9772382, tag: "File", name: "parrot_example.py", parent_id: 9772372, stem: "parrot_example", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/fixers/parrot_example.py", size: 23, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772381:File {id: 9772381, tag: "File", name: "no_fixer_cls.py", parent_id: 9772372, stem: "no_fixer_cls", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/fixers/no_fixer_cls.py", size: 75, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772372) - [:PARENT_OF] -> (n9772373)
 CREATE (n9772372) - [:PARENT_OF] -> (n9772382)
 CREATE (n9772372) - [:PARENT_OF] -> (n9772381)
+// group 15 2940
 CREATE (n9772374:Directory {id: 9772374, tag: "Directory", name: "myfixes", parent_id: 9772372, stem: "myfixes", extension: "", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/fixers/myfixes", size: 256, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772372) - [:PARENT_OF] -> (n9772374)
+MERGE (p9772374:Directory {id: 9772372})
+CREATE (p9772374) - [:PARENT_OF] -> (n9772374)
 CREATE (n9772379:File {id: 9772379, tag: "File", name: "fix_parrot.py", parent_id: 9772374, stem: "fix_parrot", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/fixers/myfixes/fix_parrot.py", size: 347, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772376:File {id: 9772376, tag: "File", name: "fix_explicit.py", parent_id: 9772374, stem: "fix_explicit", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/fixers/myfixes/fix_explicit.py", size: 123, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772377:File {id: 9772377, tag: "File", name: "fix_first.py", parent_id: 9772374, stem: "fix_first", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/tests/data/fixers/myfixes/fix_first.py", size: 124, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7471,8 +7896,10 @@ CREATE (n9772374) - [:PARENT_OF] -> (n9772377)
 CREATE (n9772374) - [:PARENT_OF] -> (n9772375)
 CREATE (n9772374) - [:PARENT_OF] -> (n9772380)
 CREATE (n9772374) - [:PARENT_OF] -> (n9772378)
+// group 21 3897
 CREATE (n9772350:Directory {id: 9772350, tag: "Directory", name: "pgen2", parent_id: 9772285, stem: "pgen2", extension: "", path: "/Users/starver/code/public/cpython/Lib/lib2to3/pgen2", size: 352, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772285) - [:PARENT_OF] -> (n9772350)
+MERGE (p9772350:Directory {id: 9772285})
+CREATE (p9772350) - [:PARENT_OF] -> (n9772350)
 CREATE (n9772358:File {id: 9772358, tag: "File", name: "token.py", parent_id: 9772350, stem: "token", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/pgen2/token.py", size: 1286, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9772357:File {id: 9772357, tag: "File", name: "pgen.py", parent_id: 9772350, stem: "pgen", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/pgen2/pgen.py", size: 13812, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772351:File {id: 9772351, tag: "File", name: "__init__.py", parent_id: 9772350, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/lib2to3/pgen2/__init__.py", size: 143, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7491,8 +7918,10 @@ CREATE (n9772350) - [:PARENT_OF] -> (n9772352)
 CREATE (n9772350) - [:PARENT_OF] -> (n9772356)
 CREATE (n9772350) - [:PARENT_OF] -> (n9772353)
 CREATE (n9772350) - [:PARENT_OF] -> (n9772359)
+// group 151 29043
 CREATE (n9772110:Directory {id: 9772110, tag: "Directory", name: "idlelib", parent_id: 9771638, stem: "idlelib", extension: "", path: "/Users/starver/code/public/cpython/Lib/idlelib", size: 2496, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772110)
+MERGE (p9772110:Directory {id: 9771638})
+CREATE (p9772110) - [:PARENT_OF] -> (n9772110)
 CREATE (n9772235:File {id: 9772235, tag: "File", name: "multicall.py", parent_id: 9772110, stem: "multicall", extension: "py", path: "/Users/starver/code/public/cpython/Lib/idlelib/multicall.py", size: 18648, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772166:File {id: 9772166, tag: "File", name: "idle.py", parent_id: 9772110, stem: "idle", extension: "py", path: "/Users/starver/code/public/cpython/Lib/idlelib/idle.py", size: 454, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772234:File {id: 9772234, tag: "File", name: "mainmenu.py", parent_id: 9772110, stem: "mainmenu", extension: "py", path: "/Users/starver/code/public/cpython/Lib/idlelib/mainmenu.py", size: 3703, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7641,8 +8070,10 @@ CREATE (n9772110) - [:PARENT_OF] -> (n9772165)
 CREATE (n9772110) - [:PARENT_OF] -> (n9772163)
 CREATE (n9772110) - [:PARENT_OF] -> (n9772153)
 CREATE (n9772110) - [:PARENT_OF] -> (n9772245)
+// group 31 5882
 CREATE (n9772114:Directory {id: 9772114, tag: "Directory", name: "Icons", parent_id: 9772110, stem: "Icons", extension: "", path: "/Users/starver/code/public/cpython/Lib/idlelib/Icons", size: 512, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772110) - [:PARENT_OF] -> (n9772114)
+MERGE (p9772114:Directory {id: 9772110})
+CREATE (p9772114) - [:PARENT_OF] -> (n9772114)
 CREATE (n9772126:File {id: 9772126, tag: "File", name: "plusnode.gif", parent_id: 9772114, stem: "plusnode", extension: "gif", path: "/Users/starver/code/public/cpython/Lib/idlelib/Icons/plusnode.gif", size: 79, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772115:File {id: 9772115, tag: "File", name: "folder.gif", parent_id: 9772114, stem: "folder", extension: "gif", path: "/Users/starver/code/public/cpython/Lib/idlelib/Icons/folder.gif", size: 120, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772123:File {id: 9772123, tag: "File", name: "idle_48.png", parent_id: 9772114, stem: "idle_48", extension: "png", path: "/Users/starver/code/public/cpython/Lib/idlelib/Icons/idle_48.png", size: 4710, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7671,8 +8102,10 @@ CREATE (n9772114) - [:PARENT_OF] -> (n9772121)
 CREATE (n9772114) - [:PARENT_OF] -> (n9772116)
 CREATE (n9772114) - [:PARENT_OF] -> (n9772117)
 CREATE (n9772114) - [:PARENT_OF] -> (n9772118)
+// group 129 26229
 CREATE (n9772168:Directory {id: 9772168, tag: "Directory", name: "idle_test", parent_id: 9772110, stem: "idle_test", extension: "", path: "/Users/starver/code/public/cpython/Lib/idlelib/idle_test", size: 2080, owner: 501, group: 20, created: 1545241636, accessed: 1545676677, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9772110) - [:PARENT_OF] -> (n9772168)
+MERGE (p9772168:Directory {id: 9772110})
+CREATE (p9772168) - [:PARENT_OF] -> (n9772168)
 CREATE (n9772204:File {id: 9772204, tag: "File", name: "test_paragraph.py", parent_id: 9772168, stem: "test_paragraph", extension: "py", path: "/Users/starver/code/public/cpython/Lib/idlelib/idle_test/test_paragraph.py", size: 14352, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772200:File {id: 9772200, tag: "File", name: "test_macosx.py", parent_id: 9772168, stem: "test_macosx", extension: "py", path: "/Users/starver/code/public/cpython/Lib/idlelib/idle_test/test_macosx.py", size: 3309, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772214:File {id: 9772214, tag: "File", name: "test_rstrip.py", parent_id: 9772168, stem: "test_rstrip", extension: "py", path: "/Users/starver/code/public/cpython/Lib/idlelib/idle_test/test_rstrip.py", size: 1605, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7799,22 +8232,28 @@ CREATE (n9772168) - [:PARENT_OF] -> (n9772173)
 CREATE (n9772168) - [:PARENT_OF] -> (n9772182)
 CREATE (n9772168) - [:PARENT_OF] -> (n9772185)
 CREATE (n9772168) - [:PARENT_OF] -> (n9772221)
+// group 9 1581
 CREATE (n9772461:Directory {id: 9772461, tag: "Directory", name: "pydoc_data", parent_id: 9771638, stem: "pydoc_data", extension: "", path: "/Users/starver/code/public/cpython/Lib/pydoc_data", size: 160, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772461)
+MERGE (p9772461:Directory {id: 9771638})
+CREATE (p9772461) - [:PARENT_OF] -> (n9772461)
 CREATE (n9772462:File {id: 9772462, tag: "File", name: "__init__.py", parent_id: 9772461, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/pydoc_data/__init__.py", size: 0, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772463:File {id: 9772463, tag: "File", name: "_pydoc.css", parent_id: 9772461, stem: "_pydoc", extension: "css", path: "/Users/starver/code/public/cpython/Lib/pydoc_data/_pydoc.css", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772464:File {id: 9772464, tag: "File", name: "topics.py", parent_id: 9772461, stem: "topics", extension: "py", path: "/Users/starver/code/public/cpython/Lib/pydoc_data/topics.py", size: 649306, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772461) - [:PARENT_OF] -> (n9772462)
 CREATE (n9772461) - [:PARENT_OF] -> (n9772463)
 CREATE (n9772461) - [:PARENT_OF] -> (n9772464)
+// group 7 1193
 CREATE (n9771703:Directory {id: 9771703, tag: "Directory", name: "collections", parent_id: 9771638, stem: "collections", extension: "", path: "/Users/starver/code/public/cpython/Lib/collections", size: 128, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771703)
+MERGE (p9771703:Directory {id: 9771638})
+CREATE (p9771703) - [:PARENT_OF] -> (n9771703)
 CREATE (n9771704:File {id: 9771704, tag: "File", name: "__init__.py", parent_id: 9771703, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/collections/__init__.py", size: 47971, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771705:File {id: 9771705, tag: "File", name: "abc.py", parent_id: 9771703, stem: "abc", extension: "py", path: "/Users/starver/code/public/cpython/Lib/collections/abc.py", size: 68, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771703) - [:PARENT_OF] -> (n9771704)
 CREATE (n9771703) - [:PARENT_OF] -> (n9771705)
+// group 55 10589
 CREATE (n9771661:Directory {id: 9771661, tag: "Directory", name: "asyncio", parent_id: 9771638, stem: "asyncio", extension: "", path: "/Users/starver/code/public/cpython/Lib/asyncio", size: 896, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771661)
+MERGE (p9771661:Directory {id: 9771638})
+CREATE (p9771661) - [:PARENT_OF] -> (n9771661)
 CREATE (n9771677:File {id: 9771677, tag: "File", name: "queues.py", parent_id: 9771661, stem: "queues", extension: "py", path: "/Users/starver/code/public/cpython/Lib/asyncio/queues.py", size: 8003, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771681:File {id: 9771681, tag: "File", name: "streams.py", parent_id: 9771661, stem: "streams", extension: "py", path: "/Users/starver/code/public/cpython/Lib/asyncio/streams.py", size: 26227, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771683:File {id: 9771683, tag: "File", name: "tasks.py", parent_id: 9771661, stem: "tasks", extension: "py", path: "/Users/starver/code/public/cpython/Lib/asyncio/tasks.py", size: 30988, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7867,16 +8306,20 @@ CREATE (n9771661) - [:PARENT_OF] -> (n9771668)
 CREATE (n9771661) - [:PARENT_OF] -> (n9771686)
 CREATE (n9771661) - [:PARENT_OF] -> (n9771664)
 CREATE (n9771661) - [:PARENT_OF] -> (n9771685)
+// group 9 1572
 CREATE (n9772397:Directory {id: 9772397, tag: "Directory", name: "logging", parent_id: 9771638, stem: "logging", extension: "", path: "/Users/starver/code/public/cpython/Lib/logging", size: 160, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9772397)
+MERGE (p9772397:Directory {id: 9771638})
+CREATE (p9772397) - [:PARENT_OF] -> (n9772397)
 CREATE (n9772399:File {id: 9772399, tag: "File", name: "config.py", parent_id: 9772397, stem: "config", extension: "py", path: "/Users/starver/code/public/cpython/Lib/logging/config.py", size: 36249, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772400:File {id: 9772400, tag: "File", name: "handlers.py", parent_id: 9772397, stem: "handlers", extension: "py", path: "/Users/starver/code/public/cpython/Lib/logging/handlers.py", size: 57674, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772398:File {id: 9772398, tag: "File", name: "__init__.py", parent_id: 9772397, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/logging/__init__.py", size: 77679, owner: 501, group: 20, created: 1545241636, accessed: 1545267142, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9772397) - [:PARENT_OF] -> (n9772399)
 CREATE (n9772397) - [:PARENT_OF] -> (n9772400)
 CREATE (n9772397) - [:PARENT_OF] -> (n9772398)
+// group 45 8592
 CREATE (n9771918:Directory {id: 9771918, tag: "Directory", name: "email", parent_id: 9771638, stem: "email", extension: "", path: "/Users/starver/code/public/cpython/Lib/email", size: 768, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771638) - [:PARENT_OF] -> (n9771918)
+MERGE (p9771918:Directory {id: 9771638})
+CREATE (p9771918) - [:PARENT_OF] -> (n9771918)
 CREATE (n9771927:File {id: 9771927, tag: "File", name: "contentmanager.py", parent_id: 9771918, stem: "contentmanager", extension: "py", path: "/Users/starver/code/public/cpython/Lib/email/contentmanager.py", size: 10672, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771923:File {id: 9771923, tag: "File", name: "_policybase.py", parent_id: 9771918, stem: "_policybase", extension: "py", path: "/Users/starver/code/public/cpython/Lib/email/_policybase.py", size: 15073, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771932:File {id: 9771932, tag: "File", name: "header.py", parent_id: 9771918, stem: "header", extension: "py", path: "/Users/starver/code/public/cpython/Lib/email/header.py", size: 24086, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7919,8 +8362,10 @@ CREATE (n9771918) - [:PARENT_OF] -> (n9771924)
 CREATE (n9771918) - [:PARENT_OF] -> (n9771922)
 CREATE (n9771918) - [:PARENT_OF] -> (n9771925)
 CREATE (n9771918) - [:PARENT_OF] -> (n9771933)
+// group 21 3889
 CREATE (n9771936:Directory {id: 9771936, tag: "Directory", name: "mime", parent_id: 9771918, stem: "mime", extension: "", path: "/Users/starver/code/public/cpython/Lib/email/mime", size: 352, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771918) - [:PARENT_OF] -> (n9771936)
+MERGE (p9771936:Directory {id: 9771918})
+CREATE (p9771936) - [:PARENT_OF] -> (n9771936)
 CREATE (n9771943:File {id: 9771943, tag: "File", name: "multipart.py", parent_id: 9771936, stem: "multipart", extension: "py", path: "/Users/starver/code/public/cpython/Lib/email/mime/multipart.py", size: 1621, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771937:File {id: 9771937, tag: "File", name: "__init__.py", parent_id: 9771936, stem: "__init__", extension: "py", path: "/Users/starver/code/public/cpython/Lib/email/mime/__init__.py", size: 0, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771942:File {id: 9771942, tag: "File", name: "message.py", parent_id: 9771936, stem: "message", extension: "py", path: "/Users/starver/code/public/cpython/Lib/email/mime/message.py", size: 1317, owner: 501, group: 20, created: 1545241636, accessed: 1545267138, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7939,14 +8384,18 @@ CREATE (n9771936) - [:PARENT_OF] -> (n9771945)
 CREATE (n9771936) - [:PARENT_OF] -> (n9771939)
 CREATE (n9771936) - [:PARENT_OF] -> (n9771941)
 CREATE (n9771936) - [:PARENT_OF] -> (n9771940)
+// group 7 1230
 CREATE (n9775970:Directory {id: 9775970, tag: "Directory", name: "m4", parent_id: 9768633, stem: "m4", extension: "", path: "/Users/starver/code/public/cpython/m4", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676678, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9775970)
+MERGE (p9775970:Directory {id: 9768633})
+CREATE (p9775970) - [:PARENT_OF] -> (n9775970)
 CREATE (n9775972:File {id: 9775972, tag: "File", name: "ax_check_openssl.m4", parent_id: 9775970, stem: "ax_check_openssl", extension: "m4", path: "/Users/starver/code/public/cpython/m4/ax_check_openssl.m4", size: 4189, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775971:File {id: 9775971, tag: "File", name: "ax_c_float_words_bigendian.m4", parent_id: 9775970, stem: "ax_c_float_words_bigendian", extension: "m4", path: "/Users/starver/code/public/cpython/m4/ax_c_float_words_bigendian.m4", size: 3159, owner: 501, group: 20, created: 1545241637, accessed: 1545267152, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775970) - [:PARENT_OF] -> (n9775972)
 CREATE (n9775970) - [:PARENT_OF] -> (n9775971)
+// group 23 4146
 CREATE (n9770925:Directory {id: 9770925, tag: "Directory", name: "Doc", parent_id: 9768633, stem: "Doc", extension: "", path: "/Users/starver/code/public/cpython/Doc", size: 896, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9770925)
+MERGE (p9770925:Directory {id: 9768633})
+CREATE (p9770925) - [:PARENT_OF] -> (n9770925)
 CREATE (n9770929:File {id: 9770929, tag: "File", name: "bugs.rst", parent_id: 9770925, stem: "bugs", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/bugs.rst", size: 4338, owner: 501, group: 20, created: 1545241636, accessed: 1545267129, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770992:File {id: 9770992, tag: "File", name: "contents.rst", parent_id: 9770925, stem: "contents", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/contents.rst", size: 538, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770926:File {id: 9770926, tag: "File", name: "Makefile", parent_id: 9770925, stem: "Makefile", extension: "", path: "/Users/starver/code/public/cpython/Doc/Makefile", size: 7538, owner: 501, group: 20, created: 1545241636, accessed: 1545267129, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7967,8 +8416,10 @@ CREATE (n9770925) - [:PARENT_OF] -> (n9771426)
 CREATE (n9770925) - [:PARENT_OF] -> (n9770927)
 CREATE (n9770925) - [:PARENT_OF] -> (n9771030)
 CREATE (n9770925) - [:PARENT_OF] -> (n9770928)
+// group 27 5163
 CREATE (n9770998:Directory {id: 9770998, tag: "Directory", name: "distutils", parent_id: 9770925, stem: "distutils", extension: "", path: "/Users/starver/code/public/cpython/Doc/distutils", size: 448, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9770998)
+MERGE (p9770998:Directory {id: 9770925})
+CREATE (p9770998) - [:PARENT_OF] -> (n9770998)
 CREATE (n9771005:File {id: 9771005, tag: "File", name: "index.rst", parent_id: 9770998, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/distutils/index.rst", size: 1237, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771000:File {id: 9771000, tag: "File", name: "builtdist.rst", parent_id: 9770998, stem: "builtdist", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/distutils/builtdist.rst", size: 22639, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771002:File {id: 9771002, tag: "File", name: "configfile.rst", parent_id: 9770998, stem: "configfile", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/distutils/configfile.rst", size: 6018, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -7993,8 +8444,10 @@ CREATE (n9770998) - [:PARENT_OF] -> (n9771009)
 CREATE (n9770998) - [:PARENT_OF] -> (n9770999)
 CREATE (n9770998) - [:PARENT_OF] -> (n9771006)
 CREATE (n9770998) - [:PARENT_OF] -> (n9771001)
+// group 37 7096
 CREATE (n9771460:Directory {id: 9771460, tag: "Directory", name: "tutorial", parent_id: 9770925, stem: "tutorial", extension: "", path: "/Users/starver/code/public/cpython/Doc/tutorial", size: 608, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771460)
+MERGE (p9771460:Directory {id: 9770925})
+CREATE (p9771460) - [:PARENT_OF] -> (n9771460)
 CREATE (n9771476:File {id: 9771476, tag: "File", name: "venv.rst", parent_id: 9771460, stem: "venv", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/tutorial/venv.rst", size: 7354, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771468:File {id: 9771468, tag: "File", name: "index.rst", parent_id: 9771460, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/tutorial/index.rst", size: 2386, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771466:File {id: 9771466, tag: "File", name: "errors.rst", parent_id: 9771460, stem: "errors", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/tutorial/errors.rst", size: 15045, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8029,14 +8482,18 @@ CREATE (n9771460) - [:PARENT_OF] -> (n9771461)
 CREATE (n9771460) - [:PARENT_OF] -> (n9771475)
 CREATE (n9771460) - [:PARENT_OF] -> (n9771471)
 CREATE (n9771460) - [:PARENT_OF] -> (n9771472)
+// group 7 1192
 CREATE (n9771440:Directory {id: 9771440, tag: "Directory", name: "tools", parent_id: 9770925, stem: "tools", extension: "", path: "/Users/starver/code/public/cpython/Doc/tools", size: 224, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771440)
+MERGE (p9771440:Directory {id: 9770925})
+CREATE (p9771440) - [:PARENT_OF] -> (n9771440)
 CREATE (n9771447:File {id: 9771447, tag: "File", name: "rstlint.py", parent_id: 9771440, stem: "rstlint", extension: "py", path: "/Users/starver/code/public/cpython/Doc/tools/rstlint.py", size: 7590, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9771451:File {id: 9771451, tag: "File", name: "susp-ignored.csv", parent_id: 9771440, stem: "susp-ignored", extension: "csv", path: "/Users/starver/code/public/cpython/Doc/tools/susp-ignored.csv", size: 21088, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771440) - [:PARENT_OF] -> (n9771447)
 CREATE (n9771440) - [:PARENT_OF] -> (n9771451)
+// group 13 2447
 CREATE (n9771441:Directory {id: 9771441, tag: "Directory", name: "extensions", parent_id: 9771440, stem: "extensions", extension: "", path: "/Users/starver/code/public/cpython/Doc/tools/extensions", size: 224, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771440) - [:PARENT_OF] -> (n9771441)
+MERGE (p9771441:Directory {id: 9771440})
+CREATE (p9771441) - [:PARENT_OF] -> (n9771441)
 CREATE (n9771445:File {id: 9771445, tag: "File", name: "pyspecific.py", parent_id: 9771441, stem: "pyspecific", extension: "py", path: "/Users/starver/code/public/cpython/Doc/tools/extensions/pyspecific.py", size: 16028, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771444:File {id: 9771444, tag: "File", name: "patchlevel.py", parent_id: 9771441, stem: "patchlevel", extension: "py", path: "/Users/starver/code/public/cpython/Doc/tools/extensions/patchlevel.py", size: 1952, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771443:File {id: 9771443, tag: "File", name: "escape4chm.py", parent_id: 9771441, stem: "escape4chm", extension: "py", path: "/Users/starver/code/public/cpython/Doc/tools/extensions/escape4chm.py", size: 1144, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8047,14 +8504,18 @@ CREATE (n9771441) - [:PARENT_OF] -> (n9771444)
 CREATE (n9771441) - [:PARENT_OF] -> (n9771443)
 CREATE (n9771441) - [:PARENT_OF] -> (n9771446)
 CREATE (n9771441) - [:PARENT_OF] -> (n9771442)
+// group 7 1229
 CREATE (n9771448:Directory {id: 9771448, tag: "Directory", name: "static", parent_id: 9771440, stem: "static", extension: "", path: "/Users/starver/code/public/cpython/Doc/tools/static", size: 128, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771440) - [:PARENT_OF] -> (n9771448)
+MERGE (p9771448:Directory {id: 9771440})
+CREATE (p9771448) - [:PARENT_OF] -> (n9771448)
 CREATE (n9771450:File {id: 9771450, tag: "File", name: "switchers.js", parent_id: 9771448, stem: "switchers", extension: "js", path: "/Users/starver/code/public/cpython/Doc/tools/static/switchers.js", size: 5061, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771449:File {id: 9771449, tag: "File", name: "changelog_search.js", parent_id: 9771448, stem: "changelog_search", extension: "js", path: "/Users/starver/code/public/cpython/Doc/tools/static/changelog_search.js", size: 1895, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771448) - [:PARENT_OF] -> (n9771450)
 CREATE (n9771448) - [:PARENT_OF] -> (n9771449)
+// group 17 3262
 CREATE (n9771452:Directory {id: 9771452, tag: "Directory", name: "templates", parent_id: 9771440, stem: "templates", extension: "", path: "/Users/starver/code/public/cpython/Doc/tools/templates", size: 288, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771440) - [:PARENT_OF] -> (n9771452)
+MERGE (p9771452:Directory {id: 9771440})
+CREATE (p9771452) - [:PARENT_OF] -> (n9771452)
 CREATE (n9771459:File {id: 9771459, tag: "File", name: "opensearch.xml", parent_id: 9771452, stem: "opensearch", extension: "xml", path: "/Users/starver/code/public/cpython/Doc/tools/templates/opensearch.xml", size: 172, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771456:File {id: 9771456, tag: "File", name: "indexcontent.html", parent_id: 9771452, stem: "indexcontent", extension: "html", path: "/Users/starver/code/public/cpython/Doc/tools/templates/indexcontent.html", size: 5229, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771457:File {id: 9771457, tag: "File", name: "indexsidebar.html", parent_id: 9771452, stem: "indexsidebar", extension: "html", path: "/Users/starver/code/public/cpython/Doc/tools/templates/indexsidebar.html", size: 1454, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8069,16 +8530,22 @@ CREATE (n9771452) - [:PARENT_OF] -> (n9771458)
 CREATE (n9771452) - [:PARENT_OF] -> (n9771454)
 CREATE (n9771452) - [:PARENT_OF] -> (n9771455)
 CREATE (n9771452) - [:PARENT_OF] -> (n9771453)
+// group 5 797
 CREATE (n9771105:Directory {id: 9771105, tag: "Directory", name: "install", parent_id: 9770925, stem: "install", extension: "", path: "/Users/starver/code/public/cpython/Doc/install", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771105)
+MERGE (p9771105:Directory {id: 9770925})
+CREATE (p9771105) - [:PARENT_OF] -> (n9771105)
 CREATE (n9771106:File {id: 9771106, tag: "File", name: "index.rst", parent_id: 9771105, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/install/index.rst", size: 50137, owner: 501, group: 20, created: 1545241636, accessed: 1545267134, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771105) - [:PARENT_OF] -> (n9771106)
+// group 5 808
 CREATE (n9771107:Directory {id: 9771107, tag: "Directory", name: "installing", parent_id: 9770925, stem: "installing", extension: "", path: "/Users/starver/code/public/cpython/Doc/installing", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771107)
+MERGE (p9771107:Directory {id: 9770925})
+CREATE (p9771107) - [:PARENT_OF] -> (n9771107)
 CREATE (n9771108:File {id: 9771108, tag: "File", name: "index.rst", parent_id: 9771107, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/installing/index.rst", size: 9377, owner: 501, group: 20, created: 1545241636, accessed: 1545267134, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771107) - [:PARENT_OF] -> (n9771108)
+// group 23 4263
 CREATE (n9771019:Directory {id: 9771019, tag: "Directory", name: "faq", parent_id: 9770925, stem: "faq", extension: "", path: "/Users/starver/code/public/cpython/Doc/faq", size: 384, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771019)
+MERGE (p9771019:Directory {id: 9770925})
+CREATE (p9771019) - [:PARENT_OF] -> (n9771019)
 CREATE (n9771024:File {id: 9771024, tag: "File", name: "index.rst", parent_id: 9771019, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/faq/index.rst", size: 278, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771020:File {id: 9771020, tag: "File", name: "design.rst", parent_id: 9771019, stem: "design", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/faq/design.rst", size: 34684, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771023:File {id: 9771023, tag: "File", name: "gui.rst", parent_id: 9771019, stem: "gui", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/faq/gui.rst", size: 5902, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8099,8 +8566,10 @@ CREATE (n9771019) - [:PARENT_OF] -> (n9771025)
 CREATE (n9771019) - [:PARENT_OF] -> (n9771029)
 CREATE (n9771019) - [:PARENT_OF] -> (n9771027)
 CREATE (n9771019) - [:PARENT_OF] -> (n9771022)
+// group 49 9438
 CREATE (n9771050:Directory {id: 9771050, tag: "Directory", name: "includes", parent_id: 9770925, stem: "includes", extension: "", path: "/Users/starver/code/public/cpython/Doc/includes", size: 832, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771050)
+MERGE (p9771050:Directory {id: 9770925})
+CREATE (p9771050) - [:PARENT_OF] -> (n9771050)
 CREATE (n9771057:File {id: 9771057, tag: "File", name: "email-dir.py", parent_id: 9771050, stem: "email-dir", extension: "py", path: "/Users/starver/code/public/cpython/Doc/includes/email-dir.py", size: 3070, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771061:File {id: 9771061, tag: "File", name: "email-simple.py", parent_id: 9771050, stem: "email-simple", extension: "py", path: "/Users/starver/code/public/cpython/Doc/includes/email-simple.py", size: 587, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771063:File {id: 9771063, tag: "File", name: "minidom-example.py", parent_id: 9771050, stem: "minidom-example", extension: "py", path: "/Users/starver/code/public/cpython/Doc/includes/minidom-example.py", size: 1582, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8147,8 +8616,10 @@ CREATE (n9771050) - [:PARENT_OF] -> (n9771102)
 CREATE (n9771050) - [:PARENT_OF] -> (n9771060)
 CREATE (n9771050) - [:PARENT_OF] -> (n9771104)
 CREATE (n9771050) - [:PARENT_OF] -> (n9771065)
+// group 63 12733
 CREATE (n9771069:Directory {id: 9771069, tag: "Directory", name: "sqlite3", parent_id: 9771050, stem: "sqlite3", extension: "", path: "/Users/starver/code/public/cpython/Doc/includes/sqlite3", size: 1024, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9771050) - [:PARENT_OF] -> (n9771069)
+MERGE (p9771069:Directory {id: 9771050})
+CREATE (p9771069) - [:PARENT_OF] -> (n9771069)
 CREATE (n9771093:File {id: 9771093, tag: "File", name: "pysqlite_datetime.py", parent_id: 9771069, stem: "pysqlite_datetime", extension: "py", path: "/Users/starver/code/public/cpython/Doc/includes/sqlite3/pysqlite_datetime.py", size: 672, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771082:File {id: 9771082, tag: "File", name: "execsql_printall_1.py", parent_id: 9771069, stem: "execsql_printall_1", extension: "py", path: "/Users/starver/code/public/cpython/Doc/includes/sqlite3/execsql_printall_1.py", size: 351, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771070:File {id: 9771070, tag: "File", name: "adapter_datetime.py", parent_id: 9771069, stem: "adapter_datetime", extension: "py", path: "/Users/starver/code/public/cpython/Doc/includes/sqlite3/adapter_datetime.py", size: 310, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8209,8 +8680,10 @@ CREATE (n9771069) - [:PARENT_OF] -> (n9771080)
 CREATE (n9771069) - [:PARENT_OF] -> (n9771083)
 CREATE (n9771069) - [:PARENT_OF] -> (n9771098)
 CREATE (n9771069) - [:PARENT_OF] -> (n9771078)
+// group 17 3104
 CREATE (n9771478:Directory {id: 9771478, tag: "Directory", name: "using", parent_id: 9770925, stem: "using", extension: "", path: "/Users/starver/code/public/cpython/Doc/using", size: 288, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771478)
+MERGE (p9771478:Directory {id: 9770925})
+CREATE (p9771478) - [:PARENT_OF] -> (n9771478)
 CREATE (n9771480:File {id: 9771480, tag: "File", name: "index.rst", parent_id: 9771478, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/using/index.rst", size: 393, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771481:File {id: 9771481, tag: "File", name: "mac.rst", parent_id: 9771478, stem: "mac", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/using/mac.rst", size: 7151, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771483:File {id: 9771483, tag: "File", name: "venv-create.inc", parent_id: 9771478, stem: "venv-create", extension: "inc", path: "/Users/starver/code/public/cpython/Doc/using/venv-create.inc", size: 5841, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8225,8 +8698,10 @@ CREATE (n9771478) - [:PARENT_OF] -> (n9771479)
 CREATE (n9771478) - [:PARENT_OF] -> (n9771484)
 CREATE (n9771478) - [:PARENT_OF] -> (n9771482)
 CREATE (n9771478) - [:PARENT_OF] -> (n9771485)
+// group 635 123702
 CREATE (n9771109:Directory {id: 9771109, tag: "Directory", name: "library", parent_id: 9770925, stem: "library", extension: "", path: "/Users/starver/code/public/cpython/Doc/library", size: 10176, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771109)
+MERGE (p9771109:Directory {id: 9770925})
+CREATE (p9771109) - [:PARENT_OF] -> (n9771109)
 CREATE (n9771125:File {id: 9771125, tag: "File", name: "asyncio-eventloop.rst", parent_id: 9771109, stem: "asyncio-eventloop", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/library/asyncio-eventloop.rst", size: 53488, owner: 501, group: 20, created: 1545241636, accessed: 1545267134, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771366:File {id: 9771366, tag: "File", name: "time.rst", parent_id: 9771109, stem: "time", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/library/time.rst", size: 36318, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771280:File {id: 9771280, tag: "File", name: "msvcrt.rst", parent_id: 9771109, stem: "msvcrt", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/library/msvcrt.rst", size: 4392, owner: 501, group: 20, created: 1545241636, accessed: 1545267135, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8859,8 +9334,10 @@ CREATE (n9771109) - [:PARENT_OF] -> (n9771110)
 CREATE (n9771109) - [:PARENT_OF] -> (n9771114)
 CREATE (n9771109) - [:PARENT_OF] -> (n9771257)
 CREATE (n9771109) - [:PARENT_OF] -> (n9771357)
+// group 41 7588
 CREATE (n9771486:Directory {id: 9771486, tag: "Directory", name: "whatsnew", parent_id: 9770925, stem: "whatsnew", extension: "", path: "/Users/starver/code/public/cpython/Doc/whatsnew", size: 672, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771486)
+MERGE (p9771486:Directory {id: 9770925})
+CREATE (p9771486) - [:PARENT_OF] -> (n9771486)
 CREATE (n9771495:File {id: 9771495, tag: "File", name: "3.0.rst", parent_id: 9771486, stem: "3.0", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/whatsnew/3.0.rst", size: 39412, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771496:File {id: 9771496, tag: "File", name: "3.1.rst", parent_id: 9771486, stem: "3.1", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/whatsnew/3.1.rst", size: 21956, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771505:File {id: 9771505, tag: "File", name: "index.rst", parent_id: 9771486, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/whatsnew/index.rst", size: 789, owner: 501, group: 20, created: 1545241636, accessed: 1545267137, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8899,12 +9376,16 @@ CREATE (n9771486) - [:PARENT_OF] -> (n9771493)
 CREATE (n9771486) - [:PARENT_OF] -> (n9771494)
 CREATE (n9771486) - [:PARENT_OF] -> (n9771503)
 CREATE (n9771486) - [:PARENT_OF] -> (n9771504)
+// group 5 816
 CREATE (n9770996:Directory {id: 9770996, tag: "Directory", name: "distributing", parent_id: 9770925, stem: "distributing", extension: "", path: "/Users/starver/code/public/cpython/Doc/distributing", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9770996)
+MERGE (p9770996:Directory {id: 9770925})
+CREATE (p9770996) - [:PARENT_OF] -> (n9770996)
 CREATE (n9770997:File {id: 9770997, tag: "File", name: "index.rst", parent_id: 9770996, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/distributing/index.rst", size: 7044, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770996) - [:PARENT_OF] -> (n9770997)
+// group 17 3185
 CREATE (n9771011:Directory {id: 9771011, tag: "Directory", name: "extending", parent_id: 9770925, stem: "extending", extension: "", path: "/Users/starver/code/public/cpython/Doc/extending", size: 288, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771011)
+MERGE (p9771011:Directory {id: 9770925})
+CREATE (p9771011) - [:PARENT_OF] -> (n9771011)
 CREATE (n9771015:File {id: 9771015, tag: "File", name: "index.rst", parent_id: 9771011, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/extending/index.rst", size: 2876, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771017:File {id: 9771017, tag: "File", name: "newtypes_tutorial.rst", parent_id: 9771011, stem: "newtypes_tutorial", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/extending/newtypes_tutorial.rst", size: 33890, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771016:File {id: 9771016, tag: "File", name: "newtypes.rst", parent_id: 9771011, stem: "newtypes", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/extending/newtypes.rst", size: 25320, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8919,8 +9400,10 @@ CREATE (n9771011) - [:PARENT_OF] -> (n9771012)
 CREATE (n9771011) - [:PARENT_OF] -> (n9771014)
 CREATE (n9771011) - [:PARENT_OF] -> (n9771013)
 CREATE (n9771011) - [:PARENT_OF] -> (n9771018)
+// group 39 7423
 CREATE (n9771031:Directory {id: 9771031, tag: "Directory", name: "howto", parent_id: 9770925, stem: "howto", extension: "", path: "/Users/starver/code/public/cpython/Doc/howto", size: 640, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771031)
+MERGE (p9771031:Directory {id: 9770925})
+CREATE (p9771031) - [:PARENT_OF] -> (n9771031)
 CREATE (n9771048:File {id: 9771048, tag: "File", name: "unicode.rst", parent_id: 9771031, stem: "unicode", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/howto/unicode.rst", size: 31800, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771045:File {id: 9771045, tag: "File", name: "regex.rst", parent_id: 9771031, stem: "regex", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/howto/regex.rst", size: 62593, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771038:File {id: 9771038, tag: "File", name: "index.rst", parent_id: 9771031, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/howto/index.rst", size: 654, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -8957,12 +9440,16 @@ CREATE (n9771031) - [:PARENT_OF] -> (n9771044)
 CREATE (n9771031) - [:PARENT_OF] -> (n9771040)
 CREATE (n9771031) - [:PARENT_OF] -> (n9771042)
 CREATE (n9771031) - [:PARENT_OF] -> (n9771036)
+// group 5 797
 CREATE (n9770994:Directory {id: 9770994, tag: "Directory", name: "data", parent_id: 9770925, stem: "data", extension: "", path: "/Users/starver/code/public/cpython/Doc/data", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9770994)
+MERGE (p9770994:Directory {id: 9770925})
+CREATE (p9770994) - [:PARENT_OF] -> (n9770994)
 CREATE (n9770995:File {id: 9770995, tag: "File", name: "refcounts.dat", parent_id: 9770994, stem: "refcounts", extension: "dat", path: "/Users/starver/code/public/cpython/Doc/data/refcounts.dat", size: 52309, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770994) - [:PARENT_OF] -> (n9770995)
+// group 123 23391
 CREATE (n9770930:Directory {id: 9770930, tag: "Directory", name: "c-api", parent_id: 9770925, stem: "c-api", extension: "", path: "/Users/starver/code/public/cpython/Doc/c-api", size: 1984, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9770930)
+MERGE (p9770930:Directory {id: 9770925})
+CREATE (p9770930) - [:PARENT_OF] -> (n9770930)
 CREATE (n9770957:File {id: 9770957, tag: "File", name: "import.rst", parent_id: 9770930, stem: "import", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/c-api/import.rst", size: 13035, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770981:File {id: 9770981, tag: "File", name: "stable.rst", parent_id: 9770930, stem: "stable", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/c-api/stable.rst", size: 1969, owner: 501, group: 20, created: 1545241636, accessed: 1545267133, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770933:File {id: 9770933, tag: "File", name: "apiabiversion.rst", parent_id: 9770930, stem: "apiabiversion", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/c-api/apiabiversion.rst", size: 2242, owner: 501, group: 20, created: 1545241636, accessed: 1545267129, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9083,8 +9570,10 @@ CREATE (n9770930) - [:PARENT_OF] -> (n9770956)
 CREATE (n9770930) - [:PARENT_OF] -> (n9770967)
 CREATE (n9770930) - [:PARENT_OF] -> (n9770949)
 CREATE (n9770930) - [:PARENT_OF] -> (n9770951)
+// group 25 4841
 CREATE (n9771428:Directory {id: 9771428, tag: "Directory", name: "reference", parent_id: 9770925, stem: "reference", extension: "", path: "/Users/starver/code/public/cpython/Doc/reference", size: 416, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770925) - [:PARENT_OF] -> (n9771428)
+MERGE (p9771428:Directory {id: 9770925})
+CREATE (p9771428) - [:PARENT_OF] -> (n9771428)
 CREATE (n9771434:File {id: 9771434, tag: "File", name: "import.rst", parent_id: 9771428, stem: "import", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/reference/import.rst", size: 46653, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771435:File {id: 9771435, tag: "File", name: "index.rst", parent_id: 9771428, stem: "index", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/reference/index.rst", size: 957, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9771430:File {id: 9771430, tag: "File", name: "datamodel.rst", parent_id: 9771428, stem: "datamodel", extension: "rst", path: "/Users/starver/code/public/cpython/Doc/reference/datamodel.rst", size: 117401, owner: 501, group: 20, created: 1545241636, accessed: 1545267136, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9107,8 +9596,10 @@ CREATE (n9771428) - [:PARENT_OF] -> (n9771437)
 CREATE (n9771428) - [:PARENT_OF] -> (n9771436)
 CREATE (n9771428) - [:PARENT_OF] -> (n9771439)
 CREATE (n9771428) - [:PARENT_OF] -> (n9771438)
+// group 15 2625
 CREATE (n9768634:Directory {id: 9768634, tag: "Directory", name: ".git", parent_id: 9768633, stem: ".git", extension: "", path: "/Users/starver/code/public/cpython/.git", size: 448, owner: 501, group: 20, created: 1545241684, accessed: 1545676678, modified: 1545241684, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9768634)
+MERGE (p9768634:Directory {id: 9768633})
+CREATE (p9768634) - [:PARENT_OF] -> (n9768634)
 CREATE (n9776054:File {id: 9776054, tag: "File", name: "config", parent_id: 9768634, stem: "config", extension: "", path: "/Users/starver/code/public/cpython/.git/config", size: 357, owner: 501, group: 20, created: 1545241684, accessed: 1545241706, modified: 1545241684, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770895:File {id: 9770895, tag: "File", name: "HEAD", parent_id: 9768634, stem: "HEAD", extension: "", path: "/Users/starver/code/public/cpython/.git/HEAD", size: 23, owner: 501, group: 20, created: 1545241636, accessed: 1545241646, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9768637:File {id: 9768637, tag: "File", name: "description", parent_id: 9768634, stem: "description", extension: "", path: "/Users/starver/code/public/cpython/.git/description", size: 73, owner: 501, group: 20, created: 1545241485, accessed: 1545241485, modified: 1545241485, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9121,38 +9612,58 @@ CREATE (n9768634) - [:PARENT_OF] -> (n9768637)
 CREATE (n9768634) - [:PARENT_OF] -> (n9776025)
 CREATE (n9768634) - [:PARENT_OF] -> (n9770886)
 CREATE (n9768634) - [:PARENT_OF] -> (n9775980)
+// group 3 418
 CREATE (n9768664:Directory {id: 9768664, tag: "Directory", name: "objects", parent_id: 9768634, stem: "objects", extension: "", path: "/Users/starver/code/public/cpython/.git/objects", size: 128, owner: 501, group: 20, created: 1545241485, accessed: 1545676678, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768634) - [:PARENT_OF] -> (n9768664)
+MERGE (p9768664:Directory {id: 9768634})
+CREATE (p9768664) - [:PARENT_OF] -> (n9768664)
+// group 7 1441
 CREATE (n9768665:Directory {id: 9768665, tag: "Directory", name: "pack", parent_id: 9768664, stem: "pack", extension: "", path: "/Users/starver/code/public/cpython/.git/objects/pack", size: 128, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768664) - [:PARENT_OF] -> (n9768665)
+MERGE (p9768665:Directory {id: 9768664})
+CREATE (p9768665) - [:PARENT_OF] -> (n9768665)
 CREATE (n9770879:File {id: 9770879, tag: "File", name: "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", parent_id: 9768665, stem: "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", extension: "idx", path: "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", size: 20458908, owner: 501, group: 20, created: 1545241636, accessed: 1545241700, modified: 1545241636, owner_perm: 4, group_perm: 4, other_perm: 4})
 CREATE (n9769910:File {id: 9769910, tag: "File", name: "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", parent_id: 9768665, stem: "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", extension: "pack", path: "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", size: 269003613, owner: 501, group: 20, created: 1545241636, accessed: 1545241700, modified: 1545241635, owner_perm: 4, group_perm: 4, other_perm: 4})
 CREATE (n9768665) - [:PARENT_OF] -> (n9770879)
 CREATE (n9768665) - [:PARENT_OF] -> (n9769910)
+// group 3 416
 CREATE (n9768666:Directory {id: 9768666, tag: "Directory", name: "info", parent_id: 9768664, stem: "info", extension: "", path: "/Users/starver/code/public/cpython/.git/objects/info", size: 64, owner: 501, group: 20, created: 1545241485, accessed: 1545676678, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768664) - [:PARENT_OF] -> (n9768666)
+MERGE (p9768666:Directory {id: 9768664})
+CREATE (p9768666) - [:PARENT_OF] -> (n9768666)
+// group 5 780
 CREATE (n9768635:Directory {id: 9768635, tag: "Directory", name: "info", parent_id: 9768634, stem: "info", extension: "", path: "/Users/starver/code/public/cpython/.git/info", size: 96, owner: 501, group: 20, created: 1545241485, accessed: 1545676678, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768634) - [:PARENT_OF] -> (n9768635)
+MERGE (p9768635:Directory {id: 9768634})
+CREATE (p9768635) - [:PARENT_OF] -> (n9768635)
 CREATE (n9768636:File {id: 9768636, tag: "File", name: "exclude", parent_id: 9768635, stem: "exclude", extension: "", path: "/Users/starver/code/public/cpython/.git/info/exclude", size: 240, owner: 501, group: 20, created: 1545241485, accessed: 1545241485, modified: 1545241485, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9768635) - [:PARENT_OF] -> (n9768636)
+// group 5 772
 CREATE (n9770890:Directory {id: 9770890, tag: "Directory", name: "logs", parent_id: 9768634, stem: "logs", extension: "", path: "/Users/starver/code/public/cpython/.git/logs", size: 128, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768634) - [:PARENT_OF] -> (n9770890)
+MERGE (p9770890:Directory {id: 9768634})
+CREATE (p9770890) - [:PARENT_OF] -> (n9770890)
 CREATE (n9770898:File {id: 9770898, tag: "File", name: "HEAD", parent_id: 9770890, stem: "HEAD", extension: "", path: "/Users/starver/code/public/cpython/.git/logs/HEAD", size: 204, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770890) - [:PARENT_OF] -> (n9770898)
+// group 3 414
 CREATE (n9770891:Directory {id: 9770891, tag: "Directory", name: "refs", parent_id: 9770890, stem: "refs", extension: "", path: "/Users/starver/code/public/cpython/.git/logs/refs", size: 128, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770890) - [:PARENT_OF] -> (n9770891)
+MERGE (p9770891:Directory {id: 9770890})
+CREATE (p9770891) - [:PARENT_OF] -> (n9770891)
+// group 5 801
 CREATE (n9770899:Directory {id: 9770899, tag: "Directory", name: "heads", parent_id: 9770891, stem: "heads", extension: "", path: "/Users/starver/code/public/cpython/.git/logs/refs/heads", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770891) - [:PARENT_OF] -> (n9770899)
+MERGE (p9770899:Directory {id: 9770891})
+CREATE (p9770899) - [:PARENT_OF] -> (n9770899)
 CREATE (n9770900:File {id: 9770900, tag: "File", name: "master", parent_id: 9770899, stem: "master", extension: "", path: "/Users/starver/code/public/cpython/.git/logs/refs/heads/master", size: 204, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770899) - [:PARENT_OF] -> (n9770900)
+// group 3 427
 CREATE (n9770892:Directory {id: 9770892, tag: "Directory", name: "remotes", parent_id: 9770891, stem: "remotes", extension: "", path: "/Users/starver/code/public/cpython/.git/logs/refs/remotes", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770891) - [:PARENT_OF] -> (n9770892)
+MERGE (p9770892:Directory {id: 9770891})
+CREATE (p9770892) - [:PARENT_OF] -> (n9770892)
+// group 5 815
 CREATE (n9770893:Directory {id: 9770893, tag: "Directory", name: "origin", parent_id: 9770892, stem: "origin", extension: "", path: "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770892) - [:PARENT_OF] -> (n9770893)
+MERGE (p9770893:Directory {id: 9770892})
+CREATE (p9770893) - [:PARENT_OF] -> (n9770893)
 CREATE (n9770894:File {id: 9770894, tag: "File", name: "HEAD", parent_id: 9770893, stem: "HEAD", extension: "", path: "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin/HEAD", size: 204, owner: 501, group: 20, created: 1545241636, accessed: 1545241636, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770893) - [:PARENT_OF] -> (n9770894)
+// group 25 4900
 CREATE (n9768638:Directory {id: 9768638, tag: "Directory", name: "hooks", parent_id: 9768634, stem: "hooks", extension: "", path: "/Users/starver/code/public/cpython/.git/hooks", size: 416, owner: 501, group: 20, created: 1545241485, accessed: 1545676678, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768634) - [:PARENT_OF] -> (n9768638)
+MERGE (p9768638:Directory {id: 9768634})
+CREATE (p9768638) - [:PARENT_OF] -> (n9768638)
 CREATE (n9768639:File {id: 9768639, tag: "File", name: "commit-msg.sample", parent_id: 9768638, stem: "commit-msg", extension: "sample", path: "/Users/starver/code/public/cpython/.git/hooks/commit-msg.sample", size: 896, owner: 501, group: 20, created: 1545241485, accessed: 1545241485, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9768640:File {id: 9768640, tag: "File", name: "pre-rebase.sample", parent_id: 9768638, stem: "pre-rebase", extension: "sample", path: "/Users/starver/code/public/cpython/.git/hooks/pre-rebase.sample", size: 4898, owner: 501, group: 20, created: 1545241485, accessed: 1545241485, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9768641:File {id: 9768641, tag: "File", name: "pre-commit.sample", parent_id: 9768638, stem: "pre-commit", extension: "sample", path: "/Users/starver/code/public/cpython/.git/hooks/pre-commit.sample", size: 1638, owner: 501, group: 20, created: 1545241485, accessed: 1545241485, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
@@ -9175,24 +9686,38 @@ CREATE (n9768638) - [:PARENT_OF] -> (n9768646)
 CREATE (n9768638) - [:PARENT_OF] -> (n9768647)
 CREATE (n9768638) - [:PARENT_OF] -> (n9768648)
 CREATE (n9768638) - [:PARENT_OF] -> (n9768649)
+// group 3 409
 CREATE (n9768651:Directory {id: 9768651, tag: "Directory", name: "refs", parent_id: 9768634, stem: "refs", extension: "", path: "/Users/starver/code/public/cpython/.git/refs", size: 160, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768634) - [:PARENT_OF] -> (n9768651)
+MERGE (p9768651:Directory {id: 9768634})
+CREATE (p9768651) - [:PARENT_OF] -> (n9768651)
+// group 5 790
 CREATE (n9768652:Directory {id: 9768652, tag: "Directory", name: "heads", parent_id: 9768651, stem: "heads", extension: "", path: "/Users/starver/code/public/cpython/.git/refs/heads", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768651) - [:PARENT_OF] -> (n9768652)
+MERGE (p9768652:Directory {id: 9768651})
+CREATE (p9768652) - [:PARENT_OF] -> (n9768652)
 CREATE (n9770897:File {id: 9770897, tag: "File", name: "master", parent_id: 9768652, stem: "master", extension: "", path: "/Users/starver/code/public/cpython/.git/refs/heads/master", size: 41, owner: 501, group: 20, created: 1545241636, accessed: 1545241646, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9768652) - [:PARENT_OF] -> (n9770897)
+// group 3 413
 CREATE (n9768653:Directory {id: 9768653, tag: "Directory", name: "tags", parent_id: 9768651, stem: "tags", extension: "", path: "/Users/starver/code/public/cpython/.git/refs/tags", size: 64, owner: 501, group: 20, created: 1545241485, accessed: 1545676678, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768651) - [:PARENT_OF] -> (n9768653)
+MERGE (p9768653:Directory {id: 9768651})
+CREATE (p9768653) - [:PARENT_OF] -> (n9768653)
+// group 3 422
 CREATE (n9770887:Directory {id: 9770887, tag: "Directory", name: "remotes", parent_id: 9768651, stem: "remotes", extension: "", path: "/Users/starver/code/public/cpython/.git/refs/remotes", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768651) - [:PARENT_OF] -> (n9770887)
+MERGE (p9770887:Directory {id: 9768651})
+CREATE (p9770887) - [:PARENT_OF] -> (n9770887)
+// group 5 804
 CREATE (n9770888:Directory {id: 9770888, tag: "Directory", name: "origin", parent_id: 9770887, stem: "origin", extension: "", path: "/Users/starver/code/public/cpython/.git/refs/remotes/origin", size: 96, owner: 501, group: 20, created: 1545241636, accessed: 1545676678, modified: 1545241636, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9770887) - [:PARENT_OF] -> (n9770888)
+MERGE (p9770888:Directory {id: 9770887})
+CREATE (p9770888) - [:PARENT_OF] -> (n9770888)
 CREATE (n9770889:File {id: 9770889, tag: "File", name: "HEAD", parent_id: 9770888, stem: "HEAD", extension: "", path: "/Users/starver/code/public/cpython/.git/refs/remotes/origin/HEAD", size: 32, owner: 501, group: 20, created: 1545241636, accessed: 1545241646, modified: 1545241636, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9770888) - [:PARENT_OF] -> (n9770889)
+// group 3 420
 CREATE (n9768650:Directory {id: 9768650, tag: "Directory", name: "branches", parent_id: 9768634, stem: "branches", extension: "", path: "/Users/starver/code/public/cpython/.git/branches", size: 64, owner: 501, group: 20, created: 1545241485, accessed: 1545676678, modified: 1545241485, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768634) - [:PARENT_OF] -> (n9768650)
+MERGE (p9768650:Directory {id: 9768634})
+CREATE (p9768650) - [:PARENT_OF] -> (n9768650)
+// group 233 44860
 CREATE (n9774794:Directory {id: 9774794, tag: "Directory", name: "Modules", parent_id: 9768633, stem: "Modules", extension: "", path: "/Users/starver/code/public/cpython/Modules", size: 4096, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9768633) - [:PARENT_OF] -> (n9774794)
+MERGE (p9774794:Directory {id: 9768633})
+CREATE (p9774794) - [:PARENT_OF] -> (n9774794)
 CREATE (n9775053:File {id: 9775053, tag: "File", name: "atexitmodule.c", parent_id: 9774794, stem: "atexitmodule", extension: "c", path: "/Users/starver/code/public/cpython/Modules/atexitmodule.c", size: 9086, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775167:File {id: 9775167, tag: "File", name: "itertoolsmodule.c", parent_id: 9774794, stem: "itertoolsmodule", extension: "c", path: "/Users/starver/code/public/cpython/Modules/itertoolsmodule.c", size: 152066, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775051:File {id: 9775051, tag: "File", name: "addrinfo.h", parent_id: 9774794, stem: "addrinfo", extension: "h", path: "/Users/starver/code/public/cpython/Modules/addrinfo.h", size: 6022, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9423,20 +9948,26 @@ CREATE (n9774794) - [:PARENT_OF] -> (n9775195)
 CREATE (n9774794) - [:PARENT_OF] -> (n9774827)
 CREATE (n9774794) - [:PARENT_OF] -> (n9774829)
 CREATE (n9774794) - [:PARENT_OF] -> (n9775193)
+// group 9 1576
 CREATE (n9774988:Directory {id: 9774988, tag: "Directory", name: "_sha3", parent_id: 9774794, stem: "_sha3", extension: "", path: "/Users/starver/code/public/cpython/Modules/_sha3", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9774988)
+MERGE (p9774988:Directory {id: 9774794})
+CREATE (p9774988) - [:PARENT_OF] -> (n9774988)
 CREATE (n9774990:File {id: 9774990, tag: "File", name: "cleanup.py", parent_id: 9774988, stem: "cleanup", extension: "py", path: "/Users/starver/code/public/cpython/Modules/_sha3/cleanup.py", size: 1442, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
 CREATE (n9774989:File {id: 9774989, tag: "File", name: "README.txt", parent_id: 9774988, stem: "README", extension: "txt", path: "/Users/starver/code/public/cpython/Modules/_sha3/README.txt", size: 400, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775010:File {id: 9775010, tag: "File", name: "sha3module.c", parent_id: 9774988, stem: "sha3module", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_sha3/sha3module.c", size: 23252, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774988) - [:PARENT_OF] -> (n9774990)
 CREATE (n9774988) - [:PARENT_OF] -> (n9774989)
 CREATE (n9774988) - [:PARENT_OF] -> (n9775010)
+// group 5 827
 CREATE (n9774991:Directory {id: 9774991, tag: "Directory", name: "clinic", parent_id: 9774988, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Modules/_sha3/clinic", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774988) - [:PARENT_OF] -> (n9774991)
+MERGE (p9774991:Directory {id: 9774988})
+CREATE (p9774991) - [:PARENT_OF] -> (n9774991)
 CREATE (n9774992:File {id: 9774992, tag: "File", name: "sha3module.c.h", parent_id: 9774991, stem: "sha3module.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_sha3/clinic/sha3module.c.h", size: 3303, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774991) - [:PARENT_OF] -> (n9774992)
+// group 35 7048
 CREATE (n9774993:Directory {id: 9774993, tag: "Directory", name: "kcp", parent_id: 9774988, stem: "kcp", extension: "", path: "/Users/starver/code/public/cpython/Modules/_sha3/kcp", size: 576, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774988) - [:PARENT_OF] -> (n9774993)
+MERGE (p9774993:Directory {id: 9774988})
+CREATE (p9774993) - [:PARENT_OF] -> (n9774993)
 CREATE (n9775000:File {id: 9775000, tag: "File", name: "KeccakP-1600-inplace32BI.c", parent_id: 9774993, stem: "KeccakP-1600-inplace32BI", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_sha3/kcp/KeccakP-1600-inplace32BI.c", size: 41505, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775009:File {id: 9775009, tag: "File", name: "align.h", parent_id: 9774993, stem: "align", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_sha3/kcp/align.h", size: 940, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775007:File {id: 9775007, tag: "File", name: "PlSnP-Fallback.inc", parent_id: 9774993, stem: "PlSnP-Fallback", extension: "inc", path: "/Users/starver/code/public/cpython/Modules/_sha3/kcp/PlSnP-Fallback.inc", size: 9530, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9469,8 +10000,10 @@ CREATE (n9774993) - [:PARENT_OF] -> (n9775002)
 CREATE (n9774993) - [:PARENT_OF] -> (n9775008)
 CREATE (n9774993) - [:PARENT_OF] -> (n9775004)
 CREATE (n9774993) - [:PARENT_OF] -> (n9774997)
+// group 49 9296
 CREATE (n9775131:Directory {id: 9775131, tag: "Directory", name: "expat", parent_id: 9774794, stem: "expat", extension: "", path: "/Users/starver/code/public/cpython/Modules/expat", size: 800, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9775131)
+MERGE (p9775131:Directory {id: 9774794})
+CREATE (p9775131) - [:PARENT_OF] -> (n9775131)
 CREATE (n9775148:File {id: 9775148, tag: "File", name: "xmlrole.c", parent_id: 9775131, stem: "xmlrole", extension: "c", path: "/Users/starver/code/public/cpython/Modules/expat/xmlrole.c", size: 36159, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775136:File {id: 9775136, tag: "File", name: "expat_config.h", parent_id: 9775131, stem: "expat_config", extension: "h", path: "/Users/starver/code/public/cpython/Modules/expat/expat_config.h", size: 365, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775139:File {id: 9775139, tag: "File", name: "internal.h", parent_id: 9775131, stem: "internal", extension: "h", path: "/Users/starver/code/public/cpython/Modules/expat/internal.h", size: 3927, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9517,8 +10050,10 @@ CREATE (n9775131) - [:PARENT_OF] -> (n9775150)
 CREATE (n9775131) - [:PARENT_OF] -> (n9775152)
 CREATE (n9775131) - [:PARENT_OF] -> (n9775134)
 CREATE (n9775131) - [:PARENT_OF] -> (n9775138)
+// group 21 3867
 CREATE (n9774952:Directory {id: 9774952, tag: "Directory", name: "_io", parent_id: 9774794, stem: "_io", extension: "", path: "/Users/starver/code/public/cpython/Modules/_io", size: 384, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9774952)
+MERGE (p9774952:Directory {id: 9774794})
+CREATE (p9774952) - [:PARENT_OF] -> (n9774952)
 CREATE (n9774953:File {id: 9774953, tag: "File", name: "_iomodule.c", parent_id: 9774952, stem: "_iomodule", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_io/_iomodule.c", size: 24863, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774966:File {id: 9774966, tag: "File", name: "fileio.c", parent_id: 9774952, stem: "fileio", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_io/fileio.c", size: 32919, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774970:File {id: 9774970, tag: "File", name: "winconsoleio.c", parent_id: 9774952, stem: "winconsoleio", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_io/winconsoleio.c", size: 32689, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9537,8 +10072,10 @@ CREATE (n9774952) - [:PARENT_OF] -> (n9774955)
 CREATE (n9774952) - [:PARENT_OF] -> (n9774967)
 CREATE (n9774952) - [:PARENT_OF] -> (n9774956)
 CREATE (n9774952) - [:PARENT_OF] -> (n9774968)
+// group 19 3594
 CREATE (n9774957:Directory {id: 9774957, tag: "Directory", name: "clinic", parent_id: 9774952, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Modules/_io/clinic", size: 320, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774952) - [:PARENT_OF] -> (n9774957)
+MERGE (p9774957:Directory {id: 9774952})
+CREATE (p9774957) - [:PARENT_OF] -> (n9774957)
 CREATE (n9774962:File {id: 9774962, tag: "File", name: "iobase.c.h", parent_id: 9774957, stem: "iobase.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_io/clinic/iobase.c.h", size: 7455, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774960:File {id: 9774960, tag: "File", name: "bytesio.c.h", parent_id: 9774957, stem: "bytesio.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_io/clinic/bytesio.c.h", size: 11954, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774964:File {id: 9774964, tag: "File", name: "textio.c.h", parent_id: 9774957, stem: "textio.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_io/clinic/textio.c.h", size: 15980, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9555,8 +10092,10 @@ CREATE (n9774957) - [:PARENT_OF] -> (n9774958)
 CREATE (n9774957) - [:PARENT_OF] -> (n9774963)
 CREATE (n9774957) - [:PARENT_OF] -> (n9774965)
 CREATE (n9774957) - [:PARENT_OF] -> (n9774959)
+// group 39 7398
 CREATE (n9775011:Directory {id: 9775011, tag: "Directory", name: "_sqlite", parent_id: 9774794, stem: "_sqlite", extension: "", path: "/Users/starver/code/public/cpython/Modules/_sqlite", size: 640, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9775011)
+MERGE (p9775011:Directory {id: 9774794})
+CREATE (p9775011) - [:PARENT_OF] -> (n9775011)
 CREATE (n9775015:File {id: 9775015, tag: "File", name: "connection.h", parent_id: 9775011, stem: "connection", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_sqlite/connection.h", size: 4710, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775019:File {id: 9775019, tag: "File", name: "microprotocols.h", parent_id: 9775011, stem: "microprotocols", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_sqlite/microprotocols.h", size: 2054, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775022:File {id: 9775022, tag: "File", name: "prepare_protocol.c", parent_id: 9775011, stem: "prepare_protocol", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_sqlite/prepare_protocol.c", size: 4396, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9593,8 +10132,10 @@ CREATE (n9775011) - [:PARENT_OF] -> (n9775021)
 CREATE (n9775011) - [:PARENT_OF] -> (n9775016)
 CREATE (n9775011) - [:PARENT_OF] -> (n9775026)
 CREATE (n9775011) - [:PARENT_OF] -> (n9775025)
+// group 39 7650
 CREATE (n9775056:Directory {id: 9775056, tag: "Directory", name: "cjkcodecs", parent_id: 9774794, stem: "cjkcodecs", extension: "", path: "/Users/starver/code/public/cpython/Modules/cjkcodecs", size: 672, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9775056)
+MERGE (p9775056:Directory {id: 9774794})
+CREATE (p9775056) - [:PARENT_OF] -> (n9775056)
 CREATE (n9775070:File {id: 9775070, tag: "File", name: "mappings_hk.h", parent_id: 9775056, stem: "mappings_hk", extension: "h", path: "/Users/starver/code/public/cpython/Modules/cjkcodecs/mappings_hk.h", size: 183751, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775073:File {id: 9775073, tag: "File", name: "mappings_kr.h", parent_id: 9775056, stem: "mappings_kr", extension: "h", path: "/Users/starver/code/public/cpython/Modules/cjkcodecs/mappings_kr.h", size: 253835, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775058:File {id: 9775058, tag: "File", name: "_codecs_cn.c", parent_id: 9775056, stem: "_codecs_cn", extension: "c", path: "/Users/starver/code/public/cpython/Modules/cjkcodecs/_codecs_cn.c", size: 11250, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9631,12 +10172,16 @@ CREATE (n9775056) - [:PARENT_OF] -> (n9775063)
 CREATE (n9775056) - [:PARENT_OF] -> (n9775069)
 CREATE (n9775056) - [:PARENT_OF] -> (n9775065)
 CREATE (n9775056) - [:PARENT_OF] -> (n9775075)
+// group 5 848
 CREATE (n9775066:Directory {id: 9775066, tag: "Directory", name: "clinic", parent_id: 9775056, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Modules/cjkcodecs/clinic", size: 96, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9775056) - [:PARENT_OF] -> (n9775066)
+MERGE (p9775066:Directory {id: 9775056})
+CREATE (p9775066) - [:PARENT_OF] -> (n9775066)
 CREATE (n9775067:File {id: 9775067, tag: "File", name: "multibytecodec.c.h", parent_id: 9775066, stem: "multibytecodec.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/cjkcodecs/clinic/multibytecodec.c.h", size: 15666, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775066) - [:PARENT_OF] -> (n9775067)
+// group 11 2010
 CREATE (n9775046:Directory {id: 9775046, tag: "Directory", name: "_xxtestfuzz", parent_id: 9774794, stem: "_xxtestfuzz", extension: "", path: "/Users/starver/code/public/cpython/Modules/_xxtestfuzz", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9775046)
+MERGE (p9775046:Directory {id: 9774794})
+CREATE (p9775046) - [:PARENT_OF] -> (n9775046)
 CREATE (n9775050:File {id: 9775050, tag: "File", name: "fuzzer.c", parent_id: 9775046, stem: "fuzzer", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_xxtestfuzz/fuzzer.c", size: 4034, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775048:File {id: 9775048, tag: "File", name: "_xxtestfuzz.c", parent_id: 9775046, stem: "_xxtestfuzz", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_xxtestfuzz/_xxtestfuzz.c", size: 1156, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775047:File {id: 9775047, tag: "File", name: "README.rst", parent_id: 9775046, stem: "README", extension: "rst", path: "/Users/starver/code/public/cpython/Modules/_xxtestfuzz/README.rst", size: 1501, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9645,8 +10190,10 @@ CREATE (n9775046) - [:PARENT_OF] -> (n9775050)
 CREATE (n9775046) - [:PARENT_OF] -> (n9775048)
 CREATE (n9775046) - [:PARENT_OF] -> (n9775047)
 CREATE (n9775046) - [:PARENT_OF] -> (n9775049)
+// group 103 20375
 CREATE (n9775077:Directory {id: 9775077, tag: "Directory", name: "clinic", parent_id: 9774794, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Modules/clinic", size: 1664, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9775077)
+MERGE (p9775077:Directory {id: 9774794})
+CREATE (p9775077) - [:PARENT_OF] -> (n9775077)
 CREATE (n9775101:File {id: 9775101, tag: "File", name: "_tracemalloc.c.h", parent_id: 9775077, stem: "_tracemalloc.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/clinic/_tracemalloc.c.h", size: 5770, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775126:File {id: 9775126, tag: "File", name: "zipimport.c.h", parent_id: 9775077, stem: "zipimport.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/clinic/zipimport.c.h", size: 10082, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9775123:File {id: 9775123, tag: "File", name: "spwdmodule.c.h", parent_id: 9775077, stem: "spwdmodule.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/clinic/spwdmodule.c.h", size: 1726, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9747,8 +10294,10 @@ CREATE (n9775077) - [:PARENT_OF] -> (n9775084)
 CREATE (n9775077) - [:PARENT_OF] -> (n9775088)
 CREATE (n9775077) - [:PARENT_OF] -> (n9775095)
 CREATE (n9775077) - [:PARENT_OF] -> (n9775089)
+// group 23 4335
 CREATE (n9774830:Directory {id: 9774830, tag: "Directory", name: "_ctypes", parent_id: 9774794, stem: "_ctypes", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes", size: 480, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9774830)
+MERGE (p9774830:Directory {id: 9774794})
+CREATE (p9774830) - [:PARENT_OF] -> (n9774830)
 CREATE (n9774836:File {id: 9774836, tag: "File", name: "cfield.c", parent_id: 9774830, stem: "cfield", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_ctypes/cfield.c", size: 44443, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774835:File {id: 9774835, tag: "File", name: "callproc.c", parent_id: 9774830, stem: "callproc", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_ctypes/callproc.c", size: 54799, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774831:File {id: 9774831, tag: "File", name: "_ctypes.c", parent_id: 9774830, stem: "_ctypes", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_ctypes/_ctypes.c", size: 185099, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9769,8 +10318,10 @@ CREATE (n9774830) - [:PARENT_OF] -> (n9774883)
 CREATE (n9774830) - [:PARENT_OF] -> (n9774837)
 CREATE (n9774830) - [:PARENT_OF] -> (n9774834)
 CREATE (n9774830) - [:PARENT_OF] -> (n9774833)
+// group 13 2394
 CREATE (n9774858:Directory {id: 9774858, tag: "Directory", name: "libffi_osx", parent_id: 9774830, stem: "libffi_osx", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx", size: 320, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774830) - [:PARENT_OF] -> (n9774858)
+MERGE (p9774858:Directory {id: 9774830})
+CREATE (p9774858) - [:PARENT_OF] -> (n9774858)
 CREATE (n9774859:File {id: 9774859, tag: "File", name: "LICENSE", parent_id: 9774858, stem: "LICENSE", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/LICENSE", size: 1060, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774862:File {id: 9774862, tag: "File", name: "ffi.c", parent_id: 9774858, stem: "ffi", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/ffi.c", size: 6170, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774861:File {id: 9774861, tag: "File", name: "README.pyobjc", parent_id: 9774858, stem: "README", extension: "pyobjc", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/README.pyobjc", size: 241, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9781,8 +10332,10 @@ CREATE (n9774858) - [:PARENT_OF] -> (n9774862)
 CREATE (n9774858) - [:PARENT_OF] -> (n9774861)
 CREATE (n9774858) - [:PARENT_OF] -> (n9774860)
 CREATE (n9774858) - [:PARENT_OF] -> (n9774876)
+// group 13 2567
 CREATE (n9774870:Directory {id: 9774870, tag: "Directory", name: "powerpc", parent_id: 9774858, stem: "powerpc", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/powerpc", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774858) - [:PARENT_OF] -> (n9774870)
+MERGE (p9774870:Directory {id: 9774858})
+CREATE (p9774870) - [:PARENT_OF] -> (n9774870)
 CREATE (n9774875:File {id: 9774875, tag: "File", name: "ppc64-darwin_closure.S", parent_id: 9774870, stem: "ppc64-darwin_closure", extension: "S", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/powerpc/ppc64-darwin_closure.S", size: 9914, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774873:File {id: 9774873, tag: "File", name: "ppc-darwin_closure.S", parent_id: 9774870, stem: "ppc-darwin_closure", extension: "S", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/powerpc/ppc-darwin_closure.S", size: 7234, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774871:File {id: 9774871, tag: "File", name: "ppc-darwin.S", parent_id: 9774870, stem: "ppc-darwin", extension: "S", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/powerpc/ppc-darwin.S", size: 9719, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9793,8 +10346,10 @@ CREATE (n9774870) - [:PARENT_OF] -> (n9774873)
 CREATE (n9774870) - [:PARENT_OF] -> (n9774871)
 CREATE (n9774870) - [:PARENT_OF] -> (n9774872)
 CREATE (n9774870) - [:PARENT_OF] -> (n9774874)
+// group 15 2902
 CREATE (n9774863:Directory {id: 9774863, tag: "Directory", name: "include", parent_id: 9774858, stem: "include", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/include", size: 256, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774858) - [:PARENT_OF] -> (n9774863)
+MERGE (p9774863:Directory {id: 9774858})
+CREATE (p9774863) - [:PARENT_OF] -> (n9774863)
 CREATE (n9774867:File {id: 9774867, tag: "File", name: "ffitarget.h", parent_id: 9774863, stem: "ffitarget", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/include/ffitarget.h", size: 455, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774869:File {id: 9774869, tag: "File", name: "x86-ffitarget.h", parent_id: 9774863, stem: "x86-ffitarget", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/include/x86-ffitarget.h", size: 2737, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774865:File {id: 9774865, tag: "File", name: "ffi_common.h", parent_id: 9774863, stem: "ffi_common", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/include/ffi_common.h", size: 2531, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9807,8 +10362,10 @@ CREATE (n9774863) - [:PARENT_OF] -> (n9774865)
 CREATE (n9774863) - [:PARENT_OF] -> (n9774868)
 CREATE (n9774863) - [:PARENT_OF] -> (n9774866)
 CREATE (n9774863) - [:PARENT_OF] -> (n9774864)
+// group 11 2066
 CREATE (n9774877:Directory {id: 9774877, tag: "Directory", name: "x86", parent_id: 9774858, stem: "x86", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/x86", size: 192, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774858) - [:PARENT_OF] -> (n9774877)
+MERGE (p9774877:Directory {id: 9774858})
+CREATE (p9774877) - [:PARENT_OF] -> (n9774877)
 CREATE (n9774879:File {id: 9774879, tag: "File", name: "x86-darwin.S", parent_id: 9774877, stem: "x86-darwin", extension: "S", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/x86/x86-darwin.S", size: 8955, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774878:File {id: 9774878, tag: "File", name: "darwin64.S", parent_id: 9774877, stem: "darwin64", extension: "S", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/x86/darwin64.S", size: 11660, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774880:File {id: 9774880, tag: "File", name: "x86-ffi64.c", parent_id: 9774877, stem: "x86-ffi64", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_osx/x86/x86-ffi64.c", size: 18337, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9817,8 +10374,10 @@ CREATE (n9774877) - [:PARENT_OF] -> (n9774879)
 CREATE (n9774877) - [:PARENT_OF] -> (n9774878)
 CREATE (n9774877) - [:PARENT_OF] -> (n9774880)
 CREATE (n9774877) - [:PARENT_OF] -> (n9774881)
+// group 13 2388
 CREATE (n9774839:Directory {id: 9774839, tag: "Directory", name: "darwin", parent_id: 9774830, stem: "darwin", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/darwin", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774830) - [:PARENT_OF] -> (n9774839)
+MERGE (p9774839:Directory {id: 9774830})
+CREATE (p9774839) - [:PARENT_OF] -> (n9774839)
 CREATE (n9774840:File {id: 9774840, tag: "File", name: "LICENSE", parent_id: 9774839, stem: "LICENSE", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/darwin/LICENSE", size: 1408, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774844:File {id: 9774844, tag: "File", name: "dlfcn_simple.c", parent_id: 9774839, stem: "dlfcn_simple", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_ctypes/darwin/dlfcn_simple.c", size: 8823, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774841:File {id: 9774841, tag: "File", name: "README", parent_id: 9774839, stem: "README", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/darwin/README", size: 3235, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9829,8 +10388,10 @@ CREATE (n9774839) - [:PARENT_OF] -> (n9774844)
 CREATE (n9774839) - [:PARENT_OF] -> (n9774841)
 CREATE (n9774839) - [:PARENT_OF] -> (n9774843)
 CREATE (n9774839) - [:PARENT_OF] -> (n9774842)
+// group 27 5181
 CREATE (n9774845:Directory {id: 9774845, tag: "Directory", name: "libffi_msvc", parent_id: 9774830, stem: "libffi_msvc", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_msvc", size: 448, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774830) - [:PARENT_OF] -> (n9774845)
+MERGE (p9774845:Directory {id: 9774830})
+CREATE (p9774845) - [:PARENT_OF] -> (n9774845)
 CREATE (n9774853:File {id: 9774853, tag: "File", name: "ffitarget.h", parent_id: 9774845, stem: "ffitarget", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_msvc/ffitarget.h", size: 2699, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774846:File {id: 9774846, tag: "File", name: "LICENSE", parent_id: 9774845, stem: "LICENSE", extension: "", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_msvc/LICENSE", size: 1060, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774851:File {id: 9774851, tag: "File", name: "ffi_common.h", parent_id: 9774845, stem: "ffi_common", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_ctypes/libffi_msvc/ffi_common.h", size: 2114, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9855,8 +10416,10 @@ CREATE (n9774845) - [:PARENT_OF] -> (n9774855)
 CREATE (n9774845) - [:PARENT_OF] -> (n9774848)
 CREATE (n9774845) - [:PARENT_OF] -> (n9774856)
 CREATE (n9774845) - [:PARENT_OF] -> (n9774850)
+// group 13 2400
 CREATE (n9774800:Directory {id: 9774800, tag: "Directory", name: "_blake2", parent_id: 9774794, stem: "_blake2", extension: "", path: "/Users/starver/code/public/cpython/Modules/_blake2", size: 288, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9774800)
+MERGE (p9774800:Directory {id: 9774794})
+CREATE (p9774800) - [:PARENT_OF] -> (n9774800)
 CREATE (n9774802:File {id: 9774802, tag: "File", name: "blake2b_impl.c", parent_id: 9774800, stem: "blake2b_impl", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_blake2/blake2b_impl.c", size: 13048, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774804:File {id: 9774804, tag: "File", name: "blake2ns.h", parent_id: 9774800, stem: "blake2ns", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_blake2/blake2ns.h", size: 1340, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774801:File {id: 9774801, tag: "File", name: "blake2b2s.py", parent_id: 9774800, stem: "blake2b2s", extension: "py", path: "/Users/starver/code/public/cpython/Modules/_blake2/blake2b2s.py", size: 1208, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
@@ -9867,8 +10430,10 @@ CREATE (n9774800) - [:PARENT_OF] -> (n9774804)
 CREATE (n9774800) - [:PARENT_OF] -> (n9774801)
 CREATE (n9774800) - [:PARENT_OF] -> (n9774803)
 CREATE (n9774800) - [:PARENT_OF] -> (n9774805)
+// group 31 6110
 CREATE (n9774809:Directory {id: 9774809, tag: "Directory", name: "impl", parent_id: 9774800, stem: "impl", extension: "", path: "/Users/starver/code/public/cpython/Modules/_blake2/impl", size: 512, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774800) - [:PARENT_OF] -> (n9774809)
+MERGE (p9774809:Directory {id: 9774800})
+CREATE (p9774809) - [:PARENT_OF] -> (n9774809)
 CREATE (n9774821:File {id: 9774821, tag: "File", name: "blake2s-ref.c", parent_id: 9774809, stem: "blake2s-ref", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_blake2/impl/blake2s-ref.c", size: 10505, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774813:File {id: 9774813, tag: "File", name: "blake2b-load-sse2.h", parent_id: 9774809, stem: "blake2b-load-sse2", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_blake2/impl/blake2b-load-sse2.h", size: 4903, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774816:File {id: 9774816, tag: "File", name: "blake2b-round.h", parent_id: 9774809, stem: "blake2b-round", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_blake2/impl/blake2b-round.h", size: 5013, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -9897,22 +10462,28 @@ CREATE (n9774809) - [:PARENT_OF] -> (n9774815)
 CREATE (n9774809) - [:PARENT_OF] -> (n9774823)
 CREATE (n9774809) - [:PARENT_OF] -> (n9774810)
 CREATE (n9774809) - [:PARENT_OF] -> (n9774811)
+// group 7 1250
 CREATE (n9774806:Directory {id: 9774806, tag: "Directory", name: "clinic", parent_id: 9774800, stem: "clinic", extension: "", path: "/Users/starver/code/public/cpython/Modules/_blake2/clinic", size: 128, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774800) - [:PARENT_OF] -> (n9774806)
+MERGE (p9774806:Directory {id: 9774800})
+CREATE (p9774806) - [:PARENT_OF] -> (n9774806)
 CREATE (n9774807:File {id: 9774807, tag: "File", name: "blake2b_impl.c.h", parent_id: 9774806, stem: "blake2b_impl.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_blake2/clinic/blake2b_impl.c.h", size: 4057, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774808:File {id: 9774808, tag: "File", name: "blake2s_impl.c.h", parent_id: 9774806, stem: "blake2s_impl.c", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_blake2/clinic/blake2s_impl.c.h", size: 4057, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774806) - [:PARENT_OF] -> (n9774807)
 CREATE (n9774806) - [:PARENT_OF] -> (n9774808)
+// group 9 1597
 CREATE (n9774888:Directory {id: 9774888, tag: "Directory", name: "_decimal", parent_id: 9774794, stem: "_decimal", extension: "", path: "/Users/starver/code/public/cpython/Modules/_decimal", size: 224, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9774888)
+MERGE (p9774888:Directory {id: 9774794})
+CREATE (p9774888) - [:PARENT_OF] -> (n9774888)
 CREATE (n9774890:File {id: 9774890, tag: "File", name: "_decimal.c", parent_id: 9774888, stem: "_decimal", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_decimal/_decimal.c", size: 171513, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774889:File {id: 9774889, tag: "File", name: "README.txt", parent_id: 9774888, stem: "README", extension: "txt", path: "/Users/starver/code/public/cpython/Modules/_decimal/README.txt", size: 1210, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774891:File {id: 9774891, tag: "File", name: "docstrings.h", parent_id: 9774888, stem: "docstrings", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_decimal/docstrings.h", size: 29091, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774888) - [:PARENT_OF] -> (n9774890)
 CREATE (n9774888) - [:PARENT_OF] -> (n9774889)
 CREATE (n9774888) - [:PARENT_OF] -> (n9774891)
+// group 21 4029
 CREATE (n9774936:Directory {id: 9774936, tag: "Directory", name: "tests", parent_id: 9774888, stem: "tests", extension: "", path: "/Users/starver/code/public/cpython/Modules/_decimal/tests", size: 352, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774888) - [:PARENT_OF] -> (n9774936)
+MERGE (p9774936:Directory {id: 9774888})
+CREATE (p9774936) - [:PARENT_OF] -> (n9774936)
 CREATE (n9774941:File {id: 9774941, tag: "File", name: "formathelper.py", parent_id: 9774936, stem: "formathelper", extension: "py", path: "/Users/starver/code/public/cpython/Modules/_decimal/tests/formathelper.py", size: 11559, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774938:File {id: 9774938, tag: "File", name: "bench.py", parent_id: 9774936, stem: "bench", extension: "py", path: "/Users/starver/code/public/cpython/Modules/_decimal/tests/bench.py", size: 3704, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774946:File {id: 9774946, tag: "File", name: "runall.bat", parent_id: 9774936, stem: "runall", extension: "bat", path: "/Users/starver/code/public/cpython/Modules/_decimal/tests/runall.bat", size: 3123, owner: 501, group: 20, created: 1545241637, accessed: 1545267151, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
@@ -9931,8 +10502,10 @@ CREATE (n9774936) - [:PARENT_OF] -> (n9774939)
 CREATE (n9774936) - [:PARENT_OF] -> (n9774945)
 CREATE (n9774936) - [:PARENT_OF] -> (n9774942)
 CREATE (n9774936) - [:PARENT_OF] -> (n9774940)
+// group 71 13882
 CREATE (n9774892:Directory {id: 9774892, tag: "Directory", name: "libmpdec", parent_id: 9774888, stem: "libmpdec", extension: "", path: "/Users/starver/code/public/cpython/Modules/_decimal/libmpdec", size: 1184, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774888) - [:PARENT_OF] -> (n9774892)
+MERGE (p9774892:Directory {id: 9774888})
+CREATE (p9774892) - [:PARENT_OF] -> (n9774892)
 CREATE (n9774906:File {id: 9774906, tag: "File", name: "fnt.c", parent_id: 9774892, stem: "fnt", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_decimal/libmpdec/fnt.c", size: 2335, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774926:File {id: 9774926, tag: "File", name: "numbertheory.h", parent_id: 9774892, stem: "numbertheory", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_decimal/libmpdec/numbertheory.h", size: 2396, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774900:File {id: 9774900, tag: "File", name: "convolute.c", parent_id: 9774892, stem: "convolute", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_decimal/libmpdec/convolute.c", size: 4535, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -10001,8 +10574,10 @@ CREATE (n9774892) - [:PARENT_OF] -> (n9774895)
 CREATE (n9774892) - [:PARENT_OF] -> (n9774930)
 CREATE (n9774892) - [:PARENT_OF] -> (n9774896)
 CREATE (n9774892) - [:PARENT_OF] -> (n9774908)
+// group 19 3785
 CREATE (n9774912:Directory {id: 9774912, tag: "Directory", name: "literature", parent_id: 9774892, stem: "literature", extension: "", path: "/Users/starver/code/public/cpython/Modules/_decimal/libmpdec/literature", size: 320, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774892) - [:PARENT_OF] -> (n9774912)
+MERGE (p9774912:Directory {id: 9774892})
+CREATE (p9774912) - [:PARENT_OF] -> (n9774912)
 CREATE (n9774915:File {id: 9774915, tag: "File", name: "fnt.py", parent_id: 9774912, stem: "fnt", extension: "py", path: "/Users/starver/code/public/cpython/Modules/_decimal/libmpdec/literature/fnt.py", size: 7169, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774916:File {id: 9774916, tag: "File", name: "matrix-transform.txt", parent_id: 9774912, stem: "matrix-transform", extension: "txt", path: "/Users/starver/code/public/cpython/Modules/_decimal/libmpdec/literature/matrix-transform.txt", size: 8327, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774917:File {id: 9774917, tag: "File", name: "mulmod-64.txt", parent_id: 9774912, stem: "mulmod-64", extension: "txt", path: "/Users/starver/code/public/cpython/Modules/_decimal/libmpdec/literature/mulmod-64.txt", size: 2963, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
@@ -10019,8 +10594,10 @@ CREATE (n9774912) - [:PARENT_OF] -> (n9774918)
 CREATE (n9774912) - [:PARENT_OF] -> (n9774914)
 CREATE (n9774912) - [:PARENT_OF] -> (n9774913)
 CREATE (n9774912) - [:PARENT_OF] -> (n9774919)
+// group 9 1682
 CREATE (n9774977:Directory {id: 9774977, tag: "Directory", name: "_multiprocessing", parent_id: 9774794, stem: "_multiprocessing", extension: "", path: "/Users/starver/code/public/cpython/Modules/_multiprocessing", size: 160, owner: 501, group: 20, created: 1545241637, accessed: 1545676677, modified: 1545241637, owner_perm: 7, group_perm: 5, other_perm: 5})
-CREATE (n9774794) - [:PARENT_OF] -> (n9774977)
+MERGE (p9774977:Directory {id: 9774794})
+CREATE (p9774977) - [:PARENT_OF] -> (n9774977)
 CREATE (n9774978:File {id: 9774978, tag: "File", name: "multiprocessing.c", parent_id: 9774977, stem: "multiprocessing", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_multiprocessing/multiprocessing.c", size: 5484, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774980:File {id: 9774980, tag: "File", name: "semaphore.c", parent_id: 9774977, stem: "semaphore", extension: "c", path: "/Users/starver/code/public/cpython/Modules/_multiprocessing/semaphore.c", size: 19115, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
 CREATE (n9774979:File {id: 9774979, tag: "File", name: "multiprocessing.h", parent_id: 9774977, stem: "multiprocessing", extension: "h", path: "/Users/starver/code/public/cpython/Modules/_multiprocessing/multiprocessing.h", size: 2397, owner: 501, group: 20, created: 1545241637, accessed: 1545267150, modified: 1545241637, owner_perm: 6, group_perm: 4, other_perm: 4})
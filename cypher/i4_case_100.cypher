@@ -1,227 +1,262 @@
-MERGE (n82274497:Directory {id: 9768633}) ON CREATE SET n82274497.tag = "Directory", n82274497.name = "cpython", n82274497.parent_id = "None", n82274497.stem = "cpython", n82274497.extension = "", n82274497.path = "/Users/starver/code/public/cpython", n82274497.size = 1120, n82274497.owner = 501, n82274497.group = 20, n82274497.created = 1545241637, n82274497.accessed = 1545673345, n82274497.modified = 1545241637, n82274497.owner_perm = 7, n82274497.group_perm = 5, n82274497.other_perm = 5 ON MATCH SET n82274497.tag = "Directory", n82274497.name = "cpython", n82274497.parent_id = "None", n82274497.stem = "cpython", n82274497.extension = "", n82274497.path = "/Users/starver/code/public/cpython", n82274497.size = 1120, n82274497.owner = 501, n82274497.group = 20, n82274497.created = 1545241637, n82274497.accessed = 1545673345, n82274497.modified = 1545241637, n82274497.owner_perm = 7, n82274497.group_perm = 5, n82274497.other_perm = 5
-MERGE (n759348659:File {id: 9770924}) ON CREATE SET n759348659.tag = "File", n759348659.name = "CODE_OF_CONDUCT.md", n759348659.parent_id = 9768633, n759348659.stem = "CODE_OF_CONDUCT", n759348659.extension = "md", n759348659.path = "/Users/starver/code/public/cpython/CODE_OF_CONDUCT.md", n759348659.size = 609, n759348659.owner = 501, n759348659.group = 20, n759348659.created = 1545241636, n759348659.accessed = 1545267129, n759348659.modified = 1545241636, n759348659.owner_perm = 6, n759348659.group_perm = 4, n759348659.other_perm = 4 ON MATCH SET n759348659.tag = "File", n759348659.name = "CODE_OF_CONDUCT.md", n759348659.parent_id = 9768633, n759348659.stem = "CODE_OF_CONDUCT", n759348659.extension = "md", n759348659.path = "/Users/starver/code/public/cpython/CODE_OF_CONDUCT.md", n759348659.size = 609, n759348659.owner = 501, n759348659.group = 20, n759348659.created = 1545241636, n759348659.accessed = 1545267129, n759348659.modified = 1545241636, n759348659.owner_perm = 6, n759348659.group_perm = 4, n759348659.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n759348659)
-MERGE (n343515406:File {id: 9775969}) ON CREATE SET n343515406.tag = "File", n343515406.name = "install-sh", n343515406.parent_id = 9768633, n343515406.stem = "install-sh", n343515406.extension = "", n343515406.path = "/Users/starver/code/public/cpython/install-sh", n343515406.size = 15368, n343515406.owner = 501, n343515406.group = 20, n343515406.created = 1545241637, n343515406.accessed = 1545241637, n343515406.modified = 1545241637, n343515406.owner_perm = 7, n343515406.group_perm = 5, n343515406.other_perm = 5 ON MATCH SET n343515406.tag = "File", n343515406.name = "install-sh", n343515406.parent_id = 9768633, n343515406.stem = "install-sh", n343515406.extension = "", n343515406.path = "/Users/starver/code/public/cpython/install-sh", n343515406.size = 15368, n343515406.owner = 501, n343515406.group = 20, n343515406.created = 1545241637, n343515406.accessed = 1545241637, n343515406.modified = 1545241637, n343515406.owner_perm = 7, n343515406.group_perm = 5, n343515406.other_perm = 5
-MERGE (n82274497) - [:PARENT_OF] -> (n343515406)
-MERGE (n564750910:File {id: 9775968}) ON CREATE SET n564750910.tag = "File", n564750910.name = "configure.ac", n564750910.parent_id = 9768633, n564750910.stem = "configure", n564750910.extension = "ac", n564750910.path = "/Users/starver/code/public/cpython/configure.ac", n564750910.size = 162570, n564750910.owner = 501, n564750910.group = 20, n564750910.created = 1545241637, n564750910.accessed = 1545267152, n564750910.modified = 1545241637, n564750910.owner_perm = 6, n564750910.group_perm = 4, n564750910.other_perm = 4 ON MATCH SET n564750910.tag = "File", n564750910.name = "configure.ac", n564750910.parent_id = 9768633, n564750910.stem = "configure", n564750910.extension = "ac", n564750910.path = "/Users/starver/code/public/cpython/configure.ac", n564750910.size = 162570, n564750910.owner = 501, n564750910.group = 20, n564750910.created = 1545241637, n564750910.accessed = 1545267152, n564750910.modified = 1545241637, n564750910.owner_perm = 6, n564750910.group_perm = 4, n564750910.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n564750910)
-MERGE (n983718728:File {id: 9773910}) ON CREATE SET n983718728.tag = "File", n983718728.name = "Makefile.pre.in", n983718728.parent_id = 9768633, n983718728.stem = "Makefile.pre", n983718728.extension = "in", n983718728.path = "/Users/starver/code/public/cpython/Makefile.pre.in", n983718728.size = 64646, n983718728.owner = 501, n983718728.group = 20, n983718728.created = 1545241637, n983718728.accessed = 1545267147, n983718728.modified = 1545241637, n983718728.owner_perm = 6, n983718728.group_perm = 4, n983718728.other_perm = 4 ON MATCH SET n983718728.tag = "File", n983718728.name = "Makefile.pre.in", n983718728.parent_id = 9768633, n983718728.stem = "Makefile.pre", n983718728.extension = "in", n983718728.path = "/Users/starver/code/public/cpython/Makefile.pre.in", n983718728.size = 64646, n983718728.owner = 501, n983718728.group = 20, n983718728.created = 1545241637, n983718728.accessed = 1545267147, n983718728.modified = 1545241637, n983718728.owner_perm = 6, n983718728.group_perm = 4, n983718728.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n983718728)
-MERGE (n743887612:File {id: 9771637}) ON CREATE SET n743887612.tag = "File", n743887612.name = "LICENSE", n743887612.parent_id = 9768633, n743887612.stem = "LICENSE", n743887612.extension = "", n743887612.path = "/Users/starver/code/public/cpython/LICENSE", n743887612.size = 12763, n743887612.owner = 501, n743887612.group = 20, n743887612.created = 1545241636, n743887612.accessed = 1545267137, n743887612.modified = 1545241636, n743887612.owner_perm = 6, n743887612.group_perm = 4, n743887612.other_perm = 4 ON MATCH SET n743887612.tag = "File", n743887612.name = "LICENSE", n743887612.parent_id = 9768633, n743887612.stem = "LICENSE", n743887612.extension = "", n743887612.path = "/Users/starver/code/public/cpython/LICENSE", n743887612.size = 12763, n743887612.owner = 501, n743887612.group = 20, n743887612.created = 1545241636, n743887612.accessed = 1545267137, n743887612.modified = 1545241636, n743887612.owner_perm = 6, n743887612.group_perm = 4, n743887612.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n743887612)
-MERGE (n874313945:File {id: 9775967}) ON CREATE SET n874313945.tag = "File", n874313945.name = "configure", n874313945.parent_id = 9768633, n874313945.stem = "configure", n874313945.extension = "", n874313945.path = "/Users/starver/code/public/cpython/configure", n874313945.size = 495202, n874313945.owner = 501, n874313945.group = 20, n874313945.created = 1545241637, n874313945.accessed = 1545241664, n874313945.modified = 1545241637, n874313945.owner_perm = 7, n874313945.group_perm = 5, n874313945.other_perm = 5 ON MATCH SET n874313945.tag = "File", n874313945.name = "configure", n874313945.parent_id = 9768633, n874313945.stem = "configure", n874313945.extension = "", n874313945.path = "/Users/starver/code/public/cpython/configure", n874313945.size = 495202, n874313945.owner = 501, n874313945.group = 20, n874313945.created = 1545241637, n874313945.accessed = 1545241664, n874313945.modified = 1545241637, n874313945.owner_perm = 7, n874313945.group_perm = 5, n874313945.other_perm = 5
-MERGE (n82274497) - [:PARENT_OF] -> (n874313945)
-MERGE (n434652967:File {id: 9775965}) ON CREATE SET n434652967.tag = "File", n434652967.name = "config.guess", n434652967.parent_id = 9768633, n434652967.stem = "config", n434652967.extension = "guess", n434652967.path = "/Users/starver/code/public/cpython/config.guess", n434652967.size = 44166, n434652967.owner = 501, n434652967.group = 20, n434652967.created = 1545241637, n434652967.accessed = 1545267152, n434652967.modified = 1545241637, n434652967.owner_perm = 7, n434652967.group_perm = 5, n434652967.other_perm = 5 ON MATCH SET n434652967.tag = "File", n434652967.name = "config.guess", n434652967.parent_id = 9768633, n434652967.stem = "config", n434652967.extension = "guess", n434652967.path = "/Users/starver/code/public/cpython/config.guess", n434652967.size = 44166, n434652967.owner = 501, n434652967.group = 20, n434652967.created = 1545241637, n434652967.accessed = 1545267152, n434652967.modified = 1545241637, n434652967.owner_perm = 7, n434652967.group_perm = 5, n434652967.other_perm = 5
-MERGE (n82274497) - [:PARENT_OF] -> (n434652967)
-MERGE (n963529862:File {id: 9775973}) ON CREATE SET n963529862.tag = "File", n963529862.name = "pyconfig.h.in", n963529862.parent_id = 9768633, n963529862.stem = "pyconfig.h", n963529862.extension = "in", n963529862.path = "/Users/starver/code/public/cpython/pyconfig.h.in", n963529862.size = 43657, n963529862.owner = 501, n963529862.group = 20, n963529862.created = 1545241637, n963529862.accessed = 1545267152, n963529862.modified = 1545241637, n963529862.owner_perm = 6, n963529862.group_perm = 4, n963529862.other_perm = 4 ON MATCH SET n963529862.tag = "File", n963529862.name = "pyconfig.h.in", n963529862.parent_id = 9768633, n963529862.stem = "pyconfig.h", n963529862.extension = "in", n963529862.path = "/Users/starver/code/public/cpython/pyconfig.h.in", n963529862.size = 43657, n963529862.owner = 501, n963529862.group = 20, n963529862.created = 1545241637, n963529862.accessed = 1545267152, n963529862.modified = 1545241637, n963529862.owner_perm = 6, n963529862.group_perm = 4, n963529862.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n963529862)
-MERGE (n407029522:File {id: 9775966}) ON CREATE SET n407029522.tag = "File", n407029522.name = "config.sub", n407029522.parent_id = 9768633, n407029522.stem = "config", n407029522.extension = "sub", n407029522.path = "/Users/starver/code/public/cpython/config.sub", n407029522.size = 36251, n407029522.owner = 501, n407029522.group = 20, n407029522.created = 1545241637, n407029522.accessed = 1545267152, n407029522.modified = 1545241637, n407029522.owner_perm = 7, n407029522.group_perm = 5, n407029522.other_perm = 5 ON MATCH SET n407029522.tag = "File", n407029522.name = "config.sub", n407029522.parent_id = 9768633, n407029522.stem = "config", n407029522.extension = "sub", n407029522.path = "/Users/starver/code/public/cpython/config.sub", n407029522.size = 36251, n407029522.owner = 501, n407029522.group = 20, n407029522.created = 1545241637, n407029522.accessed = 1545267152, n407029522.modified = 1545241637, n407029522.owner_perm = 7, n407029522.group_perm = 5, n407029522.other_perm = 5
-MERGE (n82274497) - [:PARENT_OF] -> (n407029522)
-MERGE (n978501098:File {id: 9775974}) ON CREATE SET n978501098.tag = "File", n978501098.name = "setup.py", n978501098.parent_id = 9768633, n978501098.stem = "setup", n978501098.extension = "py", n978501098.path = "/Users/starver/code/public/cpython/setup.py", n978501098.size = 101533, n978501098.owner = 501, n978501098.group = 20, n978501098.created = 1545241637, n978501098.accessed = 1545267152, n978501098.modified = 1545241637, n978501098.owner_perm = 6, n978501098.group_perm = 4, n978501098.other_perm = 4 ON MATCH SET n978501098.tag = "File", n978501098.name = "setup.py", n978501098.parent_id = 9768633, n978501098.stem = "setup", n978501098.extension = "py", n978501098.path = "/Users/starver/code/public/cpython/setup.py", n978501098.size = 101533, n978501098.owner = 501, n978501098.group = 20, n978501098.created = 1545241637, n978501098.accessed = 1545267152, n978501098.modified = 1545241637, n978501098.owner_perm = 6, n978501098.group_perm = 4, n978501098.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n978501098)
-MERGE (n408269812:File {id: 9770922}) ON CREATE SET n408269812.tag = "File", n408269812.name = ".gitignore", n408269812.parent_id = 9768633, n408269812.stem = ".gitignore", n408269812.extension = "", n408269812.path = "/Users/starver/code/public/cpython/.gitignore", n408269812.size = 1590, n408269812.owner = 501, n408269812.group = 20, n408269812.created = 1545241636, n408269812.accessed = 1545241636, n408269812.modified = 1545241636, n408269812.owner_perm = 6, n408269812.group_perm = 4, n408269812.other_perm = 4 ON MATCH SET n408269812.tag = "File", n408269812.name = ".gitignore", n408269812.parent_id = 9768633, n408269812.stem = ".gitignore", n408269812.extension = "", n408269812.path = "/Users/starver/code/public/cpython/.gitignore", n408269812.size = 1590, n408269812.owner = 501, n408269812.group = 20, n408269812.created = 1545241636, n408269812.accessed = 1545241636, n408269812.modified = 1545241636, n408269812.owner_perm = 6, n408269812.group_perm = 4, n408269812.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n408269812)
-MERGE (n240769045:File {id: 9770915}) ON CREATE SET n240769045.tag = "File", n240769045.name = ".gitattributes", n240769045.parent_id = 9768633, n240769045.stem = ".gitattributes", n240769045.extension = "", n240769045.path = "/Users/starver/code/public/cpython/.gitattributes", n240769045.size = 1600, n240769045.owner = 501, n240769045.group = 20, n240769045.created = 1545241636, n240769045.accessed = 1545241636, n240769045.modified = 1545241636, n240769045.owner_perm = 6, n240769045.group_perm = 4, n240769045.other_perm = 4 ON MATCH SET n240769045.tag = "File", n240769045.name = ".gitattributes", n240769045.parent_id = 9768633, n240769045.stem = ".gitattributes", n240769045.extension = "", n240769045.path = "/Users/starver/code/public/cpython/.gitattributes", n240769045.size = 1600, n240769045.owner = 501, n240769045.group = 20, n240769045.created = 1545241636, n240769045.accessed = 1545241636, n240769045.modified = 1545241636, n240769045.owner_perm = 6, n240769045.group_perm = 4, n240769045.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n240769045)
-MERGE (n948425854:File {id: 9775623}) ON CREATE SET n948425854.tag = "File", n948425854.name = "README.rst", n948425854.parent_id = 9768633, n948425854.stem = "README", n948425854.extension = "rst", n948425854.path = "/Users/starver/code/public/cpython/README.rst", n948425854.size = 10064, n948425854.owner = 501, n948425854.group = 20, n948425854.created = 1545241637, n948425854.accessed = 1545267151, n948425854.modified = 1545241637, n948425854.owner_perm = 6, n948425854.group_perm = 4, n948425854.other_perm = 4 ON MATCH SET n948425854.tag = "File", n948425854.name = "README.rst", n948425854.parent_id = 9768633, n948425854.stem = "README", n948425854.extension = "rst", n948425854.path = "/Users/starver/code/public/cpython/README.rst", n948425854.size = 10064, n948425854.owner = 501, n948425854.group = 20, n948425854.created = 1545241637, n948425854.accessed = 1545267151, n948425854.modified = 1545241637, n948425854.owner_perm = 6, n948425854.group_perm = 4, n948425854.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n948425854)
-MERGE (n931977977:File {id: 9770923}) ON CREATE SET n931977977.tag = "File", n931977977.name = ".travis.yml", n931977977.parent_id = 9768633, n931977977.stem = ".travis", n931977977.extension = "yml", n931977977.path = "/Users/starver/code/public/cpython/.travis.yml", n931977977.size = 8095, n931977977.owner = 501, n931977977.group = 20, n931977977.created = 1545241636, n931977977.accessed = 1545241636, n931977977.modified = 1545241636, n931977977.owner_perm = 6, n931977977.group_perm = 4, n931977977.other_perm = 4 ON MATCH SET n931977977.tag = "File", n931977977.name = ".travis.yml", n931977977.parent_id = 9768633, n931977977.stem = ".travis", n931977977.extension = "yml", n931977977.path = "/Users/starver/code/public/cpython/.travis.yml", n931977977.size = 8095, n931977977.owner = 501, n931977977.group = 20, n931977977.created = 1545241636, n931977977.accessed = 1545241636, n931977977.modified = 1545241636, n931977977.owner_perm = 6, n931977977.group_perm = 4, n931977977.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n931977977)
-MERGE (n151003483:File {id: 9775964}) ON CREATE SET n151003483.tag = "File", n151003483.name = "aclocal.m4", n151003483.parent_id = 9768633, n151003483.stem = "aclocal", n151003483.extension = "m4", n151003483.path = "/Users/starver/code/public/cpython/aclocal.m4", n151003483.size = 10996, n151003483.owner = 501, n151003483.group = 20, n151003483.created = 1545241637, n151003483.accessed = 1545267152, n151003483.modified = 1545241637, n151003483.owner_perm = 6, n151003483.group_perm = 4, n151003483.other_perm = 4 ON MATCH SET n151003483.tag = "File", n151003483.name = "aclocal.m4", n151003483.parent_id = 9768633, n151003483.stem = "aclocal", n151003483.extension = "m4", n151003483.path = "/Users/starver/code/public/cpython/aclocal.m4", n151003483.size = 10996, n151003483.owner = 501, n151003483.group = 20, n151003483.created = 1545241637, n151003483.accessed = 1545267152, n151003483.modified = 1545241637, n151003483.owner_perm = 6, n151003483.group_perm = 4, n151003483.other_perm = 4
-MERGE (n82274497) - [:PARENT_OF] -> (n151003483)
-MERGE (n707047034:Directory {id: 9775304}) ON CREATE SET n707047034.tag = "Directory", n707047034.name = "PC", n707047034.parent_id = 9768633, n707047034.stem = "PC", n707047034.extension = "", n707047034.path = "/Users/starver/code/public/cpython/PC", n707047034.size = 1440, n707047034.owner = 501, n707047034.group = 20, n707047034.created = 1545241637, n707047034.accessed = 1545673345, n707047034.modified = 1545241637, n707047034.owner_perm = 7, n707047034.group_perm = 5, n707047034.other_perm = 5 ON MATCH SET n707047034.tag = "Directory", n707047034.name = "PC", n707047034.parent_id = 9768633, n707047034.stem = "PC", n707047034.extension = "", n707047034.path = "/Users/starver/code/public/cpython/PC", n707047034.size = 1440, n707047034.owner = 501, n707047034.group = 20, n707047034.created = 1545241637, n707047034.accessed = 1545673345, n707047034.modified = 1545241637, n707047034.owner_perm = 7, n707047034.group_perm = 5, n707047034.other_perm = 5
-MERGE (n586565423:Directory {id: 9768633})
-MERGE (n586565423) - [:PARENT_OF] -> (n707047034)
-MERGE (n739551683:Directory {id: 9773911}) ON CREATE SET n739551683.tag = "Directory", n739551683.name = "Misc", n739551683.parent_id = 9768633, n739551683.stem = "Misc", n739551683.extension = "", n739551683.path = "/Users/starver/code/public/cpython/Misc", n739551683.size = 768, n739551683.owner = 501, n739551683.group = 20, n739551683.created = 1545241637, n739551683.accessed = 1545673345, n739551683.modified = 1545241637, n739551683.owner_perm = 7, n739551683.group_perm = 5, n739551683.other_perm = 5 ON MATCH SET n739551683.tag = "Directory", n739551683.name = "Misc", n739551683.parent_id = 9768633, n739551683.stem = "Misc", n739551683.extension = "", n739551683.path = "/Users/starver/code/public/cpython/Misc", n739551683.size = 768, n739551683.owner = 501, n739551683.group = 20, n739551683.created = 1545241637, n739551683.accessed = 1545673345, n739551683.modified = 1545241637, n739551683.owner_perm = 7, n739551683.group_perm = 5, n739551683.other_perm = 5
-MERGE (n266503374:Directory {id: 9768633})
-MERGE (n266503374) - [:PARENT_OF] -> (n739551683)
-MERGE (n354488903:Directory {id: 9771506}) ON CREATE SET n354488903.tag = "Directory", n354488903.name = "Grammar", n354488903.parent_id = 9768633, n354488903.stem = "Grammar", n354488903.extension = "", n354488903.path = "/Users/starver/code/public/cpython/Grammar", n354488903.size = 96, n354488903.owner = 501, n354488903.group = 20, n354488903.created = 1545241636, n354488903.accessed = 1545673345, n354488903.modified = 1545241636, n354488903.owner_perm = 7, n354488903.group_perm = 5, n354488903.other_perm = 5 ON MATCH SET n354488903.tag = "Directory", n354488903.name = "Grammar", n354488903.parent_id = 9768633, n354488903.stem = "Grammar", n354488903.extension = "", n354488903.path = "/Users/starver/code/public/cpython/Grammar", n354488903.size = 96, n354488903.owner = 501, n354488903.group = 20, n354488903.created = 1545241636, n354488903.accessed = 1545673345, n354488903.modified = 1545241636, n354488903.owner_perm = 7, n354488903.group_perm = 5, n354488903.other_perm = 5
-MERGE (n639245634:Directory {id: 9768633})
-MERGE (n639245634) - [:PARENT_OF] -> (n354488903)
-MERGE (n836500510:File {id: 9771507}) ON CREATE SET n836500510.tag = "File", n836500510.name = "Grammar", n836500510.parent_id = 9771506, n836500510.stem = "Grammar", n836500510.extension = "", n836500510.path = "/Users/starver/code/public/cpython/Grammar/Grammar", n836500510.size = 6520, n836500510.owner = 501, n836500510.group = 20, n836500510.created = 1545241636, n836500510.accessed = 1545267137, n836500510.modified = 1545241636, n836500510.owner_perm = 6, n836500510.group_perm = 4, n836500510.other_perm = 4 ON MATCH SET n836500510.tag = "File", n836500510.name = "Grammar", n836500510.parent_id = 9771506, n836500510.stem = "Grammar", n836500510.extension = "", n836500510.path = "/Users/starver/code/public/cpython/Grammar/Grammar", n836500510.size = 6520, n836500510.owner = 501, n836500510.group = 20, n836500510.created = 1545241636, n836500510.accessed = 1545267137, n836500510.modified = 1545241636, n836500510.owner_perm = 6, n836500510.group_perm = 4, n836500510.other_perm = 4
-MERGE (n354488903) - [:PARENT_OF] -> (n836500510)
-MERGE (n203077309:Directory {id: 9775624}) ON CREATE SET n203077309.tag = "Directory", n203077309.name = "Tools", n203077309.parent_id = 9768633, n203077309.stem = "Tools", n203077309.extension = "", n203077309.path = "/Users/starver/code/public/cpython/Tools", n203077309.size = 768, n203077309.owner = 501, n203077309.group = 20, n203077309.created = 1545241637, n203077309.accessed = 1545673345, n203077309.modified = 1545241637, n203077309.owner_perm = 7, n203077309.group_perm = 5, n203077309.other_perm = 5 ON MATCH SET n203077309.tag = "Directory", n203077309.name = "Tools", n203077309.parent_id = 9768633, n203077309.stem = "Tools", n203077309.extension = "", n203077309.path = "/Users/starver/code/public/cpython/Tools", n203077309.size = 768, n203077309.owner = 501, n203077309.group = 20, n203077309.created = 1545241637, n203077309.accessed = 1545673345, n203077309.modified = 1545241637, n203077309.owner_perm = 7, n203077309.group_perm = 5, n203077309.other_perm = 5
-MERGE (n490745396:Directory {id: 9768633})
-MERGE (n490745396) - [:PARENT_OF] -> (n203077309)
-MERGE (n373226198:Directory {id: 9770904}) ON CREATE SET n373226198.tag = "Directory", n373226198.name = ".azure-pipelines", n373226198.parent_id = 9768633, n373226198.stem = ".azure-pipelines", n373226198.extension = "", n373226198.path = "/Users/starver/code/public/cpython/.azure-pipelines", n373226198.size = 384, n373226198.owner = 501, n373226198.group = 20, n373226198.created = 1545241636, n373226198.accessed = 1545673345, n373226198.modified = 1545241636, n373226198.owner_perm = 7, n373226198.group_perm = 5, n373226198.other_perm = 5 ON MATCH SET n373226198.tag = "Directory", n373226198.name = ".azure-pipelines", n373226198.parent_id = 9768633, n373226198.stem = ".azure-pipelines", n373226198.extension = "", n373226198.path = "/Users/starver/code/public/cpython/.azure-pipelines", n373226198.size = 384, n373226198.owner = 501, n373226198.group = 20, n373226198.created = 1545241636, n373226198.accessed = 1545673345, n373226198.modified = 1545241636, n373226198.owner_perm = 7, n373226198.group_perm = 5, n373226198.other_perm = 5
-MERGE (n954688409:Directory {id: 9768633})
-MERGE (n954688409) - [:PARENT_OF] -> (n373226198)
-MERGE (n384530135:File {id: 9770906}) ON CREATE SET n384530135.tag = "File", n384530135.name = "docker-steps.yml", n384530135.parent_id = 9770904, n384530135.stem = "docker-steps", n384530135.extension = "yml", n384530135.path = "/Users/starver/code/public/cpython/.azure-pipelines/docker-steps.yml", n384530135.size = 2258, n384530135.owner = 501, n384530135.group = 20, n384530135.created = 1545241636, n384530135.accessed = 1545241636, n384530135.modified = 1545241636, n384530135.owner_perm = 6, n384530135.group_perm = 4, n384530135.other_perm = 4 ON MATCH SET n384530135.tag = "File", n384530135.name = "docker-steps.yml", n384530135.parent_id = 9770904, n384530135.stem = "docker-steps", n384530135.extension = "yml", n384530135.path = "/Users/starver/code/public/cpython/.azure-pipelines/docker-steps.yml", n384530135.size = 2258, n384530135.owner = 501, n384530135.group = 20, n384530135.created = 1545241636, n384530135.accessed = 1545241636, n384530135.modified = 1545241636, n384530135.owner_perm = 6, n384530135.group_perm = 4, n384530135.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n384530135)
-MERGE (n221693781:File {id: 9770907}) ON CREATE SET n221693781.tag = "File", n221693781.name = "docs-steps.yml", n221693781.parent_id = 9770904, n221693781.stem = "docs-steps", n221693781.extension = "yml", n221693781.path = "/Users/starver/code/public/cpython/.azure-pipelines/docs-steps.yml", n221693781.size = 1351, n221693781.owner = 501, n221693781.group = 20, n221693781.created = 1545241636, n221693781.accessed = 1545241636, n221693781.modified = 1545241636, n221693781.owner_perm = 6, n221693781.group_perm = 4, n221693781.other_perm = 4 ON MATCH SET n221693781.tag = "File", n221693781.name = "docs-steps.yml", n221693781.parent_id = 9770904, n221693781.stem = "docs-steps", n221693781.extension = "yml", n221693781.path = "/Users/starver/code/public/cpython/.azure-pipelines/docs-steps.yml", n221693781.size = 1351, n221693781.owner = 501, n221693781.group = 20, n221693781.created = 1545241636, n221693781.accessed = 1545241636, n221693781.modified = 1545241636, n221693781.owner_perm = 6, n221693781.group_perm = 4, n221693781.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n221693781)
-MERGE (n708285858:File {id: 9770910}) ON CREATE SET n708285858.tag = "File", n708285858.name = "posix-steps.yml", n708285858.parent_id = 9770904, n708285858.stem = "posix-steps", n708285858.extension = "yml", n708285858.path = "/Users/starver/code/public/cpython/.azure-pipelines/posix-steps.yml", n708285858.size = 1964, n708285858.owner = 501, n708285858.group = 20, n708285858.created = 1545241636, n708285858.accessed = 1545241636, n708285858.modified = 1545241636, n708285858.owner_perm = 6, n708285858.group_perm = 4, n708285858.other_perm = 4 ON MATCH SET n708285858.tag = "File", n708285858.name = "posix-steps.yml", n708285858.parent_id = 9770904, n708285858.stem = "posix-steps", n708285858.extension = "yml", n708285858.path = "/Users/starver/code/public/cpython/.azure-pipelines/posix-steps.yml", n708285858.size = 1964, n708285858.owner = 501, n708285858.group = 20, n708285858.created = 1545241636, n708285858.accessed = 1545241636, n708285858.modified = 1545241636, n708285858.owner_perm = 6, n708285858.group_perm = 4, n708285858.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n708285858)
-MERGE (n498567359:File {id: 9770911}) ON CREATE SET n498567359.tag = "File", n498567359.name = "pr.yml", n498567359.parent_id = 9770904, n498567359.stem = "pr", n498567359.extension = "yml", n498567359.path = "/Users/starver/code/public/cpython/.azure-pipelines/pr.yml", n498567359.size = 1882, n498567359.owner = 501, n498567359.group = 20, n498567359.created = 1545241636, n498567359.accessed = 1545241636, n498567359.modified = 1545241636, n498567359.owner_perm = 6, n498567359.group_perm = 4, n498567359.other_perm = 4 ON MATCH SET n498567359.tag = "File", n498567359.name = "pr.yml", n498567359.parent_id = 9770904, n498567359.stem = "pr", n498567359.extension = "yml", n498567359.path = "/Users/starver/code/public/cpython/.azure-pipelines/pr.yml", n498567359.size = 1882, n498567359.owner = 501, n498567359.group = 20, n498567359.created = 1545241636, n498567359.accessed = 1545241636, n498567359.modified = 1545241636, n498567359.owner_perm = 6, n498567359.group_perm = 4, n498567359.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n498567359)
-MERGE (n672948069:File {id: 9770914}) ON CREATE SET n672948069.tag = "File", n672948069.name = "windows-steps.yml", n672948069.parent_id = 9770904, n672948069.stem = "windows-steps", n672948069.extension = "yml", n672948069.path = "/Users/starver/code/public/cpython/.azure-pipelines/windows-steps.yml", n672948069.size = 1242, n672948069.owner = 501, n672948069.group = 20, n672948069.created = 1545241636, n672948069.accessed = 1545241636, n672948069.modified = 1545241636, n672948069.owner_perm = 6, n672948069.group_perm = 4, n672948069.other_perm = 4 ON MATCH SET n672948069.tag = "File", n672948069.name = "windows-steps.yml", n672948069.parent_id = 9770904, n672948069.stem = "windows-steps", n672948069.extension = "yml", n672948069.path = "/Users/starver/code/public/cpython/.azure-pipelines/windows-steps.yml", n672948069.size = 1242, n672948069.owner = 501, n672948069.group = 20, n672948069.created = 1545241636, n672948069.accessed = 1545241636, n672948069.modified = 1545241636, n672948069.owner_perm = 6, n672948069.group_perm = 4, n672948069.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n672948069)
-MERGE (n842573539:File {id: 9770908}) ON CREATE SET n842573539.tag = "File", n842573539.name = "macos-steps.yml", n842573539.parent_id = 9770904, n842573539.stem = "macos-steps", n842573539.extension = "yml", n842573539.path = "/Users/starver/code/public/cpython/.azure-pipelines/macos-steps.yml", n842573539.size = 724, n842573539.owner = 501, n842573539.group = 20, n842573539.created = 1545241636, n842573539.accessed = 1545241636, n842573539.modified = 1545241636, n842573539.owner_perm = 6, n842573539.group_perm = 4, n842573539.other_perm = 4 ON MATCH SET n842573539.tag = "File", n842573539.name = "macos-steps.yml", n842573539.parent_id = 9770904, n842573539.stem = "macos-steps", n842573539.extension = "yml", n842573539.path = "/Users/starver/code/public/cpython/.azure-pipelines/macos-steps.yml", n842573539.size = 724, n842573539.owner = 501, n842573539.group = 20, n842573539.created = 1545241636, n842573539.accessed = 1545241636, n842573539.modified = 1545241636, n842573539.owner_perm = 6, n842573539.group_perm = 4, n842573539.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n842573539)
-MERGE (n484143904:File {id: 9770909}) ON CREATE SET n484143904.tag = "File", n484143904.name = "posix-deps.sh", n484143904.parent_id = 9770904, n484143904.stem = "posix-deps", n484143904.extension = "sh", n484143904.path = "/Users/starver/code/public/cpython/.azure-pipelines/posix-deps.sh", n484143904.size = 590, n484143904.owner = 501, n484143904.group = 20, n484143904.created = 1545241636, n484143904.accessed = 1545241636, n484143904.modified = 1545241636, n484143904.owner_perm = 7, n484143904.group_perm = 5, n484143904.other_perm = 5 ON MATCH SET n484143904.tag = "File", n484143904.name = "posix-deps.sh", n484143904.parent_id = 9770904, n484143904.stem = "posix-deps", n484143904.extension = "sh", n484143904.path = "/Users/starver/code/public/cpython/.azure-pipelines/posix-deps.sh", n484143904.size = 590, n484143904.owner = 501, n484143904.group = 20, n484143904.created = 1545241636, n484143904.accessed = 1545241636, n484143904.modified = 1545241636, n484143904.owner_perm = 7, n484143904.group_perm = 5, n484143904.other_perm = 5
-MERGE (n373226198) - [:PARENT_OF] -> (n484143904)
-MERGE (n601640326:File {id: 9770913}) ON CREATE SET n601640326.tag = "File", n601640326.name = "windows-appx-test.yml", n601640326.parent_id = 9770904, n601640326.stem = "windows-appx-test", n601640326.extension = "yml", n601640326.path = "/Users/starver/code/public/cpython/.azure-pipelines/windows-appx-test.yml", n601640326.size = 2197, n601640326.owner = 501, n601640326.group = 20, n601640326.created = 1545241636, n601640326.accessed = 1545241636, n601640326.modified = 1545241636, n601640326.owner_perm = 6, n601640326.group_perm = 4, n601640326.other_perm = 4 ON MATCH SET n601640326.tag = "File", n601640326.name = "windows-appx-test.yml", n601640326.parent_id = 9770904, n601640326.stem = "windows-appx-test", n601640326.extension = "yml", n601640326.path = "/Users/starver/code/public/cpython/.azure-pipelines/windows-appx-test.yml", n601640326.size = 2197, n601640326.owner = 501, n601640326.group = 20, n601640326.created = 1545241636, n601640326.accessed = 1545241636, n601640326.modified = 1545241636, n601640326.owner_perm = 6, n601640326.group_perm = 4, n601640326.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n601640326)
-MERGE (n376949770:File {id: 9770912}) ON CREATE SET n376949770.tag = "File", n376949770.name = "prebuild-checks.yml", n376949770.parent_id = 9770904, n376949770.stem = "prebuild-checks", n376949770.extension = "yml", n376949770.path = "/Users/starver/code/public/cpython/.azure-pipelines/prebuild-checks.yml", n376949770.size = 1218, n376949770.owner = 501, n376949770.group = 20, n376949770.created = 1545241636, n376949770.accessed = 1545241636, n376949770.modified = 1545241636, n376949770.owner_perm = 6, n376949770.group_perm = 4, n376949770.other_perm = 4 ON MATCH SET n376949770.tag = "File", n376949770.name = "prebuild-checks.yml", n376949770.parent_id = 9770904, n376949770.stem = "prebuild-checks", n376949770.extension = "yml", n376949770.path = "/Users/starver/code/public/cpython/.azure-pipelines/prebuild-checks.yml", n376949770.size = 1218, n376949770.owner = 501, n376949770.group = 20, n376949770.created = 1545241636, n376949770.accessed = 1545241636, n376949770.modified = 1545241636, n376949770.owner_perm = 6, n376949770.group_perm = 4, n376949770.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n376949770)
-MERGE (n136933443:File {id: 9770905}) ON CREATE SET n136933443.tag = "File", n136933443.name = "ci.yml", n136933443.parent_id = 9770904, n136933443.stem = "ci", n136933443.extension = "yml", n136933443.path = "/Users/starver/code/public/cpython/.azure-pipelines/ci.yml", n136933443.size = 2753, n136933443.owner = 501, n136933443.group = 20, n136933443.created = 1545241636, n136933443.accessed = 1545241636, n136933443.modified = 1545241636, n136933443.owner_perm = 6, n136933443.group_perm = 4, n136933443.other_perm = 4 ON MATCH SET n136933443.tag = "File", n136933443.name = "ci.yml", n136933443.parent_id = 9770904, n136933443.stem = "ci", n136933443.extension = "yml", n136933443.path = "/Users/starver/code/public/cpython/.azure-pipelines/ci.yml", n136933443.size = 2753, n136933443.owner = 501, n136933443.group = 20, n136933443.created = 1545241636, n136933443.accessed = 1545241636, n136933443.modified = 1545241636, n136933443.owner_perm = 6, n136933443.group_perm = 4, n136933443.other_perm = 4
-MERGE (n373226198) - [:PARENT_OF] -> (n136933443)
-MERGE (n669186530:Directory {id: 9775540}) ON CREATE SET n669186530.tag = "Directory", n669186530.name = "Python", n669186530.parent_id = 9768633, n669186530.stem = "Python", n669186530.extension = "", n669186530.path = "/Users/starver/code/public/cpython/Python", n669186530.size = 2464, n669186530.owner = 501, n669186530.group = 20, n669186530.created = 1545241637, n669186530.accessed = 1545673345, n669186530.modified = 1545241637, n669186530.owner_perm = 7, n669186530.group_perm = 5, n669186530.other_perm = 5 ON MATCH SET n669186530.tag = "Directory", n669186530.name = "Python", n669186530.parent_id = 9768633, n669186530.stem = "Python", n669186530.extension = "", n669186530.path = "/Users/starver/code/public/cpython/Python", n669186530.size = 2464, n669186530.owner = 501, n669186530.group = 20, n669186530.created = 1545241637, n669186530.accessed = 1545673345, n669186530.modified = 1545241637, n669186530.owner_perm = 7, n669186530.group_perm = 5, n669186530.other_perm = 5
-MERGE (n904071574:Directory {id: 9768633})
-MERGE (n904071574) - [:PARENT_OF] -> (n669186530)
-MERGE (n169067665:Directory {id: 9771508}) ON CREATE SET n169067665.tag = "Directory", n169067665.name = "Include", n169067665.parent_id = 9768633, n169067665.stem = "Include", n169067665.extension = "", n169067665.path = "/Users/starver/code/public/cpython/Include", n169067665.size = 3328, n169067665.owner = 501, n169067665.group = 20, n169067665.created = 1545241636, n169067665.accessed = 1545673345, n169067665.modified = 1545241636, n169067665.owner_perm = 7, n169067665.group_perm = 5, n169067665.other_perm = 5 ON MATCH SET n169067665.tag = "Directory", n169067665.name = "Include", n169067665.parent_id = 9768633, n169067665.stem = "Include", n169067665.extension = "", n169067665.path = "/Users/starver/code/public/cpython/Include", n169067665.size = 3328, n169067665.owner = 501, n169067665.group = 20, n169067665.created = 1545241636, n169067665.accessed = 1545673345, n169067665.modified = 1545241636, n169067665.owner_perm = 7, n169067665.group_perm = 5, n169067665.other_perm = 5
-MERGE (n727847161:Directory {id: 9768633})
-MERGE (n727847161) - [:PARENT_OF] -> (n169067665)
-MERGE (n444769383:Directory {id: 9775213}) ON CREATE SET n444769383.tag = "Directory", n444769383.name = "Objects", n444769383.parent_id = 9768633, n444769383.stem = "Objects", n444769383.extension = "", n444769383.path = "/Users/starver/code/public/cpython/Objects", n444769383.size = 1664, n444769383.owner = 501, n444769383.group = 20, n444769383.created = 1545241637, n444769383.accessed = 1545673345, n444769383.modified = 1545241637, n444769383.owner_perm = 7, n444769383.group_perm = 5, n444769383.other_perm = 5 ON MATCH SET n444769383.tag = "Directory", n444769383.name = "Objects", n444769383.parent_id = 9768633, n444769383.stem = "Objects", n444769383.extension = "", n444769383.path = "/Users/starver/code/public/cpython/Objects", n444769383.size = 1664, n444769383.owner = 501, n444769383.group = 20, n444769383.created = 1545241637, n444769383.accessed = 1545673345, n444769383.modified = 1545241637, n444769383.owner_perm = 7, n444769383.group_perm = 5, n444769383.other_perm = 5
-MERGE (n610325543:Directory {id: 9768633})
-MERGE (n610325543) - [:PARENT_OF] -> (n444769383)
-MERGE (n100698442:Directory {id: 9775512}) ON CREATE SET n100698442.tag = "Directory", n100698442.name = "Parser", n100698442.parent_id = 9768633, n100698442.stem = "Parser", n100698442.extension = "", n100698442.path = "/Users/starver/code/public/cpython/Parser", n100698442.size = 768, n100698442.owner = 501, n100698442.group = 20, n100698442.created = 1545241637, n100698442.accessed = 1545241637, n100698442.modified = 1545241637, n100698442.owner_perm = 7, n100698442.group_perm = 5, n100698442.other_perm = 5 ON MATCH SET n100698442.tag = "Directory", n100698442.name = "Parser", n100698442.parent_id = 9768633, n100698442.stem = "Parser", n100698442.extension = "", n100698442.path = "/Users/starver/code/public/cpython/Parser", n100698442.size = 768, n100698442.owner = 501, n100698442.group = 20, n100698442.created = 1545241637, n100698442.accessed = 1545241637, n100698442.modified = 1545241637, n100698442.owner_perm = 7, n100698442.group_perm = 5, n100698442.other_perm = 5
-MERGE (n921044400:Directory {id: 9768633})
-MERGE (n921044400) - [:PARENT_OF] -> (n100698442)
-MERGE (n968601605:Directory {id: 9773821}) ON CREATE SET n968601605.tag = "Directory", n968601605.name = "Mac", n968601605.parent_id = 9768633, n968601605.stem = "Mac", n968601605.extension = "", n968601605.path = "/Users/starver/code/public/cpython/Mac", n968601605.size = 352, n968601605.owner = 501, n968601605.group = 20, n968601605.created = 1545241637, n968601605.accessed = 1545673345, n968601605.modified = 1545241637, n968601605.owner_perm = 7, n968601605.group_perm = 5, n968601605.other_perm = 5 ON MATCH SET n968601605.tag = "Directory", n968601605.name = "Mac", n968601605.parent_id = 9768633, n968601605.stem = "Mac", n968601605.extension = "", n968601605.path = "/Users/starver/code/public/cpython/Mac", n968601605.size = 352, n968601605.owner = 501, n968601605.group = 20, n968601605.created = 1545241637, n968601605.accessed = 1545673345, n968601605.modified = 1545241637, n968601605.owner_perm = 7, n968601605.group_perm = 5, n968601605.other_perm = 5
-MERGE (n489668377:Directory {id: 9768633})
-MERGE (n489668377) - [:PARENT_OF] -> (n968601605)
-MERGE (n124239855:Directory {id: 9775535}) ON CREATE SET n124239855.tag = "Directory", n124239855.name = "Programs", n124239855.parent_id = 9768633, n124239855.stem = "Programs", n124239855.extension = "", n124239855.path = "/Users/starver/code/public/cpython/Programs", n124239855.size = 192, n124239855.owner = 501, n124239855.group = 20, n124239855.created = 1545241637, n124239855.accessed = 1545673345, n124239855.modified = 1545241637, n124239855.owner_perm = 7, n124239855.group_perm = 5, n124239855.other_perm = 5 ON MATCH SET n124239855.tag = "Directory", n124239855.name = "Programs", n124239855.parent_id = 9768633, n124239855.stem = "Programs", n124239855.extension = "", n124239855.path = "/Users/starver/code/public/cpython/Programs", n124239855.size = 192, n124239855.owner = 501, n124239855.group = 20, n124239855.created = 1545241637, n124239855.accessed = 1545673345, n124239855.modified = 1545241637, n124239855.owner_perm = 7, n124239855.group_perm = 5, n124239855.other_perm = 5
-MERGE (n974711250:Directory {id: 9768633})
-MERGE (n974711250) - [:PARENT_OF] -> (n124239855)
-MERGE (n809729880:File {id: 9775537}) ON CREATE SET n809729880.tag = "File", n809729880.name = "_freeze_importlib.c", n809729880.parent_id = 9775535, n809729880.stem = "_freeze_importlib", n809729880.extension = "c", n809729880.path = "/Users/starver/code/public/cpython/Programs/_freeze_importlib.c", n809729880.size = 4722, n809729880.owner = 501, n809729880.group = 20, n809729880.created = 1545241637, n809729880.accessed = 1545267151, n809729880.modified = 1545241637, n809729880.owner_perm = 6, n809729880.group_perm = 4, n809729880.other_perm = 4 ON MATCH SET n809729880.tag = "File", n809729880.name = "_freeze_importlib.c", n809729880.parent_id = 9775535, n809729880.stem = "_freeze_importlib", n809729880.extension = "c", n809729880.path = "/Users/starver/code/public/cpython/Programs/_freeze_importlib.c", n809729880.size = 4722, n809729880.owner = 501, n809729880.group = 20, n809729880.created = 1545241637, n809729880.accessed = 1545267151, n809729880.modified = 1545241637, n809729880.owner_perm = 6, n809729880.group_perm = 4, n809729880.other_perm = 4
-MERGE (n124239855) - [:PARENT_OF] -> (n809729880)
-MERGE (n689464932:File {id: 9775538}) ON CREATE SET n689464932.tag = "File", n689464932.name = "_testembed.c", n689464932.parent_id = 9775535, n689464932.stem = "_testembed", n689464932.extension = "c", n689464932.path = "/Users/starver/code/public/cpython/Programs/_testembed.c", n689464932.size = 19671, n689464932.owner = 501, n689464932.group = 20, n689464932.created = 1545241637, n689464932.accessed = 1545267151, n689464932.modified = 1545241637, n689464932.owner_perm = 6, n689464932.group_perm = 4, n689464932.other_perm = 4 ON MATCH SET n689464932.tag = "File", n689464932.name = "_testembed.c", n689464932.parent_id = 9775535, n689464932.stem = "_testembed", n689464932.extension = "c", n689464932.path = "/Users/starver/code/public/cpython/Programs/_testembed.c", n689464932.size = 19671, n689464932.owner = 501, n689464932.group = 20, n689464932.created = 1545241637, n689464932.accessed = 1545267151, n689464932.modified = 1545241637, n689464932.owner_perm = 6, n689464932.group_perm = 4, n689464932.other_perm = 4
-MERGE (n124239855) - [:PARENT_OF] -> (n689464932)
-MERGE (n254633224:File {id: 9775539}) ON CREATE SET n254633224.tag = "File", n254633224.name = "python.c", n254633224.parent_id = 9775535, n254633224.stem = "python", n254633224.extension = "c", n254633224.path = "/Users/starver/code/public/cpython/Programs/python.c", n254633224.size = 298, n254633224.owner = 501, n254633224.group = 20, n254633224.created = 1545241637, n254633224.accessed = 1545267151, n254633224.modified = 1545241637, n254633224.owner_perm = 6, n254633224.group_perm = 4, n254633224.other_perm = 4 ON MATCH SET n254633224.tag = "File", n254633224.name = "python.c", n254633224.parent_id = 9775535, n254633224.stem = "python", n254633224.extension = "c", n254633224.path = "/Users/starver/code/public/cpython/Programs/python.c", n254633224.size = 298, n254633224.owner = 501, n254633224.group = 20, n254633224.created = 1545241637, n254633224.accessed = 1545267151, n254633224.modified = 1545241637, n254633224.owner_perm = 6, n254633224.group_perm = 4, n254633224.other_perm = 4
-MERGE (n124239855) - [:PARENT_OF] -> (n254633224)
-MERGE (n13820446:File {id: 9775536}) ON CREATE SET n13820446.tag = "File", n13820446.name = "README", n13820446.parent_id = 9775535, n13820446.stem = "README", n13820446.extension = "", n13820446.path = "/Users/starver/code/public/cpython/Programs/README", n13820446.size = 67, n13820446.owner = 501, n13820446.group = 20, n13820446.created = 1545241637, n13820446.accessed = 1545267151, n13820446.modified = 1545241637, n13820446.owner_perm = 6, n13820446.group_perm = 4, n13820446.other_perm = 4 ON MATCH SET n13820446.tag = "File", n13820446.name = "README", n13820446.parent_id = 9775535, n13820446.stem = "README", n13820446.extension = "", n13820446.path = "/Users/starver/code/public/cpython/Programs/README", n13820446.size = 67, n13820446.owner = 501, n13820446.group = 20, n13820446.created = 1545241637, n13820446.accessed = 1545267151, n13820446.modified = 1545241637, n13820446.owner_perm = 6, n13820446.group_perm = 4, n13820446.other_perm = 4
-MERGE (n124239855) - [:PARENT_OF] -> (n13820446)
-MERGE (n597280379:Directory {id: 9775403}) ON CREATE SET n597280379.tag = "Directory", n597280379.name = "PCbuild", n597280379.parent_id = 9768633, n597280379.stem = "PCbuild", n597280379.extension = "", n597280379.path = "/Users/starver/code/public/cpython/PCbuild", n597280379.size = 3520, n597280379.owner = 501, n597280379.group = 20, n597280379.created = 1545241637, n597280379.accessed = 1545673345, n597280379.modified = 1545241637, n597280379.owner_perm = 7, n597280379.group_perm = 5, n597280379.other_perm = 5 ON MATCH SET n597280379.tag = "Directory", n597280379.name = "PCbuild", n597280379.parent_id = 9768633, n597280379.stem = "PCbuild", n597280379.extension = "", n597280379.path = "/Users/starver/code/public/cpython/PCbuild", n597280379.size = 3520, n597280379.owner = 501, n597280379.group = 20, n597280379.created = 1545241637, n597280379.accessed = 1545673345, n597280379.modified = 1545241637, n597280379.owner_perm = 7, n597280379.group_perm = 5, n597280379.other_perm = 5
-MERGE (n136521696:Directory {id: 9768633})
-MERGE (n136521696) - [:PARENT_OF] -> (n597280379)
-MERGE (n351520975:Directory {id: 9770916}) ON CREATE SET n351520975.tag = "Directory", n351520975.name = ".github", n351520975.parent_id = 9768633, n351520975.stem = ".github", n351520975.extension = "", n351520975.path = "/Users/starver/code/public/cpython/.github", n351520975.size = 224, n351520975.owner = 501, n351520975.group = 20, n351520975.created = 1545241636, n351520975.accessed = 1545673345, n351520975.modified = 1545241636, n351520975.owner_perm = 7, n351520975.group_perm = 5, n351520975.other_perm = 5 ON MATCH SET n351520975.tag = "Directory", n351520975.name = ".github", n351520975.parent_id = 9768633, n351520975.stem = ".github", n351520975.extension = "", n351520975.path = "/Users/starver/code/public/cpython/.github", n351520975.size = 224, n351520975.owner = 501, n351520975.group = 20, n351520975.created = 1545241636, n351520975.accessed = 1545673345, n351520975.modified = 1545241636, n351520975.owner_perm = 7, n351520975.group_perm = 5, n351520975.other_perm = 5
-MERGE (n293730219:Directory {id: 9768633})
-MERGE (n293730219) - [:PARENT_OF] -> (n351520975)
-MERGE (n171152152:File {id: 9770921}) ON CREATE SET n171152152.tag = "File", n171152152.name = "codecov.yml", n171152152.parent_id = 9770916, n171152152.stem = "codecov", n171152152.extension = "yml", n171152152.path = "/Users/starver/code/public/cpython/.github/codecov.yml", n171152152.size = 482, n171152152.owner = 501, n171152152.group = 20, n171152152.created = 1545241636, n171152152.accessed = 1545241636, n171152152.modified = 1545241636, n171152152.owner_perm = 6, n171152152.group_perm = 4, n171152152.other_perm = 4 ON MATCH SET n171152152.tag = "File", n171152152.name = "codecov.yml", n171152152.parent_id = 9770916, n171152152.stem = "codecov", n171152152.extension = "yml", n171152152.path = "/Users/starver/code/public/cpython/.github/codecov.yml", n171152152.size = 482, n171152152.owner = 501, n171152152.group = 20, n171152152.created = 1545241636, n171152152.accessed = 1545241636, n171152152.modified = 1545241636, n171152152.owner_perm = 6, n171152152.group_perm = 4, n171152152.other_perm = 4
-MERGE (n351520975) - [:PARENT_OF] -> (n171152152)
-MERGE (n18618588:File {id: 9770918}) ON CREATE SET n18618588.tag = "File", n18618588.name = "CONTRIBUTING.rst", n18618588.parent_id = 9770916, n18618588.stem = "CONTRIBUTING", n18618588.extension = "rst", n18618588.path = "/Users/starver/code/public/cpython/.github/CONTRIBUTING.rst", n18618588.size = 2412, n18618588.owner = 501, n18618588.group = 20, n18618588.created = 1545241636, n18618588.accessed = 1545241636, n18618588.modified = 1545241636, n18618588.owner_perm = 6, n18618588.group_perm = 4, n18618588.other_perm = 4 ON MATCH SET n18618588.tag = "File", n18618588.name = "CONTRIBUTING.rst", n18618588.parent_id = 9770916, n18618588.stem = "CONTRIBUTING", n18618588.extension = "rst", n18618588.path = "/Users/starver/code/public/cpython/.github/CONTRIBUTING.rst", n18618588.size = 2412, n18618588.owner = 501, n18618588.group = 20, n18618588.created = 1545241636, n18618588.accessed = 1545241636, n18618588.modified = 1545241636, n18618588.owner_perm = 6, n18618588.group_perm = 4, n18618588.other_perm = 4
-MERGE (n351520975) - [:PARENT_OF] -> (n18618588)
-MERGE (n489661055:File {id: 9770917}) ON CREATE SET n489661055.tag = "File", n489661055.name = "CODEOWNERS", n489661055.parent_id = 9770916, n489661055.stem = "CODEOWNERS", n489661055.extension = "", n489661055.path = "/Users/starver/code/public/cpython/.github/CODEOWNERS", n489661055.size = 2144, n489661055.owner = 501, n489661055.group = 20, n489661055.created = 1545241636, n489661055.accessed = 1545241636, n489661055.modified = 1545241636, n489661055.owner_perm = 6, n489661055.group_perm = 4, n489661055.other_perm = 4 ON MATCH SET n489661055.tag = "File", n489661055.name = "CODEOWNERS", n489661055.parent_id = 9770916, n489661055.stem = "CODEOWNERS", n489661055.extension = "", n489661055.path = "/Users/starver/code/public/cpython/.github/CODEOWNERS", n489661055.size = 2144, n489661055.owner = 501, n489661055.group = 20, n489661055.created = 1545241636, n489661055.accessed = 1545241636, n489661055.modified = 1545241636, n489661055.owner_perm = 6, n489661055.group_perm = 4, n489661055.other_perm = 4
-MERGE (n351520975) - [:PARENT_OF] -> (n489661055)
-MERGE (n320870885:File {id: 9770919}) ON CREATE SET n320870885.tag = "File", n320870885.name = "PULL_REQUEST_TEMPLATE.md", n320870885.parent_id = 9770916, n320870885.stem = "PULL_REQUEST_TEMPLATE", n320870885.extension = "md", n320870885.path = "/Users/starver/code/public/cpython/.github/PULL_REQUEST_TEMPLATE.md", n320870885.size = 700, n320870885.owner = 501, n320870885.group = 20, n320870885.created = 1545241636, n320870885.accessed = 1545241636, n320870885.modified = 1545241636, n320870885.owner_perm = 6, n320870885.group_perm = 4, n320870885.other_perm = 4 ON MATCH SET n320870885.tag = "File", n320870885.name = "PULL_REQUEST_TEMPLATE.md", n320870885.parent_id = 9770916, n320870885.stem = "PULL_REQUEST_TEMPLATE", n320870885.extension = "md", n320870885.path = "/Users/starver/code/public/cpython/.github/PULL_REQUEST_TEMPLATE.md", n320870885.size = 700, n320870885.owner = 501, n320870885.group = 20, n320870885.created = 1545241636, n320870885.accessed = 1545241636, n320870885.modified = 1545241636, n320870885.owner_perm = 6, n320870885.group_perm = 4, n320870885.other_perm = 4
-MERGE (n351520975) - [:PARENT_OF] -> (n320870885)
-MERGE (n365665930:File {id: 9770920}) ON CREATE SET n365665930.tag = "File", n365665930.name = "appveyor.yml", n365665930.parent_id = 9770916, n365665930.stem = "appveyor", n365665930.extension = "yml", n365665930.path = "/Users/starver/code/public/cpython/.github/appveyor.yml", n365665930.size = 1148, n365665930.owner = 501, n365665930.group = 20, n365665930.created = 1545241636, n365665930.accessed = 1545241636, n365665930.modified = 1545241636, n365665930.owner_perm = 6, n365665930.group_perm = 4, n365665930.other_perm = 4 ON MATCH SET n365665930.tag = "File", n365665930.name = "appveyor.yml", n365665930.parent_id = 9770916, n365665930.stem = "appveyor", n365665930.extension = "yml", n365665930.path = "/Users/starver/code/public/cpython/.github/appveyor.yml", n365665930.size = 1148, n365665930.owner = 501, n365665930.group = 20, n365665930.created = 1545241636, n365665930.accessed = 1545241636, n365665930.modified = 1545241636, n365665930.owner_perm = 6, n365665930.group_perm = 4, n365665930.other_perm = 4
-MERGE (n351520975) - [:PARENT_OF] -> (n365665930)
-MERGE (n219095200:Directory {id: 9771638}) ON CREATE SET n219095200.tag = "Directory", n219095200.name = "Lib", n219095200.parent_id = 9768633, n219095200.stem = "Lib", n219095200.extension = "", n219095200.path = "/Users/starver/code/public/cpython/Lib", n219095200.size = 6528, n219095200.owner = 501, n219095200.group = 20, n219095200.created = 1545241637, n219095200.accessed = 1545673345, n219095200.modified = 1545241637, n219095200.owner_perm = 7, n219095200.group_perm = 5, n219095200.other_perm = 5 ON MATCH SET n219095200.tag = "Directory", n219095200.name = "Lib", n219095200.parent_id = 9768633, n219095200.stem = "Lib", n219095200.extension = "", n219095200.path = "/Users/starver/code/public/cpython/Lib", n219095200.size = 6528, n219095200.owner = 501, n219095200.group = 20, n219095200.created = 1545241637, n219095200.accessed = 1545673345, n219095200.modified = 1545241637, n219095200.owner_perm = 7, n219095200.group_perm = 5, n219095200.other_perm = 5
-MERGE (n393573358:Directory {id: 9768633})
-MERGE (n393573358) - [:PARENT_OF] -> (n219095200)
-MERGE (n891648794:Directory {id: 9775970}) ON CREATE SET n891648794.tag = "Directory", n891648794.name = "m4", n891648794.parent_id = 9768633, n891648794.stem = "m4", n891648794.extension = "", n891648794.path = "/Users/starver/code/public/cpython/m4", n891648794.size = 128, n891648794.owner = 501, n891648794.group = 20, n891648794.created = 1545241637, n891648794.accessed = 1545241637, n891648794.modified = 1545241637, n891648794.owner_perm = 7, n891648794.group_perm = 5, n891648794.other_perm = 5 ON MATCH SET n891648794.tag = "Directory", n891648794.name = "m4", n891648794.parent_id = 9768633, n891648794.stem = "m4", n891648794.extension = "", n891648794.path = "/Users/starver/code/public/cpython/m4", n891648794.size = 128, n891648794.owner = 501, n891648794.group = 20, n891648794.created = 1545241637, n891648794.accessed = 1545241637, n891648794.modified = 1545241637, n891648794.owner_perm = 7, n891648794.group_perm = 5, n891648794.other_perm = 5
-MERGE (n913037667:Directory {id: 9768633})
-MERGE (n913037667) - [:PARENT_OF] -> (n891648794)
-MERGE (n334316929:File {id: 9775972}) ON CREATE SET n334316929.tag = "File", n334316929.name = "ax_check_openssl.m4", n334316929.parent_id = 9775970, n334316929.stem = "ax_check_openssl", n334316929.extension = "m4", n334316929.path = "/Users/starver/code/public/cpython/m4/ax_check_openssl.m4", n334316929.size = 4189, n334316929.owner = 501, n334316929.group = 20, n334316929.created = 1545241637, n334316929.accessed = 1545267152, n334316929.modified = 1545241637, n334316929.owner_perm = 6, n334316929.group_perm = 4, n334316929.other_perm = 4 ON MATCH SET n334316929.tag = "File", n334316929.name = "ax_check_openssl.m4", n334316929.parent_id = 9775970, n334316929.stem = "ax_check_openssl", n334316929.extension = "m4", n334316929.path = "/Users/starver/code/public/cpython/m4/ax_check_openssl.m4", n334316929.size = 4189, n334316929.owner = 501, n334316929.group = 20, n334316929.created = 1545241637, n334316929.accessed = 1545267152, n334316929.modified = 1545241637, n334316929.owner_perm = 6, n334316929.group_perm = 4, n334316929.other_perm = 4
-MERGE (n891648794) - [:PARENT_OF] -> (n334316929)
-MERGE (n908992162:File {id: 9775971}) ON CREATE SET n908992162.tag = "File", n908992162.name = "ax_c_float_words_bigendian.m4", n908992162.parent_id = 9775970, n908992162.stem = "ax_c_float_words_bigendian", n908992162.extension = "m4", n908992162.path = "/Users/starver/code/public/cpython/m4/ax_c_float_words_bigendian.m4", n908992162.size = 3159, n908992162.owner = 501, n908992162.group = 20, n908992162.created = 1545241637, n908992162.accessed = 1545267152, n908992162.modified = 1545241637, n908992162.owner_perm = 6, n908992162.group_perm = 4, n908992162.other_perm = 4 ON MATCH SET n908992162.tag = "File", n908992162.name = "ax_c_float_words_bigendian.m4", n908992162.parent_id = 9775970, n908992162.stem = "ax_c_float_words_bigendian", n908992162.extension = "m4", n908992162.path = "/Users/starver/code/public/cpython/m4/ax_c_float_words_bigendian.m4", n908992162.size = 3159, n908992162.owner = 501, n908992162.group = 20, n908992162.created = 1545241637, n908992162.accessed = 1545267152, n908992162.modified = 1545241637, n908992162.owner_perm = 6, n908992162.group_perm = 4, n908992162.other_perm = 4
-MERGE (n891648794) - [:PARENT_OF] -> (n908992162)
-MERGE (n55499857:Directory {id: 9770925}) ON CREATE SET n55499857.tag = "Directory", n55499857.name = "Doc", n55499857.parent_id = 9768633, n55499857.stem = "Doc", n55499857.extension = "", n55499857.path = "/Users/starver/code/public/cpython/Doc", n55499857.size = 896, n55499857.owner = 501, n55499857.group = 20, n55499857.created = 1545241636, n55499857.accessed = 1545673346, n55499857.modified = 1545241636, n55499857.owner_perm = 7, n55499857.group_perm = 5, n55499857.other_perm = 5 ON MATCH SET n55499857.tag = "Directory", n55499857.name = "Doc", n55499857.parent_id = 9768633, n55499857.stem = "Doc", n55499857.extension = "", n55499857.path = "/Users/starver/code/public/cpython/Doc", n55499857.size = 896, n55499857.owner = 501, n55499857.group = 20, n55499857.created = 1545241636, n55499857.accessed = 1545673346, n55499857.modified = 1545241636, n55499857.owner_perm = 7, n55499857.group_perm = 5, n55499857.other_perm = 5
-MERGE (n649358616:Directory {id: 9768633})
-MERGE (n649358616) - [:PARENT_OF] -> (n55499857)
-MERGE (n862360296:Directory {id: 9768634}) ON CREATE SET n862360296.tag = "Directory", n862360296.name = ".git", n862360296.parent_id = 9768633, n862360296.stem = ".git", n862360296.extension = "", n862360296.path = "/Users/starver/code/public/cpython/.git", n862360296.size = 448, n862360296.owner = 501, n862360296.group = 20, n862360296.created = 1545241684, n862360296.accessed = 1545673346, n862360296.modified = 1545241684, n862360296.owner_perm = 7, n862360296.group_perm = 5, n862360296.other_perm = 5 ON MATCH SET n862360296.tag = "Directory", n862360296.name = ".git", n862360296.parent_id = 9768633, n862360296.stem = ".git", n862360296.extension = "", n862360296.path = "/Users/starver/code/public/cpython/.git", n862360296.size = 448, n862360296.owner = 501, n862360296.group = 20, n862360296.created = 1545241684, n862360296.accessed = 1545673346, n862360296.modified = 1545241684, n862360296.owner_perm = 7, n862360296.group_perm = 5, n862360296.other_perm = 5
-MERGE (n523416495:Directory {id: 9768633})
-MERGE (n523416495) - [:PARENT_OF] -> (n862360296)
-MERGE (n550592858:File {id: 9776054}) ON CREATE SET n550592858.tag = "File", n550592858.name = "config", n550592858.parent_id = 9768634, n550592858.stem = "config", n550592858.extension = "", n550592858.path = "/Users/starver/code/public/cpython/.git/config", n550592858.size = 357, n550592858.owner = 501, n550592858.group = 20, n550592858.created = 1545241684, n550592858.accessed = 1545241706, n550592858.modified = 1545241684, n550592858.owner_perm = 6, n550592858.group_perm = 4, n550592858.other_perm = 4 ON MATCH SET n550592858.tag = "File", n550592858.name = "config", n550592858.parent_id = 9768634, n550592858.stem = "config", n550592858.extension = "", n550592858.path = "/Users/starver/code/public/cpython/.git/config", n550592858.size = 357, n550592858.owner = 501, n550592858.group = 20, n550592858.created = 1545241684, n550592858.accessed = 1545241706, n550592858.modified = 1545241684, n550592858.owner_perm = 6, n550592858.group_perm = 4, n550592858.other_perm = 4
-MERGE (n862360296) - [:PARENT_OF] -> (n550592858)
-MERGE (n868464565:File {id: 9770895}) ON CREATE SET n868464565.tag = "File", n868464565.name = "HEAD", n868464565.parent_id = 9768634, n868464565.stem = "HEAD", n868464565.extension = "", n868464565.path = "/Users/starver/code/public/cpython/.git/HEAD", n868464565.size = 23, n868464565.owner = 501, n868464565.group = 20, n868464565.created = 1545241636, n868464565.accessed = 1545241646, n868464565.modified = 1545241636, n868464565.owner_perm = 6, n868464565.group_perm = 4, n868464565.other_perm = 4 ON MATCH SET n868464565.tag = "File", n868464565.name = "HEAD", n868464565.parent_id = 9768634, n868464565.stem = "HEAD", n868464565.extension = "", n868464565.path = "/Users/starver/code/public/cpython/.git/HEAD", n868464565.size = 23, n868464565.owner = 501, n868464565.group = 20, n868464565.created = 1545241636, n868464565.accessed = 1545241646, n868464565.modified = 1545241636, n868464565.owner_perm = 6, n868464565.group_perm = 4, n868464565.other_perm = 4
-MERGE (n862360296) - [:PARENT_OF] -> (n868464565)
-MERGE (n633043395:File {id: 9768637}) ON CREATE SET n633043395.tag = "File", n633043395.name = "description", n633043395.parent_id = 9768634, n633043395.stem = "description", n633043395.extension = "", n633043395.path = "/Users/starver/code/public/cpython/.git/description", n633043395.size = 73, n633043395.owner = 501, n633043395.group = 20, n633043395.created = 1545241485, n633043395.accessed = 1545241485, n633043395.modified = 1545241485, n633043395.owner_perm = 6, n633043395.group_perm = 4, n633043395.other_perm = 4 ON MATCH SET n633043395.tag = "File", n633043395.name = "description", n633043395.parent_id = 9768634, n633043395.stem = "description", n633043395.extension = "", n633043395.path = "/Users/starver/code/public/cpython/.git/description", n633043395.size = 73, n633043395.owner = 501, n633043395.group = 20, n633043395.created = 1545241485, n633043395.accessed = 1545241485, n633043395.modified = 1545241485, n633043395.owner_perm = 6, n633043395.group_perm = 4, n633043395.other_perm = 4
-MERGE (n862360296) - [:PARENT_OF] -> (n633043395)
-MERGE (n655453961:File {id: 9776025}) ON CREATE SET n655453961.tag = "File", n655453961.name = "index", n655453961.parent_id = 9768634, n655453961.stem = "index", n655453961.extension = "", n655453961.path = "/Users/starver/code/public/cpython/.git/index", n655453961.size = 488920, n655453961.owner = 501, n655453961.group = 20, n655453961.created = 1545241664, n655453961.accessed = 1545241700, n655453961.modified = 1545241664, n655453961.owner_perm = 6, n655453961.group_perm = 4, n655453961.other_perm = 4 ON MATCH SET n655453961.tag = "File", n655453961.name = "index", n655453961.parent_id = 9768634, n655453961.stem = "index", n655453961.extension = "", n655453961.path = "/Users/starver/code/public/cpython/.git/index", n655453961.size = 488920, n655453961.owner = 501, n655453961.group = 20, n655453961.created = 1545241664, n655453961.accessed = 1545241700, n655453961.modified = 1545241664, n655453961.owner_perm = 6, n655453961.group_perm = 4, n655453961.other_perm = 4
-MERGE (n862360296) - [:PARENT_OF] -> (n655453961)
-MERGE (n620661732:File {id: 9770886}) ON CREATE SET n620661732.tag = "File", n620661732.name = "packed-refs", n620661732.parent_id = 9768634, n620661732.stem = "packed-refs", n620661732.extension = "", n620661732.path = "/Users/starver/code/public/cpython/.git/packed-refs", n620661732.size = 25007, n620661732.owner = 501, n620661732.group = 20, n620661732.created = 1545241636, n620661732.accessed = 1545241644, n620661732.modified = 1545241636, n620661732.owner_perm = 6, n620661732.group_perm = 4, n620661732.other_perm = 4 ON MATCH SET n620661732.tag = "File", n620661732.name = "packed-refs", n620661732.parent_id = 9768634, n620661732.stem = "packed-refs", n620661732.extension = "", n620661732.path = "/Users/starver/code/public/cpython/.git/packed-refs", n620661732.size = 25007, n620661732.owner = 501, n620661732.group = 20, n620661732.created = 1545241636, n620661732.accessed = 1545241644, n620661732.modified = 1545241636, n620661732.owner_perm = 6, n620661732.group_perm = 4, n620661732.other_perm = 4
-MERGE (n862360296) - [:PARENT_OF] -> (n620661732)
-MERGE (n637545333:File {id: 9775980}) ON CREATE SET n637545333.tag = "File", n637545333.name = "FETCH_HEAD", n637545333.parent_id = 9768634, n637545333.stem = "FETCH_HEAD", n637545333.extension = "", n637545333.path = "/Users/starver/code/public/cpython/.git/FETCH_HEAD", n637545333.size = 2217, n637545333.owner = 501, n637545333.group = 20, n637545333.created = 1545241641, n637545333.accessed = 1545241638, n637545333.modified = 1545241641, n637545333.owner_perm = 6, n637545333.group_perm = 4, n637545333.other_perm = 4 ON MATCH SET n637545333.tag = "File", n637545333.name = "FETCH_HEAD", n637545333.parent_id = 9768634, n637545333.stem = "FETCH_HEAD", n637545333.extension = "", n637545333.path = "/Users/starver/code/public/cpython/.git/FETCH_HEAD", n637545333.size = 2217, n637545333.owner = 501, n637545333.group = 20, n637545333.created = 1545241641, n637545333.accessed = 1545241638, n637545333.modified = 1545241641, n637545333.owner_perm = 6, n637545333.group_perm = 4, n637545333.other_perm = 4
-MERGE (n862360296) - [:PARENT_OF] -> (n637545333)
-MERGE (n238833813:Directory {id: 9768664}) ON CREATE SET n238833813.tag = "Directory", n238833813.name = "objects", n238833813.parent_id = 9768634, n238833813.stem = "objects", n238833813.extension = "", n238833813.path = "/Users/starver/code/public/cpython/.git/objects", n238833813.size = 128, n238833813.owner = 501, n238833813.group = 20, n238833813.created = 1545241485, n238833813.accessed = 1545673346, n238833813.modified = 1545241485, n238833813.owner_perm = 7, n238833813.group_perm = 5, n238833813.other_perm = 5 ON MATCH SET n238833813.tag = "Directory", n238833813.name = "objects", n238833813.parent_id = 9768634, n238833813.stem = "objects", n238833813.extension = "", n238833813.path = "/Users/starver/code/public/cpython/.git/objects", n238833813.size = 128, n238833813.owner = 501, n238833813.group = 20, n238833813.created = 1545241485, n238833813.accessed = 1545673346, n238833813.modified = 1545241485, n238833813.owner_perm = 7, n238833813.group_perm = 5, n238833813.other_perm = 5
-MERGE (n5042603:Directory {id: 9768634})
-MERGE (n5042603) - [:PARENT_OF] -> (n238833813)
-MERGE (n79507096:Directory {id: 9768665}) ON CREATE SET n79507096.tag = "Directory", n79507096.name = "pack", n79507096.parent_id = 9768664, n79507096.stem = "pack", n79507096.extension = "", n79507096.path = "/Users/starver/code/public/cpython/.git/objects/pack", n79507096.size = 128, n79507096.owner = 501, n79507096.group = 20, n79507096.created = 1545241636, n79507096.accessed = 1545241636, n79507096.modified = 1545241636, n79507096.owner_perm = 7, n79507096.group_perm = 5, n79507096.other_perm = 5 ON MATCH SET n79507096.tag = "Directory", n79507096.name = "pack", n79507096.parent_id = 9768664, n79507096.stem = "pack", n79507096.extension = "", n79507096.path = "/Users/starver/code/public/cpython/.git/objects/pack", n79507096.size = 128, n79507096.owner = 501, n79507096.group = 20, n79507096.created = 1545241636, n79507096.accessed = 1545241636, n79507096.modified = 1545241636, n79507096.owner_perm = 7, n79507096.group_perm = 5, n79507096.other_perm = 5
-MERGE (n557391525:Directory {id: 9768664})
-MERGE (n557391525) - [:PARENT_OF] -> (n79507096)
-MERGE (n9780829:File {id: 9770879}) ON CREATE SET n9780829.tag = "File", n9780829.name = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", n9780829.parent_id = 9768665, n9780829.stem = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", n9780829.extension = "idx", n9780829.path = "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", n9780829.size = 20458908, n9780829.owner = 501, n9780829.group = 20, n9780829.created = 1545241636, n9780829.accessed = 1545241700, n9780829.modified = 1545241636, n9780829.owner_perm = 4, n9780829.group_perm = 4, n9780829.other_perm = 4 ON MATCH SET n9780829.tag = "File", n9780829.name = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", n9780829.parent_id = 9768665, n9780829.stem = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", n9780829.extension = "idx", n9780829.path = "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", n9780829.size = 20458908, n9780829.owner = 501, n9780829.group = 20, n9780829.created = 1545241636, n9780829.accessed = 1545241700, n9780829.modified = 1545241636, n9780829.owner_perm = 4, n9780829.group_perm = 4, n9780829.other_perm = 4
-MERGE (n79507096) - [:PARENT_OF] -> (n9780829)
-MERGE (n162236186:File {id: 9769910}) ON CREATE SET n162236186.tag = "File", n162236186.name = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", n162236186.parent_id = 9768665, n162236186.stem = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", n162236186.extension = "pack", n162236186.path = "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", n162236186.size = 269003613, n162236186.owner = 501, n162236186.group = 20, n162236186.created = 1545241636, n162236186.accessed = 1545241700, n162236186.modified = 1545241635, n162236186.owner_perm = 4, n162236186.group_perm = 4, n162236186.other_perm = 4 ON MATCH SET n162236186.tag = "File", n162236186.name = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", n162236186.parent_id = 9768665, n162236186.stem = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", n162236186.extension = "pack", n162236186.path = "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", n162236186.size = 269003613, n162236186.owner = 501, n162236186.group = 20, n162236186.created = 1545241636, n162236186.accessed = 1545241700, n162236186.modified = 1545241635, n162236186.owner_perm = 4, n162236186.group_perm = 4, n162236186.other_perm = 4
-MERGE (n79507096) - [:PARENT_OF] -> (n162236186)
-MERGE (n167053760:Directory {id: 9768666}) ON CREATE SET n167053760.tag = "Directory", n167053760.name = "info", n167053760.parent_id = 9768664, n167053760.stem = "info", n167053760.extension = "", n167053760.path = "/Users/starver/code/public/cpython/.git/objects/info", n167053760.size = 64, n167053760.owner = 501, n167053760.group = 20, n167053760.created = 1545241485, n167053760.accessed = 1545673480, n167053760.modified = 1545241485, n167053760.owner_perm = 7, n167053760.group_perm = 5, n167053760.other_perm = 5 ON MATCH SET n167053760.tag = "Directory", n167053760.name = "info", n167053760.parent_id = 9768664, n167053760.stem = "info", n167053760.extension = "", n167053760.path = "/Users/starver/code/public/cpython/.git/objects/info", n167053760.size = 64, n167053760.owner = 501, n167053760.group = 20, n167053760.created = 1545241485, n167053760.accessed = 1545673480, n167053760.modified = 1545241485, n167053760.owner_perm = 7, n167053760.group_perm = 5, n167053760.other_perm = 5
-MERGE (n259078667:Directory {id: 9768664})
-MERGE (n259078667) - [:PARENT_OF] -> (n167053760)
-MERGE (n493198404:Directory {id: 9768635}) ON CREATE SET n493198404.tag = "Directory", n493198404.name = "info", n493198404.parent_id = 9768634, n493198404.stem = "info", n493198404.extension = "", n493198404.path = "/Users/starver/code/public/cpython/.git/info", n493198404.size = 96, n493198404.owner = 501, n493198404.group = 20, n493198404.created = 1545241485, n493198404.accessed = 1545673346, n493198404.modified = 1545241485, n493198404.owner_perm = 7, n493198404.group_perm = 5, n493198404.other_perm = 5 ON MATCH SET n493198404.tag = "Directory", n493198404.name = "info", n493198404.parent_id = 9768634, n493198404.stem = "info", n493198404.extension = "", n493198404.path = "/Users/starver/code/public/cpython/.git/info", n493198404.size = 96, n493198404.owner = 501, n493198404.group = 20, n493198404.created = 1545241485, n493198404.accessed = 1545673346, n493198404.modified = 1545241485, n493198404.owner_perm = 7, n493198404.group_perm = 5, n493198404.other_perm = 5
-MERGE (n695014936:Directory {id: 9768634})
-MERGE (n695014936) - [:PARENT_OF] -> (n493198404)
-MERGE (n746651423:File {id: 9768636}) ON CREATE SET n746651423.tag = "File", n746651423.name = "exclude", n746651423.parent_id = 9768635, n746651423.stem = "exclude", n746651423.extension = "", n746651423.path = "/Users/starver/code/public/cpython/.git/info/exclude", n746651423.size = 240, n746651423.owner = 501, n746651423.group = 20, n746651423.created = 1545241485, n746651423.accessed = 1545241485, n746651423.modified = 1545241485, n746651423.owner_perm = 6, n746651423.group_perm = 4, n746651423.other_perm = 4 ON MATCH SET n746651423.tag = "File", n746651423.name = "exclude", n746651423.parent_id = 9768635, n746651423.stem = "exclude", n746651423.extension = "", n746651423.path = "/Users/starver/code/public/cpython/.git/info/exclude", n746651423.size = 240, n746651423.owner = 501, n746651423.group = 20, n746651423.created = 1545241485, n746651423.accessed = 1545241485, n746651423.modified = 1545241485, n746651423.owner_perm = 6, n746651423.group_perm = 4, n746651423.other_perm = 4
-MERGE (n493198404) - [:PARENT_OF] -> (n746651423)
-MERGE (n549218207:Directory {id: 9770890}) ON CREATE SET n549218207.tag = "Directory", n549218207.name = "logs", n549218207.parent_id = 9768634, n549218207.stem = "logs", n549218207.extension = "", n549218207.path = "/Users/starver/code/public/cpython/.git/logs", n549218207.size = 128, n549218207.owner = 501, n549218207.group = 20, n549218207.created = 1545241636, n549218207.accessed = 1545673346, n549218207.modified = 1545241636, n549218207.owner_perm = 7, n549218207.group_perm = 5, n549218207.other_perm = 5 ON MATCH SET n549218207.tag = "Directory", n549218207.name = "logs", n549218207.parent_id = 9768634, n549218207.stem = "logs", n549218207.extension = "", n549218207.path = "/Users/starver/code/public/cpython/.git/logs", n549218207.size = 128, n549218207.owner = 501, n549218207.group = 20, n549218207.created = 1545241636, n549218207.accessed = 1545673346, n549218207.modified = 1545241636, n549218207.owner_perm = 7, n549218207.group_perm = 5, n549218207.other_perm = 5
-MERGE (n852843191:Directory {id: 9768634})
-MERGE (n852843191) - [:PARENT_OF] -> (n549218207)
-MERGE (n160109382:File {id: 9770898}) ON CREATE SET n160109382.tag = "File", n160109382.name = "HEAD", n160109382.parent_id = 9770890, n160109382.stem = "HEAD", n160109382.extension = "", n160109382.path = "/Users/starver/code/public/cpython/.git/logs/HEAD", n160109382.size = 204, n160109382.owner = 501, n160109382.group = 20, n160109382.created = 1545241636, n160109382.accessed = 1545241636, n160109382.modified = 1545241636, n160109382.owner_perm = 6, n160109382.group_perm = 4, n160109382.other_perm = 4 ON MATCH SET n160109382.tag = "File", n160109382.name = "HEAD", n160109382.parent_id = 9770890, n160109382.stem = "HEAD", n160109382.extension = "", n160109382.path = "/Users/starver/code/public/cpython/.git/logs/HEAD", n160109382.size = 204, n160109382.owner = 501, n160109382.group = 20, n160109382.created = 1545241636, n160109382.accessed = 1545241636, n160109382.modified = 1545241636, n160109382.owner_perm = 6, n160109382.group_perm = 4, n160109382.other_perm = 4
-MERGE (n549218207) - [:PARENT_OF] -> (n160109382)
-MERGE (n678182893:Directory {id: 9770891}) ON CREATE SET n678182893.tag = "Directory", n678182893.name = "refs", n678182893.parent_id = 9770890, n678182893.stem = "refs", n678182893.extension = "", n678182893.path = "/Users/starver/code/public/cpython/.git/logs/refs", n678182893.size = 128, n678182893.owner = 501, n678182893.group = 20, n678182893.created = 1545241636, n678182893.accessed = 1545673346, n678182893.modified = 1545241636, n678182893.owner_perm = 7, n678182893.group_perm = 5, n678182893.other_perm = 5 ON MATCH SET n678182893.tag = "Directory", n678182893.name = "refs", n678182893.parent_id = 9770890, n678182893.stem = "refs", n678182893.extension = "", n678182893.path = "/Users/starver/code/public/cpython/.git/logs/refs", n678182893.size = 128, n678182893.owner = 501, n678182893.group = 20, n678182893.created = 1545241636, n678182893.accessed = 1545673346, n678182893.modified = 1545241636, n678182893.owner_perm = 7, n678182893.group_perm = 5, n678182893.other_perm = 5
-MERGE (n381765118:Directory {id: 9770890})
-MERGE (n381765118) - [:PARENT_OF] -> (n678182893)
-MERGE (n729852847:Directory {id: 9770899}) ON CREATE SET n729852847.tag = "Directory", n729852847.name = "heads", n729852847.parent_id = 9770891, n729852847.stem = "heads", n729852847.extension = "", n729852847.path = "/Users/starver/code/public/cpython/.git/logs/refs/heads", n729852847.size = 96, n729852847.owner = 501, n729852847.group = 20, n729852847.created = 1545241636, n729852847.accessed = 1545673346, n729852847.modified = 1545241636, n729852847.owner_perm = 7, n729852847.group_perm = 5, n729852847.other_perm = 5 ON MATCH SET n729852847.tag = "Directory", n729852847.name = "heads", n729852847.parent_id = 9770891, n729852847.stem = "heads", n729852847.extension = "", n729852847.path = "/Users/starver/code/public/cpython/.git/logs/refs/heads", n729852847.size = 96, n729852847.owner = 501, n729852847.group = 20, n729852847.created = 1545241636, n729852847.accessed = 1545673346, n729852847.modified = 1545241636, n729852847.owner_perm = 7, n729852847.group_perm = 5, n729852847.other_perm = 5
-MERGE (n612409763:Directory {id: 9770891})
-MERGE (n612409763) - [:PARENT_OF] -> (n729852847)
-MERGE (n318347006:File {id: 9770900}) ON CREATE SET n318347006.tag = "File", n318347006.name = "master", n318347006.parent_id = 9770899, n318347006.stem = "master", n318347006.extension = "", n318347006.path = "/Users/starver/code/public/cpython/.git/logs/refs/heads/master", n318347006.size = 204, n318347006.owner = 501, n318347006.group = 20, n318347006.created = 1545241636, n318347006.accessed = 1545241636, n318347006.modified = 1545241636, n318347006.owner_perm = 6, n318347006.group_perm = 4, n318347006.other_perm = 4 ON MATCH SET n318347006.tag = "File", n318347006.name = "master", n318347006.parent_id = 9770899, n318347006.stem = "master", n318347006.extension = "", n318347006.path = "/Users/starver/code/public/cpython/.git/logs/refs/heads/master", n318347006.size = 204, n318347006.owner = 501, n318347006.group = 20, n318347006.created = 1545241636, n318347006.accessed = 1545241636, n318347006.modified = 1545241636, n318347006.owner_perm = 6, n318347006.group_perm = 4, n318347006.other_perm = 4
-MERGE (n729852847) - [:PARENT_OF] -> (n318347006)
-MERGE (n238036663:Directory {id: 9770892}) ON CREATE SET n238036663.tag = "Directory", n238036663.name = "remotes", n238036663.parent_id = 9770891, n238036663.stem = "remotes", n238036663.extension = "", n238036663.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes", n238036663.size = 96, n238036663.owner = 501, n238036663.group = 20, n238036663.created = 1545241636, n238036663.accessed = 1545673346, n238036663.modified = 1545241636, n238036663.owner_perm = 7, n238036663.group_perm = 5, n238036663.other_perm = 5 ON MATCH SET n238036663.tag = "Directory", n238036663.name = "remotes", n238036663.parent_id = 9770891, n238036663.stem = "remotes", n238036663.extension = "", n238036663.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes", n238036663.size = 96, n238036663.owner = 501, n238036663.group = 20, n238036663.created = 1545241636, n238036663.accessed = 1545673346, n238036663.modified = 1545241636, n238036663.owner_perm = 7, n238036663.group_perm = 5, n238036663.other_perm = 5
-MERGE (n482236017:Directory {id: 9770891})
-MERGE (n482236017) - [:PARENT_OF] -> (n238036663)
-MERGE (n223319236:Directory {id: 9770893}) ON CREATE SET n223319236.tag = "Directory", n223319236.name = "origin", n223319236.parent_id = 9770892, n223319236.stem = "origin", n223319236.extension = "", n223319236.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin", n223319236.size = 96, n223319236.owner = 501, n223319236.group = 20, n223319236.created = 1545241636, n223319236.accessed = 1545673346, n223319236.modified = 1545241636, n223319236.owner_perm = 7, n223319236.group_perm = 5, n223319236.other_perm = 5 ON MATCH SET n223319236.tag = "Directory", n223319236.name = "origin", n223319236.parent_id = 9770892, n223319236.stem = "origin", n223319236.extension = "", n223319236.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin", n223319236.size = 96, n223319236.owner = 501, n223319236.group = 20, n223319236.created = 1545241636, n223319236.accessed = 1545673346, n223319236.modified = 1545241636, n223319236.owner_perm = 7, n223319236.group_perm = 5, n223319236.other_perm = 5
-MERGE (n732996316:Directory {id: 9770892})
-MERGE (n732996316) - [:PARENT_OF] -> (n223319236)
-MERGE (n942448745:File {id: 9770894}) ON CREATE SET n942448745.tag = "File", n942448745.name = "HEAD", n942448745.parent_id = 9770893, n942448745.stem = "HEAD", n942448745.extension = "", n942448745.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin/HEAD", n942448745.size = 204, n942448745.owner = 501, n942448745.group = 20, n942448745.created = 1545241636, n942448745.accessed = 1545241636, n942448745.modified = 1545241636, n942448745.owner_perm = 6, n942448745.group_perm = 4, n942448745.other_perm = 4 ON MATCH SET n942448745.tag = "File", n942448745.name = "HEAD", n942448745.parent_id = 9770893, n942448745.stem = "HEAD", n942448745.extension = "", n942448745.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin/HEAD", n942448745.size = 204, n942448745.owner = 501, n942448745.group = 20, n942448745.created = 1545241636, n942448745.accessed = 1545241636, n942448745.modified = 1545241636, n942448745.owner_perm = 6, n942448745.group_perm = 4, n942448745.other_perm = 4
-MERGE (n223319236) - [:PARENT_OF] -> (n942448745)
-MERGE (n377515394:Directory {id: 9768638}) ON CREATE SET n377515394.tag = "Directory", n377515394.name = "hooks", n377515394.parent_id = 9768634, n377515394.stem = "hooks", n377515394.extension = "", n377515394.path = "/Users/starver/code/public/cpython/.git/hooks", n377515394.size = 416, n377515394.owner = 501, n377515394.group = 20, n377515394.created = 1545241485, n377515394.accessed = 1545241485, n377515394.modified = 1545241485, n377515394.owner_perm = 7, n377515394.group_perm = 5, n377515394.other_perm = 5 ON MATCH SET n377515394.tag = "Directory", n377515394.name = "hooks", n377515394.parent_id = 9768634, n377515394.stem = "hooks", n377515394.extension = "", n377515394.path = "/Users/starver/code/public/cpython/.git/hooks", n377515394.size = 416, n377515394.owner = 501, n377515394.group = 20, n377515394.created = 1545241485, n377515394.accessed = 1545241485, n377515394.modified = 1545241485, n377515394.owner_perm = 7, n377515394.group_perm = 5, n377515394.other_perm = 5
-MERGE (n348272729:Directory {id: 9768634})
-MERGE (n348272729) - [:PARENT_OF] -> (n377515394)
-MERGE (n65940778:File {id: 9768639}) ON CREATE SET n65940778.tag = "File", n65940778.name = "commit-msg.sample", n65940778.parent_id = 9768638, n65940778.stem = "commit-msg", n65940778.extension = "sample", n65940778.path = "/Users/starver/code/public/cpython/.git/hooks/commit-msg.sample", n65940778.size = 896, n65940778.owner = 501, n65940778.group = 20, n65940778.created = 1545241485, n65940778.accessed = 1545241485, n65940778.modified = 1545241485, n65940778.owner_perm = 7, n65940778.group_perm = 5, n65940778.other_perm = 5 ON MATCH SET n65940778.tag = "File", n65940778.name = "commit-msg.sample", n65940778.parent_id = 9768638, n65940778.stem = "commit-msg", n65940778.extension = "sample", n65940778.path = "/Users/starver/code/public/cpython/.git/hooks/commit-msg.sample", n65940778.size = 896, n65940778.owner = 501, n65940778.group = 20, n65940778.created = 1545241485, n65940778.accessed = 1545241485, n65940778.modified = 1545241485, n65940778.owner_perm = 7, n65940778.group_perm = 5, n65940778.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n65940778)
-MERGE (n44066164:File {id: 9768640}) ON CREATE SET n44066164.tag = "File", n44066164.name = "pre-rebase.sample", n44066164.parent_id = 9768638, n44066164.stem = "pre-rebase", n44066164.extension = "sample", n44066164.path = "/Users/starver/code/public/cpython/.git/hooks/pre-rebase.sample", n44066164.size = 4898, n44066164.owner = 501, n44066164.group = 20, n44066164.created = 1545241485, n44066164.accessed = 1545241485, n44066164.modified = 1545241485, n44066164.owner_perm = 7, n44066164.group_perm = 5, n44066164.other_perm = 5 ON MATCH SET n44066164.tag = "File", n44066164.name = "pre-rebase.sample", n44066164.parent_id = 9768638, n44066164.stem = "pre-rebase", n44066164.extension = "sample", n44066164.path = "/Users/starver/code/public/cpython/.git/hooks/pre-rebase.sample", n44066164.size = 4898, n44066164.owner = 501, n44066164.group = 20, n44066164.created = 1545241485, n44066164.accessed = 1545241485, n44066164.modified = 1545241485, n44066164.owner_perm = 7, n44066164.group_perm = 5, n44066164.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n44066164)
-MERGE (n571523856:File {id: 9768641}) ON CREATE SET n571523856.tag = "File", n571523856.name = "pre-commit.sample", n571523856.parent_id = 9768638, n571523856.stem = "pre-commit", n571523856.extension = "sample", n571523856.path = "/Users/starver/code/public/cpython/.git/hooks/pre-commit.sample", n571523856.size = 1638, n571523856.owner = 501, n571523856.group = 20, n571523856.created = 1545241485, n571523856.accessed = 1545241485, n571523856.modified = 1545241485, n571523856.owner_perm = 7, n571523856.group_perm = 5, n571523856.other_perm = 5 ON MATCH SET n571523856.tag = "File", n571523856.name = "pre-commit.sample", n571523856.parent_id = 9768638, n571523856.stem = "pre-commit", n571523856.extension = "sample", n571523856.path = "/Users/starver/code/public/cpython/.git/hooks/pre-commit.sample", n571523856.size = 1638, n571523856.owner = 501, n571523856.group = 20, n571523856.created = 1545241485, n571523856.accessed = 1545241485, n571523856.modified = 1545241485, n571523856.owner_perm = 7, n571523856.group_perm = 5, n571523856.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n571523856)
-MERGE (n456766147:File {id: 9768642}) ON CREATE SET n456766147.tag = "File", n456766147.name = "applypatch-msg.sample", n456766147.parent_id = 9768638, n456766147.stem = "applypatch-msg", n456766147.extension = "sample", n456766147.path = "/Users/starver/code/public/cpython/.git/hooks/applypatch-msg.sample", n456766147.size = 478, n456766147.owner = 501, n456766147.group = 20, n456766147.created = 1545241485, n456766147.accessed = 1545241485, n456766147.modified = 1545241485, n456766147.owner_perm = 7, n456766147.group_perm = 5, n456766147.other_perm = 5 ON MATCH SET n456766147.tag = "File", n456766147.name = "applypatch-msg.sample", n456766147.parent_id = 9768638, n456766147.stem = "applypatch-msg", n456766147.extension = "sample", n456766147.path = "/Users/starver/code/public/cpython/.git/hooks/applypatch-msg.sample", n456766147.size = 478, n456766147.owner = 501, n456766147.group = 20, n456766147.created = 1545241485, n456766147.accessed = 1545241485, n456766147.modified = 1545241485, n456766147.owner_perm = 7, n456766147.group_perm = 5, n456766147.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n456766147)
-MERGE (n777015007:File {id: 9768643}) ON CREATE SET n777015007.tag = "File", n777015007.name = "fsmonitor-watchman.sample", n777015007.parent_id = 9768638, n777015007.stem = "fsmonitor-watchman", n777015007.extension = "sample", n777015007.path = "/Users/starver/code/public/cpython/.git/hooks/fsmonitor-watchman.sample", n777015007.size = 3327, n777015007.owner = 501, n777015007.group = 20, n777015007.created = 1545241485, n777015007.accessed = 1545241485, n777015007.modified = 1545241485, n777015007.owner_perm = 7, n777015007.group_perm = 5, n777015007.other_perm = 5 ON MATCH SET n777015007.tag = "File", n777015007.name = "fsmonitor-watchman.sample", n777015007.parent_id = 9768638, n777015007.stem = "fsmonitor-watchman", n777015007.extension = "sample", n777015007.path = "/Users/starver/code/public/cpython/.git/hooks/fsmonitor-watchman.sample", n777015007.size = 3327, n777015007.owner = 501, n777015007.group = 20, n777015007.created = 1545241485, n777015007.accessed = 1545241485, n777015007.modified = 1545241485, n777015007.owner_perm = 7, n777015007.group_perm = 5, n777015007.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n777015007)
-MERGE (n512395958:File {id: 9768644}) ON CREATE SET n512395958.tag = "File", n512395958.name = "pre-receive.sample", n512395958.parent_id = 9768638, n512395958.stem = "pre-receive", n512395958.extension = "sample", n512395958.path = "/Users/starver/code/public/cpython/.git/hooks/pre-receive.sample", n512395958.size = 544, n512395958.owner = 501, n512395958.group = 20, n512395958.created = 1545241485, n512395958.accessed = 1545241485, n512395958.modified = 1545241485, n512395958.owner_perm = 7, n512395958.group_perm = 5, n512395958.other_perm = 5 ON MATCH SET n512395958.tag = "File", n512395958.name = "pre-receive.sample", n512395958.parent_id = 9768638, n512395958.stem = "pre-receive", n512395958.extension = "sample", n512395958.path = "/Users/starver/code/public/cpython/.git/hooks/pre-receive.sample", n512395958.size = 544, n512395958.owner = 501, n512395958.group = 20, n512395958.created = 1545241485, n512395958.accessed = 1545241485, n512395958.modified = 1545241485, n512395958.owner_perm = 7, n512395958.group_perm = 5, n512395958.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n512395958)
-MERGE (n709053272:File {id: 9768645}) ON CREATE SET n709053272.tag = "File", n709053272.name = "prepare-commit-msg.sample", n709053272.parent_id = 9768638, n709053272.stem = "prepare-commit-msg", n709053272.extension = "sample", n709053272.path = "/Users/starver/code/public/cpython/.git/hooks/prepare-commit-msg.sample", n709053272.size = 1492, n709053272.owner = 501, n709053272.group = 20, n709053272.created = 1545241485, n709053272.accessed = 1545241485, n709053272.modified = 1545241485, n709053272.owner_perm = 7, n709053272.group_perm = 5, n709053272.other_perm = 5 ON MATCH SET n709053272.tag = "File", n709053272.name = "prepare-commit-msg.sample", n709053272.parent_id = 9768638, n709053272.stem = "prepare-commit-msg", n709053272.extension = "sample", n709053272.path = "/Users/starver/code/public/cpython/.git/hooks/prepare-commit-msg.sample", n709053272.size = 1492, n709053272.owner = 501, n709053272.group = 20, n709053272.created = 1545241485, n709053272.accessed = 1545241485, n709053272.modified = 1545241485, n709053272.owner_perm = 7, n709053272.group_perm = 5, n709053272.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n709053272)
-MERGE (n520885483:File {id: 9768646}) ON CREATE SET n520885483.tag = "File", n520885483.name = "post-update.sample", n520885483.parent_id = 9768638, n520885483.stem = "post-update", n520885483.extension = "sample", n520885483.path = "/Users/starver/code/public/cpython/.git/hooks/post-update.sample", n520885483.size = 189, n520885483.owner = 501, n520885483.group = 20, n520885483.created = 1545241485, n520885483.accessed = 1545241485, n520885483.modified = 1545241485, n520885483.owner_perm = 7, n520885483.group_perm = 5, n520885483.other_perm = 5 ON MATCH SET n520885483.tag = "File", n520885483.name = "post-update.sample", n520885483.parent_id = 9768638, n520885483.stem = "post-update", n520885483.extension = "sample", n520885483.path = "/Users/starver/code/public/cpython/.git/hooks/post-update.sample", n520885483.size = 189, n520885483.owner = 501, n520885483.group = 20, n520885483.created = 1545241485, n520885483.accessed = 1545241485, n520885483.modified = 1545241485, n520885483.owner_perm = 7, n520885483.group_perm = 5, n520885483.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n520885483)
-MERGE (n828870937:File {id: 9768647}) ON CREATE SET n828870937.tag = "File", n828870937.name = "pre-applypatch.sample", n828870937.parent_id = 9768638, n828870937.stem = "pre-applypatch", n828870937.extension = "sample", n828870937.path = "/Users/starver/code/public/cpython/.git/hooks/pre-applypatch.sample", n828870937.size = 424, n828870937.owner = 501, n828870937.group = 20, n828870937.created = 1545241485, n828870937.accessed = 1545241485, n828870937.modified = 1545241485, n828870937.owner_perm = 7, n828870937.group_perm = 5, n828870937.other_perm = 5 ON MATCH SET n828870937.tag = "File", n828870937.name = "pre-applypatch.sample", n828870937.parent_id = 9768638, n828870937.stem = "pre-applypatch", n828870937.extension = "sample", n828870937.path = "/Users/starver/code/public/cpython/.git/hooks/pre-applypatch.sample", n828870937.size = 424, n828870937.owner = 501, n828870937.group = 20, n828870937.created = 1545241485, n828870937.accessed = 1545241485, n828870937.modified = 1545241485, n828870937.owner_perm = 7, n828870937.group_perm = 5, n828870937.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n828870937)
-MERGE (n908707865:File {id: 9768648}) ON CREATE SET n908707865.tag = "File", n908707865.name = "pre-push.sample", n908707865.parent_id = 9768638, n908707865.stem = "pre-push", n908707865.extension = "sample", n908707865.path = "/Users/starver/code/public/cpython/.git/hooks/pre-push.sample", n908707865.size = 1348, n908707865.owner = 501, n908707865.group = 20, n908707865.created = 1545241485, n908707865.accessed = 1545241485, n908707865.modified = 1545241485, n908707865.owner_perm = 7, n908707865.group_perm = 5, n908707865.other_perm = 5 ON MATCH SET n908707865.tag = "File", n908707865.name = "pre-push.sample", n908707865.parent_id = 9768638, n908707865.stem = "pre-push", n908707865.extension = "sample", n908707865.path = "/Users/starver/code/public/cpython/.git/hooks/pre-push.sample", n908707865.size = 1348, n908707865.owner = 501, n908707865.group = 20, n908707865.created = 1545241485, n908707865.accessed = 1545241485, n908707865.modified = 1545241485, n908707865.owner_perm = 7, n908707865.group_perm = 5, n908707865.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n908707865)
-MERGE (n465503840:File {id: 9768649}) ON CREATE SET n465503840.tag = "File", n465503840.name = "update.sample", n465503840.parent_id = 9768638, n465503840.stem = "update", n465503840.extension = "sample", n465503840.path = "/Users/starver/code/public/cpython/.git/hooks/update.sample", n465503840.size = 3610, n465503840.owner = 501, n465503840.group = 20, n465503840.created = 1545241485, n465503840.accessed = 1545241485, n465503840.modified = 1545241485, n465503840.owner_perm = 7, n465503840.group_perm = 5, n465503840.other_perm = 5 ON MATCH SET n465503840.tag = "File", n465503840.name = "update.sample", n465503840.parent_id = 9768638, n465503840.stem = "update", n465503840.extension = "sample", n465503840.path = "/Users/starver/code/public/cpython/.git/hooks/update.sample", n465503840.size = 3610, n465503840.owner = 501, n465503840.group = 20, n465503840.created = 1545241485, n465503840.accessed = 1545241485, n465503840.modified = 1545241485, n465503840.owner_perm = 7, n465503840.group_perm = 5, n465503840.other_perm = 5
-MERGE (n377515394) - [:PARENT_OF] -> (n465503840)
-MERGE (n303956272:Directory {id: 9768651}) ON CREATE SET n303956272.tag = "Directory", n303956272.name = "refs", n303956272.parent_id = 9768634, n303956272.stem = "refs", n303956272.extension = "", n303956272.path = "/Users/starver/code/public/cpython/.git/refs", n303956272.size = 160, n303956272.owner = 501, n303956272.group = 20, n303956272.created = 1545241636, n303956272.accessed = 1545673346, n303956272.modified = 1545241636, n303956272.owner_perm = 7, n303956272.group_perm = 5, n303956272.other_perm = 5 ON MATCH SET n303956272.tag = "Directory", n303956272.name = "refs", n303956272.parent_id = 9768634, n303956272.stem = "refs", n303956272.extension = "", n303956272.path = "/Users/starver/code/public/cpython/.git/refs", n303956272.size = 160, n303956272.owner = 501, n303956272.group = 20, n303956272.created = 1545241636, n303956272.accessed = 1545673346, n303956272.modified = 1545241636, n303956272.owner_perm = 7, n303956272.group_perm = 5, n303956272.other_perm = 5
-MERGE (n101018732:Directory {id: 9768634})
-MERGE (n101018732) - [:PARENT_OF] -> (n303956272)
-MERGE (n958013669:Directory {id: 9768652}) ON CREATE SET n958013669.tag = "Directory", n958013669.name = "heads", n958013669.parent_id = 9768651, n958013669.stem = "heads", n958013669.extension = "", n958013669.path = "/Users/starver/code/public/cpython/.git/refs/heads", n958013669.size = 96, n958013669.owner = 501, n958013669.group = 20, n958013669.created = 1545241636, n958013669.accessed = 1545673346, n958013669.modified = 1545241636, n958013669.owner_perm = 7, n958013669.group_perm = 5, n958013669.other_perm = 5 ON MATCH SET n958013669.tag = "Directory", n958013669.name = "heads", n958013669.parent_id = 9768651, n958013669.stem = "heads", n958013669.extension = "", n958013669.path = "/Users/starver/code/public/cpython/.git/refs/heads", n958013669.size = 96, n958013669.owner = 501, n958013669.group = 20, n958013669.created = 1545241636, n958013669.accessed = 1545673346, n958013669.modified = 1545241636, n958013669.owner_perm = 7, n958013669.group_perm = 5, n958013669.other_perm = 5
-MERGE (n20144330:Directory {id: 9768651})
-MERGE (n20144330) - [:PARENT_OF] -> (n958013669)
-MERGE (n54516594:File {id: 9770897}) ON CREATE SET n54516594.tag = "File", n54516594.name = "master", n54516594.parent_id = 9768652, n54516594.stem = "master", n54516594.extension = "", n54516594.path = "/Users/starver/code/public/cpython/.git/refs/heads/master", n54516594.size = 41, n54516594.owner = 501, n54516594.group = 20, n54516594.created = 1545241636, n54516594.accessed = 1545241646, n54516594.modified = 1545241636, n54516594.owner_perm = 6, n54516594.group_perm = 4, n54516594.other_perm = 4 ON MATCH SET n54516594.tag = "File", n54516594.name = "master", n54516594.parent_id = 9768652, n54516594.stem = "master", n54516594.extension = "", n54516594.path = "/Users/starver/code/public/cpython/.git/refs/heads/master", n54516594.size = 41, n54516594.owner = 501, n54516594.group = 20, n54516594.created = 1545241636, n54516594.accessed = 1545241646, n54516594.modified = 1545241636, n54516594.owner_perm = 6, n54516594.group_perm = 4, n54516594.other_perm = 4
-MERGE (n958013669) - [:PARENT_OF] -> (n54516594)
-MERGE (n265642604:Directory {id: 9768653}) ON CREATE SET n265642604.tag = "Directory", n265642604.name = "tags", n265642604.parent_id = 9768651, n265642604.stem = "tags", n265642604.extension = "", n265642604.path = "/Users/starver/code/public/cpython/.git/refs/tags", n265642604.size = 64, n265642604.owner = 501, n265642604.group = 20, n265642604.created = 1545241485, n265642604.accessed = 1545673480, n265642604.modified = 1545241485, n265642604.owner_perm = 7, n265642604.group_perm = 5, n265642604.other_perm = 5 ON MATCH SET n265642604.tag = "Directory", n265642604.name = "tags", n265642604.parent_id = 9768651, n265642604.stem = "tags", n265642604.extension = "", n265642604.path = "/Users/starver/code/public/cpython/.git/refs/tags", n265642604.size = 64, n265642604.owner = 501, n265642604.group = 20, n265642604.created = 1545241485, n265642604.accessed = 1545673480, n265642604.modified = 1545241485, n265642604.owner_perm = 7, n265642604.group_perm = 5, n265642604.other_perm = 5
-MERGE (n636140971:Directory {id: 9768651})
-MERGE (n636140971) - [:PARENT_OF] -> (n265642604)
-MERGE (n388310064:Directory {id: 9770887}) ON CREATE SET n388310064.tag = "Directory", n388310064.name = "remotes", n388310064.parent_id = 9768651, n388310064.stem = "remotes", n388310064.extension = "", n388310064.path = "/Users/starver/code/public/cpython/.git/refs/remotes", n388310064.size = 96, n388310064.owner = 501, n388310064.group = 20, n388310064.created = 1545241636, n388310064.accessed = 1545673346, n388310064.modified = 1545241636, n388310064.owner_perm = 7, n388310064.group_perm = 5, n388310064.other_perm = 5 ON MATCH SET n388310064.tag = "Directory", n388310064.name = "remotes", n388310064.parent_id = 9768651, n388310064.stem = "remotes", n388310064.extension = "", n388310064.path = "/Users/starver/code/public/cpython/.git/refs/remotes", n388310064.size = 96, n388310064.owner = 501, n388310064.group = 20, n388310064.created = 1545241636, n388310064.accessed = 1545673346, n388310064.modified = 1545241636, n388310064.owner_perm = 7, n388310064.group_perm = 5, n388310064.other_perm = 5
-MERGE (n69373905:Directory {id: 9768651})
-MERGE (n69373905) - [:PARENT_OF] -> (n388310064)
-MERGE (n983766975:Directory {id: 9770888}) ON CREATE SET n983766975.tag = "Directory", n983766975.name = "origin", n983766975.parent_id = 9770887, n983766975.stem = "origin", n983766975.extension = "", n983766975.path = "/Users/starver/code/public/cpython/.git/refs/remotes/origin", n983766975.size = 96, n983766975.owner = 501, n983766975.group = 20, n983766975.created = 1545241636, n983766975.accessed = 1545673346, n983766975.modified = 1545241636, n983766975.owner_perm = 7, n983766975.group_perm = 5, n983766975.other_perm = 5 ON MATCH SET n983766975.tag = "Directory", n983766975.name = "origin", n983766975.parent_id = 9770887, n983766975.stem = "origin", n983766975.extension = "", n983766975.path = "/Users/starver/code/public/cpython/.git/refs/remotes/origin", n983766975.size = 96, n983766975.owner = 501, n983766975.group = 20, n983766975.created = 1545241636, n983766975.accessed = 1545673346, n983766975.modified = 1545241636, n983766975.owner_perm = 7, n983766975.group_perm = 5, n983766975.other_perm = 5
-MERGE (n927377751:Directory {id: 9770887})
-MERGE (n927377751) - [:PARENT_OF] -> (n983766975)
-MERGE (n855495214:File {id: 9770889}) ON CREATE SET n855495214.tag = "File", n855495214.name = "HEAD", n855495214.parent_id = 9770888, n855495214.stem = "HEAD", n855495214.extension = "", n855495214.path = "/Users/starver/code/public/cpython/.git/refs/remotes/origin/HEAD", n855495214.size = 32, n855495214.owner = 501, n855495214.group = 20, n855495214.created = 1545241636, n855495214.accessed = 1545241646, n855495214.modified = 1545241636, n855495214.owner_perm = 6, n855495214.group_perm = 4, n855495214.other_perm = 4 ON MATCH SET n855495214.tag = "File", n855495214.name = "HEAD", n855495214.parent_id = 9770888, n855495214.stem = "HEAD", n855495214.extension = "", n855495214.path = "/Users/starver/code/public/cpython/.git/refs/remotes/origin/HEAD", n855495214.size = 32, n855495214.owner = 501, n855495214.group = 20, n855495214.created = 1545241636, n855495214.accessed = 1545241646, n855495214.modified = 1545241636, n855495214.owner_perm = 6, n855495214.group_perm = 4, n855495214.other_perm = 4
-MERGE (n983766975) - [:PARENT_OF] -> (n855495214)
-MERGE (n356094182:Directory {id: 9768650}) ON CREATE SET n356094182.tag = "Directory", n356094182.name = "branches", n356094182.parent_id = 9768634, n356094182.stem = "branches", n356094182.extension = "", n356094182.path = "/Users/starver/code/public/cpython/.git/branches", n356094182.size = 64, n356094182.owner = 501, n356094182.group = 20, n356094182.created = 1545241485, n356094182.accessed = 1545673480, n356094182.modified = 1545241485, n356094182.owner_perm = 7, n356094182.group_perm = 5, n356094182.other_perm = 5 ON MATCH SET n356094182.tag = "Directory", n356094182.name = "branches", n356094182.parent_id = 9768634, n356094182.stem = "branches", n356094182.extension = "", n356094182.path = "/Users/starver/code/public/cpython/.git/branches", n356094182.size = 64, n356094182.owner = 501, n356094182.group = 20, n356094182.created = 1545241485, n356094182.accessed = 1545673480, n356094182.modified = 1545241485, n356094182.owner_perm = 7, n356094182.group_perm = 5, n356094182.other_perm = 5
-MERGE (n337681849:Directory {id: 9768634})
-MERGE (n337681849) - [:PARENT_OF] -> (n356094182)
-MERGE (n920605943:Directory {id: 9774794}) ON CREATE SET n920605943.tag = "Directory", n920605943.name = "Modules", n920605943.parent_id = 9768633, n920605943.stem = "Modules", n920605943.extension = "", n920605943.path = "/Users/starver/code/public/cpython/Modules", n920605943.size = 4096, n920605943.owner = 501, n920605943.group = 20, n920605943.created = 1545241637, n920605943.accessed = 1545673346, n920605943.modified = 1545241637, n920605943.owner_perm = 7, n920605943.group_perm = 5, n920605943.other_perm = 5 ON MATCH SET n920605943.tag = "Directory", n920605943.name = "Modules", n920605943.parent_id = 9768633, n920605943.stem = "Modules", n920605943.extension = "", n920605943.path = "/Users/starver/code/public/cpython/Modules", n920605943.size = 4096, n920605943.owner = 501, n920605943.group = 20, n920605943.created = 1545241637, n920605943.accessed = 1545673346, n920605943.modified = 1545241637, n920605943.owner_perm = 7, n920605943.group_perm = 5, n920605943.other_perm = 5
-MERGE (n776326545:Directory {id: 9768633})
-MERGE (n776326545) - [:PARENT_OF] -> (n920605943)
+// group 31 16737
+MERGE (n914966907:Directory {id: 9768633}) ON CREATE SET n914966907.tag = "Directory", n914966907.name = "cpython", n914966907.parent_id = "None", n914966907.stem = "cpython", n914966907.extension = "", n914966907.path = "/Users/starver/code/public/cpython", n914966907.size = 1120, n914966907.owner = 501, n914966907.group = 20, n914966907.created = 1545241637, n914966907.accessed = 1545673345, n914966907.modified = 1545241637, n914966907.owner_perm = 7, n914966907.group_perm = 5, n914966907.other_perm = 5 ON MATCH SET n914966907.tag = "Directory", n914966907.name = "cpython", n914966907.parent_id = "None", n914966907.stem = "cpython", n914966907.extension = "", n914966907.path = "/Users/starver/code/public/cpython", n914966907.size = 1120, n914966907.owner = 501, n914966907.group = 20, n914966907.created = 1545241637, n914966907.accessed = 1545673345, n914966907.modified = 1545241637, n914966907.owner_perm = 7, n914966907.group_perm = 5, n914966907.other_perm = 5
+MERGE (n94342230:File {id: 9770924}) ON CREATE SET n94342230.tag = "File", n94342230.name = "CODE_OF_CONDUCT.md", n94342230.parent_id = 9768633, n94342230.stem = "CODE_OF_CONDUCT", n94342230.extension = "md", n94342230.path = "/Users/starver/code/public/cpython/CODE_OF_CONDUCT.md", n94342230.size = 609, n94342230.owner = 501, n94342230.group = 20, n94342230.created = 1545241636, n94342230.accessed = 1545267129, n94342230.modified = 1545241636, n94342230.owner_perm = 6, n94342230.group_perm = 4, n94342230.other_perm = 4 ON MATCH SET n94342230.tag = "File", n94342230.name = "CODE_OF_CONDUCT.md", n94342230.parent_id = 9768633, n94342230.stem = "CODE_OF_CONDUCT", n94342230.extension = "md", n94342230.path = "/Users/starver/code/public/cpython/CODE_OF_CONDUCT.md", n94342230.size = 609, n94342230.owner = 501, n94342230.group = 20, n94342230.created = 1545241636, n94342230.accessed = 1545267129, n94342230.modified = 1545241636, n94342230.owner_perm = 6, n94342230.group_perm = 4, n94342230.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n94342230)
+MERGE (n142123244:File {id: 9775969}) ON CREATE SET n142123244.tag = "File", n142123244.name = "install-sh", n142123244.parent_id = 9768633, n142123244.stem = "install-sh", n142123244.extension = "", n142123244.path = "/Users/starver/code/public/cpython/install-sh", n142123244.size = 15368, n142123244.owner = 501, n142123244.group = 20, n142123244.created = 1545241637, n142123244.accessed = 1545241637, n142123244.modified = 1545241637, n142123244.owner_perm = 7, n142123244.group_perm = 5, n142123244.other_perm = 5 ON MATCH SET n142123244.tag = "File", n142123244.name = "install-sh", n142123244.parent_id = 9768633, n142123244.stem = "install-sh", n142123244.extension = "", n142123244.path = "/Users/starver/code/public/cpython/install-sh", n142123244.size = 15368, n142123244.owner = 501, n142123244.group = 20, n142123244.created = 1545241637, n142123244.accessed = 1545241637, n142123244.modified = 1545241637, n142123244.owner_perm = 7, n142123244.group_perm = 5, n142123244.other_perm = 5
+MERGE (n914966907) - [:PARENT_OF] -> (n142123244)
+MERGE (n449596597:File {id: 9775968}) ON CREATE SET n449596597.tag = "File", n449596597.name = "configure.ac", n449596597.parent_id = 9768633, n449596597.stem = "configure", n449596597.extension = "ac", n449596597.path = "/Users/starver/code/public/cpython/configure.ac", n449596597.size = 162570, n449596597.owner = 501, n449596597.group = 20, n449596597.created = 1545241637, n449596597.accessed = 1545267152, n449596597.modified = 1545241637, n449596597.owner_perm = 6, n449596597.group_perm = 4, n449596597.other_perm = 4 ON MATCH SET n449596597.tag = "File", n449596597.name = "configure.ac", n449596597.parent_id = 9768633, n449596597.stem = "configure", n449596597.extension = "ac", n449596597.path = "/Users/starver/code/public/cpython/configure.ac", n449596597.size = 162570, n449596597.owner = 501, n449596597.group = 20, n449596597.created = 1545241637, n449596597.accessed = 1545267152, n449596597.modified = 1545241637, n449596597.owner_perm = 6, n449596597.group_perm = 4, n449596597.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n449596597)
+MERGE (n82274289:File {id: 9773910}) ON CREATE SET n82274289.tag = "File", n82274289.name = "Makefile.pre.in", n82274289.parent_id = 9768633, n82274289.stem = "Makefile.pre", n82274289.extension = "in", n82274289.path = "/Users/starver/code/public/cpython/Makefile.pre.in", n82274289.size = 64646, n82274289.owner = 501, n82274289.group = 20, n82274289.created = 1545241637, n82274289.accessed = 1545267147, n82274289.modified = 1545241637, n82274289.owner_perm = 6, n82274289.group_perm = 4, n82274289.other_perm = 4 ON MATCH SET n82274289.tag = "File", n82274289.name = "Makefile.pre.in", n82274289.parent_id = 9768633, n82274289.stem = "Makefile.pre", n82274289.extension = "in", n82274289.path = "/Users/starver/code/public/cpython/Makefile.pre.in", n82274289.size = 64646, n82274289.owner = 501, n82274289.group = 20, n82274289.created = 1545241637, n82274289.accessed = 1545267147, n82274289.modified = 1545241637, n82274289.owner_perm = 6, n82274289.group_perm = 4, n82274289.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n82274289)
+MERGE (n455867430:File {id: 9771637}) ON CREATE SET n455867430.tag = "File", n455867430.name = "LICENSE", n455867430.parent_id = 9768633, n455867430.stem = "LICENSE", n455867430.extension = "", n455867430.path = "/Users/starver/code/public/cpython/LICENSE", n455867430.size = 12763, n455867430.owner = 501, n455867430.group = 20, n455867430.created = 1545241636, n455867430.accessed = 1545267137, n455867430.modified = 1545241636, n455867430.owner_perm = 6, n455867430.group_perm = 4, n455867430.other_perm = 4 ON MATCH SET n455867430.tag = "File", n455867430.name = "LICENSE", n455867430.parent_id = 9768633, n455867430.stem = "LICENSE", n455867430.extension = "", n455867430.path = "/Users/starver/code/public/cpython/LICENSE", n455867430.size = 12763, n455867430.owner = 501, n455867430.group = 20, n455867430.created = 1545241636, n455867430.accessed = 1545267137, n455867430.modified = 1545241636, n455867430.owner_perm = 6, n455867430.group_perm = 4, n455867430.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n455867430)
+MERGE (n123355282:File {id: 9775967}) ON CREATE SET n123355282.tag = "File", n123355282.name = "configure", n123355282.parent_id = 9768633, n123355282.stem = "configure", n123355282.extension = "", n123355282.path = "/Users/starver/code/public/cpython/configure", n123355282.size = 495202, n123355282.owner = 501, n123355282.group = 20, n123355282.created = 1545241637, n123355282.accessed = 1545241664, n123355282.modified = 1545241637, n123355282.owner_perm = 7, n123355282.group_perm = 5, n123355282.other_perm = 5 ON MATCH SET n123355282.tag = "File", n123355282.name = "configure", n123355282.parent_id = 9768633, n123355282.stem = "configure", n123355282.extension = "", n123355282.path = "/Users/starver/code/public/cpython/configure", n123355282.size = 495202, n123355282.owner = 501, n123355282.group = 20, n123355282.created = 1545241637, n123355282.accessed = 1545241664, n123355282.modified = 1545241637, n123355282.owner_perm = 7, n123355282.group_perm = 5, n123355282.other_perm = 5
+MERGE (n914966907) - [:PARENT_OF] -> (n123355282)
+MERGE (n755101086:File {id: 9775965}) ON CREATE SET n755101086.tag = "File", n755101086.name = "config.guess", n755101086.parent_id = 9768633, n755101086.stem = "config", n755101086.extension = "guess", n755101086.path = "/Users/starver/code/public/cpython/config.guess", n755101086.size = 44166, n755101086.owner = 501, n755101086.group = 20, n755101086.created = 1545241637, n755101086.accessed = 1545267152, n755101086.modified = 1545241637, n755101086.owner_perm = 7, n755101086.group_perm = 5, n755101086.other_perm = 5 ON MATCH SET n755101086.tag = "File", n755101086.name = "config.guess", n755101086.parent_id = 9768633, n755101086.stem = "config", n755101086.extension = "guess", n755101086.path = "/Users/starver/code/public/cpython/config.guess", n755101086.size = 44166, n755101086.owner = 501, n755101086.group = 20, n755101086.created = 1545241637, n755101086.accessed = 1545267152, n755101086.modified = 1545241637, n755101086.owner_perm = 7, n755101086.group_perm = 5, n755101086.other_perm = 5
+MERGE (n914966907) - [:PARENT_OF] -> (n755101086)
+MERGE (n214040433:File {id: 9775973}) ON CREATE SET n214040433.tag = "File", n214040433.name = "pyconfig.h.in", n214040433.parent_id = 9768633, n214040433.stem = "pyconfig.h", n214040433.extension = "in", n214040433.path = "/Users/starver/code/public/cpython/pyconfig.h.in", n214040433.size = 43657, n214040433.owner = 501, n214040433.group = 20, n214040433.created = 1545241637, n214040433.accessed = 1545267152, n214040433.modified = 1545241637, n214040433.owner_perm = 6, n214040433.group_perm = 4, n214040433.other_perm = 4 ON MATCH SET n214040433.tag = "File", n214040433.name = "pyconfig.h.in", n214040433.parent_id = 9768633, n214040433.stem = "pyconfig.h", n214040433.extension = "in", n214040433.path = "/Users/starver/code/public/cpython/pyconfig.h.in", n214040433.size = 43657, n214040433.owner = 501, n214040433.group = 20, n214040433.created = 1545241637, n214040433.accessed = 1545267152, n214040433.modified = 1545241637, n214040433.owner_perm = 6, n214040433.group_perm = 4, n214040433.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n214040433)
+MERGE (n67044521:File {id: 9775966}) ON CREATE SET n67044521.tag = "File", n67044521.name = "config.sub", n67044521.parent_id = 9768633, n67044521.stem = "config", n67044521.extension = "sub", n67044521.path = "/Users/starver/code/public/cpython/config.sub", n67044521.size = 36251, n67044521.owner = 501, n67044521.group = 20, n67044521.created = 1545241637, n67044521.accessed = 1545267152, n67044521.modified = 1545241637, n67044521.owner_perm = 7, n67044521.group_perm = 5, n67044521.other_perm = 5 ON MATCH SET n67044521.tag = "File", n67044521.name = "config.sub", n67044521.parent_id = 9768633, n67044521.stem = "config", n67044521.extension = "sub", n67044521.path = "/Users/starver/code/public/cpython/config.sub", n67044521.size = 36251, n67044521.owner = 501, n67044521.group = 20, n67044521.created = 1545241637, n67044521.accessed = 1545267152, n67044521.modified = 1545241637, n67044521.owner_perm = 7, n67044521.group_perm = 5, n67044521.other_perm = 5
+MERGE (n914966907) - [:PARENT_OF] -> (n67044521)
+MERGE (n552163015:File {id: 9775974}) ON CREATE SET n552163015.tag = "File", n552163015.name = "setup.py", n552163015.parent_id = 9768633, n552163015.stem = "setup", n552163015.extension = "py", n552163015.path = "/Users/starver/code/public/cpython/setup.py", n552163015.size = 101533, n552163015.owner = 501, n552163015.group = 20, n552163015.created = 1545241637, n552163015.accessed = 1545267152, n552163015.modified = 1545241637, n552163015.owner_perm = 6, n552163015.group_perm = 4, n552163015.other_perm = 4 ON MATCH SET n552163015.tag = "File", n552163015.name = "setup.py", n552163015.parent_id = 9768633, n552163015.stem = "setup", n552163015.extension = "py", n552163015.path = "/Users/starver/code/public/cpython/setup.py", n552163015.size = 101533, n552163015.owner = 501, n552163015.group = 20, n552163015.created = 1545241637, n552163015.accessed = 1545267152, n552163015.modified = 1545241637, n552163015.owner_perm = 6, n552163015.group_perm = 4, n552163015.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n552163015)
+MERGE (n535308223:File {id: 9770922}) ON CREATE SET n535308223.tag = "File", n535308223.name = ".gitignore", n535308223.parent_id = 9768633, n535308223.stem = ".gitignore", n535308223.extension = "", n535308223.path = "/Users/starver/code/public/cpython/.gitignore", n535308223.size = 1590, n535308223.owner = 501, n535308223.group = 20, n535308223.created = 1545241636, n535308223.accessed = 1545241636, n535308223.modified = 1545241636, n535308223.owner_perm = 6, n535308223.group_perm = 4, n535308223.other_perm = 4 ON MATCH SET n535308223.tag = "File", n535308223.name = ".gitignore", n535308223.parent_id = 9768633, n535308223.stem = ".gitignore", n535308223.extension = "", n535308223.path = "/Users/starver/code/public/cpython/.gitignore", n535308223.size = 1590, n535308223.owner = 501, n535308223.group = 20, n535308223.created = 1545241636, n535308223.accessed = 1545241636, n535308223.modified = 1545241636, n535308223.owner_perm = 6, n535308223.group_perm = 4, n535308223.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n535308223)
+MERGE (n177009927:File {id: 9770915}) ON CREATE SET n177009927.tag = "File", n177009927.name = ".gitattributes", n177009927.parent_id = 9768633, n177009927.stem = ".gitattributes", n177009927.extension = "", n177009927.path = "/Users/starver/code/public/cpython/.gitattributes", n177009927.size = 1600, n177009927.owner = 501, n177009927.group = 20, n177009927.created = 1545241636, n177009927.accessed = 1545241636, n177009927.modified = 1545241636, n177009927.owner_perm = 6, n177009927.group_perm = 4, n177009927.other_perm = 4 ON MATCH SET n177009927.tag = "File", n177009927.name = ".gitattributes", n177009927.parent_id = 9768633, n177009927.stem = ".gitattributes", n177009927.extension = "", n177009927.path = "/Users/starver/code/public/cpython/.gitattributes", n177009927.size = 1600, n177009927.owner = 501, n177009927.group = 20, n177009927.created = 1545241636, n177009927.accessed = 1545241636, n177009927.modified = 1545241636, n177009927.owner_perm = 6, n177009927.group_perm = 4, n177009927.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n177009927)
+MERGE (n456482523:File {id: 9775623}) ON CREATE SET n456482523.tag = "File", n456482523.name = "README.rst", n456482523.parent_id = 9768633, n456482523.stem = "README", n456482523.extension = "rst", n456482523.path = "/Users/starver/code/public/cpython/README.rst", n456482523.size = 10064, n456482523.owner = 501, n456482523.group = 20, n456482523.created = 1545241637, n456482523.accessed = 1545267151, n456482523.modified = 1545241637, n456482523.owner_perm = 6, n456482523.group_perm = 4, n456482523.other_perm = 4 ON MATCH SET n456482523.tag = "File", n456482523.name = "README.rst", n456482523.parent_id = 9768633, n456482523.stem = "README", n456482523.extension = "rst", n456482523.path = "/Users/starver/code/public/cpython/README.rst", n456482523.size = 10064, n456482523.owner = 501, n456482523.group = 20, n456482523.created = 1545241637, n456482523.accessed = 1545267151, n456482523.modified = 1545241637, n456482523.owner_perm = 6, n456482523.group_perm = 4, n456482523.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n456482523)
+MERGE (n448890845:File {id: 9770923}) ON CREATE SET n448890845.tag = "File", n448890845.name = ".travis.yml", n448890845.parent_id = 9768633, n448890845.stem = ".travis", n448890845.extension = "yml", n448890845.path = "/Users/starver/code/public/cpython/.travis.yml", n448890845.size = 8095, n448890845.owner = 501, n448890845.group = 20, n448890845.created = 1545241636, n448890845.accessed = 1545241636, n448890845.modified = 1545241636, n448890845.owner_perm = 6, n448890845.group_perm = 4, n448890845.other_perm = 4 ON MATCH SET n448890845.tag = "File", n448890845.name = ".travis.yml", n448890845.parent_id = 9768633, n448890845.stem = ".travis", n448890845.extension = "yml", n448890845.path = "/Users/starver/code/public/cpython/.travis.yml", n448890845.size = 8095, n448890845.owner = 501, n448890845.group = 20, n448890845.created = 1545241636, n448890845.accessed = 1545241636, n448890845.modified = 1545241636, n448890845.owner_perm = 6, n448890845.group_perm = 4, n448890845.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n448890845)
+MERGE (n496709238:File {id: 9775964}) ON CREATE SET n496709238.tag = "File", n496709238.name = "aclocal.m4", n496709238.parent_id = 9768633, n496709238.stem = "aclocal", n496709238.extension = "m4", n496709238.path = "/Users/starver/code/public/cpython/aclocal.m4", n496709238.size = 10996, n496709238.owner = 501, n496709238.group = 20, n496709238.created = 1545241637, n496709238.accessed = 1545267152, n496709238.modified = 1545241637, n496709238.owner_perm = 6, n496709238.group_perm = 4, n496709238.other_perm = 4 ON MATCH SET n496709238.tag = "File", n496709238.name = "aclocal.m4", n496709238.parent_id = 9768633, n496709238.stem = "aclocal", n496709238.extension = "m4", n496709238.path = "/Users/starver/code/public/cpython/aclocal.m4", n496709238.size = 10996, n496709238.owner = 501, n496709238.group = 20, n496709238.created = 1545241637, n496709238.accessed = 1545267152, n496709238.modified = 1545241637, n496709238.owner_perm = 6, n496709238.group_perm = 4, n496709238.other_perm = 4
+MERGE (n914966907) - [:PARENT_OF] -> (n496709238)
+// group 3 1059
+MERGE (n270989791:Directory {id: 9775304}) ON CREATE SET n270989791.tag = "Directory", n270989791.name = "PC", n270989791.parent_id = 9768633, n270989791.stem = "PC", n270989791.extension = "", n270989791.path = "/Users/starver/code/public/cpython/PC", n270989791.size = 1440, n270989791.owner = 501, n270989791.group = 20, n270989791.created = 1545241637, n270989791.accessed = 1545673345, n270989791.modified = 1545241637, n270989791.owner_perm = 7, n270989791.group_perm = 5, n270989791.other_perm = 5 ON MATCH SET n270989791.tag = "Directory", n270989791.name = "PC", n270989791.parent_id = 9768633, n270989791.stem = "PC", n270989791.extension = "", n270989791.path = "/Users/starver/code/public/cpython/PC", n270989791.size = 1440, n270989791.owner = 501, n270989791.group = 20, n270989791.created = 1545241637, n270989791.accessed = 1545673345, n270989791.modified = 1545241637, n270989791.owner_perm = 7, n270989791.group_perm = 5, n270989791.other_perm = 5
+MERGE (n480936262:Directory {id: 9768633})
+MERGE (n480936262) - [:PARENT_OF] -> (n270989791)
+// group 3 1069
+MERGE (n972906767:Directory {id: 9773911}) ON CREATE SET n972906767.tag = "Directory", n972906767.name = "Misc", n972906767.parent_id = 9768633, n972906767.stem = "Misc", n972906767.extension = "", n972906767.path = "/Users/starver/code/public/cpython/Misc", n972906767.size = 768, n972906767.owner = 501, n972906767.group = 20, n972906767.created = 1545241637, n972906767.accessed = 1545673345, n972906767.modified = 1545241637, n972906767.owner_perm = 7, n972906767.group_perm = 5, n972906767.other_perm = 5 ON MATCH SET n972906767.tag = "Directory", n972906767.name = "Misc", n972906767.parent_id = 9768633, n972906767.stem = "Misc", n972906767.extension = "", n972906767.path = "/Users/starver/code/public/cpython/Misc", n972906767.size = 768, n972906767.owner = 501, n972906767.group = 20, n972906767.created = 1545241637, n972906767.accessed = 1545673345, n972906767.modified = 1545241637, n972906767.owner_perm = 7, n972906767.group_perm = 5, n972906767.other_perm = 5
+MERGE (n796061855:Directory {id: 9768633})
+MERGE (n796061855) - [:PARENT_OF] -> (n972906767)
+// group 5 2132
+MERGE (n443470845:Directory {id: 9771506}) ON CREATE SET n443470845.tag = "Directory", n443470845.name = "Grammar", n443470845.parent_id = 9768633, n443470845.stem = "Grammar", n443470845.extension = "", n443470845.path = "/Users/starver/code/public/cpython/Grammar", n443470845.size = 96, n443470845.owner = 501, n443470845.group = 20, n443470845.created = 1545241636, n443470845.accessed = 1545673345, n443470845.modified = 1545241636, n443470845.owner_perm = 7, n443470845.group_perm = 5, n443470845.other_perm = 5 ON MATCH SET n443470845.tag = "Directory", n443470845.name = "Grammar", n443470845.parent_id = 9768633, n443470845.stem = "Grammar", n443470845.extension = "", n443470845.path = "/Users/starver/code/public/cpython/Grammar", n443470845.size = 96, n443470845.owner = 501, n443470845.group = 20, n443470845.created = 1545241636, n443470845.accessed = 1545673345, n443470845.modified = 1545241636, n443470845.owner_perm = 7, n443470845.group_perm = 5, n443470845.other_perm = 5
+MERGE (n510836521:Directory {id: 9768633})
+MERGE (n510836521) - [:PARENT_OF] -> (n443470845)
+MERGE (n824158557:File {id: 9771507}) ON CREATE SET n824158557.tag = "File", n824158557.name = "Grammar", n824158557.parent_id = 9771506, n824158557.stem = "Grammar", n824158557.extension = "", n824158557.path = "/Users/starver/code/public/cpython/Grammar/Grammar", n824158557.size = 6520, n824158557.owner = 501, n824158557.group = 20, n824158557.created = 1545241636, n824158557.accessed = 1545267137, n824158557.modified = 1545241636, n824158557.owner_perm = 6, n824158557.group_perm = 4, n824158557.other_perm = 4 ON MATCH SET n824158557.tag = "File", n824158557.name = "Grammar", n824158557.parent_id = 9771506, n824158557.stem = "Grammar", n824158557.extension = "", n824158557.path = "/Users/starver/code/public/cpython/Grammar/Grammar", n824158557.size = 6520, n824158557.owner = 501, n824158557.group = 20, n824158557.created = 1545241636, n824158557.accessed = 1545267137, n824158557.modified = 1545241636, n824158557.owner_perm = 6, n824158557.group_perm = 4, n824158557.other_perm = 4
+MERGE (n443470845) - [:PARENT_OF] -> (n824158557)
+// group 3 1075
+MERGE (n458849001:Directory {id: 9775624}) ON CREATE SET n458849001.tag = "Directory", n458849001.name = "Tools", n458849001.parent_id = 9768633, n458849001.stem = "Tools", n458849001.extension = "", n458849001.path = "/Users/starver/code/public/cpython/Tools", n458849001.size = 768, n458849001.owner = 501, n458849001.group = 20, n458849001.created = 1545241637, n458849001.accessed = 1545673345, n458849001.modified = 1545241637, n458849001.owner_perm = 7, n458849001.group_perm = 5, n458849001.other_perm = 5 ON MATCH SET n458849001.tag = "Directory", n458849001.name = "Tools", n458849001.parent_id = 9768633, n458849001.stem = "Tools", n458849001.extension = "", n458849001.path = "/Users/starver/code/public/cpython/Tools", n458849001.size = 768, n458849001.owner = 501, n458849001.group = 20, n458849001.created = 1545241637, n458849001.accessed = 1545673345, n458849001.modified = 1545241637, n458849001.owner_perm = 7, n458849001.group_perm = 5, n458849001.other_perm = 5
+MERGE (n700096465:Directory {id: 9768633})
+MERGE (n700096465) - [:PARENT_OF] -> (n458849001)
+// group 23 12167
+MERGE (n156274655:Directory {id: 9770904}) ON CREATE SET n156274655.tag = "Directory", n156274655.name = ".azure-pipelines", n156274655.parent_id = 9768633, n156274655.stem = ".azure-pipelines", n156274655.extension = "", n156274655.path = "/Users/starver/code/public/cpython/.azure-pipelines", n156274655.size = 384, n156274655.owner = 501, n156274655.group = 20, n156274655.created = 1545241636, n156274655.accessed = 1545673345, n156274655.modified = 1545241636, n156274655.owner_perm = 7, n156274655.group_perm = 5, n156274655.other_perm = 5 ON MATCH SET n156274655.tag = "Directory", n156274655.name = ".azure-pipelines", n156274655.parent_id = 9768633, n156274655.stem = ".azure-pipelines", n156274655.extension = "", n156274655.path = "/Users/starver/code/public/cpython/.azure-pipelines", n156274655.size = 384, n156274655.owner = 501, n156274655.group = 20, n156274655.created = 1545241636, n156274655.accessed = 1545673345, n156274655.modified = 1545241636, n156274655.owner_perm = 7, n156274655.group_perm = 5, n156274655.other_perm = 5
+MERGE (n391059496:Directory {id: 9768633})
+MERGE (n391059496) - [:PARENT_OF] -> (n156274655)
+MERGE (n285751942:File {id: 9770906}) ON CREATE SET n285751942.tag = "File", n285751942.name = "docker-steps.yml", n285751942.parent_id = 9770904, n285751942.stem = "docker-steps", n285751942.extension = "yml", n285751942.path = "/Users/starver/code/public/cpython/.azure-pipelines/docker-steps.yml", n285751942.size = 2258, n285751942.owner = 501, n285751942.group = 20, n285751942.created = 1545241636, n285751942.accessed = 1545241636, n285751942.modified = 1545241636, n285751942.owner_perm = 6, n285751942.group_perm = 4, n285751942.other_perm = 4 ON MATCH SET n285751942.tag = "File", n285751942.name = "docker-steps.yml", n285751942.parent_id = 9770904, n285751942.stem = "docker-steps", n285751942.extension = "yml", n285751942.path = "/Users/starver/code/public/cpython/.azure-pipelines/docker-steps.yml", n285751942.size = 2258, n285751942.owner = 501, n285751942.group = 20, n285751942.created = 1545241636, n285751942.accessed = 1545241636, n285751942.modified = 1545241636, n285751942.owner_perm = 6, n285751942.group_perm = 4, n285751942.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n285751942)
+MERGE (n356062302:File {id: 9770907}) ON CREATE SET n356062302.tag = "File", n356062302.name = "docs-steps.yml", n356062302.parent_id = 9770904, n356062302.stem = "docs-steps", n356062302.extension = "yml", n356062302.path = "/Users/starver/code/public/cpython/.azure-pipelines/docs-steps.yml", n356062302.size = 1351, n356062302.owner = 501, n356062302.group = 20, n356062302.created = 1545241636, n356062302.accessed = 1545241636, n356062302.modified = 1545241636, n356062302.owner_perm = 6, n356062302.group_perm = 4, n356062302.other_perm = 4 ON MATCH SET n356062302.tag = "File", n356062302.name = "docs-steps.yml", n356062302.parent_id = 9770904, n356062302.stem = "docs-steps", n356062302.extension = "yml", n356062302.path = "/Users/starver/code/public/cpython/.azure-pipelines/docs-steps.yml", n356062302.size = 1351, n356062302.owner = 501, n356062302.group = 20, n356062302.created = 1545241636, n356062302.accessed = 1545241636, n356062302.modified = 1545241636, n356062302.owner_perm = 6, n356062302.group_perm = 4, n356062302.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n356062302)
+MERGE (n662618279:File {id: 9770910}) ON CREATE SET n662618279.tag = "File", n662618279.name = "posix-steps.yml", n662618279.parent_id = 9770904, n662618279.stem = "posix-steps", n662618279.extension = "yml", n662618279.path = "/Users/starver/code/public/cpython/.azure-pipelines/posix-steps.yml", n662618279.size = 1964, n662618279.owner = 501, n662618279.group = 20, n662618279.created = 1545241636, n662618279.accessed = 1545241636, n662618279.modified = 1545241636, n662618279.owner_perm = 6, n662618279.group_perm = 4, n662618279.other_perm = 4 ON MATCH SET n662618279.tag = "File", n662618279.name = "posix-steps.yml", n662618279.parent_id = 9770904, n662618279.stem = "posix-steps", n662618279.extension = "yml", n662618279.path = "/Users/starver/code/public/cpython/.azure-pipelines/posix-steps.yml", n662618279.size = 1964, n662618279.owner = 501, n662618279.group = 20, n662618279.created = 1545241636, n662618279.accessed = 1545241636, n662618279.modified = 1545241636, n662618279.owner_perm = 6, n662618279.group_perm = 4, n662618279.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n662618279)
+MERGE (n16076360:File {id: 9770911}) ON CREATE SET n16076360.tag = "File", n16076360.name = "pr.yml", n16076360.parent_id = 9770904, n16076360.stem = "pr", n16076360.extension = "yml", n16076360.path = "/Users/starver/code/public/cpython/.azure-pipelines/pr.yml", n16076360.size = 1882, n16076360.owner = 501, n16076360.group = 20, n16076360.created = 1545241636, n16076360.accessed = 1545241636, n16076360.modified = 1545241636, n16076360.owner_perm = 6, n16076360.group_perm = 4, n16076360.other_perm = 4 ON MATCH SET n16076360.tag = "File", n16076360.name = "pr.yml", n16076360.parent_id = 9770904, n16076360.stem = "pr", n16076360.extension = "yml", n16076360.path = "/Users/starver/code/public/cpython/.azure-pipelines/pr.yml", n16076360.size = 1882, n16076360.owner = 501, n16076360.group = 20, n16076360.created = 1545241636, n16076360.accessed = 1545241636, n16076360.modified = 1545241636, n16076360.owner_perm = 6, n16076360.group_perm = 4, n16076360.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n16076360)
+MERGE (n331750061:File {id: 9770914}) ON CREATE SET n331750061.tag = "File", n331750061.name = "windows-steps.yml", n331750061.parent_id = 9770904, n331750061.stem = "windows-steps", n331750061.extension = "yml", n331750061.path = "/Users/starver/code/public/cpython/.azure-pipelines/windows-steps.yml", n331750061.size = 1242, n331750061.owner = 501, n331750061.group = 20, n331750061.created = 1545241636, n331750061.accessed = 1545241636, n331750061.modified = 1545241636, n331750061.owner_perm = 6, n331750061.group_perm = 4, n331750061.other_perm = 4 ON MATCH SET n331750061.tag = "File", n331750061.name = "windows-steps.yml", n331750061.parent_id = 9770904, n331750061.stem = "windows-steps", n331750061.extension = "yml", n331750061.path = "/Users/starver/code/public/cpython/.azure-pipelines/windows-steps.yml", n331750061.size = 1242, n331750061.owner = 501, n331750061.group = 20, n331750061.created = 1545241636, n331750061.accessed = 1545241636, n331750061.modified = 1545241636, n331750061.owner_perm = 6, n331750061.group_perm = 4, n331750061.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n331750061)
+MERGE (n238467548:File {id: 9770908}) ON CREATE SET n238467548.tag = "File", n238467548.name = "macos-steps.yml", n238467548.parent_id = 9770904, n238467548.stem = "macos-steps", n238467548.extension = "yml", n238467548.path = "/Users/starver/code/public/cpython/.azure-pipelines/macos-steps.yml", n238467548.size = 724, n238467548.owner = 501, n238467548.group = 20, n238467548.created = 1545241636, n238467548.accessed = 1545241636, n238467548.modified = 1545241636, n238467548.owner_perm = 6, n238467548.group_perm = 4, n238467548.other_perm = 4 ON MATCH SET n238467548.tag = "File", n238467548.name = "macos-steps.yml", n238467548.parent_id = 9770904, n238467548.stem = "macos-steps", n238467548.extension = "yml", n238467548.path = "/Users/starver/code/public/cpython/.azure-pipelines/macos-steps.yml", n238467548.size = 724, n238467548.owner = 501, n238467548.group = 20, n238467548.created = 1545241636, n238467548.accessed = 1545241636, n238467548.modified = 1545241636, n238467548.owner_perm = 6, n238467548.group_perm = 4, n238467548.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n238467548)
+MERGE (n968295465:File {id: 9770909}) ON CREATE SET n968295465.tag = "File", n968295465.name = "posix-deps.sh", n968295465.parent_id = 9770904, n968295465.stem = "posix-deps", n968295465.extension = "sh", n968295465.path = "/Users/starver/code/public/cpython/.azure-pipelines/posix-deps.sh", n968295465.size = 590, n968295465.owner = 501, n968295465.group = 20, n968295465.created = 1545241636, n968295465.accessed = 1545241636, n968295465.modified = 1545241636, n968295465.owner_perm = 7, n968295465.group_perm = 5, n968295465.other_perm = 5 ON MATCH SET n968295465.tag = "File", n968295465.name = "posix-deps.sh", n968295465.parent_id = 9770904, n968295465.stem = "posix-deps", n968295465.extension = "sh", n968295465.path = "/Users/starver/code/public/cpython/.azure-pipelines/posix-deps.sh", n968295465.size = 590, n968295465.owner = 501, n968295465.group = 20, n968295465.created = 1545241636, n968295465.accessed = 1545241636, n968295465.modified = 1545241636, n968295465.owner_perm = 7, n968295465.group_perm = 5, n968295465.other_perm = 5
+MERGE (n156274655) - [:PARENT_OF] -> (n968295465)
+MERGE (n528997465:File {id: 9770913}) ON CREATE SET n528997465.tag = "File", n528997465.name = "windows-appx-test.yml", n528997465.parent_id = 9770904, n528997465.stem = "windows-appx-test", n528997465.extension = "yml", n528997465.path = "/Users/starver/code/public/cpython/.azure-pipelines/windows-appx-test.yml", n528997465.size = 2197, n528997465.owner = 501, n528997465.group = 20, n528997465.created = 1545241636, n528997465.accessed = 1545241636, n528997465.modified = 1545241636, n528997465.owner_perm = 6, n528997465.group_perm = 4, n528997465.other_perm = 4 ON MATCH SET n528997465.tag = "File", n528997465.name = "windows-appx-test.yml", n528997465.parent_id = 9770904, n528997465.stem = "windows-appx-test", n528997465.extension = "yml", n528997465.path = "/Users/starver/code/public/cpython/.azure-pipelines/windows-appx-test.yml", n528997465.size = 2197, n528997465.owner = 501, n528997465.group = 20, n528997465.created = 1545241636, n528997465.accessed = 1545241636, n528997465.modified = 1545241636, n528997465.owner_perm = 6, n528997465.group_perm = 4, n528997465.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n528997465)
+MERGE (n941592313:File {id: 9770912}) ON CREATE SET n941592313.tag = "File", n941592313.name = "prebuild-checks.yml", n941592313.parent_id = 9770904, n941592313.stem = "prebuild-checks", n941592313.extension = "yml", n941592313.path = "/Users/starver/code/public/cpython/.azure-pipelines/prebuild-checks.yml", n941592313.size = 1218, n941592313.owner = 501, n941592313.group = 20, n941592313.created = 1545241636, n941592313.accessed = 1545241636, n941592313.modified = 1545241636, n941592313.owner_perm = 6, n941592313.group_perm = 4, n941592313.other_perm = 4 ON MATCH SET n941592313.tag = "File", n941592313.name = "prebuild-checks.yml", n941592313.parent_id = 9770904, n941592313.stem = "prebuild-checks", n941592313.extension = "yml", n941592313.path = "/Users/starver/code/public/cpython/.azure-pipelines/prebuild-checks.yml", n941592313.size = 1218, n941592313.owner = 501, n941592313.group = 20, n941592313.created = 1545241636, n941592313.accessed = 1545241636, n941592313.modified = 1545241636, n941592313.owner_perm = 6, n941592313.group_perm = 4, n941592313.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n941592313)
+MERGE (n139680734:File {id: 9770905}) ON CREATE SET n139680734.tag = "File", n139680734.name = "ci.yml", n139680734.parent_id = 9770904, n139680734.stem = "ci", n139680734.extension = "yml", n139680734.path = "/Users/starver/code/public/cpython/.azure-pipelines/ci.yml", n139680734.size = 2753, n139680734.owner = 501, n139680734.group = 20, n139680734.created = 1545241636, n139680734.accessed = 1545241636, n139680734.modified = 1545241636, n139680734.owner_perm = 6, n139680734.group_perm = 4, n139680734.other_perm = 4 ON MATCH SET n139680734.tag = "File", n139680734.name = "ci.yml", n139680734.parent_id = 9770904, n139680734.stem = "ci", n139680734.extension = "yml", n139680734.path = "/Users/starver/code/public/cpython/.azure-pipelines/ci.yml", n139680734.size = 2753, n139680734.owner = 501, n139680734.group = 20, n139680734.created = 1545241636, n139680734.accessed = 1545241636, n139680734.modified = 1545241636, n139680734.owner_perm = 6, n139680734.group_perm = 4, n139680734.other_perm = 4
+MERGE (n156274655) - [:PARENT_OF] -> (n139680734)
+// group 3 1083
+MERGE (n556260734:Directory {id: 9775540}) ON CREATE SET n556260734.tag = "Directory", n556260734.name = "Python", n556260734.parent_id = 9768633, n556260734.stem = "Python", n556260734.extension = "", n556260734.path = "/Users/starver/code/public/cpython/Python", n556260734.size = 2464, n556260734.owner = 501, n556260734.group = 20, n556260734.created = 1545241637, n556260734.accessed = 1545673345, n556260734.modified = 1545241637, n556260734.owner_perm = 7, n556260734.group_perm = 5, n556260734.other_perm = 5 ON MATCH SET n556260734.tag = "Directory", n556260734.name = "Python", n556260734.parent_id = 9768633, n556260734.stem = "Python", n556260734.extension = "", n556260734.path = "/Users/starver/code/public/cpython/Python", n556260734.size = 2464, n556260734.owner = 501, n556260734.group = 20, n556260734.created = 1545241637, n556260734.accessed = 1545673345, n556260734.modified = 1545241637, n556260734.owner_perm = 7, n556260734.group_perm = 5, n556260734.other_perm = 5
+MERGE (n879381757:Directory {id: 9768633})
+MERGE (n879381757) - [:PARENT_OF] -> (n556260734)
+// group 3 1089
+MERGE (n824267661:Directory {id: 9771508}) ON CREATE SET n824267661.tag = "Directory", n824267661.name = "Include", n824267661.parent_id = 9768633, n824267661.stem = "Include", n824267661.extension = "", n824267661.path = "/Users/starver/code/public/cpython/Include", n824267661.size = 3328, n824267661.owner = 501, n824267661.group = 20, n824267661.created = 1545241636, n824267661.accessed = 1545673345, n824267661.modified = 1545241636, n824267661.owner_perm = 7, n824267661.group_perm = 5, n824267661.other_perm = 5 ON MATCH SET n824267661.tag = "Directory", n824267661.name = "Include", n824267661.parent_id = 9768633, n824267661.stem = "Include", n824267661.extension = "", n824267661.path = "/Users/starver/code/public/cpython/Include", n824267661.size = 3328, n824267661.owner = 501, n824267661.group = 20, n824267661.created = 1545241636, n824267661.accessed = 1545673345, n824267661.modified = 1545241636, n824267661.owner_perm = 7, n824267661.group_perm = 5, n824267661.other_perm = 5
+MERGE (n241074495:Directory {id: 9768633})
+MERGE (n241074495) - [:PARENT_OF] -> (n824267661)
+// group 3 1089
+MERGE (n930026651:Directory {id: 9775213}) ON CREATE SET n930026651.tag = "Directory", n930026651.name = "Objects", n930026651.parent_id = 9768633, n930026651.stem = "Objects", n930026651.extension = "", n930026651.path = "/Users/starver/code/public/cpython/Objects", n930026651.size = 1664, n930026651.owner = 501, n930026651.group = 20, n930026651.created = 1545241637, n930026651.accessed = 1545673345, n930026651.modified = 1545241637, n930026651.owner_perm = 7, n930026651.group_perm = 5, n930026651.other_perm = 5 ON MATCH SET n930026651.tag = "Directory", n930026651.name = "Objects", n930026651.parent_id = 9768633, n930026651.stem = "Objects", n930026651.extension = "", n930026651.path = "/Users/starver/code/public/cpython/Objects", n930026651.size = 1664, n930026651.owner = 501, n930026651.group = 20, n930026651.created = 1545241637, n930026651.accessed = 1545673345, n930026651.modified = 1545241637, n930026651.owner_perm = 7, n930026651.group_perm = 5, n930026651.other_perm = 5
+MERGE (n935750217:Directory {id: 9768633})
+MERGE (n935750217) - [:PARENT_OF] -> (n930026651)
+// group 3 1049
+MERGE (n82272784:Directory {id: 9775512}) ON CREATE SET n82272784.tag = "Directory", n82272784.name = "Parser", n82272784.parent_id = 9768633, n82272784.stem = "Parser", n82272784.extension = "", n82272784.path = "/Users/starver/code/public/cpython/Parser", n82272784.size = 768, n82272784.owner = 501, n82272784.group = 20, n82272784.created = 1545241637, n82272784.accessed = 1545241637, n82272784.modified = 1545241637, n82272784.owner_perm = 7, n82272784.group_perm = 5, n82272784.other_perm = 5 ON MATCH SET n82272784.tag = "Directory", n82272784.name = "Parser", n82272784.parent_id = 9768633, n82272784.stem = "Parser", n82272784.extension = "", n82272784.path = "/Users/starver/code/public/cpython/Parser", n82272784.size = 768, n82272784.owner = 501, n82272784.group = 20, n82272784.created = 1545241637, n82272784.accessed = 1545241637, n82272784.modified = 1545241637, n82272784.owner_perm = 7, n82272784.group_perm = 5, n82272784.other_perm = 5
+MERGE (n886584364:Directory {id: 9768633})
+MERGE (n886584364) - [:PARENT_OF] -> (n82272784)
+// group 3 1063
+MERGE (n860343445:Directory {id: 9773821}) ON CREATE SET n860343445.tag = "Directory", n860343445.name = "Mac", n860343445.parent_id = 9768633, n860343445.stem = "Mac", n860343445.extension = "", n860343445.path = "/Users/starver/code/public/cpython/Mac", n860343445.size = 352, n860343445.owner = 501, n860343445.group = 20, n860343445.created = 1545241637, n860343445.accessed = 1545673345, n860343445.modified = 1545241637, n860343445.owner_perm = 7, n860343445.group_perm = 5, n860343445.other_perm = 5 ON MATCH SET n860343445.tag = "Directory", n860343445.name = "Mac", n860343445.parent_id = 9768633, n860343445.stem = "Mac", n860343445.extension = "", n860343445.path = "/Users/starver/code/public/cpython/Mac", n860343445.size = 352, n860343445.owner = 501, n860343445.group = 20, n860343445.created = 1545241637, n860343445.accessed = 1545673345, n860343445.modified = 1545241637, n860343445.owner_perm = 7, n860343445.group_perm = 5, n860343445.other_perm = 5
+MERGE (n221884307:Directory {id: 9768633})
+MERGE (n221884307) - [:PARENT_OF] -> (n860343445)
+// group 11 5317
+MERGE (n239752884:Directory {id: 9775535}) ON CREATE SET n239752884.tag = "Directory", n239752884.name = "Programs", n239752884.parent_id = 9768633, n239752884.stem = "Programs", n239752884.extension = "", n239752884.path = "/Users/starver/code/public/cpython/Programs", n239752884.size = 192, n239752884.owner = 501, n239752884.group = 20, n239752884.created = 1545241637, n239752884.accessed = 1545673345, n239752884.modified = 1545241637, n239752884.owner_perm = 7, n239752884.group_perm = 5, n239752884.other_perm = 5 ON MATCH SET n239752884.tag = "Directory", n239752884.name = "Programs", n239752884.parent_id = 9768633, n239752884.stem = "Programs", n239752884.extension = "", n239752884.path = "/Users/starver/code/public/cpython/Programs", n239752884.size = 192, n239752884.owner = 501, n239752884.group = 20, n239752884.created = 1545241637, n239752884.accessed = 1545673345, n239752884.modified = 1545241637, n239752884.owner_perm = 7, n239752884.group_perm = 5, n239752884.other_perm = 5
+MERGE (n513589234:Directory {id: 9768633})
+MERGE (n513589234) - [:PARENT_OF] -> (n239752884)
+MERGE (n657158452:File {id: 9775537}) ON CREATE SET n657158452.tag = "File", n657158452.name = "_freeze_importlib.c", n657158452.parent_id = 9775535, n657158452.stem = "_freeze_importlib", n657158452.extension = "c", n657158452.path = "/Users/starver/code/public/cpython/Programs/_freeze_importlib.c", n657158452.size = 4722, n657158452.owner = 501, n657158452.group = 20, n657158452.created = 1545241637, n657158452.accessed = 1545267151, n657158452.modified = 1545241637, n657158452.owner_perm = 6, n657158452.group_perm = 4, n657158452.other_perm = 4 ON MATCH SET n657158452.tag = "File", n657158452.name = "_freeze_importlib.c", n657158452.parent_id = 9775535, n657158452.stem = "_freeze_importlib", n657158452.extension = "c", n657158452.path = "/Users/starver/code/public/cpython/Programs/_freeze_importlib.c", n657158452.size = 4722, n657158452.owner = 501, n657158452.group = 20, n657158452.created = 1545241637, n657158452.accessed = 1545267151, n657158452.modified = 1545241637, n657158452.owner_perm = 6, n657158452.group_perm = 4, n657158452.other_perm = 4
+MERGE (n239752884) - [:PARENT_OF] -> (n657158452)
+MERGE (n15099945:File {id: 9775538}) ON CREATE SET n15099945.tag = "File", n15099945.name = "_testembed.c", n15099945.parent_id = 9775535, n15099945.stem = "_testembed", n15099945.extension = "c", n15099945.path = "/Users/starver/code/public/cpython/Programs/_testembed.c", n15099945.size = 19671, n15099945.owner = 501, n15099945.group = 20, n15099945.created = 1545241637, n15099945.accessed = 1545267151, n15099945.modified = 1545241637, n15099945.owner_perm = 6, n15099945.group_perm = 4, n15099945.other_perm = 4 ON MATCH SET n15099945.tag = "File", n15099945.name = "_testembed.c", n15099945.parent_id = 9775535, n15099945.stem = "_testembed", n15099945.extension = "c", n15099945.path = "/Users/starver/code/public/cpython/Programs/_testembed.c", n15099945.size = 19671, n15099945.owner = 501, n15099945.group = 20, n15099945.created = 1545241637, n15099945.accessed = 1545267151, n15099945.modified = 1545241637, n15099945.owner_perm = 6, n15099945.group_perm = 4, n15099945.other_perm = 4
+MERGE (n239752884) - [:PARENT_OF] -> (n15099945)
+MERGE (n85351028:File {id: 9775539}) ON CREATE SET n85351028.tag = "File", n85351028.name = "python.c", n85351028.parent_id = 9775535, n85351028.stem = "python", n85351028.extension = "c", n85351028.path = "/Users/starver/code/public/cpython/Programs/python.c", n85351028.size = 298, n85351028.owner = 501, n85351028.group = 20, n85351028.created = 1545241637, n85351028.accessed = 1545267151, n85351028.modified = 1545241637, n85351028.owner_perm = 6, n85351028.group_perm = 4, n85351028.other_perm = 4 ON MATCH SET n85351028.tag = "File", n85351028.name = "python.c", n85351028.parent_id = 9775535, n85351028.stem = "python", n85351028.extension = "c", n85351028.path = "/Users/starver/code/public/cpython/Programs/python.c", n85351028.size = 298, n85351028.owner = 501, n85351028.group = 20, n85351028.created = 1545241637, n85351028.accessed = 1545267151, n85351028.modified = 1545241637, n85351028.owner_perm = 6, n85351028.group_perm = 4, n85351028.other_perm = 4
+MERGE (n239752884) - [:PARENT_OF] -> (n85351028)
+MERGE (n692561624:File {id: 9775536}) ON CREATE SET n692561624.tag = "File", n692561624.name = "README", n692561624.parent_id = 9775535, n692561624.stem = "README", n692561624.extension = "", n692561624.path = "/Users/starver/code/public/cpython/Programs/README", n692561624.size = 67, n692561624.owner = 501, n692561624.group = 20, n692561624.created = 1545241637, n692561624.accessed = 1545267151, n692561624.modified = 1545241637, n692561624.owner_perm = 6, n692561624.group_perm = 4, n692561624.other_perm = 4 ON MATCH SET n692561624.tag = "File", n692561624.name = "README", n692561624.parent_id = 9775535, n692561624.stem = "README", n692561624.extension = "", n692561624.path = "/Users/starver/code/public/cpython/Programs/README", n692561624.size = 67, n692561624.owner = 501, n692561624.group = 20, n692561624.created = 1545241637, n692561624.accessed = 1545267151, n692561624.modified = 1545241637, n692561624.owner_perm = 6, n692561624.group_perm = 4, n692561624.other_perm = 4
+MERGE (n239752884) - [:PARENT_OF] -> (n692561624)
+// group 3 1089
+MERGE (n681889212:Directory {id: 9775403}) ON CREATE SET n681889212.tag = "Directory", n681889212.name = "PCbuild", n681889212.parent_id = 9768633, n681889212.stem = "PCbuild", n681889212.extension = "", n681889212.path = "/Users/starver/code/public/cpython/PCbuild", n681889212.size = 3520, n681889212.owner = 501, n681889212.group = 20, n681889212.created = 1545241637, n681889212.accessed = 1545673345, n681889212.modified = 1545241637, n681889212.owner_perm = 7, n681889212.group_perm = 5, n681889212.other_perm = 5 ON MATCH SET n681889212.tag = "Directory", n681889212.name = "PCbuild", n681889212.parent_id = 9768633, n681889212.stem = "PCbuild", n681889212.extension = "", n681889212.path = "/Users/starver/code/public/cpython/PCbuild", n681889212.size = 3520, n681889212.owner = 501, n681889212.group = 20, n681889212.created = 1545241637, n681889212.accessed = 1545673345, n681889212.modified = 1545241637, n681889212.owner_perm = 7, n681889212.group_perm = 5, n681889212.other_perm = 5
+MERGE (n428710883:Directory {id: 9768633})
+MERGE (n428710883) - [:PARENT_OF] -> (n681889212)
+// group 13 6538
+MERGE (n459917251:Directory {id: 9770916}) ON CREATE SET n459917251.tag = "Directory", n459917251.name = ".github", n459917251.parent_id = 9768633, n459917251.stem = ".github", n459917251.extension = "", n459917251.path = "/Users/starver/code/public/cpython/.github", n459917251.size = 224, n459917251.owner = 501, n459917251.group = 20, n459917251.created = 1545241636, n459917251.accessed = 1545673345, n459917251.modified = 1545241636, n459917251.owner_perm = 7, n459917251.group_perm = 5, n459917251.other_perm = 5 ON MATCH SET n459917251.tag = "Directory", n459917251.name = ".github", n459917251.parent_id = 9768633, n459917251.stem = ".github", n459917251.extension = "", n459917251.path = "/Users/starver/code/public/cpython/.github", n459917251.size = 224, n459917251.owner = 501, n459917251.group = 20, n459917251.created = 1545241636, n459917251.accessed = 1545673345, n459917251.modified = 1545241636, n459917251.owner_perm = 7, n459917251.group_perm = 5, n459917251.other_perm = 5
+MERGE (n192056620:Directory {id: 9768633})
+MERGE (n192056620) - [:PARENT_OF] -> (n459917251)
+MERGE (n649528475:File {id: 9770921}) ON CREATE SET n649528475.tag = "File", n649528475.name = "codecov.yml", n649528475.parent_id = 9770916, n649528475.stem = "codecov", n649528475.extension = "yml", n649528475.path = "/Users/starver/code/public/cpython/.github/codecov.yml", n649528475.size = 482, n649528475.owner = 501, n649528475.group = 20, n649528475.created = 1545241636, n649528475.accessed = 1545241636, n649528475.modified = 1545241636, n649528475.owner_perm = 6, n649528475.group_perm = 4, n649528475.other_perm = 4 ON MATCH SET n649528475.tag = "File", n649528475.name = "codecov.yml", n649528475.parent_id = 9770916, n649528475.stem = "codecov", n649528475.extension = "yml", n649528475.path = "/Users/starver/code/public/cpython/.github/codecov.yml", n649528475.size = 482, n649528475.owner = 501, n649528475.group = 20, n649528475.created = 1545241636, n649528475.accessed = 1545241636, n649528475.modified = 1545241636, n649528475.owner_perm = 6, n649528475.group_perm = 4, n649528475.other_perm = 4
+MERGE (n459917251) - [:PARENT_OF] -> (n649528475)
+MERGE (n749018761:File {id: 9770918}) ON CREATE SET n749018761.tag = "File", n749018761.name = "CONTRIBUTING.rst", n749018761.parent_id = 9770916, n749018761.stem = "CONTRIBUTING", n749018761.extension = "rst", n749018761.path = "/Users/starver/code/public/cpython/.github/CONTRIBUTING.rst", n749018761.size = 2412, n749018761.owner = 501, n749018761.group = 20, n749018761.created = 1545241636, n749018761.accessed = 1545241636, n749018761.modified = 1545241636, n749018761.owner_perm = 6, n749018761.group_perm = 4, n749018761.other_perm = 4 ON MATCH SET n749018761.tag = "File", n749018761.name = "CONTRIBUTING.rst", n749018761.parent_id = 9770916, n749018761.stem = "CONTRIBUTING", n749018761.extension = "rst", n749018761.path = "/Users/starver/code/public/cpython/.github/CONTRIBUTING.rst", n749018761.size = 2412, n749018761.owner = 501, n749018761.group = 20, n749018761.created = 1545241636, n749018761.accessed = 1545241636, n749018761.modified = 1545241636, n749018761.owner_perm = 6, n749018761.group_perm = 4, n749018761.other_perm = 4
+MERGE (n459917251) - [:PARENT_OF] -> (n749018761)
+MERGE (n515474985:File {id: 9770917}) ON CREATE SET n515474985.tag = "File", n515474985.name = "CODEOWNERS", n515474985.parent_id = 9770916, n515474985.stem = "CODEOWNERS", n515474985.extension = "", n515474985.path = "/Users/starver/code/public/cpython/.github/CODEOWNERS", n515474985.size = 2144, n515474985.owner = 501, n515474985.group = 20, n515474985.created = 1545241636, n515474985.accessed = 1545241636, n515474985.modified = 1545241636, n515474985.owner_perm = 6, n515474985.group_perm = 4, n515474985.other_perm = 4 ON MATCH SET n515474985.tag = "File", n515474985.name = "CODEOWNERS", n515474985.parent_id = 9770916, n515474985.stem = "CODEOWNERS", n515474985.extension = "", n515474985.path = "/Users/starver/code/public/cpython/.github/CODEOWNERS", n515474985.size = 2144, n515474985.owner = 501, n515474985.group = 20, n515474985.created = 1545241636, n515474985.accessed = 1545241636, n515474985.modified = 1545241636, n515474985.owner_perm = 6, n515474985.group_perm = 4, n515474985.other_perm = 4
+MERGE (n459917251) - [:PARENT_OF] -> (n515474985)
+MERGE (n714649193:File {id: 9770919}) ON CREATE SET n714649193.tag = "File", n714649193.name = "PULL_REQUEST_TEMPLATE.md", n714649193.parent_id = 9770916, n714649193.stem = "PULL_REQUEST_TEMPLATE", n714649193.extension = "md", n714649193.path = "/Users/starver/code/public/cpython/.github/PULL_REQUEST_TEMPLATE.md", n714649193.size = 700, n714649193.owner = 501, n714649193.group = 20, n714649193.created = 1545241636, n714649193.accessed = 1545241636, n714649193.modified = 1545241636, n714649193.owner_perm = 6, n714649193.group_perm = 4, n714649193.other_perm = 4 ON MATCH SET n714649193.tag = "File", n714649193.name = "PULL_REQUEST_TEMPLATE.md", n714649193.parent_id = 9770916, n714649193.stem = "PULL_REQUEST_TEMPLATE", n714649193.extension = "md", n714649193.path = "/Users/starver/code/public/cpython/.github/PULL_REQUEST_TEMPLATE.md", n714649193.size = 700, n714649193.owner = 501, n714649193.group = 20, n714649193.created = 1545241636, n714649193.accessed = 1545241636, n714649193.modified = 1545241636, n714649193.owner_perm = 6, n714649193.group_perm = 4, n714649193.other_perm = 4
+MERGE (n459917251) - [:PARENT_OF] -> (n714649193)
+MERGE (n697297208:File {id: 9770920}) ON CREATE SET n697297208.tag = "File", n697297208.name = "appveyor.yml", n697297208.parent_id = 9770916, n697297208.stem = "appveyor", n697297208.extension = "yml", n697297208.path = "/Users/starver/code/public/cpython/.github/appveyor.yml", n697297208.size = 1148, n697297208.owner = 501, n697297208.group = 20, n697297208.created = 1545241636, n697297208.accessed = 1545241636, n697297208.modified = 1545241636, n697297208.owner_perm = 6, n697297208.group_perm = 4, n697297208.other_perm = 4 ON MATCH SET n697297208.tag = "File", n697297208.name = "appveyor.yml", n697297208.parent_id = 9770916, n697297208.stem = "appveyor", n697297208.extension = "yml", n697297208.path = "/Users/starver/code/public/cpython/.github/appveyor.yml", n697297208.size = 1148, n697297208.owner = 501, n697297208.group = 20, n697297208.created = 1545241636, n697297208.accessed = 1545241636, n697297208.modified = 1545241636, n697297208.owner_perm = 6, n697297208.group_perm = 4, n697297208.other_perm = 4
+MERGE (n459917251) - [:PARENT_OF] -> (n697297208)
+// group 3 1065
+MERGE (n187203158:Directory {id: 9771638}) ON CREATE SET n187203158.tag = "Directory", n187203158.name = "Lib", n187203158.parent_id = 9768633, n187203158.stem = "Lib", n187203158.extension = "", n187203158.path = "/Users/starver/code/public/cpython/Lib", n187203158.size = 6528, n187203158.owner = 501, n187203158.group = 20, n187203158.created = 1545241637, n187203158.accessed = 1545673345, n187203158.modified = 1545241637, n187203158.owner_perm = 7, n187203158.group_perm = 5, n187203158.other_perm = 5 ON MATCH SET n187203158.tag = "Directory", n187203158.name = "Lib", n187203158.parent_id = 9768633, n187203158.stem = "Lib", n187203158.extension = "", n187203158.path = "/Users/starver/code/public/cpython/Lib", n187203158.size = 6528, n187203158.owner = 501, n187203158.group = 20, n187203158.created = 1545241637, n187203158.accessed = 1545673345, n187203158.modified = 1545241637, n187203158.owner_perm = 7, n187203158.group_perm = 5, n187203158.other_perm = 5
+MERGE (n175344008:Directory {id: 9768633})
+MERGE (n175344008) - [:PARENT_OF] -> (n187203158)
+// group 7 3331
+MERGE (n598351162:Directory {id: 9775970}) ON CREATE SET n598351162.tag = "Directory", n598351162.name = "m4", n598351162.parent_id = 9768633, n598351162.stem = "m4", n598351162.extension = "", n598351162.path = "/Users/starver/code/public/cpython/m4", n598351162.size = 128, n598351162.owner = 501, n598351162.group = 20, n598351162.created = 1545241637, n598351162.accessed = 1545241637, n598351162.modified = 1545241637, n598351162.owner_perm = 7, n598351162.group_perm = 5, n598351162.other_perm = 5 ON MATCH SET n598351162.tag = "Directory", n598351162.name = "m4", n598351162.parent_id = 9768633, n598351162.stem = "m4", n598351162.extension = "", n598351162.path = "/Users/starver/code/public/cpython/m4", n598351162.size = 128, n598351162.owner = 501, n598351162.group = 20, n598351162.created = 1545241637, n598351162.accessed = 1545241637, n598351162.modified = 1545241637, n598351162.owner_perm = 7, n598351162.group_perm = 5, n598351162.other_perm = 5
+MERGE (n313111803:Directory {id: 9768633})
+MERGE (n313111803) - [:PARENT_OF] -> (n598351162)
+MERGE (n505682375:File {id: 9775972}) ON CREATE SET n505682375.tag = "File", n505682375.name = "ax_check_openssl.m4", n505682375.parent_id = 9775970, n505682375.stem = "ax_check_openssl", n505682375.extension = "m4", n505682375.path = "/Users/starver/code/public/cpython/m4/ax_check_openssl.m4", n505682375.size = 4189, n505682375.owner = 501, n505682375.group = 20, n505682375.created = 1545241637, n505682375.accessed = 1545267152, n505682375.modified = 1545241637, n505682375.owner_perm = 6, n505682375.group_perm = 4, n505682375.other_perm = 4 ON MATCH SET n505682375.tag = "File", n505682375.name = "ax_check_openssl.m4", n505682375.parent_id = 9775970, n505682375.stem = "ax_check_openssl", n505682375.extension = "m4", n505682375.path = "/Users/starver/code/public/cpython/m4/ax_check_openssl.m4", n505682375.size = 4189, n505682375.owner = 501, n505682375.group = 20, n505682375.created = 1545241637, n505682375.accessed = 1545267152, n505682375.modified = 1545241637, n505682375.owner_perm = 6, n505682375.group_perm = 4, n505682375.other_perm = 4
+MERGE (n598351162) - [:PARENT_OF] -> (n505682375)
+MERGE (n884550314:File {id: 9775971}) ON CREATE SET n884550314.tag = "File", n884550314.name = "ax_c_float_words_bigendian.m4", n884550314.parent_id = 9775970, n884550314.stem = "ax_c_float_words_bigendian", n884550314.extension = "m4", n884550314.path = "/Users/starver/code/public/cpython/m4/ax_c_float_words_bigendian.m4", n884550314.size = 3159, n884550314.owner = 501, n884550314.group = 20, n884550314.created = 1545241637, n884550314.accessed = 1545267152, n884550314.modified = 1545241637, n884550314.owner_perm = 6, n884550314.group_perm = 4, n884550314.other_perm = 4 ON MATCH SET n884550314.tag = "File", n884550314.name = "ax_c_float_words_bigendian.m4", n884550314.parent_id = 9775970, n884550314.stem = "ax_c_float_words_bigendian", n884550314.extension = "m4", n884550314.path = "/Users/starver/code/public/cpython/m4/ax_c_float_words_bigendian.m4", n884550314.size = 3159, n884550314.owner = 501, n884550314.group = 20, n884550314.created = 1545241637, n884550314.accessed = 1545267152, n884550314.modified = 1545241637, n884550314.owner_perm = 6, n884550314.group_perm = 4, n884550314.other_perm = 4
+MERGE (n598351162) - [:PARENT_OF] -> (n884550314)
+// group 3 1063
+MERGE (n660758983:Directory {id: 9770925}) ON CREATE SET n660758983.tag = "Directory", n660758983.name = "Doc", n660758983.parent_id = 9768633, n660758983.stem = "Doc", n660758983.extension = "", n660758983.path = "/Users/starver/code/public/cpython/Doc", n660758983.size = 896, n660758983.owner = 501, n660758983.group = 20, n660758983.created = 1545241636, n660758983.accessed = 1545673346, n660758983.modified = 1545241636, n660758983.owner_perm = 7, n660758983.group_perm = 5, n660758983.other_perm = 5 ON MATCH SET n660758983.tag = "Directory", n660758983.name = "Doc", n660758983.parent_id = 9768633, n660758983.stem = "Doc", n660758983.extension = "", n660758983.path = "/Users/starver/code/public/cpython/Doc", n660758983.size = 896, n660758983.owner = 501, n660758983.group = 20, n660758983.created = 1545241636, n660758983.accessed = 1545673346, n660758983.modified = 1545241636, n660758983.owner_perm = 7, n660758983.group_perm = 5, n660758983.other_perm = 5
+MERGE (n248134415:Directory {id: 9768633})
+MERGE (n248134415) - [:PARENT_OF] -> (n660758983)
+// group 15 7341
+MERGE (n916483788:Directory {id: 9768634}) ON CREATE SET n916483788.tag = "Directory", n916483788.name = ".git", n916483788.parent_id = 9768633, n916483788.stem = ".git", n916483788.extension = "", n916483788.path = "/Users/starver/code/public/cpython/.git", n916483788.size = 448, n916483788.owner = 501, n916483788.group = 20, n916483788.created = 1545241684, n916483788.accessed = 1545673346, n916483788.modified = 1545241684, n916483788.owner_perm = 7, n916483788.group_perm = 5, n916483788.other_perm = 5 ON MATCH SET n916483788.tag = "Directory", n916483788.name = ".git", n916483788.parent_id = 9768633, n916483788.stem = ".git", n916483788.extension = "", n916483788.path = "/Users/starver/code/public/cpython/.git", n916483788.size = 448, n916483788.owner = 501, n916483788.group = 20, n916483788.created = 1545241684, n916483788.accessed = 1545673346, n916483788.modified = 1545241684, n916483788.owner_perm = 7, n916483788.group_perm = 5, n916483788.other_perm = 5
+MERGE (n636104710:Directory {id: 9768633})
+MERGE (n636104710) - [:PARENT_OF] -> (n916483788)
+MERGE (n716226961:File {id: 9776054}) ON CREATE SET n716226961.tag = "File", n716226961.name = "config", n716226961.parent_id = 9768634, n716226961.stem = "config", n716226961.extension = "", n716226961.path = "/Users/starver/code/public/cpython/.git/config", n716226961.size = 357, n716226961.owner = 501, n716226961.group = 20, n716226961.created = 1545241684, n716226961.accessed = 1545241706, n716226961.modified = 1545241684, n716226961.owner_perm = 6, n716226961.group_perm = 4, n716226961.other_perm = 4 ON MATCH SET n716226961.tag = "File", n716226961.name = "config", n716226961.parent_id = 9768634, n716226961.stem = "config", n716226961.extension = "", n716226961.path = "/Users/starver/code/public/cpython/.git/config", n716226961.size = 357, n716226961.owner = 501, n716226961.group = 20, n716226961.created = 1545241684, n716226961.accessed = 1545241706, n716226961.modified = 1545241684, n716226961.owner_perm = 6, n716226961.group_perm = 4, n716226961.other_perm = 4
+MERGE (n916483788) - [:PARENT_OF] -> (n716226961)
+MERGE (n865493408:File {id: 9770895}) ON CREATE SET n865493408.tag = "File", n865493408.name = "HEAD", n865493408.parent_id = 9768634, n865493408.stem = "HEAD", n865493408.extension = "", n865493408.path = "/Users/starver/code/public/cpython/.git/HEAD", n865493408.size = 23, n865493408.owner = 501, n865493408.group = 20, n865493408.created = 1545241636, n865493408.accessed = 1545241646, n865493408.modified = 1545241636, n865493408.owner_perm = 6, n865493408.group_perm = 4, n865493408.other_perm = 4 ON MATCH SET n865493408.tag = "File", n865493408.name = "HEAD", n865493408.parent_id = 9768634, n865493408.stem = "HEAD", n865493408.extension = "", n865493408.path = "/Users/starver/code/public/cpython/.git/HEAD", n865493408.size = 23, n865493408.owner = 501, n865493408.group = 20, n865493408.created = 1545241636, n865493408.accessed = 1545241646, n865493408.modified = 1545241636, n865493408.owner_perm = 6, n865493408.group_perm = 4, n865493408.other_perm = 4
+MERGE (n916483788) - [:PARENT_OF] -> (n865493408)
+MERGE (n215325724:File {id: 9768637}) ON CREATE SET n215325724.tag = "File", n215325724.name = "description", n215325724.parent_id = 9768634, n215325724.stem = "description", n215325724.extension = "", n215325724.path = "/Users/starver/code/public/cpython/.git/description", n215325724.size = 73, n215325724.owner = 501, n215325724.group = 20, n215325724.created = 1545241485, n215325724.accessed = 1545241485, n215325724.modified = 1545241485, n215325724.owner_perm = 6, n215325724.group_perm = 4, n215325724.other_perm = 4 ON MATCH SET n215325724.tag = "File", n215325724.name = "description", n215325724.parent_id = 9768634, n215325724.stem = "description", n215325724.extension = "", n215325724.path = "/Users/starver/code/public/cpython/.git/description", n215325724.size = 73, n215325724.owner = 501, n215325724.group = 20, n215325724.created = 1545241485, n215325724.accessed = 1545241485, n215325724.modified = 1545241485, n215325724.owner_perm = 6, n215325724.group_perm = 4, n215325724.other_perm = 4
+MERGE (n916483788) - [:PARENT_OF] -> (n215325724)
+MERGE (n725578413:File {id: 9776025}) ON CREATE SET n725578413.tag = "File", n725578413.name = "index", n725578413.parent_id = 9768634, n725578413.stem = "index", n725578413.extension = "", n725578413.path = "/Users/starver/code/public/cpython/.git/index", n725578413.size = 488920, n725578413.owner = 501, n725578413.group = 20, n725578413.created = 1545241664, n725578413.accessed = 1545241700, n725578413.modified = 1545241664, n725578413.owner_perm = 6, n725578413.group_perm = 4, n725578413.other_perm = 4 ON MATCH SET n725578413.tag = "File", n725578413.name = "index", n725578413.parent_id = 9768634, n725578413.stem = "index", n725578413.extension = "", n725578413.path = "/Users/starver/code/public/cpython/.git/index", n725578413.size = 488920, n725578413.owner = 501, n725578413.group = 20, n725578413.created = 1545241664, n725578413.accessed = 1545241700, n725578413.modified = 1545241664, n725578413.owner_perm = 6, n725578413.group_perm = 4, n725578413.other_perm = 4
+MERGE (n916483788) - [:PARENT_OF] -> (n725578413)
+MERGE (n619778389:File {id: 9770886}) ON CREATE SET n619778389.tag = "File", n619778389.name = "packed-refs", n619778389.parent_id = 9768634, n619778389.stem = "packed-refs", n619778389.extension = "", n619778389.path = "/Users/starver/code/public/cpython/.git/packed-refs", n619778389.size = 25007, n619778389.owner = 501, n619778389.group = 20, n619778389.created = 1545241636, n619778389.accessed = 1545241644, n619778389.modified = 1545241636, n619778389.owner_perm = 6, n619778389.group_perm = 4, n619778389.other_perm = 4 ON MATCH SET n619778389.tag = "File", n619778389.name = "packed-refs", n619778389.parent_id = 9768634, n619778389.stem = "packed-refs", n619778389.extension = "", n619778389.path = "/Users/starver/code/public/cpython/.git/packed-refs", n619778389.size = 25007, n619778389.owner = 501, n619778389.group = 20, n619778389.created = 1545241636, n619778389.accessed = 1545241644, n619778389.modified = 1545241636, n619778389.owner_perm = 6, n619778389.group_perm = 4, n619778389.other_perm = 4
+MERGE (n916483788) - [:PARENT_OF] -> (n619778389)
+MERGE (n359110071:File {id: 9775980}) ON CREATE SET n359110071.tag = "File", n359110071.name = "FETCH_HEAD", n359110071.parent_id = 9768634, n359110071.stem = "FETCH_HEAD", n359110071.extension = "", n359110071.path = "/Users/starver/code/public/cpython/.git/FETCH_HEAD", n359110071.size = 2217, n359110071.owner = 501, n359110071.group = 20, n359110071.created = 1545241641, n359110071.accessed = 1545241638, n359110071.modified = 1545241641, n359110071.owner_perm = 6, n359110071.group_perm = 4, n359110071.other_perm = 4 ON MATCH SET n359110071.tag = "File", n359110071.name = "FETCH_HEAD", n359110071.parent_id = 9768634, n359110071.stem = "FETCH_HEAD", n359110071.extension = "", n359110071.path = "/Users/starver/code/public/cpython/.git/FETCH_HEAD", n359110071.size = 2217, n359110071.owner = 501, n359110071.group = 20, n359110071.created = 1545241641, n359110071.accessed = 1545241638, n359110071.modified = 1545241641, n359110071.owner_perm = 6, n359110071.group_perm = 4, n359110071.other_perm = 4
+MERGE (n916483788) - [:PARENT_OF] -> (n359110071)
+// group 3 1097
+MERGE (n946870498:Directory {id: 9768664}) ON CREATE SET n946870498.tag = "Directory", n946870498.name = "objects", n946870498.parent_id = 9768634, n946870498.stem = "objects", n946870498.extension = "", n946870498.path = "/Users/starver/code/public/cpython/.git/objects", n946870498.size = 128, n946870498.owner = 501, n946870498.group = 20, n946870498.created = 1545241485, n946870498.accessed = 1545673346, n946870498.modified = 1545241485, n946870498.owner_perm = 7, n946870498.group_perm = 5, n946870498.other_perm = 5 ON MATCH SET n946870498.tag = "Directory", n946870498.name = "objects", n946870498.parent_id = 9768634, n946870498.stem = "objects", n946870498.extension = "", n946870498.path = "/Users/starver/code/public/cpython/.git/objects", n946870498.size = 128, n946870498.owner = 501, n946870498.group = 20, n946870498.created = 1545241485, n946870498.accessed = 1545673346, n946870498.modified = 1545241485, n946870498.owner_perm = 7, n946870498.group_perm = 5, n946870498.other_perm = 5
+MERGE (n490022733:Directory {id: 9768634})
+MERGE (n490022733) - [:PARENT_OF] -> (n946870498)
+// group 7 3721
+MERGE (n154268795:Directory {id: 9768665}) ON CREATE SET n154268795.tag = "Directory", n154268795.name = "pack", n154268795.parent_id = 9768664, n154268795.stem = "pack", n154268795.extension = "", n154268795.path = "/Users/starver/code/public/cpython/.git/objects/pack", n154268795.size = 128, n154268795.owner = 501, n154268795.group = 20, n154268795.created = 1545241636, n154268795.accessed = 1545241636, n154268795.modified = 1545241636, n154268795.owner_perm = 7, n154268795.group_perm = 5, n154268795.other_perm = 5 ON MATCH SET n154268795.tag = "Directory", n154268795.name = "pack", n154268795.parent_id = 9768664, n154268795.stem = "pack", n154268795.extension = "", n154268795.path = "/Users/starver/code/public/cpython/.git/objects/pack", n154268795.size = 128, n154268795.owner = 501, n154268795.group = 20, n154268795.created = 1545241636, n154268795.accessed = 1545241636, n154268795.modified = 1545241636, n154268795.owner_perm = 7, n154268795.group_perm = 5, n154268795.other_perm = 5
+MERGE (n908153200:Directory {id: 9768664})
+MERGE (n908153200) - [:PARENT_OF] -> (n154268795)
+MERGE (n69642588:File {id: 9770879}) ON CREATE SET n69642588.tag = "File", n69642588.name = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", n69642588.parent_id = 9768665, n69642588.stem = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", n69642588.extension = "idx", n69642588.path = "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", n69642588.size = 20458908, n69642588.owner = 501, n69642588.group = 20, n69642588.created = 1545241636, n69642588.accessed = 1545241700, n69642588.modified = 1545241636, n69642588.owner_perm = 4, n69642588.group_perm = 4, n69642588.other_perm = 4 ON MATCH SET n69642588.tag = "File", n69642588.name = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", n69642588.parent_id = 9768665, n69642588.stem = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", n69642588.extension = "idx", n69642588.path = "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.idx", n69642588.size = 20458908, n69642588.owner = 501, n69642588.group = 20, n69642588.created = 1545241636, n69642588.accessed = 1545241700, n69642588.modified = 1545241636, n69642588.owner_perm = 4, n69642588.group_perm = 4, n69642588.other_perm = 4
+MERGE (n154268795) - [:PARENT_OF] -> (n69642588)
+MERGE (n125831454:File {id: 9769910}) ON CREATE SET n125831454.tag = "File", n125831454.name = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", n125831454.parent_id = 9768665, n125831454.stem = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", n125831454.extension = "pack", n125831454.path = "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", n125831454.size = 269003613, n125831454.owner = 501, n125831454.group = 20, n125831454.created = 1545241636, n125831454.accessed = 1545241700, n125831454.modified = 1545241635, n125831454.owner_perm = 4, n125831454.group_perm = 4, n125831454.other_perm = 4 ON MATCH SET n125831454.tag = "File", n125831454.name = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", n125831454.parent_id = 9768665, n125831454.stem = "pack-78d4af5ccebd732eefb04998b6b6912baedbdef8", n125831454.extension = "pack", n125831454.path = "/Users/starver/code/public/cpython/.git/objects/pack/pack-78d4af5ccebd732eefb04998b6b6912baedbdef8.pack", n125831454.size = 269003613, n125831454.owner = 501, n125831454.group = 20, n125831454.created = 1545241636, n125831454.accessed = 1545241700, n125831454.modified = 1545241635, n125831454.owner_perm = 4, n125831454.group_perm = 4, n125831454.other_perm = 4
+MERGE (n154268795) - [:PARENT_OF] -> (n125831454)
+// group 3 1093
+MERGE (n810081302:Directory {id: 9768666}) ON CREATE SET n810081302.tag = "Directory", n810081302.name = "info", n810081302.parent_id = 9768664, n810081302.stem = "info", n810081302.extension = "", n810081302.path = "/Users/starver/code/public/cpython/.git/objects/info", n810081302.size = 64, n810081302.owner = 501, n810081302.group = 20, n810081302.created = 1545241485, n810081302.accessed = 1545673480, n810081302.modified = 1545241485, n810081302.owner_perm = 7, n810081302.group_perm = 5, n810081302.other_perm = 5 ON MATCH SET n810081302.tag = "Directory", n810081302.name = "info", n810081302.parent_id = 9768664, n810081302.stem = "info", n810081302.extension = "", n810081302.path = "/Users/starver/code/public/cpython/.git/objects/info", n810081302.size = 64, n810081302.owner = 501, n810081302.group = 20, n810081302.created = 1545241485, n810081302.accessed = 1545673480, n810081302.modified = 1545241485, n810081302.owner_perm = 7, n810081302.group_perm = 5, n810081302.other_perm = 5
+MERGE (n117094829:Directory {id: 9768664})
+MERGE (n117094829) - [:PARENT_OF] -> (n810081302)
+// group 5 2126
+MERGE (n781866111:Directory {id: 9768635}) ON CREATE SET n781866111.tag = "Directory", n781866111.name = "info", n781866111.parent_id = 9768634, n781866111.stem = "info", n781866111.extension = "", n781866111.path = "/Users/starver/code/public/cpython/.git/info", n781866111.size = 96, n781866111.owner = 501, n781866111.group = 20, n781866111.created = 1545241485, n781866111.accessed = 1545673346, n781866111.modified = 1545241485, n781866111.owner_perm = 7, n781866111.group_perm = 5, n781866111.other_perm = 5 ON MATCH SET n781866111.tag = "Directory", n781866111.name = "info", n781866111.parent_id = 9768634, n781866111.stem = "info", n781866111.extension = "", n781866111.path = "/Users/starver/code/public/cpython/.git/info", n781866111.size = 96, n781866111.owner = 501, n781866111.group = 20, n781866111.created = 1545241485, n781866111.accessed = 1545673346, n781866111.modified = 1545241485, n781866111.owner_perm = 7, n781866111.group_perm = 5, n781866111.other_perm = 5
+MERGE (n794038190:Directory {id: 9768634})
+MERGE (n794038190) - [:PARENT_OF] -> (n781866111)
+MERGE (n671046391:File {id: 9768636}) ON CREATE SET n671046391.tag = "File", n671046391.name = "exclude", n671046391.parent_id = 9768635, n671046391.stem = "exclude", n671046391.extension = "", n671046391.path = "/Users/starver/code/public/cpython/.git/info/exclude", n671046391.size = 240, n671046391.owner = 501, n671046391.group = 20, n671046391.created = 1545241485, n671046391.accessed = 1545241485, n671046391.modified = 1545241485, n671046391.owner_perm = 6, n671046391.group_perm = 4, n671046391.other_perm = 4 ON MATCH SET n671046391.tag = "File", n671046391.name = "exclude", n671046391.parent_id = 9768635, n671046391.stem = "exclude", n671046391.extension = "", n671046391.path = "/Users/starver/code/public/cpython/.git/info/exclude", n671046391.size = 240, n671046391.owner = 501, n671046391.group = 20, n671046391.created = 1545241485, n671046391.accessed = 1545241485, n671046391.modified = 1545241485, n671046391.owner_perm = 6, n671046391.group_perm = 4, n671046391.other_perm = 4
+MERGE (n781866111) - [:PARENT_OF] -> (n671046391)
+// group 5 2074
+MERGE (n411491886:Directory {id: 9770890}) ON CREATE SET n411491886.tag = "Directory", n411491886.name = "logs", n411491886.parent_id = 9768634, n411491886.stem = "logs", n411491886.extension = "", n411491886.path = "/Users/starver/code/public/cpython/.git/logs", n411491886.size = 128, n411491886.owner = 501, n411491886.group = 20, n411491886.created = 1545241636, n411491886.accessed = 1545673346, n411491886.modified = 1545241636, n411491886.owner_perm = 7, n411491886.group_perm = 5, n411491886.other_perm = 5 ON MATCH SET n411491886.tag = "Directory", n411491886.name = "logs", n411491886.parent_id = 9768634, n411491886.stem = "logs", n411491886.extension = "", n411491886.path = "/Users/starver/code/public/cpython/.git/logs", n411491886.size = 128, n411491886.owner = 501, n411491886.group = 20, n411491886.created = 1545241636, n411491886.accessed = 1545673346, n411491886.modified = 1545241636, n411491886.owner_perm = 7, n411491886.group_perm = 5, n411491886.other_perm = 5
+MERGE (n1047260:Directory {id: 9768634})
+MERGE (n1047260) - [:PARENT_OF] -> (n411491886)
+MERGE (n46621812:File {id: 9770898}) ON CREATE SET n46621812.tag = "File", n46621812.name = "HEAD", n46621812.parent_id = 9770890, n46621812.stem = "HEAD", n46621812.extension = "", n46621812.path = "/Users/starver/code/public/cpython/.git/logs/HEAD", n46621812.size = 204, n46621812.owner = 501, n46621812.group = 20, n46621812.created = 1545241636, n46621812.accessed = 1545241636, n46621812.modified = 1545241636, n46621812.owner_perm = 6, n46621812.group_perm = 4, n46621812.other_perm = 4 ON MATCH SET n46621812.tag = "File", n46621812.name = "HEAD", n46621812.parent_id = 9770890, n46621812.stem = "HEAD", n46621812.extension = "", n46621812.path = "/Users/starver/code/public/cpython/.git/logs/HEAD", n46621812.size = 204, n46621812.owner = 501, n46621812.group = 20, n46621812.created = 1545241636, n46621812.accessed = 1545241636, n46621812.modified = 1545241636, n46621812.owner_perm = 6, n46621812.group_perm = 4, n46621812.other_perm = 4
+MERGE (n411491886) - [:PARENT_OF] -> (n46621812)
+// group 3 1089
+MERGE (n511686706:Directory {id: 9770891}) ON CREATE SET n511686706.tag = "Directory", n511686706.name = "refs", n511686706.parent_id = 9770890, n511686706.stem = "refs", n511686706.extension = "", n511686706.path = "/Users/starver/code/public/cpython/.git/logs/refs", n511686706.size = 128, n511686706.owner = 501, n511686706.group = 20, n511686706.created = 1545241636, n511686706.accessed = 1545673346, n511686706.modified = 1545241636, n511686706.owner_perm = 7, n511686706.group_perm = 5, n511686706.other_perm = 5 ON MATCH SET n511686706.tag = "Directory", n511686706.name = "refs", n511686706.parent_id = 9770890, n511686706.stem = "refs", n511686706.extension = "", n511686706.path = "/Users/starver/code/public/cpython/.git/logs/refs", n511686706.size = 128, n511686706.owner = 501, n511686706.group = 20, n511686706.created = 1545241636, n511686706.accessed = 1545673346, n511686706.modified = 1545241636, n511686706.owner_perm = 7, n511686706.group_perm = 5, n511686706.other_perm = 5
+MERGE (n403411681:Directory {id: 9770890})
+MERGE (n403411681) - [:PARENT_OF] -> (n511686706)
+// group 5 2103
+MERGE (n17392382:Directory {id: 9770899}) ON CREATE SET n17392382.tag = "Directory", n17392382.name = "heads", n17392382.parent_id = 9770891, n17392382.stem = "heads", n17392382.extension = "", n17392382.path = "/Users/starver/code/public/cpython/.git/logs/refs/heads", n17392382.size = 96, n17392382.owner = 501, n17392382.group = 20, n17392382.created = 1545241636, n17392382.accessed = 1545673346, n17392382.modified = 1545241636, n17392382.owner_perm = 7, n17392382.group_perm = 5, n17392382.other_perm = 5 ON MATCH SET n17392382.tag = "Directory", n17392382.name = "heads", n17392382.parent_id = 9770891, n17392382.stem = "heads", n17392382.extension = "", n17392382.path = "/Users/starver/code/public/cpython/.git/logs/refs/heads", n17392382.size = 96, n17392382.owner = 501, n17392382.group = 20, n17392382.created = 1545241636, n17392382.accessed = 1545673346, n17392382.modified = 1545241636, n17392382.owner_perm = 7, n17392382.group_perm = 5, n17392382.other_perm = 5
+MERGE (n824623532:Directory {id: 9770891})
+MERGE (n824623532) - [:PARENT_OF] -> (n17392382)
+MERGE (n56685144:File {id: 9770900}) ON CREATE SET n56685144.tag = "File", n56685144.name = "master", n56685144.parent_id = 9770899, n56685144.stem = "master", n56685144.extension = "", n56685144.path = "/Users/starver/code/public/cpython/.git/logs/refs/heads/master", n56685144.size = 204, n56685144.owner = 501, n56685144.group = 20, n56685144.created = 1545241636, n56685144.accessed = 1545241636, n56685144.modified = 1545241636, n56685144.owner_perm = 6, n56685144.group_perm = 4, n56685144.other_perm = 4 ON MATCH SET n56685144.tag = "File", n56685144.name = "master", n56685144.parent_id = 9770899, n56685144.stem = "master", n56685144.extension = "", n56685144.path = "/Users/starver/code/public/cpython/.git/logs/refs/heads/master", n56685144.size = 204, n56685144.owner = 501, n56685144.group = 20, n56685144.created = 1545241636, n56685144.accessed = 1545241636, n56685144.modified = 1545241636, n56685144.owner_perm = 6, n56685144.group_perm = 4, n56685144.other_perm = 4
+MERGE (n17392382) - [:PARENT_OF] -> (n56685144)
+// group 3 1115
+MERGE (n703834273:Directory {id: 9770892}) ON CREATE SET n703834273.tag = "Directory", n703834273.name = "remotes", n703834273.parent_id = 9770891, n703834273.stem = "remotes", n703834273.extension = "", n703834273.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes", n703834273.size = 96, n703834273.owner = 501, n703834273.group = 20, n703834273.created = 1545241636, n703834273.accessed = 1545673346, n703834273.modified = 1545241636, n703834273.owner_perm = 7, n703834273.group_perm = 5, n703834273.other_perm = 5 ON MATCH SET n703834273.tag = "Directory", n703834273.name = "remotes", n703834273.parent_id = 9770891, n703834273.stem = "remotes", n703834273.extension = "", n703834273.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes", n703834273.size = 96, n703834273.owner = 501, n703834273.group = 20, n703834273.created = 1545241636, n703834273.accessed = 1545673346, n703834273.modified = 1545241636, n703834273.owner_perm = 7, n703834273.group_perm = 5, n703834273.other_perm = 5
+MERGE (n816672325:Directory {id: 9770891})
+MERGE (n816672325) - [:PARENT_OF] -> (n703834273)
+// group 5 2196
+MERGE (n307308392:Directory {id: 9770893}) ON CREATE SET n307308392.tag = "Directory", n307308392.name = "origin", n307308392.parent_id = 9770892, n307308392.stem = "origin", n307308392.extension = "", n307308392.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin", n307308392.size = 96, n307308392.owner = 501, n307308392.group = 20, n307308392.created = 1545241636, n307308392.accessed = 1545673346, n307308392.modified = 1545241636, n307308392.owner_perm = 7, n307308392.group_perm = 5, n307308392.other_perm = 5 ON MATCH SET n307308392.tag = "Directory", n307308392.name = "origin", n307308392.parent_id = 9770892, n307308392.stem = "origin", n307308392.extension = "", n307308392.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin", n307308392.size = 96, n307308392.owner = 501, n307308392.group = 20, n307308392.created = 1545241636, n307308392.accessed = 1545673346, n307308392.modified = 1545241636, n307308392.owner_perm = 7, n307308392.group_perm = 5, n307308392.other_perm = 5
+MERGE (n873069360:Directory {id: 9770892})
+MERGE (n873069360) - [:PARENT_OF] -> (n307308392)
+MERGE (n713324568:File {id: 9770894}) ON CREATE SET n713324568.tag = "File", n713324568.name = "HEAD", n713324568.parent_id = 9770893, n713324568.stem = "HEAD", n713324568.extension = "", n713324568.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin/HEAD", n713324568.size = 204, n713324568.owner = 501, n713324568.group = 20, n713324568.created = 1545241636, n713324568.accessed = 1545241636, n713324568.modified = 1545241636, n713324568.owner_perm = 6, n713324568.group_perm = 4, n713324568.other_perm = 4 ON MATCH SET n713324568.tag = "File", n713324568.name = "HEAD", n713324568.parent_id = 9770893, n713324568.stem = "HEAD", n713324568.extension = "", n713324568.path = "/Users/starver/code/public/cpython/.git/logs/refs/remotes/origin/HEAD", n713324568.size = 204, n713324568.owner = 501, n713324568.group = 20, n713324568.created = 1545241636, n713324568.accessed = 1545241636, n713324568.modified = 1545241636, n713324568.owner_perm = 6, n713324568.group_perm = 4, n713324568.other_perm = 4
+MERGE (n307308392) - [:PARENT_OF] -> (n713324568)
+// group 25 13320
+MERGE (n132507014:Directory {id: 9768638}) ON CREATE SET n132507014.tag = "Directory", n132507014.name = "hooks", n132507014.parent_id = 9768634, n132507014.stem = "hooks", n132507014.extension = "", n132507014.path = "/Users/starver/code/public/cpython/.git/hooks", n132507014.size = 416, n132507014.owner = 501, n132507014.group = 20, n132507014.created = 1545241485, n132507014.accessed = 1545241485, n132507014.modified = 1545241485, n132507014.owner_perm = 7, n132507014.group_perm = 5, n132507014.other_perm = 5 ON MATCH SET n132507014.tag = "Directory", n132507014.name = "hooks", n132507014.parent_id = 9768634, n132507014.stem = "hooks", n132507014.extension = "", n132507014.path = "/Users/starver/code/public/cpython/.git/hooks", n132507014.size = 416, n132507014.owner = 501, n132507014.group = 20, n132507014.created = 1545241485, n132507014.accessed = 1545241485, n132507014.modified = 1545241485, n132507014.owner_perm = 7, n132507014.group_perm = 5, n132507014.other_perm = 5
+MERGE (n525859522:Directory {id: 9768634})
+MERGE (n525859522) - [:PARENT_OF] -> (n132507014)
+MERGE (n213906458:File {id: 9768639}) ON CREATE SET n213906458.tag = "File", n213906458.name = "commit-msg.sample", n213906458.parent_id = 9768638, n213906458.stem = "commit-msg", n213906458.extension = "sample", n213906458.path = "/Users/starver/code/public/cpython/.git/hooks/commit-msg.sample", n213906458.size = 896, n213906458.owner = 501, n213906458.group = 20, n213906458.created = 1545241485, n213906458.accessed = 1545241485, n213906458.modified = 1545241485, n213906458.owner_perm = 7, n213906458.group_perm = 5, n213906458.other_perm = 5 ON MATCH SET n213906458.tag = "File", n213906458.name = "commit-msg.sample", n213906458.parent_id = 9768638, n213906458.stem = "commit-msg", n213906458.extension = "sample", n213906458.path = "/Users/starver/code/public/cpython/.git/hooks/commit-msg.sample", n213906458.size = 896, n213906458.owner = 501, n213906458.group = 20, n213906458.created = 1545241485, n213906458.accessed = 1545241485, n213906458.modified = 1545241485, n213906458.owner_perm = 7, n213906458.group_perm = 5, n213906458.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n213906458)
+MERGE (n243339577:File {id: 9768640}) ON CREATE SET n243339577.tag = "File", n243339577.name = "pre-rebase.sample", n243339577.parent_id = 9768638, n243339577.stem = "pre-rebase", n243339577.extension = "sample", n243339577.path = "/Users/starver/code/public/cpython/.git/hooks/pre-rebase.sample", n243339577.size = 4898, n243339577.owner = 501, n243339577.group = 20, n243339577.created = 1545241485, n243339577.accessed = 1545241485, n243339577.modified = 1545241485, n243339577.owner_perm = 7, n243339577.group_perm = 5, n243339577.other_perm = 5 ON MATCH SET n243339577.tag = "File", n243339577.name = "pre-rebase.sample", n243339577.parent_id = 9768638, n243339577.stem = "pre-rebase", n243339577.extension = "sample", n243339577.path = "/Users/starver/code/public/cpython/.git/hooks/pre-rebase.sample", n243339577.size = 4898, n243339577.owner = 501, n243339577.group = 20, n243339577.created = 1545241485, n243339577.accessed = 1545241485, n243339577.modified = 1545241485, n243339577.owner_perm = 7, n243339577.group_perm = 5, n243339577.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n243339577)
+MERGE (n667210443:File {id: 9768641}) ON CREATE SET n667210443.tag = "File", n667210443.name = "pre-commit.sample", n667210443.parent_id = 9768638, n667210443.stem = "pre-commit", n667210443.extension = "sample", n667210443.path = "/Users/starver/code/public/cpython/.git/hooks/pre-commit.sample", n667210443.size = 1638, n667210443.owner = 501, n667210443.group = 20, n667210443.created = 1545241485, n667210443.accessed = 1545241485, n667210443.modified = 1545241485, n667210443.owner_perm = 7, n667210443.group_perm = 5, n667210443.other_perm = 5 ON MATCH SET n667210443.tag = "File", n667210443.name = "pre-commit.sample", n667210443.parent_id = 9768638, n667210443.stem = "pre-commit", n667210443.extension = "sample", n667210443.path = "/Users/starver/code/public/cpython/.git/hooks/pre-commit.sample", n667210443.size = 1638, n667210443.owner = 501, n667210443.group = 20, n667210443.created = 1545241485, n667210443.accessed = 1545241485, n667210443.modified = 1545241485, n667210443.owner_perm = 7, n667210443.group_perm = 5, n667210443.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n667210443)
+MERGE (n54617847:File {id: 9768642}) ON CREATE SET n54617847.tag = "File", n54617847.name = "applypatch-msg.sample", n54617847.parent_id = 9768638, n54617847.stem = "applypatch-msg", n54617847.extension = "sample", n54617847.path = "/Users/starver/code/public/cpython/.git/hooks/applypatch-msg.sample", n54617847.size = 478, n54617847.owner = 501, n54617847.group = 20, n54617847.created = 1545241485, n54617847.accessed = 1545241485, n54617847.modified = 1545241485, n54617847.owner_perm = 7, n54617847.group_perm = 5, n54617847.other_perm = 5 ON MATCH SET n54617847.tag = "File", n54617847.name = "applypatch-msg.sample", n54617847.parent_id = 9768638, n54617847.stem = "applypatch-msg", n54617847.extension = "sample", n54617847.path = "/Users/starver/code/public/cpython/.git/hooks/applypatch-msg.sample", n54617847.size = 478, n54617847.owner = 501, n54617847.group = 20, n54617847.created = 1545241485, n54617847.accessed = 1545241485, n54617847.modified = 1545241485, n54617847.owner_perm = 7, n54617847.group_perm = 5, n54617847.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n54617847)
+MERGE (n487977464:File {id: 9768643}) ON CREATE SET n487977464.tag = "File", n487977464.name = "fsmonitor-watchman.sample", n487977464.parent_id = 9768638, n487977464.stem = "fsmonitor-watchman", n487977464.extension = "sample", n487977464.path = "/Users/starver/code/public/cpython/.git/hooks/fsmonitor-watchman.sample", n487977464.size = 3327, n487977464.owner = 501, n487977464.group = 20, n487977464.created = 1545241485, n487977464.accessed = 1545241485, n487977464.modified = 1545241485, n487977464.owner_perm = 7, n487977464.group_perm = 5, n487977464.other_perm = 5 ON MATCH SET n487977464.tag = "File", n487977464.name = "fsmonitor-watchman.sample", n487977464.parent_id = 9768638, n487977464.stem = "fsmonitor-watchman", n487977464.extension = "sample", n487977464.path = "/Users/starver/code/public/cpython/.git/hooks/fsmonitor-watchman.sample", n487977464.size = 3327, n487977464.owner = 501, n487977464.group = 20, n487977464.created = 1545241485, n487977464.accessed = 1545241485, n487977464.modified = 1545241485, n487977464.owner_perm = 7, n487977464.group_perm = 5, n487977464.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n487977464)
+MERGE (n908525898:File {id: 9768644}) ON CREATE SET n908525898.tag = "File", n908525898.name = "pre-receive.sample", n908525898.parent_id = 9768638, n908525898.stem = "pre-receive", n908525898.extension = "sample", n908525898.path = "/Users/starver/code/public/cpython/.git/hooks/pre-receive.sample", n908525898.size = 544, n908525898.owner = 501, n908525898.group = 20, n908525898.created = 1545241485, n908525898.accessed = 1545241485, n908525898.modified = 1545241485, n908525898.owner_perm = 7, n908525898.group_perm = 5, n908525898.other_perm = 5 ON MATCH SET n908525898.tag = "File", n908525898.name = "pre-receive.sample", n908525898.parent_id = 9768638, n908525898.stem = "pre-receive", n908525898.extension = "sample", n908525898.path = "/Users/starver/code/public/cpython/.git/hooks/pre-receive.sample", n908525898.size = 544, n908525898.owner = 501, n908525898.group = 20, n908525898.created = 1545241485, n908525898.accessed = 1545241485, n908525898.modified = 1545241485, n908525898.owner_perm = 7, n908525898.group_perm = 5, n908525898.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n908525898)
+MERGE (n473275945:File {id: 9768645}) ON CREATE SET n473275945.tag = "File", n473275945.name = "prepare-commit-msg.sample", n473275945.parent_id = 9768638, n473275945.stem = "prepare-commit-msg", n473275945.extension = "sample", n473275945.path = "/Users/starver/code/public/cpython/.git/hooks/prepare-commit-msg.sample", n473275945.size = 1492, n473275945.owner = 501, n473275945.group = 20, n473275945.created = 1545241485, n473275945.accessed = 1545241485, n473275945.modified = 1545241485, n473275945.owner_perm = 7, n473275945.group_perm = 5, n473275945.other_perm = 5 ON MATCH SET n473275945.tag = "File", n473275945.name = "prepare-commit-msg.sample", n473275945.parent_id = 9768638, n473275945.stem = "prepare-commit-msg", n473275945.extension = "sample", n473275945.path = "/Users/starver/code/public/cpython/.git/hooks/prepare-commit-msg.sample", n473275945.size = 1492, n473275945.owner = 501, n473275945.group = 20, n473275945.created = 1545241485, n473275945.accessed = 1545241485, n473275945.modified = 1545241485, n473275945.owner_perm = 7, n473275945.group_perm = 5, n473275945.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n473275945)
+MERGE (n102012642:File {id: 9768646}) ON CREATE SET n102012642.tag = "File", n102012642.name = "post-update.sample", n102012642.parent_id = 9768638, n102012642.stem = "post-update", n102012642.extension = "sample", n102012642.path = "/Users/starver/code/public/cpython/.git/hooks/post-update.sample", n102012642.size = 189, n102012642.owner = 501, n102012642.group = 20, n102012642.created = 1545241485, n102012642.accessed = 1545241485, n102012642.modified = 1545241485, n102012642.owner_perm = 7, n102012642.group_perm = 5, n102012642.other_perm = 5 ON MATCH SET n102012642.tag = "File", n102012642.name = "post-update.sample", n102012642.parent_id = 9768638, n102012642.stem = "post-update", n102012642.extension = "sample", n102012642.path = "/Users/starver/code/public/cpython/.git/hooks/post-update.sample", n102012642.size = 189, n102012642.owner = 501, n102012642.group = 20, n102012642.created = 1545241485, n102012642.accessed = 1545241485, n102012642.modified = 1545241485, n102012642.owner_perm = 7, n102012642.group_perm = 5, n102012642.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n102012642)
+MERGE (n68433119:File {id: 9768647}) ON CREATE SET n68433119.tag = "File", n68433119.name = "pre-applypatch.sample", n68433119.parent_id = 9768638, n68433119.stem = "pre-applypatch", n68433119.extension = "sample", n68433119.path = "/Users/starver/code/public/cpython/.git/hooks/pre-applypatch.sample", n68433119.size = 424, n68433119.owner = 501, n68433119.group = 20, n68433119.created = 1545241485, n68433119.accessed = 1545241485, n68433119.modified = 1545241485, n68433119.owner_perm = 7, n68433119.group_perm = 5, n68433119.other_perm = 5 ON MATCH SET n68433119.tag = "File", n68433119.name = "pre-applypatch.sample", n68433119.parent_id = 9768638, n68433119.stem = "pre-applypatch", n68433119.extension = "sample", n68433119.path = "/Users/starver/code/public/cpython/.git/hooks/pre-applypatch.sample", n68433119.size = 424, n68433119.owner = 501, n68433119.group = 20, n68433119.created = 1545241485, n68433119.accessed = 1545241485, n68433119.modified = 1545241485, n68433119.owner_perm = 7, n68433119.group_perm = 5, n68433119.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n68433119)
+MERGE (n666019264:File {id: 9768648}) ON CREATE SET n666019264.tag = "File", n666019264.name = "pre-push.sample", n666019264.parent_id = 9768638, n666019264.stem = "pre-push", n666019264.extension = "sample", n666019264.path = "/Users/starver/code/public/cpython/.git/hooks/pre-push.sample", n666019264.size = 1348, n666019264.owner = 501, n666019264.group = 20, n666019264.created = 1545241485, n666019264.accessed = 1545241485, n666019264.modified = 1545241485, n666019264.owner_perm = 7, n666019264.group_perm = 5, n666019264.other_perm = 5 ON MATCH SET n666019264.tag = "File", n666019264.name = "pre-push.sample", n666019264.parent_id = 9768638, n666019264.stem = "pre-push", n666019264.extension = "sample", n666019264.path = "/Users/starver/code/public/cpython/.git/hooks/pre-push.sample", n666019264.size = 1348, n666019264.owner = 501, n666019264.group = 20, n666019264.created = 1545241485, n666019264.accessed = 1545241485, n666019264.modified = 1545241485, n666019264.owner_perm = 7, n666019264.group_perm = 5, n666019264.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n666019264)
+MERGE (n41957666:File {id: 9768649}) ON CREATE SET n41957666.tag = "File", n41957666.name = "update.sample", n41957666.parent_id = 9768638, n41957666.stem = "update", n41957666.extension = "sample", n41957666.path = "/Users/starver/code/public/cpython/.git/hooks/update.sample", n41957666.size = 3610, n41957666.owner = 501, n41957666.group = 20, n41957666.created = 1545241485, n41957666.accessed = 1545241485, n41957666.modified = 1545241485, n41957666.owner_perm = 7, n41957666.group_perm = 5, n41957666.other_perm = 5 ON MATCH SET n41957666.tag = "File", n41957666.name = "update.sample", n41957666.parent_id = 9768638, n41957666.stem = "update", n41957666.extension = "sample", n41957666.path = "/Users/starver/code/public/cpython/.git/hooks/update.sample", n41957666.size = 3610, n41957666.owner = 501, n41957666.group = 20, n41957666.created = 1545241485, n41957666.accessed = 1545241485, n41957666.modified = 1545241485, n41957666.owner_perm = 7, n41957666.group_perm = 5, n41957666.other_perm = 5
+MERGE (n132507014) - [:PARENT_OF] -> (n41957666)
+// group 3 1047
+MERGE (n22045818:Directory {id: 9768651}) ON CREATE SET n22045818.tag = "Directory", n22045818.name = "refs", n22045818.parent_id = 9768634, n22045818.stem = "refs", n22045818.extension = "", n22045818.path = "/Users/starver/code/public/cpython/.git/refs", n22045818.size = 160, n22045818.owner = 501, n22045818.group = 20, n22045818.created = 1545241636, n22045818.accessed = 1545673346, n22045818.modified = 1545241636, n22045818.owner_perm = 7, n22045818.group_perm = 5, n22045818.other_perm = 5 ON MATCH SET n22045818.tag = "Directory", n22045818.name = "refs", n22045818.parent_id = 9768634, n22045818.stem = "refs", n22045818.extension = "", n22045818.path = "/Users/starver/code/public/cpython/.git/refs", n22045818.size = 160, n22045818.owner = 501, n22045818.group = 20, n22045818.created = 1545241636, n22045818.accessed = 1545673346, n22045818.modified = 1545241636, n22045818.owner_perm = 7, n22045818.group_perm = 5, n22045818.other_perm = 5
+MERGE (n586622487:Directory {id: 9768634})
+MERGE (n586622487) - [:PARENT_OF] -> (n22045818)
+// group 5 2144
+MERGE (n631562716:Directory {id: 9768652}) ON CREATE SET n631562716.tag = "Directory", n631562716.name = "heads", n631562716.parent_id = 9768651, n631562716.stem = "heads", n631562716.extension = "", n631562716.path = "/Users/starver/code/public/cpython/.git/refs/heads", n631562716.size = 96, n631562716.owner = 501, n631562716.group = 20, n631562716.created = 1545241636, n631562716.accessed = 1545673346, n631562716.modified = 1545241636, n631562716.owner_perm = 7, n631562716.group_perm = 5, n631562716.other_perm = 5 ON MATCH SET n631562716.tag = "Directory", n631562716.name = "heads", n631562716.parent_id = 9768651, n631562716.stem = "heads", n631562716.extension = "", n631562716.path = "/Users/starver/code/public/cpython/.git/refs/heads", n631562716.size = 96, n631562716.owner = 501, n631562716.group = 20, n631562716.created = 1545241636, n631562716.accessed = 1545673346, n631562716.modified = 1545241636, n631562716.owner_perm = 7, n631562716.group_perm = 5, n631562716.other_perm = 5
+MERGE (n99054418:Directory {id: 9768651})
+MERGE (n99054418) - [:PARENT_OF] -> (n631562716)
+MERGE (n856014513:File {id: 9770897}) ON CREATE SET n856014513.tag = "File", n856014513.name = "master", n856014513.parent_id = 9768652, n856014513.stem = "master", n856014513.extension = "", n856014513.path = "/Users/starver/code/public/cpython/.git/refs/heads/master", n856014513.size = 41, n856014513.owner = 501, n856014513.group = 20, n856014513.created = 1545241636, n856014513.accessed = 1545241646, n856014513.modified = 1545241636, n856014513.owner_perm = 6, n856014513.group_perm = 4, n856014513.other_perm = 4 ON MATCH SET n856014513.tag = "File", n856014513.name = "master", n856014513.parent_id = 9768652, n856014513.stem = "master", n856014513.extension = "", n856014513.path = "/Users/starver/code/public/cpython/.git/refs/heads/master", n856014513.size = 41, n856014513.owner = 501, n856014513.group = 20, n856014513.created = 1545241636, n856014513.accessed = 1545241646, n856014513.modified = 1545241636, n856014513.owner_perm = 6, n856014513.group_perm = 4, n856014513.other_perm = 4
+MERGE (n631562716) - [:PARENT_OF] -> (n856014513)
+// group 3 1055
+MERGE (n86775179:Directory {id: 9768653}) ON CREATE SET n86775179.tag = "Directory", n86775179.name = "tags", n86775179.parent_id = 9768651, n86775179.stem = "tags", n86775179.extension = "", n86775179.path = "/Users/starver/code/public/cpython/.git/refs/tags", n86775179.size = 64, n86775179.owner = 501, n86775179.group = 20, n86775179.created = 1545241485, n86775179.accessed = 1545673480, n86775179.modified = 1545241485, n86775179.owner_perm = 7, n86775179.group_perm = 5, n86775179.other_perm = 5 ON MATCH SET n86775179.tag = "Directory", n86775179.name = "tags", n86775179.parent_id = 9768651, n86775179.stem = "tags", n86775179.extension = "", n86775179.path = "/Users/starver/code/public/cpython/.git/refs/tags", n86775179.size = 64, n86775179.owner = 501, n86775179.group = 20, n86775179.created = 1545241485, n86775179.accessed = 1545673480, n86775179.modified = 1545241485, n86775179.owner_perm = 7, n86775179.group_perm = 5, n86775179.other_perm = 5
+MERGE (n339886353:Directory {id: 9768651})
+MERGE (n339886353) - [:PARENT_OF] -> (n86775179)
+// group 3 1073
+MERGE (n22495544:Directory {id: 9770887}) ON CREATE SET n22495544.tag = "Directory", n22495544.name = "remotes", n22495544.parent_id = 9768651, n22495544.stem = "remotes", n22495544.extension = "", n22495544.path = "/Users/starver/code/public/cpython/.git/refs/remotes", n22495544.size = 96, n22495544.owner = 501, n22495544.group = 20, n22495544.created = 1545241636, n22495544.accessed = 1545673346, n22495544.modified = 1545241636, n22495544.owner_perm = 7, n22495544.group_perm = 5, n22495544.other_perm = 5 ON MATCH SET n22495544.tag = "Directory", n22495544.name = "remotes", n22495544.parent_id = 9768651, n22495544.stem = "remotes", n22495544.extension = "", n22495544.path = "/Users/starver/code/public/cpython/.git/refs/remotes", n22495544.size = 96, n22495544.owner = 501, n22495544.group = 20, n22495544.created = 1545241636, n22495544.accessed = 1545673346, n22495544.modified = 1545241636, n22495544.owner_perm = 7, n22495544.group_perm = 5, n22495544.other_perm = 5
+MERGE (n605335597:Directory {id: 9768651})
+MERGE (n605335597) - [:PARENT_OF] -> (n22495544)
+// group 5 2174
+MERGE (n943069397:Directory {id: 9770888}) ON CREATE SET n943069397.tag = "Directory", n943069397.name = "origin", n943069397.parent_id = 9770887, n943069397.stem = "origin", n943069397.extension = "", n943069397.path = "/Users/starver/code/public/cpython/.git/refs/remotes/origin", n943069397.size = 96, n943069397.owner = 501, n943069397.group = 20, n943069397.created = 1545241636, n943069397.accessed = 1545673346, n943069397.modified = 1545241636, n943069397.owner_perm = 7, n943069397.group_perm = 5, n943069397.other_perm = 5 ON MATCH SET n943069397.tag = "Directory", n943069397.name = "origin", n943069397.parent_id = 9770887, n943069397.stem = "origin", n943069397.extension = "", n943069397.path = "/Users/starver/code/public/cpython/.git/refs/remotes/origin", n943069397.size = 96, n943069397.owner = 501, n943069397.group = 20, n943069397.created = 1545241636, n943069397.accessed = 1545673346, n943069397.modified = 1545241636, n943069397.owner_perm = 7, n943069397.group_perm = 5, n943069397.other_perm = 5
+MERGE (n311054283:Directory {id: 9770887})
+MERGE (n311054283) - [:PARENT_OF] -> (n943069397)
+MERGE (n509744810:File {id: 9770889}) ON CREATE SET n509744810.tag = "File", n509744810.name = "HEAD", n509744810.parent_id = 9770888, n509744810.stem = "HEAD", n509744810.extension = "", n509744810.path = "/Users/starver/code/public/cpython/.git/refs/remotes/origin/HEAD", n509744810.size = 32, n509744810.owner = 501, n509744810.group = 20, n509744810.created = 1545241636, n509744810.accessed = 1545241646, n509744810.modified = 1545241636, n509744810.owner_perm = 6, n509744810.group_perm = 4, n509744810.other_perm = 4 ON MATCH SET n509744810.tag = "File", n509744810.name = "HEAD", n509744810.parent_id = 9770888, n509744810.stem = "HEAD", n509744810.extension = "", n509744810.path = "/Users/starver/code/public/cpython/.git/refs/remotes/origin/HEAD", n509744810.size = 32, n509744810.owner = 501, n509744810.group = 20, n509744810.created = 1545241636, n509744810.accessed = 1545241646, n509744810.modified = 1545241636, n509744810.owner_perm = 6, n509744810.group_perm = 4, n509744810.other_perm = 4
+MERGE (n943069397) - [:PARENT_OF] -> (n509744810)
+// group 3 1101
+MERGE (n768168461:Directory {id: 9768650}) ON CREATE SET n768168461.tag = "Directory", n768168461.name = "branches", n768168461.parent_id = 9768634, n768168461.stem = "branches", n768168461.extension = "", n768168461.path = "/Users/starver/code/public/cpython/.git/branches", n768168461.size = 64, n768168461.owner = 501, n768168461.group = 20, n768168461.created = 1545241485, n768168461.accessed = 1545673480, n768168461.modified = 1545241485, n768168461.owner_perm = 7, n768168461.group_perm = 5, n768168461.other_perm = 5 ON MATCH SET n768168461.tag = "Directory", n768168461.name = "branches", n768168461.parent_id = 9768634, n768168461.stem = "branches", n768168461.extension = "", n768168461.path = "/Users/starver/code/public/cpython/.git/branches", n768168461.size = 64, n768168461.owner = 501, n768168461.group = 20, n768168461.created = 1545241485, n768168461.accessed = 1545673480, n768168461.modified = 1545241485, n768168461.owner_perm = 7, n768168461.group_perm = 5, n768168461.other_perm = 5
+MERGE (n502395871:Directory {id: 9768634})
+MERGE (n502395871) - [:PARENT_OF] -> (n768168461)
+// group 3 1089
+MERGE (n739464974:Directory {id: 9774794}) ON CREATE SET n739464974.tag = "Directory", n739464974.name = "Modules", n739464974.parent_id = 9768633, n739464974.stem = "Modules", n739464974.extension = "", n739464974.path = "/Users/starver/code/public/cpython/Modules", n739464974.size = 4096, n739464974.owner = 501, n739464974.group = 20, n739464974.created = 1545241637, n739464974.accessed = 1545673346, n739464974.modified = 1545241637, n739464974.owner_perm = 7, n739464974.group_perm = 5, n739464974.other_perm = 5 ON MATCH SET n739464974.tag = "Directory", n739464974.name = "Modules", n739464974.parent_id = 9768633, n739464974.stem = "Modules", n739464974.extension = "", n739464974.path = "/Users/starver/code/public/cpython/Modules", n739464974.size = 4096, n739464974.owner = 501, n739464974.group = 20, n739464974.created = 1545241637, n739464974.accessed = 1545673346, n739464974.modified = 1545241637, n739464974.owner_perm = 7, n739464974.group_perm = 5, n739464974.other_perm = 5
+MERGE (n573051455:Directory {id: 9768633})
+MERGE (n573051455) - [:PARENT_OF] -> (n739464974)
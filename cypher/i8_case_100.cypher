@@ -0,0 +1,55 @@
+USING PERIODIC COMMIT ~COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_case_100_dir.csv" AS row
+CREATE (:Directory {
+    id: toInteger(row.id),
+    tag: row.tag,
+    name: row.name,
+    parent_id: toInteger(row.parent_id),
+    stem: row.stem,
+    extension: row.extension,
+    path: row.path,
+    size: toInteger(row.size),
+    owner: toInteger(row.owner),
+    group: toInteger(row.group),
+    created: toInteger(row.created),
+    accessed: toInteger(row.accessed),
+    modified: toInteger(row.modified),
+    owner_perm: toInteger(row.owner_perm),
+    group_perm: toInteger(row.group_perm),
+    other_perm: toInteger(row.other_perm),
+    tokens: row.tokens
+});
+
+USING PERIODIC COMMIT ~COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_case_100_file.csv" AS row
+CREATE (:File {
+    id: toInteger(row.id),
+    tag: row.tag,
+    name: row.name,
+    parent_id: toInteger(row.parent_id),
+    stem: row.stem,
+    extension: row.extension,
+    path: row.path,
+    size: toInteger(row.size),
+    owner: toInteger(row.owner),
+    group: toInteger(row.group),
+    created: toInteger(row.created),
+    accessed: toInteger(row.accessed),
+    modified: toInteger(row.modified),
+    owner_perm: toInteger(row.owner_perm),
+    group_perm: toInteger(row.group_perm),
+    other_perm: toInteger(row.other_perm),
+    tokens: row.tokens
+});
+
+USING PERIODIC COMMIT ~COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_case_100_dir_rel.csv" AS row
+MATCH (p:Directory {id: toInteger(row.parent_id)})
+MATCH (c:Directory {id: toInteger(row.id)})
+CREATE (p)-[:PARENT_OF]->(c);
+
+USING PERIODIC COMMIT ~COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_case_100_file_rel.csv" AS row
+MATCH (p:Directory {id: toInteger(row.parent_id)})
+MATCH (c:File {id: toInteger(row.id)})
+CREATE (p)-[:PARENT_OF]->(c);
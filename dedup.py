@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Find files with duplicate content without reading every file
+
+Stages - each only looks at what survived the previous one:
+1. bucket files by Node.size (collected by new_node) and drop sizes that occur once - no I/O at all
+2. hash the first block of each candidate in a process pool, drop unique (size, head hash) pairs
+3. fully hash the survivors in the pool - files no bigger than a block were already fully hashed in stage 2
+
+Confirmed duplicates become content hash nodes, written in UNWIND batches:
+    (f:File) - [:HAS_CONTENT] -> (:Content {id: <blake2b>, size: 1234})
+A Content node per group keeps edges linear in the group size - pairwise SAME_CONTENT edges would be quadratic.
+
+Hardlinks are one file under several paths - and share a node id, which is the inode. Files are told apart by
+(st_dev, st_ino), read while hashing, and a group only counts files that are distinct by that key.
+
+generator.py --dedup runs stages 1-3 right after the scan and pickles the groups next to the case.
+"""
+import argparse
+import hashlib
+import os
+import pickle
+from argparse import RawDescriptionHelpFormatter
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from node import Node, TreeNode
+
+BLOCK = 64 * 2**10
+
+# content hash -> (size, [file ids])
+Duplicates = Dict[str, Tuple[int, List[int]]]
+
+WRITE_CONTENT = """
+    UNWIND $rows AS row
+    MERGE (c:Content {id: row[0]})
+    ON CREATE SET c.size = row[1]
+    WITH c, row
+    UNWIND row[2] AS fid
+    MATCH (f:File {id: fid})
+    MERGE (f) - [:HAS_CONTENT] -> (c)"""
+
+
+def hash_file(item: Tuple[int, str, Optional[int]]) -> Tuple[int, Optional[Tuple[int, int]], Optional[str]]:
+    """
+    Hash a file, or its first nbytes - runs in a pool worker
+    :param item: (key, path, nbytes or None for the whole file)
+    :return: (key, (st_dev, st_ino), hex digest) - file and digest are None if the file could not be read
+    """
+    key, path, nbytes = item
+    h = hashlib.blake2b(digest_size=20)
+    try:
+        with open(path, "rb") as f:
+            stats = os.fstat(f.fileno())
+            if nbytes:
+                h.update(f.read(nbytes))
+            else:
+                for block in iter(lambda: f.read(BLOCK * 16), b""):
+                    h.update(block)
+    except OSError:
+        return key, None, None
+    return key, (stats.st_dev, stats.st_ino), h.hexdigest()
+
+
+def size_buckets(root: TreeNode) -> Dict[int, List[Node]]:
+    """ Stage 1: files grouped by size, only sizes shared by more than one file. Empty files are not duplicates """
+    buckets = defaultdict(list)
+    for item in root.iter():
+        if not item.is_dir() and item.size > 0:
+            buckets[item.size].append(item)
+    return {size: nodes for size, nodes in buckets.items() if len(nodes) > 1}
+
+
+def regroup(pool: ProcessPoolExecutor, groups: Iterable[List[Node]],
+            nbytes: Optional[int]) -> List[Tuple[str, List[Node]]]:
+    """
+    Hash every node in groups and split each group by digest, keeping only splits with more than one file.
+    Hardlinks to one file are kept once - node ids can't tell them apart, so nodes are keyed by position
+    """
+    nodes = []
+    items = []
+    for i, group in enumerate(groups):
+        for n in group:
+            items.append((len(nodes), str(n.path), nbytes))
+            nodes.append((i, n))
+    split = defaultdict(dict)  # (group, digest) -> {(st_dev, st_ino): node}
+    for key, file, digest in pool.map(hash_file, items, chunksize=64):
+        if digest:
+            i, n = nodes[key]
+            split[i, digest].setdefault(file, n)
+    return [(digest, list(files.values())) for (_, digest), files in split.items() if len(files) > 1]
+
+
+def find_duplicates(root: TreeNode, workers: Optional[int]=None) -> Duplicates:
+    buckets = size_buckets(root)
+    with ProcessPoolExecutor(workers) as pool:
+        # Stage 2: head hashes - for files that fit in one block, this is already the full content hash
+        candidates = regroup(pool, buckets.values(), BLOCK)
+        confirmed = [(d, g) for d, g in candidates if g[0].size <= BLOCK]
+        # Stage 3: full hashes of the rest
+        confirmed += regroup(pool, [g for _, g in candidates if g[0].size > BLOCK], None)
+    return {digest: (group[0].size, [n.id for n in group]) for digest, group in confirmed}
+
+
+def write(trinity, duplicates: Duplicates, batch_size: int=1000) -> None:
+    """ Write Content nodes and HAS_CONTENT edges in UNWIND batches of duplicate groups - to trinity's partition """
+    rows = [[digest, size, ids] for digest, (size, ids) in duplicates.items()]
+    query = trinity.scope(WRITE_CONTENT)
+    with trinity.session() as session:
+        for i in range(0, len(rows), batch_size):
+            session.run(query, {"rows": rows[i:i + batch_size]}).consume()
+    trinity.wrote()
+
+
+def duplicates_file(case: str) -> str:
+    return f"./pickles/{case}_dups.pickle"
+
+
+def print_stats(duplicates: Duplicates) -> None:
+    files = sum(len(ids) for _, ids in duplicates.values())
+    wasted = sum(size * (len(ids) - 1) for size, ids in duplicates.values())
+    print(f"{len(duplicates)} duplicate groups, {files} files, {wasted / 2**20:.1f} MiB redundant")
+
+
+def help() -> str:
+    return """Find duplicate files and write them to the graph as Content nodes
+
+Write the duplicates found by ./generator.py --dedup -n case_home -r ~ (nodes must be ingested):
+  ./dedup.py -c case_home
+
+Scan a local tree and write its duplicates:
+  ./dedup.py -r ~/shares
+
+Scan a root ingested as partition home (./generator.py -r ~ -p home) - ids are only unique within a partition:
+  ./dedup.py -r ~ -p home
+"""
+
+
+def main():
+    # generator imports us for --dedup - and scanning should not need the driver
+    from generator import collect_data
+    from trinity import Trinity
+
+    parser = argparse.ArgumentParser(description=help(), formatter_class=RawDescriptionHelpFormatter)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('-c', '--case', help='write the duplicates pickled for this case by generator.py --dedup')
+    group.add_argument('-r', '--root', help='find duplicates under this directory')
+    parser.add_argument('-w', '--workers', type=int, help='hashing processes, default one per cpu')
+    parser.add_argument('-p', '--partition', help='link duplicates to the files of this partition')
+    args = parser.parse_args()
+
+    start = timer()
+    if args.case:
+        with open(duplicates_file(args.case), "rb") as f:
+            duplicates = pickle.load(f)
+    else:
+        duplicates = find_duplicates(collect_data(Path(args.root)), args.workers)
+    print_stats(duplicates)
+    write(Trinity(partition=args.partition), duplicates)
+    print(f"completed in {timer() - start:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
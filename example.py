@@ -4,12 +4,15 @@ Generate example graphs displaying use cases
 """
 import argparse
 from argparse import RawDescriptionHelpFormatter
+from collections import defaultdict
 from pprint import pprint, pformat
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from neo4j import BoltStatementResult
 
 from generator import cypher_file
+from queries import (CATALOG, PERSPECTIVE_READS, PERSPECTIVE_WRITES, PERSPECTIVES, PII_EDGES, PII_HIERARCHY,
+                     PII_NAME_RULES)
 from trinity import Trinity
 
 
@@ -42,28 +45,42 @@ def class_rules():
         MERGE (f) - [:IS_CLASSIFIED] -> (c);"""
     # stretching on value - cpython doesn't offer meaningful uses of this
     # Note: we could use this for subtree identification on the path attribute
-    regex = """
-        MERGE (c:Classification {id: 'py', name: 'py', rule: 'n.stem =~ .*[Pp]y.*'})
-        WITH c
-        MATCH (n)
-        WHERE n.stem =~ '.*[Pp]y.*' AND (n:Directory OR n:File)
-        MERGE (n) - [:IS_CLASSIFIED] -> (c);"""
-
     # TODO: can't use: with Trinity().session as session:
     #       cause: neobolt.exceptions.ServiceUnavailable: Connection pool closed
     t = Trinity()
+    # name_match() uses the full-text name index when the pattern has a 3+ character literal - '.*[Pp]y.*'
+    # only has 'py', so this one scans
+    match, params = t.name_match('.*[Pp]y.*', field='stem')
+    regex = f"""
+        MERGE (c:Classification {{id: 'py', name: 'py', rule: 'n.stem =~ .*[Pp]y.*'}})
+        WITH c
+        {match}
+        MERGE (n) - [:IS_CLASSIFIED] -> (c);"""
+
     with t.session() as session:
-        for stmt in [code, id, size, regex]:
+        for stmt in [code, id, size]:
             session.run(stmt)
-            
-        query = "MATCH (n) - [:IS_CLASSIFIED] -> (:Classification {id: 'code'}) RETURN n"
-        print("===> See graph with: MATCH (n) RETURN n")
-        print("===> Fetching all nodes classified 'code' using query:")
-        print(f"===>     {query}")
-        # This is a BoltStatementResult
-        result = session.run(query)
-        for item in result.value():
-            print(f"{','.join(item.labels)}\t{item['path']}")
+        session.run(regex, params)
+
+    # Stream just the fields we print - not whole Node records
+    query = "MATCH (n) - [:IS_CLASSIFIED] -> (:Classification {id: 'code'}) RETURN labels(n), n.path"
+    print("===> See graph with: MATCH (n) RETURN n")
+    print("===> Fetching all nodes classified 'code' using query:")
+    print(f"===>     {query}")
+    for labels, path in t.stream(query):
+        print(f"{','.join(labels)}\t{path}")
+
+
+def hierarchy(edges: List[Tuple[str, str]], root: str) -> Dict:
+    """ Nest (parent, child) pairs into {root: {child: {grandchild: {}}}} - to make the hierarchy clear """
+    children = defaultdict(list)
+    for parent, child in edges:
+        children[parent].append(child)
+
+    def nest(name: str) -> Dict:
+        return {child: nest(child) for child in children[name]}
+
+    return {root: nest(root)}
 
 
 def class_pii(show_help: bool=True) -> None:
@@ -73,68 +90,15 @@ def class_pii(show_help: bool=True) -> None:
     with t.session() as session:
         with open(cypher_file('pii', 'i1')) as f:
             session.run(f.read())
+    t.wrote()
 
-    # Show classifications as a dict to make the hierarchy clear (instead of cypher statements)
-    hier = {
-        'pii': {
-            'pii_sensitive': {
-                'pifi': {
-                    'credit_card': {},
-                    'bank_account': {},
-                },
-                'ssn': {},
-                'passport': {},
-            },
-            'pii_non_sensitive': {
-                'phone': {},
-                'address': {},
-            },
-        }
-    }
-    def create_node(name: str) -> str:
-        # CREATE (pii:Classification {name: 'pii'})
-        return f"CREATE ({name}:Classification {{id: '{name}', name: '{name}'}})"
-    def create_rels(parent: str, node: str) -> str:
-        # CREATE (pii)  - [:INCLUDES] -> (pii_s) - [:IS_CLASSIFIED] -> (pii)
-        return f"CREATE ({parent}) - [:INCLUDES] -> ({node}) - [:IS_CLASSIFIED] -> ({parent})"
-    def gen_classes(parent, values: Dict) -> List[str]:
-        """
-        I get a parent variable name and a dict of children:
-        - create classifications for each child
-        - create links to the parent
-        - recurse on all child value dicts
-        :param parent: the key of the dict values - the parent of the keys in values
-        :param values: a dict of parent's children and their children
-        """
-        stmts = []
-        for child in values:
-            stmts.append(create_node(child))
-            stmts.append(create_rels(parent, child))
-            stmts.extend(gen_classes(child, values[child]))
-        return stmts
-    
-    classifications = [create_node('pii')]
-    classifications.extend(gen_classes('pii', hier['pii']))
-    # matches must be done before creates
-    stmts = """
-    MATCH (f_addr:File) WHERE f_addr.name =~ '.*address.*'
-    MATCH (f_cc:File) WHERE f_cc.name =~ 'credit.*card.*'
-    MATCH (f_pp:File) WHERE f_pp.name =~ '.*passport.*'
-    MATCH (f_phone:File) WHERE f_phone.name =~ '.*phone.*'
-    MATCH (f_ssn:File) WHERE f_ssn.name =~ '.*ssn.*'
-    """
-    # define classifications
-    stmts += '\n'.join(classifications)
-    # classify the data files
-    stmts += """
-    MERGE (f_addr) - [:IS_CLASSIFIED] -> (address)
-    MERGE (f_cc) - [:IS_CLASSIFIED] -> (credit_card)
-    MERGE (f_pp) - [:IS_CLASSIFIED] -> (passport)
-    MERGE (f_phone) - [:IS_CLASSIFIED] -> (phone)
-    MERGE (f_ssn) - [:IS_CLASSIFIED] -> (ssn)
-    """
-    with t.session() as session:
-        session.run(stmts)
+    # The hierarchy is a parameter of a registered query - queries.PII_EDGES - so changing it changes no query
+    # text, and no plan. The filename rules - queries.PII_NAME_RULES - go through name_match(), which uses the
+    # name index for rules with a 3+ character literal once it exists
+    Trinity.register([PII_HIERARCHY], write=True)
+    t.warm([PII_HIERARCHY.name])
+    t.execute(PII_HIERARCHY.name)
+    t.classify_names(PII_NAME_RULES)
 
     help = """
     Queries:
@@ -151,32 +115,24 @@ def class_pii(show_help: bool=True) -> None:
     """
     if show_help:
         print("    Created this classification hierarchy:")
-        print("   ", pformat(hier).replace("\n", "\n    "))
+        print("   ", pformat(hierarchy(PII_EDGES, 'pii')).replace("\n", "\n    "))
         print(help)
 
 
 def perspective_pii():
     """ Add a perspective to the class_pii example """
     class_pii()
-    perspectives = """
-    CREATE (owner:Perspective {id: 'tom', name: 'tom', descr: 'owner'})
-    CREATE (group:Perspective {id: 'sales', name: 'sales', descr: 'group'})
-    CREATE (other:Perspective {id: 'internet', name: 'internet', descr: 'other'})
-    """
-    edge = """
-    MATCH (p:Perspective)
-    WHERE p.descr = '{perm}'
-    MATCH (n)
-    WHERE (n:File OR n:Directory)
-        AND n.{perm}_perm >= {bits}
-    MERGE (p) - [:{label}]  -> (n)
-    """
     t = Trinity()
-    with t.session() as session:
-        session.run(perspectives)
-        for perm in ['other', 'group', 'owner']:
-            session.run(edge.format(perm=perm, label='CAN_READ', bits=4))
-            session.run(edge.format(perm=perm, label='CAN_WRITE', bits=6))
+    Trinity.register([PERSPECTIVES, PERSPECTIVE_READS, PERSPECTIVE_WRITES], write=True)
+    Trinity.register(CATALOG)
+    t.warm([PERSPECTIVES.name, PERSPECTIVE_READS.name, PERSPECTIVE_WRITES.name, "perspective_pii"])
+    for q in (PERSPECTIVES, PERSPECTIVE_READS, PERSPECTIVE_WRITES):
+        t.execute(q.name)
+
+    # the hot read path: the same plan for every perspective
+    for perspective in ('internet', 'sales', 'tom'):
+        paths = t.execute("perspective_pii", {"perspective": perspective})
+        print(f"    {perspective} can read {len(paths)} PII files")
 
     # TODO: standard security queries
     print("""
@@ -184,6 +140,9 @@ def perspective_pii():
     You can see the whole graph with:
         MATCH (n) RETURN n
     """)
+    print("    Query\tRuns\tTotal ms\tMax ms\tCache hits")
+    for name, (runs, total, slowest, hits) in Trinity.timings().items():
+        print(f"    {name}\t{runs}\t{total * 1000:.1f}\t{slowest * 1000:.1f}\t{hits}")
 
     
 # TODO: classify some data, create a perspecitve tied to what they can read, add_stat on security questions
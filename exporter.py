@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Export the graph back to the dataset format - fast enough to round-trip millions of nodes
+
+Strategy:
+- find the id (inode) bounds of each label, split them into many more ranges than workers - inodes are not
+  evenly spread, so small ranges keep every worker busy to the end
+- each worker pulls a range on its own session with Trinity.stream() - an index seek on the id constraint,
+  results streamed rather than materialized
+- each row carries the node's properties and the id of the Directory that is its PARENT_OF, so edges come
+  back with the nodes in the same pass
+
+Output:
+- pickle:  a TreeNode, rebuilt from the PARENT_OF edges - the same format as generator.py, so every ingest
+           script can regenerate from an export
+- columns: a pickled {"nodes": {field: [values]}, "edges": [(parent id, child id)]} - no tree to rebuild,
+           loads straight into numpy or pandas
+
+--diff compares the export against a case pickle: missing, extra and changed nodes, and edges that differ.
+
+NOTES:
+- the root is the one node without a PARENT_OF - a graph holding several roots exports the first one found;
+  give -p to export one partition
+"""
+import argparse
+import pickle
+from argparse import RawDescriptionHelpFormatter
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Dict, Iterator, List, Tuple
+
+from generator import pickle_file
+from node import Node, TreeNode
+from trinity import Trinity
+
+LABELS = ("Directory", "File")
+
+# noinspection SqlNoDataSourceInspection
+BOUNDS = "MATCH (n:{label}) RETURN min(n.id), max(n.id)"
+
+# noinspection SqlNoDataSourceInspection
+RANGE = """
+    MATCH (n:{label})
+    WHERE n.id >= $lo AND n.id < $hi
+    OPTIONAL MATCH (p:Directory) - [:PARENT_OF] -> (n)
+    RETURN {fields}, p.id"""
+
+Edge = Tuple[int, int]  # (parent id, child id)
+
+
+def id_ranges(lo: int, hi: int, parts: int) -> List[Tuple[int, int]]:
+    """ Split [lo, hi] into up to parts half open ranges """
+    step = max(1, (hi - lo + parts) // parts)
+    return [(x, min(x + step, hi + 1)) for x in range(lo, hi + 1, step)]
+
+
+def export_range(trinity: Trinity, label: str, lo: int, hi: int,
+                 fetch_size: int) -> Tuple[List[Node], List[Edge]]:
+    """ Pull one id range of one label - runs in a worker thread, on its own session """
+    query = trinity.scope(RANGE.format(label=label, fields=", ".join(f"n.{f}" for f in Node._fields)))
+    nodes = []
+    edges = []
+    for row in trinity.stream(query, {"lo": lo, "hi": hi}, fetch_size):
+        node = Node(*row[:-1])
+        nodes.append(node._replace(path=Path(node.path)) if node.path is not None else node)
+        if row[-1] is not None:
+            edges.append((row[-1], node.id))
+    return nodes, edges
+
+
+def export(trinity: Trinity, workers: int=8, ranges_per_worker: int=8,
+           fetch_size: int=5000) -> Tuple[Dict[int, Node], List[Edge]]:
+    """ Pull every Directory and File, and their PARENT_OF edges, range by range in parallel """
+    jobs = []
+    for label in LABELS:
+        lo, hi = trinity.query(trinity.scope(BOUNDS.format(label=label)))[0]
+        if lo is not None:
+            jobs += [(label, a, b) for a, b in id_ranges(lo, hi, workers * ranges_per_worker)]
+
+    nodes = {}
+    edges = []
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [pool.submit(export_range, trinity, label, a, b, fetch_size) for label, a, b in jobs]
+        for future in futures:
+            range_nodes, range_edges = future.result()
+            nodes.update((n.id, n) for n in range_nodes)
+            edges += range_edges
+    return nodes, edges
+
+
+def build_tree(nodes: Dict[int, Node], edges: List[Edge]) -> TreeNode:
+    """ Rebuild the TreeNode hierarchy from PARENT_OF edges """
+    children = defaultdict(list)
+    for parent, child in edges:
+        children[parent].append(child)
+    has_parent = {child for _, child in edges}
+    roots = [n for n in nodes.values() if n.is_dir() and n.id not in has_parent]
+    if not roots:
+        raise ValueError("No root directory - every Directory has a parent")
+    if len(roots) > 1:
+        print(f"exporter: {len(roots)} roots found - exporting {roots[0].path}")
+
+    def tree(me: Node) -> TreeNode:
+        kids = sorted((nodes[i] for i in children[me.id] if i in nodes), key=lambda n: n.name)
+        return TreeNode(me, [n for n in kids if not n.is_dir()], [tree(n) for n in kids if n.is_dir()])
+
+    return tree(roots[0])
+
+
+def columns(nodes: Dict[int, Node], edges: List[Edge]) -> Dict:
+    return {
+        "nodes": {f: [getattr(n, f) for n in nodes.values()] for f in Node._fields},
+        "edges": edges,
+    }
+
+
+def tree_edges(root: TreeNode) -> Iterator[Edge]:
+    yield from ((root.me.id, f.id) for f in root.files)
+    for d in root.dirs:
+        yield root.me.id, d.me.id
+        yield from tree_edges(d)
+
+
+def diff(expected: TreeNode, nodes: Dict[int, Node], edges: List[Edge], show: int=10) -> bool:
+    """ Print how an export differs from a dataset, return True if they match """
+    want = {n.id: n for n in expected.iter()}
+    missing = sorted(want.keys() - nodes.keys())
+    extra = sorted(nodes.keys() - want.keys())
+    changed = defaultdict(list)  # field -> ids
+    for i in want.keys() & nodes.keys():
+        for f in Node._fields:
+            a, b = getattr(want[i], f), getattr(nodes[i], f)
+            if a != b and str(a) != str(b):
+                changed[f].append(i)
+    want_edges = set(tree_edges(expected))
+    missing_edges = want_edges - set(edges)
+    extra_edges = set(edges) - want_edges
+
+    print(f"expected {len(want)} nodes, {len(want_edges)} edges - exported {len(nodes)} nodes, {len(edges)} edges")
+    for title, items in (("missing nodes", missing), ("extra nodes", extra),
+                         ("missing edges", sorted(missing_edges)), ("extra edges", sorted(extra_edges))):
+        if items:
+            print(f"  {title}: {len(items)} e.g. {items[:show]}")
+    for f, ids in sorted(changed.items()):
+        print(f"  changed {f}: {len(ids)} e.g. {sorted(ids)[:show]}")
+    return not (missing or extra or changed or missing_edges or extra_edges)
+
+
+def help() -> str:
+    return """Export the graph to the dataset format
+
+Export to a pickle that every ingest script can read - e.g. ./ingest_2.py after adding it to CASE_INFO:
+  ./exporter.py -o ./pickles/snapshot.pickle
+
+Export just the root ingested as partition home (./generator.py -r ~ -p home):
+  ./exporter.py -p home -o ./pickles/home.pickle
+
+Export columns with 16 workers:
+  ./exporter.py -f columns -w 16 -o ./exports/snapshot_columns.pickle
+
+Verify an ingest round-trips (after ./bench.py -s2 -c 5000):
+  ./exporter.py --diff case_5000
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=help(), formatter_class=RawDescriptionHelpFormatter)
+    parser.add_argument('-o', '--output', help='write the export to this file')
+    parser.add_argument('-f', '--format', choices=('pickle', 'columns'), default='pickle',
+                        help='a TreeNode pickle, or pickled columns and edges')
+    parser.add_argument('-w', '--workers', type=int, default=8, help='concurrent sessions')
+    parser.add_argument('--fetch-size', type=int, default=5000, help='records per server round trip')
+    parser.add_argument('--diff', metavar='CASE', help='compare the export with this case pickle')
+    parser.add_argument('-p', '--partition', help='export only this partition')
+    args = parser.parse_args()
+    if not args.output and not args.diff:
+        parser.error("nothing to do - give -o and/or --diff")
+
+    start = timer()
+    nodes, edges = export(Trinity(partition=args.partition), args.workers, fetch_size=args.fetch_size)
+    print(f"exported {len(nodes)} nodes, {len(edges)} edges in {timer() - start:.2f} seconds")
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        data = build_tree(nodes, edges) if "pickle" == args.format else columns(nodes, edges)
+        with open(args.output, "wb") as f:
+            pickle.dump(data, f)
+        print(f"wrote {args.output}")
+
+    if args.diff:
+        with open(pickle_file(args.diff), "rb") as f:
+            expected = pickle.load(f)
+        if not diff(expected, nodes, edges):
+            exit(1)
+
+
+if __name__ == "__main__":
+    main()
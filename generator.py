@@ -4,13 +4,19 @@ I create datasets of TreeNode hierarchies and pickle them for later use
 
 """
 import argparse
+import gzip
 import pickle
 from argparse import RawDescriptionHelpFormatter
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set
 from timeit import default_timer as timer
 
-from node import Node, TreeNode, new_node
+import dedup
+import profiler
+from node import WIDE_CHUNK, Node, TreeNode, new_node
 
 # The directory I scan. It has many things pruned for this purpose - hence the pickles, so data is reproducible
 ROOT = "/Users/starver/code/public/cpython"
@@ -33,11 +39,86 @@ CASE_INFO = {
     'case_3000': {'nodes': 2931, 'dirs': 166, 'files': 2765},
     'case_4000': {'nodes': 3957, 'dirs': 216, 'files': 3741},
     'case_5000': {'nodes': 5015, 'dirs': 289, 'files': 4726},
+    # synthetic - ./generator.py --wide
+    'case_wide': {'nodes': 25016, 'dirs': 290, 'files': 24726},
     # manually generated
     'case_2mil': {'nodes': 1914832, 'dirs': 538779, 'files': 1376053},
 }
 
 
+# Artifact compression codecs and the suffix each adds to a file name.
+# NOTE: LOAD CSV only understands gzip (and zip), so csv artifacts are always gzip when compressed
+COMPRESSION_SUFFIXES = {"gz": ".gz", "zst": ".zst"}
+
+
+def open_artifact(fn: str, mode: str="rt"):
+    """
+    Open a cypher/csv artifact for streaming read or write - the codec is chosen by file suffix
+    :param fn: file name, possibly ending in a COMPRESSION_SUFFIXES suffix
+    :param mode: a text or binary open() mode
+    :return: a file object - use it as a context manager
+    """
+    if fn.endswith(".gz"):
+        # level 6 is much faster to write than the default 9 and barely larger
+        return gzip.open(fn, mode, compresslevel=6)
+    if fn.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError(f"Reading or writing {fn} requires zstandard: pip install zstandard")
+        return zstandard.open(fn, mode)
+    return open(fn, mode)
+
+
+# Generators mark each directory's statements with a header line: // group <lines> <chars> [alone]
+# so bench.py can pack whole directories into batches instead of cutting every N lines.
+# alone: every line is a complete statement that must run in a run() of its own - e.g. an UNWIND, whose rows
+# would repeat any clause packed after it
+GROUP_HEADER = "// group "
+ALONE = "alone"
+
+# noinspection SqlNoDataSourceInspection
+WIDE_EDGES = "MATCH (p:Directory {{id: {parent}}}) UNWIND {ids} AS cid MATCH (c:{label} {{id: cid}}) {verb} (p) - [:PARENT_OF] -> (c)"
+
+
+def print_group(lines: List[str], alone: bool=False) -> None:
+    """ Print one directory group's statements, preceded by its header """
+    print(f"{GROUP_HEADER}{len(lines)} {sum(len(x) + 1 for x in lines)}" + (f" {ALONE}" if alone else ""))
+    for line in lines:
+        print(line)
+
+
+def wide_edges(parent_id: int, child_ids: List[int], verb: str="CREATE", label: str="File",
+               chunk: int=WIDE_CHUNK) -> List[str]:
+    """
+    A supernode's PARENT_OF edges as self-contained statements of chunk children each - the parent and children
+    are looked up by id, so they can run in any batch after the nodes exist. Print them with alone=True
+    """
+    return [WIDE_EDGES.format(parent=parent_id, ids=f"[{', '.join(str(x) for x in child_ids[i:i + chunk])}]",
+                              label=label, verb=verb)
+            for i in range(0, len(child_ids), chunk)]
+
+
+def artifact_file(fn: str, must_exist: bool=True, compression: Optional[str]=None) -> str:
+    """
+    Resolve an uncompressed artifact name to the file we should actually use
+    :param fn: the uncompressed file name
+    :param must_exist: True if reading - picks the newest existing variant, False if writing
+    :param compression: a COMPRESSION_SUFFIXES key when writing, None for plain text
+    :return: a file name
+    """
+    if not must_exist:
+        if compression and compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression: {compression}")
+        return fn + COMPRESSION_SUFFIXES.get(compression, "")
+    variants = [fn + suffix for suffix in (".zst", ".gz", "") if Path(fn + suffix).exists()]
+    if not variants:
+        raise ValueError(f"file does not exist: {fn}")
+    # Regenerating with another compression leaves the old variant behind - the newest is current. On a tie prefer
+    # the compressed variants - less to read for the same statements (max() keeps the first)
+    return max(variants, key=lambda x: Path(x).stat().st_mtime)
+
+
 def pickle_file(case: str, must_exist: bool=True) -> str:
     """
     Generate a path to a valid pickle file
@@ -53,26 +134,47 @@ def pickle_file(case: str, must_exist: bool=True) -> str:
     return fn
 
 
-def cypher_file(case: str, ingest_key: str, must_exist: bool=True) -> str:
+def cypher_file(case: str, ingest_key: str, must_exist: bool=True, compression: Optional[str]=None) -> str:
     """
     Generate a path to a valid cypher file
     :param ingest_key: an ingest key, like i1, i2, i3
     :param case: a use case - a key from CASE_INFO
     :param must_exist: True if reading, False if writing
-    :return: a cypher file name
+    :param compression: when writing, a COMPRESSION_SUFFIXES key or None for plain text
+    :return: a cypher file name - open it with open_artifact()
     """
     if must_exist and case not in CASE_INFO:
         raise ValueError(f"Unknown case: {case}")
-    fn = f"./cypher/{ingest_key}_{case}.cypher"
-    if must_exist and not Path(fn).exists():
-        raise ValueError(f"Cypher file does not exist: {fn}")
-    return fn
+    try:
+        return artifact_file(f"./cypher/{ingest_key}_{case}.cypher", must_exist, compression)
+    except ValueError as e:
+        raise ValueError(f"Cypher {e}")
+
+
+def records_file(case: str, ingest_key: str, must_exist: bool=True, compression: Optional[str]=None) -> str:
+    """
+    Generate a path to a json lines file of partial records, as fed to merge_buffer.MergeBuffer
+    :param ingest_key: an ingest key, like i4
+    :param case: a use case - a key from CASE_INFO
+    :param must_exist: True if reading, False if writing
+    :param compression: when writing, a COMPRESSION_SUFFIXES key or None for plain text
+    :return: a jsonl file name - open it with open_artifact()
+    """
+    if must_exist and case not in CASE_INFO:
+        raise ValueError(f"Unknown case: {case}")
+    try:
+        return artifact_file(f"./cypher/{ingest_key}_{case}.jsonl", must_exist, compression)
+    except ValueError as e:
+        raise ValueError(f"Records {e}")
 
 
 # my home dir stats - not included in repo for privacy and size
 # ./generator.py -r /Users/starver -n case_2mil
 # 'case_2mil': {'nodes': 1912541, 'dirs': 538632, 'files': 1373909},
 
+# case_wide adds a directory this wide to case_5000
+WIDE_CASE_FILES = 20_000
+
 # Conditionally exclude directories from target to hit goal node counts
 CASE_DIR_EXCLUSIONS = dict(
     case_100={'Doc', 'Include', 'Lib', 'Mac', 'Misc', 'Modules', 'Objects', 'PC', 'PCbuild', 'Parser', 'Python',
@@ -94,23 +196,73 @@ CASE_DIR_EXCLUSIONS = dict(
 )
 
 
-def collect_data_recurse(p: Path, tree_node: TreeNode) -> None:
+def collect_data_recurse(p: Path, tree_node: TreeNode, excluded: Set[str]) -> None:
     """ Recurse dirs starting at tree_node, collecting information """
     for item in p.iterdir():
         child = tree_node.add(item)
-        if item.is_dir() and item.name not in EXCLUDED_DIRS:
-            collect_data_recurse(item, child)
+        if item.is_dir() and item.name not in excluded:
+            collect_data_recurse(item, child, excluded)
 
 
-def collect_data(p: Path) -> TreeNode:
-    """ Generate hierarchical file data """
+def collect_data(p: Path, excluded: Optional[Set[str]]=None) -> TreeNode:
+    """
+    Generate hierarchical file data
+    :param p: the root directory
+    :param excluded: directory names to keep, but not descend into - EXCLUDED_DIRS by default
+    """
     result = TreeNode(me=new_node(p), files=[], dirs=[])
-    collect_data_recurse(p, result)
+    collect_data_recurse(p, result, EXCLUDED_DIRS if excluded is None else excluded)
     return result
 
 
-def print_stats(root: TreeNode, case: str) -> None:
-    """ Print case stats for CASE_INFO - for validating graph creation """
+def prune(root: TreeNode, excluded: Set[str]) -> TreeNode:
+    """
+    The tree collect_data would have scanned with these exclusions - an excluded directory keeps its own node but
+    loses its contents. Nodes are shared with root, not copied
+    """
+    return TreeNode(root.me, root.files,
+                    [TreeNode(d.me, [], []) if d.me.name in excluded else prune(d, excluded) for d in root.dirs])
+
+
+def exclusion_sizes(root: TreeNode) -> Counter:
+    """ How many nodes excluding each directory name would remove: the nodes below every directory of that name """
+    sizes = Counter()
+
+    def walk(t: TreeNode, above: frozenset) -> None:
+        sizes.update({name: len(t.files) + len(t.dirs) for name in above})
+        for d in t.dirs:
+            walk(d, above | {d.me.name})
+
+    # a name repeated along a path only counts once - above is a set
+    walk(root, frozenset())
+    return sizes
+
+
+def pick_exclusions(root: TreeNode, target: int) -> Set[str]:
+    """
+    Greedily exclude directory names until the pruned tree is as close to target nodes as this gets
+    :param root: the full scan
+    :param target: the node count to aim for
+    :return: directory names for CASE_DIR_EXCLUSIONS
+    """
+    excluded = set()
+    tree = root
+    size = sum(1 for _ in root.iter())
+    while size > target:
+        sizes = exclusion_sizes(tree)
+        if not sizes:
+            break
+        name, removed = min(sizes.items(), key=lambda x: (abs(size - x[1] - target), x[0]))
+        if abs(size - removed - target) >= abs(size - target):
+            break
+        excluded.add(name)
+        tree = prune(root, excluded)
+        size -= removed
+    return excluded
+
+
+def case_stats(root: TreeNode, case: str) -> str:
+    """ Case stats for CASE_INFO - for validating graph creation """
     files = 0
     dirs = 0
     for item in root.iter():
@@ -118,7 +270,11 @@ def print_stats(root: TreeNode, case: str) -> None:
             dirs += 1
         else:
             files += 1
-    print(f"'{case}': {{'nodes': {dirs + files}, 'dirs': {dirs}, 'files': {files}}},")
+    return f"'{case}': {{'nodes': {dirs + files}, 'dirs': {dirs}, 'files': {files}}},"
+
+
+def print_stats(root: TreeNode, case: str) -> None:
+    print(case_stats(root, case))
 
 
 def remove_root_parent(root: TreeNode) -> TreeNode:
@@ -128,18 +284,80 @@ def remove_root_parent(root: TreeNode) -> TreeNode:
     return TreeNode(Node(**od), root.files, root.dirs)
 
 
-def pickle_dataset(p: Path, case: str) -> None:
-    root = collect_data(p)
+def pickle_dataset(p: Path, case: str, find_duplicates: bool=False) -> None:
+    with profiler.phase("scan"):
+        root = collect_data(p)
     print_stats(root, case)  # so you can add to CASE_INFO
+    with profiler.phase("pickle"):
+        with open(pickle_file(case, False), "wb") as f:
+            pickle.dump(remove_root_parent(root), f)
+    if find_duplicates:
+        with profiler.phase("dedup"):
+            duplicates = dedup.find_duplicates(root)
+        dedup.print_stats(duplicates)
+        with open(dedup.duplicates_file(case), "wb") as f:
+            pickle.dump(duplicates, f)
+
+
+# The full scan, in each pickle_default_datasets worker process
+_full_scan: Optional[TreeNode] = None
+
+
+def _init_worker(root: TreeNode) -> None:
+    global _full_scan
+    _full_scan = root
+
+
+def _write_case(case: str, exclusions: Set[str]) -> str:
+    """ Derive one case from the full scan and pickle it - runs in a pool worker """
+    root = prune(_full_scan, exclusions)
     with open(pickle_file(case, False), "wb") as f:
         pickle.dump(remove_root_parent(root), f)
+    return case_stats(root, case)
 
 
-def pickle_default_datasets(p: Path) -> None:
-    global EXCLUDED_DIRS
-    for case, exclusions in CASE_DIR_EXCLUSIONS.items():
-        EXCLUDED_DIRS = exclusions
-        pickle_dataset(p, case)
+def pickle_default_datasets(p: Path, auto: bool=False, workers: Optional[int]=None) -> Dict[str, Set[str]]:
+    """
+    Scan p once and derive every case in CASE_DIR_EXCLUSIONS from it, writing the pickles in parallel
+    :param p: the directory to scan - ROOT
+    :param auto: ignore the listed exclusions, pick new ones to hit each case's node target (case_N -> N nodes)
+    :param workers: pickling processes, default one per cpu
+    :return: the exclusions used, by case
+    """
+    with profiler.phase("scan"):
+        root = collect_data(p, set())
+    cases = dict(CASE_DIR_EXCLUSIONS)
+    if auto:
+        with profiler.phase("exclusions"):
+            cases = {case: pick_exclusions(root, int(case.split("_")[1])) for case in cases}
+        for case, exclusions in cases.items():
+            print(f"    {case}={{{', '.join(repr(x) for x in sorted(exclusions))}}},")
+    # each worker gets the full scan once, when it starts, rather than a pruned copy per case
+    with profiler.phase("pickle"):
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(root,)) as pool:
+            for stats in pool.map(_write_case, cases.keys(), cases.values()):
+                print(stats)  # so you can add to CASE_INFO
+    return cases
+
+
+def wide_dataset(base: str="case_5000", width: int=WIDE_CASE_FILES) -> TreeNode:
+    """ A supernode case: base, plus one directory holding width files. Ids are far above any real inode """
+    with open(pickle_file(base), "rb") as f:
+        root = pickle.load(f)
+    ids = count(2**40)
+    path = Path(root.me.path) / "wide"
+    wide = root.me._replace(id=next(ids), parent_id=root.me.id, name="wide", stem="wide", path=path)
+    files = [wide._replace(id=next(ids), tag="File", parent_id=wide.id, name=f"f{i:06}.dat", stem=f"f{i:06}",
+                           extension="dat", path=path / f"f{i:06}.dat", size=i % 4096)
+             for i in range(width)]
+    return TreeNode(root.me, root.files, root.dirs + [TreeNode(wide, files, [])])
+
+
+def pickle_wide_dataset() -> None:
+    root = wide_dataset()
+    print_stats(root, "case_wide")
+    with open(pickle_file("case_wide", False), "wb") as f:
+        pickle.dump(root, f)
 
 
 def dir_counts_recurse(node: TreeNode, indent: int = 0) -> None:
@@ -172,10 +390,23 @@ def dir_counts(p: Path) -> None:
 def help():
     return """Collect dir/file metadata and pickle
 
-The 'default' generation creates target sized sets of dir/file data from the cpython repo.
+The 'default' generation creates target sized sets of dir/file data from the cpython repo. It scans the
+repo once and prunes CASE_DIR_EXCLUSIONS from that scan for each case:
+  ./generator.py -d
+
+Or pick the exclusions from subtree sizes to hit each case's node count - paste them into CASE_DIR_EXCLUSIONS:
+  ./generator.py -d --auto
 
 You can generate a large set from your home directory:
   ./generate.py -n my_home -r ~
+
+Once ingested, keep the graph current as files change (Linux):
+  ./generator.py -r ~ --watch
+
+Several roots can share one graph as partitions. Ingest, or refresh, one without touching the others - and
+optionally keep watching it:
+  ./generator.py -r ~ -p home
+  ./generator.py -r /mnt/share -p share --watch
 """
 
 
@@ -192,15 +423,44 @@ def main():
                         help='list node count for each dir in target dir')
     group.add_argument('-r', '--root',
                         help='root directory - where to start parsing')
+    group.add_argument('--wide',
+                        action='store_true',
+                        default=False,
+                        help='generate case_wide - case_5000 plus a directory of 20,000 files')
+    parser.add_argument('--auto',
+                        action='store_true',
+                        default=False,
+                        help='with -d, pick directory exclusions to hit each case size instead of CASE_DIR_EXCLUSIONS')
     parser.add_argument('-n', '--name',
                         default="funky-karmikel",
                         help='use case name - becomes the pickle file name')
+    parser.add_argument('-w', '--watch',
+                        action='store_true',
+                        default=False,
+                        help='with -r, keep the graph current: watch root with inotify and apply changes (Linux)')
+    parser.add_argument('-p', '--partition',
+                        help='with -r, ingest the scan into the graph as this partition, replacing only it')
+    parser.add_argument('--dedup',
+                        action='store_true',
+                        default=False,
+                        help='also find duplicate files and pickle them - write them with ./dedup.py -c NAME')
+    parser.add_argument('--profile',
+                        action='store_true',
+                        default=False,
+                        help='profile CPU and memory by phase, writing stats to ./profiles')
     args = parser.parse_args()
+    if args.profile:
+        profiler.enable("generator")
     
     if args.default:
         print("===> Generating default datasets")
-        pickle_default_datasets(Path("/Users/starver/code/public/cpython"))
+        pickle_default_datasets(Path(ROOT), args.auto)
+        # pii is not part of ROOT - its own, tiny scan
         pickle_dataset(Path("./examples/pii"), "pii")
+        profiler.report()
+        exit(0)
+    if args.wide:
+        pickle_wide_dataset()
         exit(0)
     
     p = Path(args.root)
@@ -211,13 +471,30 @@ def main():
         print(f"{p} is not a directory, cannot continue.")
         exit(1)
     
-    if args.list:
+    if args.partition:
+        # these write to neo - import the driver only when we need it
+        import merge_buffer
+        from trinity import Trinity
+        trinity = Trinity(partition=args.partition)
+        root = collect_data(p)
+        start = timer()
+        written = merge_buffer.replace_tree(trinity, root)
+        print(f"===> Replaced partition {args.partition} with {written} nodes in {timer() - start:.2f} seconds")
+        if args.watch:
+            import watcher
+            watcher.watch(p, root, trinity=trinity)
+    elif args.watch:
+        # the watcher writes to neo - import the driver only when we need it
+        import watcher
+        watcher.watch(p, collect_data(p))
+    elif args.list:
         dir_counts(p)
     elif args.root:
         print(f"===> Collecting {p} into a {args.name} pickle")
         start = timer()
-        pickle_dataset(p, args.name)
+        pickle_dataset(p, args.name, args.dedup)
         print(f"Operations completed in {timer() - start} seconds")
+    profiler.report()
 
 
 if __name__ == "__main__":
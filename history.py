@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Benchmark result history - a local SQLite store with regression detection
+
+Every bench.py run records one row per case in HISTORY_FILE, with:
+- what ran: strategy, model, case, node count, batch/commit sizes
+- where: git commit (and whether the tree was dirty), the server memory config, and an environment fingerprint
+  (python, driver, os, cpu count, host) - results from different environments aren't comparable
+- each iteration's duration - the samples a significance test needs, not just their mean
+
+The planner reads its results from here too.
+
+compare takes two commits and, for every benchmark config measured at both in the same environment, runs
+Welch's t-test on throughput (nodes/sec). A config is flagged as a regression when the candidate is slower by
+more than --threshold and the difference is significant at --alpha.
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+from argparse import RawDescriptionHelpFormatter
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+HISTORY_FILE = "./results/history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created TEXT DEFAULT CURRENT_TIMESTAMP,
+    git_commit TEXT,
+    git_dirty INTEGER,
+    strategy INTEGER,
+    model TEXT,
+    case_name TEXT,
+    nodes INTEGER,
+    batch_size INTEGER,
+    batch_bytes INTEGER,
+    commit_size INTEGER,
+    buffered INTEGER,
+    failed INTEGER,
+    error TEXT,
+    server TEXT,
+    env TEXT,
+    env_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER REFERENCES runs(id),
+    iteration INTEGER,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs(git_commit);
+"""
+
+# columns that make two runs the same benchmark
+CONFIG = ("strategy", "model", "case_name", "batch_size", "batch_bytes", "commit_size", "buffered")
+
+
+def git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(("git",) + args, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def git_commit() -> Tuple[Optional[str], bool]:
+    """ (HEAD commit, True if the working tree has changes) """
+    return git("rev-parse", "HEAD"), bool(git("status", "--porcelain", "--untracked-files=no"))
+
+
+def environment() -> Dict[str, str]:
+    """ What the client side of a benchmark ran on """
+    try:
+        from neo4j import __version__ as driver
+    except ImportError:
+        driver = None
+    return {
+        "python": platform.python_version(),
+        "driver": driver,
+        "os": platform.platform(),
+        "cpus": os.cpu_count(),
+        "host": platform.node(),
+    }
+
+
+def fingerprint(env: Dict, server: Optional[Dict]) -> str:
+    data = json.dumps({"env": env, "server": server}, sort_keys=True, default=str)
+    return hashlib.sha1(data.encode()).hexdigest()[:12]
+
+
+def connect(fn: str=HISTORY_FILE) -> sqlite3.Connection:
+    """ Open the store, creating it if needed """
+    Path(fn).parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(fn)
+    db.row_factory = sqlite3.Row
+    db.executescript(SCHEMA)
+    return db
+
+
+def insert(db: sqlite3.Connection, result: Dict, durations: List[float], commit: Optional[str], dirty: bool,
+           env: Dict) -> int:
+    cursor = db.execute(
+        "INSERT INTO runs (git_commit, git_dirty, strategy, model, case_name, nodes, batch_size, batch_bytes, "
+        "commit_size, buffered, failed, error, server, env, env_hash) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (commit, dirty, result["strategy"], result.get("model", "flat"), result["case"], result["nodes"],
+         result["batch_size"], result.get("batch_bytes"), result.get("commit_size"), bool(result.get("buffered")),
+         bool(result.get("failed")), result.get("error"), json.dumps(result.get("server"), sort_keys=True),
+         json.dumps(env, sort_keys=True), fingerprint(env, result.get("server")) if env else None))
+    db.executemany("INSERT INTO samples (run_id, iteration, duration) VALUES (?, ?, ?)",
+                   [(cursor.lastrowid, i, d) for i, d in enumerate(durations)])
+    return cursor.lastrowid
+
+
+def save_run(result: Dict, durations: List[float]) -> None:
+    """
+    Store one bench result with its per iteration durations - an empty list for a failed run
+    :param result: strategy, case, nodes, batch_size, commit_size, model, ... as built by Bench.save_result()
+    """
+    commit, dirty = git_commit()
+    with connect() as db:
+        insert(db, result, durations, commit, dirty, environment())
+
+
+def load_results() -> List[Dict]:
+    """ Every run as the planner's result dicts - duration is the mean of the iterations """
+    with connect() as db:
+        rows = db.execute("""
+            SELECT r.*, avg(s.duration) AS duration FROM runs r LEFT JOIN samples s ON s.run_id = r.id
+            GROUP BY r.id ORDER BY r.id""").fetchall()
+    return [{
+        "strategy": r["strategy"],
+        "case": r["case_name"],
+        "nodes": r["nodes"],
+        "batch_size": r["batch_size"],
+        "batch_bytes": r["batch_bytes"],
+        "commit_size": r["commit_size"],
+        "duration": r["duration"],
+        "model": r["model"],
+        "buffered": bool(r["buffered"]),
+        "failed": bool(r["failed"]),
+        "error": r["error"],
+        "server": json.loads(r["server"]) if r["server"] else None,
+    } for r in rows]
+
+
+def betainc(a: float, b: float, x: float) -> float:
+    """ The regularized incomplete beta function I_x(a, b) - continued fraction, as in Numerical Recipes """
+    if x <= 0.0 or x >= 1.0:
+        return max(0.0, min(1.0, x))
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1 - x))
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - betainc(b, a, 1 - x)
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    f = d
+    for m in range(1, 200):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            f *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return front * f / a
+
+
+def welch(a: List[float], b: List[float]) -> Tuple[float, float]:
+    """
+    Welch's t-test for two samples with possibly unequal variances
+    :return: (t, two sided p value)
+    """
+    na, nb = len(a), len(b)
+    ma, mb = sum(a) / na, sum(b) / nb
+    va = sum((x - ma) ** 2 for x in a) / (na - 1)
+    vb = sum((x - mb) ** 2 for x in b) / (nb - 1)
+    se2 = va / na + vb / nb
+    if 0 == se2:
+        return (0.0, 1.0) if ma == mb else (math.copysign(math.inf, ma - mb), 0.0)
+    t = (ma - mb) / math.sqrt(se2)
+    df = se2 ** 2 / ((va / na) ** 2 / (na - 1) + (vb / nb) ** 2 / (nb - 1))
+    return t, betainc(df / 2, 0.5, df / (df + t * t))
+
+
+def throughput(db: sqlite3.Connection, commit: str) -> Dict[Tuple, List[float]]:
+    """ nodes/sec samples per (config..., env_hash) for successful runs at a commit (or unique prefix) """
+    rows = db.execute(f"""
+        SELECT {', '.join('r.' + c for c in CONFIG)}, r.env_hash, r.nodes, s.duration
+        FROM runs r JOIN samples s ON s.run_id = r.id
+        WHERE r.git_commit LIKE ? AND NOT r.failed AND s.duration > 0""", (commit + "%",)).fetchall()
+    samples = defaultdict(list)
+    for r in rows:
+        samples[tuple(r[:len(CONFIG) + 1])].append(r["nodes"] / r["duration"])
+    return samples
+
+
+def compare(baseline: str, candidate: str, alpha: float=0.05, threshold: float=0.05) -> List[Tuple]:
+    """
+    Compare throughput at two commits, print a line per benchmark config measured at both
+    :return: the regressed configs
+    """
+    with connect() as db:
+        base = throughput(db, baseline)
+        cand = throughput(db, candidate)
+    regressions = []
+    common = sorted(base.keys() & cand.keys(), key=str)
+    if not common:
+        print(f"No benchmark config was measured at both {baseline} and {candidate} in the same environment")
+        return regressions
+    print("Strategy\tModel\tCase\tBatch\tBaseline nps\tCandidate nps\tChange\tp\tVerdict")
+    for key in common:
+        a, b = base[key], cand[key]
+        ma, mb = sum(a) / len(a), sum(b) / len(b)
+        change = (mb - ma) / ma
+        if len(a) < 2 or len(b) < 2:
+            p, verdict = None, "too few samples"
+        else:
+            _, p = welch(a, b)
+            if p < alpha and change < -threshold:
+                verdict = "REGRESSION"
+                regressions.append(key)
+            elif p < alpha and change > threshold:
+                verdict = "improved"
+            else:
+                verdict = "-"
+        batch = key[5] if key[0] == 8 else key[4] or key[3]
+        p_text = f"{p:.4f}" if p is not None else "-"
+        print(f"i{key[0]}\t{key[1]}\t{key[2]}\t{batch}\t{ma:.0f}\t{mb:.0f}\t{change:+.1%}\t{p_text}\t{verdict}")
+    return regressions
+
+
+def list_commits() -> None:
+    with connect() as db:
+        rows = db.execute("""
+            SELECT git_commit, max(git_dirty), count(*), min(created), group_concat(DISTINCT case_name)
+            FROM runs GROUP BY git_commit ORDER BY min(id)""").fetchall()
+    for commit, dirty, runs, created, cases in rows:
+        print(f"{(commit or 'unknown')[:12]}{'+' if dirty else ' '}\t{created}\t{runs} runs\t{cases}")
+
+
+def help() -> str:
+    return """Benchmark history and regression detection
+
+List the commits with stored results (+ means the tree had uncommitted changes):
+  ./history.py -l
+
+Flag significant throughput regressions at HEAD against an older commit:
+  ./bench.py -s2 -i5 -c 5000
+  ./history.py -c 1a2b3c4
+
+Compare two commits, flagging slowdowns over 10% significant at p < 0.01:
+  ./history.py -c 1a2b3c4 --candidate 5d6e7f8 --threshold 0.1 --alpha 0.01
+
+Exits with 1 when a regression is found. Run each side with -i3 or more - the t-test needs samples.
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=help(), formatter_class=RawDescriptionHelpFormatter)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('-l', '--list', action='store_true', default=False, help='list commits with results')
+    group.add_argument('-c', '--compare', metavar='BASELINE', help='baseline commit (or unique prefix)')
+    parser.add_argument('--candidate', help='candidate commit, default HEAD')
+    parser.add_argument('--alpha', type=float, default=0.05, help='significance level')
+    parser.add_argument('--threshold', type=float, default=0.05, help='ignore changes smaller than this fraction')
+    args = parser.parse_args()
+
+    if args.list:
+        list_commits()
+        exit(0)
+    candidate = args.candidate or git_commit()[0]
+    if not candidate:
+        print("No candidate commit - not in a git repository?")
+        exit(1)
+    if compare(args.compare, candidate, args.alpha, args.threshold):
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
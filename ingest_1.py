@@ -20,10 +20,14 @@ NOTES:
 - very easy to reason about
 - max # of stmts in a file heavily dependent on server RAM config
 """
+import argparse
 import pickle
 import sys
+from argparse import RawDescriptionHelpFormatter
+from typing import Optional
 
-from generator import CASE_INFO, cypher_file, pickle_file
+import profiler
+from generator import CASE_INFO, COMPRESSION_SUFFIXES, cypher_file, open_artifact, pickle_file
 from node import TreeNode
 
 
@@ -52,21 +56,40 @@ def gen_cypher(origin: TreeNode) -> None:
     gen_edges(origin)
 
 
-for case, info in CASE_INFO.items():
-    if info['nodes'] < 1800:
-        with open(pickle_file(case), "rb") as infile:
-            cypher_fn = cypher_file(case, 'i1', False)
-            with open(cypher_fn, "w") as outfile:
-                sys.stdout, tmp = outfile, sys.stdout
-                gen_cypher(pickle.load(infile))
-                sys.stdout = tmp
-                print(f"generated {cypher_fn}")
-
-# pickle generated with: ./generator.py -n pii -r /Users/starver/code/makara/neo4j-play/examples/pii
-with open(pickle_file("pii", False), "rb") as infile:
-    cypher_fn = cypher_file("pii", 'i1', False)
-    with open(cypher_fn, "w") as outfile:
-        sys.stdout, tmp = outfile, sys.stdout
-        gen_cypher(pickle.load(infile))
-        sys.stdout = tmp
-        print(f"generated {cypher_fn}")
+def gen_file(case: str, compression: Optional[str]) -> None:
+    with open(pickle_file(case), "rb") as infile:
+        with profiler.phase("pickle"):
+            root = pickle.load(infile)
+        cypher_fn = cypher_file(case, 'i1', False, compression)
+        with open_artifact(cypher_fn, "wt") as outfile:
+            sys.stdout, tmp = outfile, sys.stdout
+            with profiler.phase("generate"):
+                gen_cypher(root)
+            sys.stdout = tmp
+            print(f"generated {cypher_fn}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=RawDescriptionHelpFormatter)
+    parser.add_argument('-z', '--compress',
+                        choices=COMPRESSION_SUFFIXES,
+                        help='compress the generated cypher files')
+    parser.add_argument('--profile',
+                        action='store_true',
+                        default=False,
+                        help='profile CPU and memory by phase, writing stats to ./profiles')
+    args = parser.parse_args()
+    if args.profile:
+        profiler.enable("ingest_1")
+
+    for case, info in CASE_INFO.items():
+        if info['nodes'] < 1800:
+            gen_file(case, args.compress)
+
+    # pickle generated with: ./generator.py -n pii -r /Users/starver/code/makara/neo4j-play/examples/pii
+    gen_file("pii", args.compress)
+    profiler.report()
+
+
+if __name__ == "__main__":
+    main()
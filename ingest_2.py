@@ -9,66 +9,110 @@ Process:
 Only process the largest data set
 - for each dir:
     create self
-    create parent link (if parent_id - root should not have one)
+    create parent link (if parent_id - root should not have one) - MERGE the parent by id, it was created in an
+    earlier group and may have been in an earlier run()
     create file nodes
     create file parent links (to current dir)
-    print newline - we can safely break at any one of these
+    print a "// group <lines> <chars>" header first - bench.py packs whole groups into batches
     for each dir, recurse
 
 NOTES:
 - CREATEs are the most efficient because you don't have to first check if the node/edge exists (avoid lookup cost)
+- A directory with node.WIDE_DIR or more files (a supernode) is written differently: its files in groups of
+  node.WIDE_CHUNK, then its edges as self-contained MATCH ... UNWIND chunks that each run alone - a single group
+  would be one enormous run()
+- A node variable only lives for the run() it was bound in, so a group only refers to its own variables. The one
+  lookup per directory - its parent - needs the id constraints (bench.py creates them)
+- With -t, nodes also get a tokens property - node.name_tokens() - for the full-text name index
 
 TODO:
 - turns out we could break cypher file at any point - remove the spaces and change trinity
 """
+import argparse
 import pickle
 import sys
+from argparse import RawDescriptionHelpFormatter
 from timeit import default_timer as timer
 
-from generator import cypher_file, pickle_file
-from node import TreeNode
+import profiler
+from generator import COMPRESSION_SUFFIXES, cypher_file, open_artifact, pickle_file, print_group, wide_edges
+from node import WIDE_CHUNK, WIDE_DIR, Node, TreeNode, name_tokens
 
 
-def gen(origin: TreeNode) -> None:
-    """
-    TODO: What is a node variable lifetime?
-          In our naive use, a session.run() is an autocommit
-          Node reference variable lifetime is longer than run(), session, and ';'
-    """
+def node(item: Node, tokens: bool) -> str:
+    if not tokens:
+        return item.node()
+    return f"({item.var}:{item.tag} {{{item.colon_args()}, tokens: \"{name_tokens(item.name)}\"}})"
+
+
+def gen(origin: TreeNode, tokens: bool=False) -> None:
     me = origin.me
-    print(f"CREATE {me.node()}")
+    group = [f"CREATE {node(me, tokens)}"]
     # If no parent_id, I am the root node and don't have a PARENT_OF relationship
     if origin.me.parent_id:
-        print(f"CREATE (n{me.parent_id}) - [:PARENT_OF] -> ({me.var})")
-    for f in origin.files:
-        print(f"CREATE {f.node()}")
-    for f in origin.files:
-        print(f"CREATE ({me.var}) - [:PARENT_OF] -> ({f.var})")
-
-    # Mark the end of a "create group"
-    # TODO: this is not needed because of lifetime of variables
-    # print()
+        # the parent's variable may have died with an earlier run() - find it by id under a variable of our own
+        group.append(f"MERGE (p{me.id}:Directory {{id: {me.parent_id}}})")
+        group.append(f"CREATE (p{me.id}) - [:PARENT_OF] -> ({me.var})")
+    if len(origin.files) >= WIDE_DIR:
+        # a supernode: its files in groups of WIDE_CHUNK, then its edges as chunks that each run alone
+        print_group(group)
+        for i in range(0, len(origin.files), WIDE_CHUNK):
+            print_group([f"CREATE {node(f, tokens)}" for f in origin.files[i:i + WIDE_CHUNK]])
+        print_group(wide_edges(me.id, [f.id for f in origin.files]), alone=True)
+    else:
+        group.extend(f"CREATE {node(f, tokens)}" for f in origin.files)
+        group.extend(f"CREATE ({me.var}) - [:PARENT_OF] -> ({f.var})" for f in origin.files)
+        # A "create group" - the bench packs whole groups into a batch so a directory commits with its files
+        print_group(group)
     for d in origin.dirs:
-        gen(d)
+        gen(d, tokens)
 
 
-def gen_cypher(root: TreeNode) -> None:
-    gen(root)
+def gen_cypher(root: TreeNode, tokens: bool=False) -> None:
+    gen(root, tokens)
 
 
 # Include a small dataset so we can verify the graph
 cases = [
     "case_100",
     "case_5000",
+    "case_wide",
     "case_2mil",
 ]
-for c in cases:
-    with open(pickle_file(c), "rb") as infile:
-        with open(cypher_file(c, "i2", False), "w") as outfile:
-            sys.stdout, tmp = outfile, sys.stdout
-            start = timer()
-            gen_cypher(pickle.load(infile))
-            end = timer()
-            sys.stdout = tmp
-            print(f"generated i2_{c}.cypher in {end - start:.2f} seconds")
 
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=RawDescriptionHelpFormatter)
+    parser.add_argument('-z', '--compress',
+                        choices=COMPRESSION_SUFFIXES,
+                        help='compress the generated cypher files')
+    parser.add_argument('-t', '--tokens',
+                        action='store_true',
+                        default=False,
+                        help='add name tokens to every node for the full-text name index')
+    parser.add_argument('--profile',
+                        action='store_true',
+                        default=False,
+                        help='profile CPU and memory by phase, writing stats to ./profiles')
+    args = parser.parse_args()
+    if args.profile:
+        profiler.enable("ingest_2")
+
+    for c in cases:
+        cypher_fn = cypher_file(c, "i2", False, args.compress)
+        with open(pickle_file(c), "rb") as infile:
+            with profiler.phase("pickle"):
+                root = pickle.load(infile)
+            with open_artifact(cypher_fn, "wt") as outfile:
+                sys.stdout, tmp = outfile, sys.stdout
+                start = timer()
+                with profiler.phase("generate"):
+                    gen_cypher(root, args.tokens)
+                end = timer()
+                sys.stdout = tmp
+                print(f"generated {cypher_fn} in {end - start:.2f} seconds")
+    profiler.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,62 +26,168 @@ Only process the largest data set
 
 NOTES:
 - Following the Ingest 2 recursion strategy
+- With -d, extension, owner and group become shared dimension nodes (node.DIMENSIONS), MERGEd on their
+  indexed id so each is created once, and linked with typed edges. Written as i4d_{case}.cypher
+- Directories with node.WIDE_DIR or more files write their edges as self-contained MATCH ... UNWIND chunks,
+  each run alone - see ingest_2
+- With -j, write what such an API actually delivers instead: json lines of partial records, each node split
+  over 1-3 records, shuffled within a window. Written as i4_{case}.jsonl for merge_buffer.MergeBuffer
 
 """
+import argparse
+import json
 import pickle
 import sys
-from random import randint
+from argparse import RawDescriptionHelpFormatter
+from random import randint, sample, shuffle
 from timeit import default_timer as timer
+from typing import Dict, List
 
-from generator import cypher_file, pickle_file
-from node import RandomNode, TreeNode
+import profiler
+from generator import (COMPRESSION_SUFFIXES, cypher_file, open_artifact, pickle_file, print_group, records_file,
+                       wide_edges)
+from node import DIMENSIONS, WIDE_CHUNK, WIDE_DIR, Node, RandomNode, TreeNode
 
 
 def rand_ref():
     return f"n{randint(0, 999_999_999)}"
 
 
-def gen(origin: TreeNode) -> None:
+def gen_dimensions(node: Node) -> List[str]:
+    """ Link a node to its shared dimension nodes """
+    lines = []
+    for dim in DIMENSIONS:
+        if dim.applies(node):
+            value = getattr(node, dim.field)
+            value = value if isinstance(value, int) else f'"{value}"'
+            ref = rand_ref()
+            lines.append(f"MERGE ({ref}:{dim.label} {{id: {value}}})")
+            lines.append(f"MERGE {node.ref} - [:{dim.rel}] -> ({ref})")
+    return lines
+
+
+def gen(origin: TreeNode, dimensions: bool=False) -> None:
     # Note: single line is hard to read, but easy to break into chunks
     me = RandomNode(**origin.me._asdict())
-    print(f"MERGE {me.node_ref()} ON CREATE SET {me.equal_args()} ON MATCH SET {me.equal_args()}")
+    group = [f"MERGE {me.node_ref()} ON CREATE SET {me.equal_args()} ON MATCH SET {me.equal_args()}"]
+    if dimensions:
+        group.extend(gen_dimensions(me))
 
     # If no parent_id, I am the root node and don't have a PARENT_OF relationship
     if origin.me.parent_id:
         # need two MERGEs here - entire pattern must match existing or all are created
         parent_ref = rand_ref()
-        print(f"MERGE ({parent_ref}:Directory {{id: {me.parent_id}}})")
-        print(f"MERGE ({parent_ref}) - [:PARENT_OF] -> {me.ref}")
-    for f in origin.files:
-        rf = RandomNode(**f._asdict())
-        print(f"MERGE {rf.node_ref()} ON CREATE SET {rf.equal_args()} ON MATCH SET {rf.equal_args()}")
-        print(f"MERGE {me.ref} - [:PARENT_OF] -> {rf.ref}")
+        group.append(f"MERGE ({parent_ref}:Directory {{id: {me.parent_id}}})")
+        group.append(f"MERGE ({parent_ref}) - [:PARENT_OF] -> {me.ref}")
+    if len(origin.files) >= WIDE_DIR:
+        # a supernode: its files in groups of WIDE_CHUNK, then its edges as chunks that each run alone
+        print_group(group)
+        for i in range(0, len(origin.files), WIDE_CHUNK):
+            chunk = []
+            for f in origin.files[i:i + WIDE_CHUNK]:
+                rf = RandomNode(**f._asdict())
+                chunk.append(f"MERGE {rf.node_ref()} ON CREATE SET {rf.equal_args()} ON MATCH SET {rf.equal_args()}")
+                if dimensions:
+                    chunk.extend(gen_dimensions(rf))
+            print_group(chunk)
+        print_group(wide_edges(me.id, [f.id for f in origin.files], verb="MERGE"), alone=True)
+    else:
+        for f in origin.files:
+            rf = RandomNode(**f._asdict())
+            group.append(f"MERGE {rf.node_ref()} ON CREATE SET {rf.equal_args()} ON MATCH SET {rf.equal_args()}")
+            group.append(f"MERGE {me.ref} - [:PARENT_OF] -> {rf.ref}")
+            if dimensions:
+                group.extend(gen_dimensions(rf))
+        # the bench packs whole groups into a batch - me.ref must be in the same run() as my files' edges
+        print_group(group)
 
     for d in origin.dirs:
-        gen(d)
+        gen(d, dimensions)
 
 
-def gen_cypher(root: TreeNode) -> None:
+def gen_cypher(root: TreeNode, dimensions: bool=False) -> None:
     """
     I need to create the top level because we cannot modify the named tuple structure - can't
     """
-    gen(root)
+    gen(root, dimensions)
+
+
+def partial_records(node: Node) -> List[Dict]:
+    """ Split a node's properties over 1-3 records - every record carries the id """
+    props = node._asdict()
+    props["path"] = str(props["path"])
+    del props["id"]
+    keys = sample(list(props), len(props))
+    parts = randint(1, 3)
+    return [dict(id=node.id, **{k: props[k] for k in keys[i::parts]}) for i in range(parts)]
+
+
+def gen_records(root: TreeNode, window: int=1000) -> None:
+    """ Print partial records as json lines, shuffled within window records - bounded memory, no global order """
+    pending = []
+    for node in root.iter():
+        pending.extend(partial_records(node))
+        if len(pending) >= window:
+            shuffle(pending)
+            for record in pending:
+                print(json.dumps(record))
+            pending = []
+    shuffle(pending)
+    for record in pending:
+        print(json.dumps(record))
 
 
 # Include a small dataset so we can verify the graph
 cases = [
     "case_100",
     "case_5000",
+    "case_wide",
     "case_2mil",
 ]
-for c in cases:
-    with open(pickle_file(c), "rb") as infile:
-        with open(cypher_file(c, "i4", False), "w") as outfile:
-            sys.stdout, tmp = outfile, sys.stdout
-            start = timer()
-            gen_cypher(pickle.load(infile))
-            end = timer()
-            sys.stdout = tmp
-            print(f"generated i4_{c}.cypher in {end - start:.2f} seconds")
 
 
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=RawDescriptionHelpFormatter)
+    parser.add_argument('-z', '--compress',
+                        choices=COMPRESSION_SUFFIXES,
+                        help='compress the generated cypher files')
+    parser.add_argument('-d', '--dimensions',
+                        action='store_true',
+                        default=False,
+                        help='model extension, owner and group as shared nodes (writes i4d files)')
+    parser.add_argument('-j', '--jsonl',
+                        action='store_true',
+                        default=False,
+                        help='write shuffled partial json records instead of cypher (writes i4 jsonl files)')
+    parser.add_argument('--profile',
+                        action='store_true',
+                        default=False,
+                        help='profile CPU and memory by phase, writing stats to ./profiles')
+    args = parser.parse_args()
+    if args.profile:
+        profiler.enable("ingest_4")
+
+    for c in cases:
+        if args.jsonl:
+            cypher_fn = records_file(c, "i4", False, args.compress)
+        else:
+            cypher_fn = cypher_file(c, "i4d" if args.dimensions else "i4", False, args.compress)
+        with open(pickle_file(c), "rb") as infile:
+            with profiler.phase("pickle"):
+                root = pickle.load(infile)
+            with open_artifact(cypher_fn, "wt") as outfile:
+                sys.stdout, tmp = outfile, sys.stdout
+                start = timer()
+                with profiler.phase("generate"):
+                    if args.jsonl:
+                        gen_records(root)
+                    else:
+                        gen_cypher(root, args.dimensions)
+                end = timer()
+                sys.stdout = tmp
+                print(f"generated {cypher_fn} in {end - start:.2f} seconds")
+    profiler.report()
+
+
+if __name__ == "__main__":
+    main()
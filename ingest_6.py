@@ -14,19 +14,29 @@ NOTES:
   Potentially, we could build the data store and move it into the database
   This means a distinct approach from LOAD CSV - but we could do it on any machine with neo4j-admin
 
+- LOAD CSV reads gzip compressed files directly, so -z writes .csv.gz - a fraction of the disk footprint and read time
+- --serve skips the files: a local http server generates the rows as LOAD CSV reads them, so generation and load
+  overlap instead of adding up. Use --host if the neo4j server reaches this machine by another name
+
 CAVEATS:
 - we cannot include type information in the csv for this strategy - header row is for names only
 
 TODO:
     - provide an example CSV file
-    - provide an example CSV file compressed
     - we can also load from json - directly from an api???
 """
+import argparse
 import csv
+import io
 import pickle
+from argparse import RawDescriptionHelpFormatter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
 from timeit import default_timer as timer
+from typing import Optional, Tuple
 
-from generator import cypher_file, pickle_file
+import profiler
+from generator import COMPRESSION_SUFFIXES, artifact_file, cypher_file, open_artifact, pickle_file
 from node import Node, TreeNode
 
 # noinspection SqlNoDataSourceInspection
@@ -41,9 +51,9 @@ for k,v in Node._field_types.items():
 NODE_FIELDS = ",\n".join(NODE_FIELDS)
 
 # TODO: Something between 10,000 and 100,000 updates per transaction are a good target for periodic commit - but needs tuning
-CYPHER = f'''// NOTE: Someone should have established constraints prior to execution
-USING PERIODIC COMMIT
-LOAD CSV WITH HEADERS FROM "file:///i6_~CASE~_dir.csv" as row
+# ~URL~ is file:/// for csv files in neo4j/import, http://host:port/ for --serve
+DIR_CYPHER = f'''USING PERIODIC COMMIT
+LOAD CSV WITH HEADERS FROM "~URL~i6_~CASE~_dir.csv~CSV_SUFFIX~" as row
 
 CREATE (d:Directory {{
 {NODE_FIELDS}
@@ -54,10 +64,10 @@ FOREACH (pid IN (CASE row.parent_id WHEN NULL THEN [] ELSE [1] END) |
   MERGE (p:Directory {{id: toInteger(row.parent_id)}})
   MERGE (p)-[:PARENT_OF]->(d)
 )
+'''
 
-
-USING PERIODIC COMMIT
-LOAD CSV WITH HEADERS FROM "file:///i6_~CASE~_file.csv" as row
+FILE_CYPHER = f'''USING PERIODIC COMMIT
+LOAD CSV WITH HEADERS FROM "~URL~i6_~CASE~_file.csv~CSV_SUFFIX~" as row
 
 CREATE (f:File {{
 {NODE_FIELDS}
@@ -67,14 +77,26 @@ MERGE (p:Directory {{id: toInteger(row.parent_id)}})
 MERGE (p) - [:PARENT_OF] -> (f)
 '''
 
+CYPHER = f"// NOTE: Someone should have established constraints prior to execution\n{DIR_CYPHER}\n\n{FILE_CYPHER}"
+
+# LOAD CSV runs inside the neo4j container - this is the docker host from there
+# (scripts/run_neo4j.sh maps it on linux too)
+SERVE_HOST = "host.docker.internal"
+SERVE_PORT = 8765
 
-def gen_csv(root: TreeNode, case: str) -> None:
+
+def csv_compression(compression: Optional[str]) -> Optional[str]:
+    """ LOAD CSV can only decompress gzip - any compression request means gzip for csv files """
+    return "gz" if compression else None
+
+
+def gen_csv(root: TreeNode, case: str, compression: Optional[str]=None) -> None:
     # TODO: is there a way to combine files using :LABEL, etc.
     # Must have separate files for each node type (label)
-    dir = f"./neo4j/import/i6_{case}_dir.csv"
-    file = f"./neo4j/import/i6_{case}_file.csv"
-    with open(dir, "w") as d:
-        with open(file, "w") as f:
+    dir = artifact_file(f"./neo4j/import/i6_{case}_dir.csv", False, csv_compression(compression))
+    file = artifact_file(f"./neo4j/import/i6_{case}_file.csv", False, csv_compression(compression))
+    with open_artifact(dir, "wt") as d:
+        with open_artifact(file, "wt") as f:
             d.write(f"{','.join(Node._fields)}\n")
             f.write(f"{','.join(Node._fields)}\n")
 
@@ -87,9 +109,87 @@ def gen_csv(root: TreeNode, case: str) -> None:
                     f_writer.writerow(item._asdict())
     
     
-def gen_cypher(case: str) -> None:
-    with open(cypher_file(case, "i6", False), "w") as f:
-        f.write(CYPHER.replace("~CASE~", case))
+def cypher(template: str, case: str, url: str="file:///", suffix: str="") -> str:
+    return template.replace("~URL~", url).replace("~CASE~", case).replace("~CSV_SUFFIX~", suffix)
+
+
+def gen_cypher(case: str, compression: Optional[str]=None) -> None:
+    suffix = COMPRESSION_SUFFIXES.get(csv_compression(compression), "")
+    with open_artifact(cypher_file(case, "i6", False, compression), "wt") as f:
+        f.write(cypher(CYPHER, case, suffix=suffix))
+
+
+class CsvServer(ThreadingHTTPServer):
+    """
+    Serve a dataset's i6 csv files as a stream - rows are generated from the TreeNode as LOAD CSV reads them
+    - /i6_{case}_dir.csv and /i6_{case}_file.csv, the same columns as gen_csv() writes
+    - no Content-Length: the response is HTTP/1.0, so the end of the stream is the end of the file
+    - a slow reader blocks our writes - the socket buffers are the only place rows wait
+    """
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], root: TreeNode, case: str):
+        super().__init__(address, CsvHandler)
+        self.routes = {
+            f"/i6_{case}_dir.csv": lambda: (n for n in root.iter() if n.is_dir()),
+            f"/i6_{case}_file.csv": lambda: (n for n in root.iter() if not n.is_dir()),
+        }
+        self.rows = 0
+
+
+class CsvHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self) -> None:
+        nodes = self.server.routes.get(self.path)
+        if nodes is None:
+            self.send_error(404, f"No such csv: {self.path}")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.end_headers()
+        out = io.TextIOWrapper(self.wfile, encoding="utf-8", newline="")
+        writer = csv.DictWriter(out, Node._fields, lineterminator="\n")
+        writer.writeheader()
+        for node in nodes():
+            writer.writerow(node._asdict())
+            self.server.rows += 1
+        out.flush()
+        out.detach()
+
+    def log_message(self, format: str, *args) -> None:
+        print(f"  served {format % args}")
+
+
+def serve(root: TreeNode, case: str, host: str=SERVE_HOST, port: int=SERVE_PORT) -> float:
+    """
+    Load a case through LOAD CSV from our own http server - neo4j reads rows while we generate them, and no csv
+    is written to disk
+    :param root: the dataset
+    :param case: the case name - in the urls
+    :param host: how the neo4j server reaches this machine
+    :param port: the port to listen on, on all interfaces
+    :return: seconds from the first request to the last row loaded
+    """
+    # only serving talks to neo - import the driver only when we need it
+    from trinity import Trinity
+
+    server = CsvServer(("", port), root, case)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://{host}:{port}/"
+    trinity = Trinity().clean().create_constraints()
+    start = timer()
+    try:
+        with trinity.session() as session:
+            # directories first - file rows MERGE their parent
+            for template in (DIR_CYPHER, FILE_CYPHER):
+                session.run(cypher(template, case, url)).consume()
+        trinity.wrote()
+    finally:
+        server.shutdown()
+        server.server_close()
+    duration = timer() - start
+    print(f"loaded {server.rows} rows of {case} from {url} in {duration:.2f} seconds")
+    return duration
     
 
 cases = [
@@ -97,12 +197,52 @@ cases = [
     'case_5000',
     'case_2mil',
 ]
-for c in cases:
-    with open(pickle_file(c), "rb") as infile:
-        root = pickle.load(infile)
-        start = timer()
-        gen_csv(root, c)
-        gen_cypher(c)
-        end = timer()
-        print(f"generated i6_{c}.cypher in {end - start:.2f} seconds")
 
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=RawDescriptionHelpFormatter)
+    parser.add_argument('-z', '--compress',
+                        choices=COMPRESSION_SUFFIXES,
+                        help='compress the generated cypher file; csv files are always gzip when compressed')
+    parser.add_argument('-s', '--serve',
+                        metavar='CASE',
+                        help='load this case from a local http stream instead of generating csv files')
+    parser.add_argument('--host',
+                        default=SERVE_HOST,
+                        help=f'with --serve, the name neo4j reaches this machine by (default {SERVE_HOST})')
+    parser.add_argument('--port',
+                        type=int,
+                        default=SERVE_PORT,
+                        help=f'with --serve, the port to serve csv on (default {SERVE_PORT})')
+    parser.add_argument('--profile',
+                        action='store_true',
+                        default=False,
+                        help='profile CPU and memory by phase, writing stats to ./profiles')
+    args = parser.parse_args()
+    if args.profile:
+        profiler.enable("ingest_6")
+
+    if args.serve:
+        with open(pickle_file(args.serve), "rb") as infile:
+            with profiler.phase("pickle"):
+                root = pickle.load(infile)
+        with profiler.phase("serve"):
+            serve(root, args.serve, args.host, args.port)
+        profiler.report()
+        exit(0)
+
+    for c in cases:
+        with open(pickle_file(c), "rb") as infile:
+            with profiler.phase("pickle"):
+                root = pickle.load(infile)
+            start = timer()
+            with profiler.phase("generate"):
+                gen_csv(root, c, args.compress)
+                gen_cypher(c, args.compress)
+            end = timer()
+            print(f"generated i6_{c}.cypher in {end - start:.2f} seconds")
+    profiler.report()
+
+
+if __name__ == "__main__":
+    main()
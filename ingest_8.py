@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Key: Ingest strategy 8: Two-phase LOAD CSV
+
+Use case:
+Ingest 6 creates each node and, in the same row, MERGEs its parent and the PARENT_OF edge. A directory row can
+arrive before its parent, creating a placeholder node, and every periodic commit pays for the interleaved lookups.
+
+Strategy:
+- phase 1: CREATE all nodes from the dir and file csvs - no lookups at all
+- phase 2: CREATE PARENT_OF edges from dedicated relationship csvs, MATCHing both ends on the indexed id
+- each LOAD CSV is its own ';' terminated statement - bench.py runs them one at a time
+- the periodic commit size is a ~COMMIT_SIZE~ placeholder that bench.py fills in (-p)
+
+NOTES:
+- requires the id constraints (indexes) - bench.py creates them before loading
+- relationship csvs are split by child label so each MATCH uses a single label index
+- csv files are written to ./neo4j/import which run_neo4j.sh mounts as the neo4j import dir
+- edges to the children of wide directories (node.WIDE_DIR+ children - supernodes) get their own csvs, one row per
+  parent per WIDE_CHUNK children, sorted by parent. Their LOAD CSV runs last, looks each parent up once per row and
+  commits every ~WIDE_COMMIT_SIZE~ rows - a supernode is locked by one writer, a chunk at a time
+- every node row also carries tokens - node.name_tokens() - for the full-text name index
+  (Trinity.name_match()) - bench.py creates the index after the load, Trinity.ensure_name_index()
+- With -d, extension, owner and group become shared dimension nodes (node.DIMENSIONS): one csv of distinct values
+  per dimension creates each node once, then per-label edge csvs link nodes to them. Written as i8d_{case}.cypher
+"""
+import argparse
+import csv
+import pickle
+from argparse import RawDescriptionHelpFormatter
+from collections import defaultdict
+from timeit import default_timer as timer
+from typing import Optional
+
+import profiler
+from generator import COMPRESSION_SUFFIXES, artifact_file, cypher_file, open_artifact, pickle_file
+from ingest_6 import NODE_FIELDS, csv_compression
+from node import DIMENSIONS, WIDE_CHUNK, Node, TreeNode, name_tokens
+
+CSV_FIELDS = Node._fields + ("tokens",)
+REL_FIELDS = ("parent_id", "id")
+
+# noinspection SqlNoDataSourceInspection
+NODE_CYPHER = '''USING PERIODIC COMMIT ~COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_~CASE~_{kind}.csv~CSV_SUFFIX~" AS row
+CREATE (:{label} {{
+{fields},
+    tokens: row.tokens
+}});
+'''
+
+# noinspection SqlNoDataSourceInspection
+REL_CYPHER = '''USING PERIODIC COMMIT ~COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_~CASE~_{kind}_rel.csv~CSV_SUFFIX~" AS row
+MATCH (p:Directory {{id: toInteger(row.parent_id)}})
+MATCH (c:{label} {{id: toInteger(row.id)}})
+CREATE (p)-[:PARENT_OF]->(c);
+'''
+
+# All nodes first, then all edges
+CYPHER = "\n".join(
+    [NODE_CYPHER.format(kind=k, label=l, fields=NODE_FIELDS) for k, l in (("dir", "Directory"), ("file", "File"))] +
+    [REL_CYPHER.format(kind=k, label=l) for k, l in (("dir", "Directory"), ("file", "File"))]
+)
+
+# noinspection SqlNoDataSourceInspection
+WIDE_REL_CYPHER = '''USING PERIODIC COMMIT ~WIDE_COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_~CASE~_{kind}_wide_rel.csv~CSV_SUFFIX~" AS row
+MATCH (p:Directory {{id: toInteger(row.parent_id)}})
+UNWIND split(row.ids, ";") AS cid
+MATCH (c:{label} {{id: toInteger(cid)}})
+CREATE (p)-[:PARENT_OF]->(c);
+'''
+
+WIDE_CYPHER = "\n".join(WIDE_REL_CYPHER.format(kind=k, label=l) for k, l in (("dir", "Directory"), ("file", "File")))
+
+# noinspection SqlNoDataSourceInspection
+DIM_NODE_CYPHER = '''USING PERIODIC COMMIT ~COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_~CASE~_{field}.csv~CSV_SUFFIX~" AS row
+CREATE (:{label} {{id: {value}}});
+'''
+
+# noinspection SqlNoDataSourceInspection
+DIM_REL_CYPHER = '''USING PERIODIC COMMIT ~COMMIT_SIZE~
+LOAD CSV WITH HEADERS FROM "file:///i8_~CASE~_{kind}_{field}.csv~CSV_SUFFIX~" AS row
+MATCH (n:{node_label} {{id: toInteger(row.id)}})
+MATCH (x:{label} {{id: {value}}})
+CREATE (n)-[:{rel}]->(x);
+'''
+
+
+def dim_value(dim) -> str:
+    """ Cypher for a dimension value read from a csv row """
+    return "row.value" if Node._field_types[dim.field] == str else "toInteger(row.value)"
+
+
+def dim_kinds(dim):
+    return (("dir", "Directory"), ("file", "File")) if dim.dirs else (("file", "File"),)
+
+
+# Dimension nodes, then dimension edges - after the base load
+DIM_CYPHER = "\n".join(
+    [DIM_NODE_CYPHER.format(field=d.field, label=d.label, value=dim_value(d).replace("row.value", "row.id"))
+     for d in DIMENSIONS] +
+    [DIM_REL_CYPHER.format(kind=k, node_label=l, field=d.field, label=d.label, rel=d.rel, value=dim_value(d))
+     for d in DIMENSIONS for k, l in dim_kinds(d)]
+)
+
+
+def csv_name(case: str, kind: str, compression: Optional[str]=None) -> str:
+    return artifact_file(f"./neo4j/import/i8_{case}_{kind}.csv", False, csv_compression(compression))
+
+
+def gen_csv(root: TreeNode, case: str, compression: Optional[str]=None) -> int:
+    """
+    Write node csvs and relationship csvs in a single pass over the tree
+    :return: how many wide directories had their edges written to the wide csvs
+    """
+    wide = {t.me.id for t in root.wide()}
+    wide_children = {"dir": defaultdict(list), "file": defaultdict(list)}
+    kinds = ("dir", "file", "dir_rel", "file_rel")
+    files = {k: open_artifact(csv_name(case, k, compression), "wt") for k in kinds}
+    try:
+        writers = {}
+        for k, f in files.items():
+            fields = REL_FIELDS if k.endswith("_rel") else CSV_FIELDS
+            writers[k] = csv.DictWriter(f, fields, extrasaction="ignore")
+            writers[k].writeheader()
+        for item in root.iter():
+            kind = "dir" if item.is_dir() else "file"
+            row = item._asdict()
+            row["tokens"] = name_tokens(item.name)
+            writers[kind].writerow(row)
+            # The root node has no parent - so no edge
+            if item.parent_id in wide:
+                wide_children[kind][item.parent_id].append(item.id)
+            elif item.parent_id:
+                writers[f"{kind}_rel"].writerow(row)
+    finally:
+        for f in files.values():
+            f.close()
+
+    if wide:
+        for kind, children in wide_children.items():
+            with open_artifact(csv_name(case, f"{kind}_wide_rel", compression), "wt") as f:
+                writer = csv.writer(f)
+                writer.writerow(("parent_id", "ids"))
+                for parent in sorted(children):
+                    ids = children[parent]
+                    writer.writerows((parent, ";".join(map(str, ids[i:i + WIDE_CHUNK])))
+                                     for i in range(0, len(ids), WIDE_CHUNK))
+    return len(wide)
+
+
+def gen_dimension_csv(root: TreeNode, case: str, compression: Optional[str]=None) -> None:
+    """ Write a csv of distinct values per dimension, and (id, value) edge csvs per dimension and label """
+    values = {d.field: set() for d in DIMENSIONS}
+    files = {}
+    writers = {}
+    try:
+        for d in DIMENSIONS:
+            for kind, _ in dim_kinds(d):
+                files[kind, d.field] = open_artifact(csv_name(case, f"{kind}_{d.field}", compression), "wt")
+                writers[kind, d.field] = csv.writer(files[kind, d.field])
+                writers[kind, d.field].writerow(("id", "value"))
+        for item in root.iter():
+            kind = "dir" if item.is_dir() else "file"
+            for d in DIMENSIONS:
+                if d.applies(item):
+                    value = getattr(item, d.field)
+                    values[d.field].add(value)
+                    writers[kind, d.field].writerow((item.id, value))
+    finally:
+        for f in files.values():
+            f.close()
+
+    for d in DIMENSIONS:
+        with open_artifact(csv_name(case, d.field, compression), "wt") as f:
+            writer = csv.writer(f)
+            writer.writerow(("id",))
+            writer.writerows((x,) for x in sorted(values[d.field]))
+
+
+def gen_cypher(case: str, compression: Optional[str]=None, dimensions: bool=False, wide: bool=False) -> None:
+    suffix = COMPRESSION_SUFFIXES.get(csv_compression(compression), "")
+    cypher = CYPHER + "\n" + WIDE_CYPHER if wide else CYPHER
+    cypher = cypher + "\n" + DIM_CYPHER if dimensions else cypher
+    with open_artifact(cypher_file(case, "i8d" if dimensions else "i8", False, compression), "wt") as f:
+        f.write(cypher.replace("~CASE~", case).replace("~CSV_SUFFIX~", suffix))
+
+
+cases = [
+    'case_100',
+    'case_5000',
+    'case_wide',
+    'case_2mil',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=RawDescriptionHelpFormatter)
+    parser.add_argument('-z', '--compress',
+                        choices=COMPRESSION_SUFFIXES,
+                        help='compress the generated cypher file; csv files are always gzip when compressed')
+    parser.add_argument('-d', '--dimensions',
+                        action='store_true',
+                        default=False,
+                        help='also model extension, owner and group as shared nodes (writes i8d files)')
+    parser.add_argument('--profile',
+                        action='store_true',
+                        default=False,
+                        help='profile CPU and memory by phase, writing stats to ./profiles')
+    args = parser.parse_args()
+    if args.profile:
+        profiler.enable("ingest_8")
+
+    for c in cases:
+        with open(pickle_file(c), "rb") as infile:
+            with profiler.phase("pickle"):
+                root = pickle.load(infile)
+            start = timer()
+            with profiler.phase("generate"):
+                wide = gen_csv(root, c, args.compress)
+                gen_cypher(c, args.compress, wide=wide > 0)
+                if args.dimensions:
+                    gen_dimension_csv(root, c, args.compress)
+                    gen_cypher(c, args.compress, True, wide > 0)
+            end = timer()
+            print(f"generated i8_{c}.cypher in {end - start:.2f} seconds - {wide} wide directories")
+    profiler.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+A write-coalescing front end for unordered, partial records - the Ingest 4 use case
+
+Dropbox style APIs deliver json objects describing individual elements, in no particular order and often
+incomplete. The i4 cypher stream re-MERGEs the parent Directory once per child and sets every property twice.
+
+MergeBuffer instead:
+- merges every partial record for the same id in memory - later values win
+- de-duplicates parent references and PARENT_OF edges
+- after a time window or max_records distinct ready ids, flushes one consolidated transaction:
+    nodes:  UNWIND $rows ... MERGE (n:Label {id}) SET n += row       - one statement per label
+    edges:  UNWIND $groups ... MERGE (p:Directory {id}) once per parent, then MERGE its children's edges
+
+Parents with node.WIDE_DIR or more children in a flush are supernodes: their edges are written after the
+transaction by Trinity.link_children() - one writer, a chunk of children per lock.
+
+Records need an id. A record whose label (tag) has not arrived yet is carried over to later flushes - without a
+label the MERGE could not use the id index. Carried records are kept apart and don't count toward max_records -
+otherwise a backlog of them would trigger flushes that write nothing. Labels already written are remembered per
+id, so a late partial record for a written node needs no tag. The tag is written into the query as the label, so
+a record whose tag is not one of TAGS is rejected and counted, never written.
+
+Given a partitioned Trinity, everything written is tagged with its partition and MERGEd within it - the same id
+in another partition is another node. replace_tree() re-ingests one scanned root that way, leaving the other
+partitions alone.
+
+Nodes with a name also get its tokens - node.name_tokens() - for the full-text name index, which replace_tree()
+creates once it is done.
+
+Use:
+    with MergeBuffer(Trinity()) as buffer:
+        buffer.ingest(open("records.jsonl"))
+"""
+import json
+from collections import defaultdict
+from timeit import default_timer as timer
+from typing import Dict, Iterable
+
+from node import WIDE_DIR, TreeNode, name_tokens
+from trinity import Trinity
+
+# A tag becomes a label in the query text - labels can't be parameters - so only these are accepted
+TAGS = ("Directory", "File")
+
+# noinspection SqlNoDataSourceInspection
+WRITE_NODES = """
+    UNWIND $rows AS row
+    MERGE (n:{label} {{id: row.id}})
+    SET n += row
+    {partition}"""
+
+# noinspection SqlNoDataSourceInspection
+WRITE_EDGES = """
+    UNWIND $groups AS g
+    MERGE (p:Directory {{id: g.parent}})
+    {partition}
+    WITH p, g
+    UNWIND g.children AS cid
+    MATCH (c:{label} {{id: cid}})
+    MERGE (p) - [:PARENT_OF] -> (c)"""
+
+
+class MergeBuffer:
+
+    def __init__(self, trinity: Trinity, window: float=1.0, max_records: int=5000):
+        self.trinity = trinity
+        self.window = window
+        self.max_records = max_records
+        self.nodes: Dict[int, Dict] = {}  # id -> merged properties, label known - ready to write
+        self.carried: Dict[int, Dict] = {}  # id -> merged properties, waiting for a label
+        self.labels: Dict[int, str] = {}  # id -> label, for everything written
+        self.first = None
+        self.received = 0
+        self.written = 0
+        self.flushes = 0
+        self.dropped = 0  # carried records that never got a label, set by close()
+        self.rejected = 0  # records with a tag that is not in TAGS - never written
+
+    def add(self, record: Dict) -> None:
+        """ Merge a partial record into the buffer, flushing if the window or size limit is reached """
+        self.received += 1
+        if record.get("tag") is not None and record["tag"] not in TAGS:
+            self.rejected += 1
+            return
+        i = record["id"]
+        node = self.nodes.get(i) or self.carried.pop(i, None)
+        if node is None:
+            node = dict(record)
+        else:
+            node.update(record)
+        if not node.get("tag") and i in self.labels:
+            node["tag"] = self.labels[i]
+        if not node.get("tag"):
+            self.carried[i] = node
+            return
+        if self.first is None:
+            self.first = timer()
+        self.nodes[i] = node
+        if len(self.nodes) >= self.max_records or timer() - self.first >= self.window:
+            self.flush()
+
+    def ingest(self, lines: Iterable[str]) -> None:
+        """ Add a record per json line """
+        for line in lines:
+            if line.strip():
+                self.add(json.loads(line))
+
+    def flush(self, final: bool=False) -> None:
+        """ Write everything whose label is known in one transaction """
+        ready = self.nodes
+        self.nodes = {}
+        self.first = None
+        # the carried records wait for their label - or are dropped if there is no later
+        if final:
+            self.carried = {}
+        if not ready:
+            return
+
+        rows = defaultdict(list)
+        children = defaultdict(lambda: defaultdict(list))  # label -> parent id -> child ids
+        for node in ready.values():
+            self.labels[node["id"]] = node["tag"]
+            if node.get("name") is not None:
+                node["tokens"] = name_tokens(node["name"])
+            rows[node["tag"]].append(node)
+            if node.get("parent_id") is not None:
+                children[node["tag"]][node["parent_id"]].append(node["id"])
+
+        wide = []
+        scope, tag = self.trinity.scope, self.trinity.partition_set
+        with self.trinity.session() as session:
+            with session.begin_transaction() as tx:
+                # Directories first - they are the parents the edges will look up
+                for label in sorted(rows, key=lambda x: x != "Directory"):
+                    tx.run(scope(WRITE_NODES.format(label=label, partition=tag("n"))), {"rows": rows[label]})
+                for label, parents in children.items():
+                    groups = [{"parent": p, "children": c} for p, c in parents.items() if len(c) < WIDE_DIR]
+                    wide += [(p, c, label) for p, c in parents.items() if len(c) >= WIDE_DIR]
+                    if groups:
+                        tx.run(scope(WRITE_EDGES.format(label=label, partition=tag("p"))), {"groups": groups})
+        for parent, ids, label in wide:
+            self.trinity.link_children(parent, ids, label)
+        self.trinity.wrote()
+        directories = self.trinity.directory_index()
+        if directories is not None:
+            for node in rows.get("Directory", []):
+                if "parent_id" in node:
+                    directories.update(node["id"], node["parent_id"])
+        self.written += len(ready)
+        self.flushes += 1
+
+    def close(self) -> int:
+        """ Flush everything left. Returns the number of records dropped for never getting a label """
+        self.dropped = len(self.carried)
+        self.flush(final=True)
+        if self.dropped:
+            print(f"MergeBuffer: dropped {self.dropped} records that never received a tag")
+        if self.rejected:
+            print(f"MergeBuffer: rejected {self.rejected} records with a tag other than {', '.join(TAGS)}")
+        return self.dropped
+
+    def __enter__(self) -> "MergeBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if not exc_type:
+            self.close()
+
+
+def replace_tree(trinity: Trinity, root: TreeNode, max_records: int=5000) -> int:
+    """
+    Replace a partition's nodes with a fresh scan of its root - clean() on a partitioned Trinity only deletes
+    that partition
+    :return: the number of nodes written
+    """
+    if not trinity.partition:
+        raise ValueError("replace_tree() needs a Trinity with a partition - otherwise it would replace everything")
+    trinity.clean().create_constraints()
+    with MergeBuffer(trinity, window=float("inf"), max_records=max_records) as buffer:
+        for node in root.iter():
+            record = node._asdict()
+            record["path"] = str(record["path"])
+            if node is root.me:
+                record["parent_id"] = None  # the scanned root is the top of its partition
+            buffer.add(record)
+    trinity.ensure_name_index()
+    return buffer.written
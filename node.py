@@ -1,7 +1,8 @@
 import json
+import re
 from pathlib import Path
 from random import randint
-from typing import Dict, List, NamedTuple, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional
 
 
 class Node(NamedTuple):
@@ -81,6 +82,119 @@ class Node(NamedTuple):
         return f"({self.var}:{self.tag} {json.dumps(self._asdict(), sort_keys=True, default=str)})"
 
 
+class Dimension(NamedTuple):
+    """
+    A Node property modeled as shared nodes - one per distinct value - instead of a property on every node
+    e.g. (f:File) - [:HAS_EXTENSION] -> (:Extension {id: 'py'})
+    """
+    label: str
+    field: str
+    rel: str
+    dirs: bool  # do directories get this edge too?
+
+    def applies(self, node: Node) -> bool:
+        """ Empty values (e.g. no extension) get no edge """
+        return (self.dirs or not node.is_dir()) and getattr(node, self.field) not in ("", None)
+
+
+DIMENSIONS = (
+    Dimension("Extension", "extension", "HAS_EXTENSION", False),
+    Dimension("Owner", "owner", "OWNED_BY", True),
+    Dimension("Group", "group", "IN_GROUP", True),
+)
+
+# A directory with this many children is a supernode - every PARENT_OF write to its children locks it
+WIDE_DIR = 1000
+# Child ids per write when linking a supernode's children - one parent lookup and lock per chunk
+WIDE_CHUNK = 1000
+
+NAME_PART = re.compile(r"[0-9a-z]+")
+
+# The full-text index over name_tokens() - see Trinity.create_name_index()
+NAME_INDEX = "name_tokens"
+
+
+def name_parts(name: str) -> List[str]:
+    """ The lower-cased alphanumeric runs of a name: 'Py_Compile.c' -> ['py', 'compile', 'c'] """
+    return NAME_PART.findall(name.lower())
+
+
+def trigrams(part: str) -> List[str]:
+    return [part[i:i + 3] for i in range(len(part) - 2)]
+
+
+def name_tokens(name: str) -> str:
+    """
+    Searchable tokens for a name - its parts and their trigrams, whitespace separated for the full-text index
+    Any substring of a name that spans 3+ alphanumerics shares its trigrams - see Trinity.name_match()
+    """
+    tokens = []
+    for part in name_parts(name):
+        tokens.append(part)
+        tokens.extend(trigrams(part))
+    return " ".join(dict.fromkeys(tokens))
+
+
+def regex_literals(pattern: str) -> List[str]:
+    """
+    Literal fragments every match of a regex must contain - case folded, so a superset of matches
+        '.*[Pp]y_comp.*'  -> ['py_comp']
+        'credit.*card.*'  -> ['credit', 'card']
+    Returns [] for alternation and groups - anything could match, so a caller must scan
+    """
+    if "|" in pattern or "(" in pattern:
+        return []
+    literals = []
+    current = ""
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if "\\" == c and i + 1 < len(pattern):
+            i += 1
+            if pattern[i].isalnum():
+                # a class like \d or \w - not a literal
+                literals.append(current)
+                current = ""
+            else:
+                current += pattern[i]
+        elif "[" == c:
+            end = pattern.find("]", i + 1)
+            if end < 0:
+                return []
+            chars = set(pattern[i + 1:end].lower())
+            if 1 == len(chars) and "^" not in chars:
+                current += chars.pop()  # [Pp] -> p
+            else:
+                literals.append(current)
+                current = ""
+            i = end
+        elif c in "*?{":
+            # the previous atom is optional
+            literals.append(current[:-1])
+            current = ""
+            if "{" == c:
+                i = pattern.find("}", i)
+                if i < 0:
+                    return []
+        elif c in ".^$+":
+            literals.append(current)
+            current = ""
+        else:
+            current += c
+        i += 1
+    literals.append(current)
+    return [x.lower() for x in literals if x]
+
+
+def pattern_tokens(pattern: str) -> str:
+    """
+    A full-text query for NAME_INDEX finding every candidate match of a name regex - all the trigrams of its
+    literals: '.*address.*' -> '+add +ddr +dre +res +ess'. Empty when there are none and a caller must scan
+    """
+    grams = [g for literal in regex_literals(pattern) for part in name_parts(literal) for g in trigrams(part)]
+    return " ".join(f"+{g}" for g in dict.fromkeys(grams))
+
+
 class RandomNode(Node):
     """
     Provide a random variable to Node
@@ -141,6 +255,16 @@ class TreeNode(NamedTuple):
             else:
                 self.files.append(node)
     
+    def fan_out(self) -> int:
+        return len(self.files) + len(self.dirs)
+
+    def wide(self, threshold: int=WIDE_DIR) -> Iterator["TreeNode"]:
+        """ Every directory in this tree with at least threshold direct children """
+        if self.fan_out() >= threshold:
+            yield self
+        for d in self.dirs:
+            yield from d.wide(threshold)
+
     def iter(self):
         """
         A recursive generator - producing nodes (stripping out the TreeNode part)
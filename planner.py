@@ -0,0 +1,90 @@
+"""
+Pick an ingestion strategy and batch size from stored benchmark results
+
+Every bench.py run stores its results in the history store (history.py). The planner fits a cost model per
+(strategy, batch size) to the successful runs:
+
+    log(nodes/sec) = a + b * log(nodes)
+
+so throughput can rise (amortized overhead) or fall (bigger transactions, more heap) with dataset size.
+Recorded failures (e.g. heap exhaustion) mark a candidate unsafe at and above the size that failed.
+
+Only results from the same server memory config are used when there are any - a bigger heap changes
+which strategies are safe.
+"""
+import math
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import history
+
+
+class Plan(NamedTuple):
+    strategy: int
+    batch_size: int
+    predicted: float  # seconds
+    runs: int  # how many results the prediction is fit on
+
+
+def fit(points: List[Tuple[int, float]]) -> Tuple[float, float]:
+    """
+    Least squares fit of log(nps) = a + b * log(nodes)
+    :param points: (nodes, nodes/sec) pairs
+    :return: (a, b) - b is 0 when all points share a node count
+    """
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(nps) for _, nps in points]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    if sxx == 0:
+        return my, 0.0
+    b = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+    return my - b * mx, b
+
+
+def candidate_key(result: Dict) -> Tuple[int, int]:
+    # ingest 1 is gulped and ingest 8 is LOAD CSV - batch size means nothing to them
+    strategy = result["strategy"]
+    return strategy, 0 if strategy in (1, 8) else result["batch_size"]
+
+
+def choose(nodes: int, server: Optional[Dict]=None, results: Optional[List[Dict]]=None,
+           strategies: Tuple[int, ...]=(1, 2, 4, 6, 8)) -> Optional[Plan]:
+    """
+    Predict the fastest safe strategy and batch size for a dataset of nodes
+    :param nodes: dataset node count
+    :param server: server memory config (Trinity.server_config()) - prefer results from the same config
+    :param results: bench results, default history.load_results()
+    :param strategies: strategies we have artifacts for
+    :return: the fastest safe Plan, None if there are no usable results
+    """
+    results = history.load_results() if results is None else results
+    if server:
+        same = [r for r in results if r.get("server") == server]
+        if same:
+            results = same
+        else:
+            print("planner: no results for this server config - using all results")
+
+    points = defaultdict(list)
+    failed_at = {}
+    for r in results:
+        key = candidate_key(r)
+        if key[0] not in strategies or r.get("model", "flat") != "flat" or r.get("buffered") or r.get("batch_bytes"):
+            continue
+        if r.get("failed"):
+            failed_at[key] = min(failed_at.get(key, r["nodes"]), r["nodes"])
+        else:
+            points[key].append((r["nodes"], r["nodes"] / r["duration"]))
+
+    plans = []
+    for key, pts in points.items():
+        if key in failed_at and failed_at[key] <= nodes:
+            print(f"planner: skipping i{key[0]} batch {key[1]} - failed at {failed_at[key]} nodes")
+            continue
+        a, b = fit(pts)
+        nps = math.exp(a + b * math.log(nodes))
+        plans.append(Plan(key[0], key[1], nodes / nps, len(pts)))
+
+    return min(plans, key=lambda p: p.predicted) if plans else None
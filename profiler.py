@@ -0,0 +1,88 @@
+"""
+CPU and memory profiling by phase - scan, pickle, generate, ingest, validate
+
+Scripts turn it on with --profile, which calls enable(). Code marks phases with:
+
+    with profiler.phase("scan"):
+        ...
+
+which is a no-op unless profiling is enabled. A phase may be entered many times (e.g. once per bench
+iteration) - its stats accumulate.
+
+For each phase, report() prints wall time, peak traced memory and the top functions, and writes:
+- {out_dir}/{name}_{phase}.prof        cProfile stats: snakeviz, or flamegraphs via flameprof / gprof2dot
+- {out_dir}/{name}_{phase}.tracemalloc a tracemalloc snapshot taken at the peak phase exit
+
+NOTES:
+- tracemalloc slows allocation heavy code (new_node, Node formatting) noticeably - compare timings
+  between profiled runs, not against unprofiled ones
+- phases must not nest - cProfile allows one active profiler
+"""
+import cProfile
+import io
+import pstats
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from timeit import default_timer as timer
+
+_name = None
+_out_dir = "./profiles"
+_top = 15
+_phases = OrderedDict()  # phase -> {"profile", "seconds", "peak", "snapshot"}
+
+
+def enable(name: str, out_dir: str="./profiles", top: int=15) -> None:
+    """ Turn on profiling for a script run - name prefixes the stats files """
+    global _name, _out_dir, _top
+    _name, _out_dir, _top = name, out_dir, top
+
+
+def enabled() -> bool:
+    return _name is not None
+
+
+@contextmanager
+def phase(name: str):
+    if not enabled():
+        yield
+        return
+    stats = _phases.setdefault(name, {"profile": cProfile.Profile(), "seconds": 0.0, "peak": 0, "snapshot": None})
+    # restart tracing so the peak is this phase's own
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    tracemalloc.start()
+    start = timer()
+    stats["profile"].enable()
+    try:
+        yield
+    finally:
+        stats["profile"].disable()
+        stats["seconds"] += timer() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        if peak >= stats["peak"]:
+            stats["peak"] = peak
+            stats["snapshot"] = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+
+def report() -> None:
+    """ Print a summary per phase and write the stats files """
+    if not enabled() or not _phases:
+        return
+    Path(_out_dir).mkdir(parents=True, exist_ok=True)
+    for name, stats in _phases.items():
+        fn = f"{_out_dir}/{_name}_{name}"
+        stats["profile"].dump_stats(f"{fn}.prof")
+        if stats["snapshot"]:
+            stats["snapshot"].dump(f"{fn}.tracemalloc")
+
+        out = io.StringIO()
+        pstats.Stats(stats["profile"], stream=out).sort_stats("cumulative").print_stats(_top)
+        print(f"===> Phase {name}: {stats['seconds']:.3f}s, peak memory {stats['peak'] / 2**20:.1f} MiB")
+        print(f"     stats in {fn}.prof, {fn}.tracemalloc")
+        # skip pstats' header - the interesting part starts at the column titles
+        body = out.getvalue()
+        print(body[body.find("   ncalls"):].rstrip())
+        print()
@@ -0,0 +1,163 @@
+"""
+Named, parameterized read queries - the read paths production actually uses
+
+These mirror the README and example.py queries: the classification hierarchy, IS_CLASSIFIED* PII rollups,
+perspective CAN_READ lookups and regex name matches.
+
+SETUP statements decorate an ingested case with the classifications and perspectives the queries need. The
+PII_NAME_RULES are not a query here: Trinity.classify_names() runs each through Trinity.name_match(), which picks
+the name index or a scan.
+
+Catalog queries with an index param read the full-text name index - QueryBench skips them when it is missing.
+
+Register them with Trinity.register() to run them by name from plans warmed with Trinity.warm().
+"""
+from typing import Dict, List, NamedTuple
+
+from node import NAME_INDEX, pattern_tokens
+
+
+class Query(NamedTuple):
+    name: str
+    cypher: str
+    params: Dict
+
+
+# The example.class_pii hierarchy as (parent, child) pairs
+PII_EDGES = [
+    ('pii', 'pii_sensitive'),
+    ('pii_sensitive', 'pifi'),
+    ('pifi', 'credit_card'),
+    ('pifi', 'bank_account'),
+    ('pii_sensitive', 'ssn'),
+    ('pii_sensitive', 'passport'),
+    ('pii', 'pii_non_sensitive'),
+    ('pii_non_sensitive', 'phone'),
+    ('pii_non_sensitive', 'address'),
+]
+
+# The example.class_pii filename rules as (classification, regex) pairs - see Trinity.classify_names()
+PII_NAME_RULES = [
+    ('address', '.*address.*'),
+    ('credit_card', 'credit.*card.*'),
+    ('passport', '.*passport.*'),
+    ('phone', '.*phone.*'),
+    ('ssn', '.*ssn.*'),
+]
+
+# Create the PII classification hierarchy - idempotent
+PII_HIERARCHY = Query("class_pii_hierarchy", """
+        UNWIND $edges AS edge
+        MERGE (p:Classification {id: edge[0], name: edge[0]})
+        MERGE (c:Classification {id: edge[1], name: edge[1]})
+        MERGE (p) - [:INCLUDES] -> (c)
+        MERGE (c) - [:IS_CLASSIFIED] -> (p)""", {"edges": PII_EDGES})
+
+# A perspective per permission class: its descr names the *_perm property it reads
+PERSPECTIVES = Query("perspectives", """
+        UNWIND $perspectives AS p
+        MERGE (:Perspective {id: p[0], name: p[0], descr: p[1]})""",
+          {"perspectives": [['tom', 'owner'], ['sales', 'group'], ['internet', 'other']]})
+
+# n[...] reads the permission property named by the perspective - one plan for all three
+PERSPECTIVE_READS = Query("perspective_reads", """
+        MATCH (p:Perspective)
+        MATCH (n)
+        WHERE (n:File OR n:Directory)
+            AND n[p.descr + '_perm'] >= $bits
+        MERGE (p) - [:CAN_READ] -> (n)""", {"bits": 4})
+
+# Relationship types can't be parameters - writes get their own query
+PERSPECTIVE_WRITES = Query("perspective_writes", """
+        MATCH (p:Perspective)
+        MATCH (n)
+        WHERE (n:File OR n:Directory)
+            AND n[p.descr + '_perm'] >= $bits
+        MERGE (p) - [:CAN_WRITE] -> (n)""", {"bits": 6})
+
+SETUP: List[Query] = [
+    Query("class_code", """
+        MERGE (c:Classification {id: 'code', name: 'code'})
+        WITH c
+        MATCH (f:File)
+        WHERE f.extension IN $extensions
+        MERGE (f) - [:IS_CLASSIFIED] -> (c)""", {"extensions": ['c', 'py', 'sh']}),
+    Query("class_big", """
+        MERGE (c:Classification {id: 'big', name: 'big'})
+        WITH c
+        MATCH (f:File)
+        WHERE f.size > $size
+        MERGE (f) - [:IS_CLASSIFIED] -> (c)""", {"size": 5000}),
+    PII_HIERARCHY,
+    PERSPECTIVES,
+    PERSPECTIVE_READS,
+]
+
+CATALOG: List[Query] = [
+    Query("classification_hierarchy", """
+        MATCH (c:Classification {id: $root}) - [:INCLUDES*] -> (cc:Classification)
+        RETURN cc.id""", {"root": 'pii'}),
+    Query("pii_rollup", """
+        MATCH (n:File) - [:IS_CLASSIFIED*] -> (:Classification {id: $root})
+        RETURN n.path""", {"root": 'pii'}),
+    Query("pii_by_classification", """
+        MATCH (n:File) - [:IS_CLASSIFIED] -> (c:Classification) - [:IS_CLASSIFIED*] -> (:Classification {id: $root})
+        RETURN c.name, n.path""", {"root": 'pii'}),
+    Query("classified_code", """
+        MATCH (n) - [:IS_CLASSIFIED] -> (:Classification {id: $id})
+        RETURN n.path""", {"id": 'code'}),
+    Query("perspective_can_read", """
+        MATCH (:Perspective {id: $perspective}) - [:CAN_READ] -> (n)
+        RETURN count(n)""", {"perspective": 'internet'}),
+    Query("perspective_pii", """
+        MATCH (:Perspective {id: $perspective}) - [:CAN_READ] -> (n:File) - [:IS_CLASSIFIED*] -> (:Classification {id: $root})
+        RETURN n.path""", {"perspective": 'internet', "root": 'pii'}),
+    Query("stem_regex", """
+        MATCH (n)
+        WHERE (n:Directory OR n:File) AND n.stem =~ $pattern
+        RETURN n.path""", {"pattern": '.*[Pp]y.*'}),
+    Query("name_regex", """
+        MATCH (f:File)
+        WHERE f.name =~ $pattern
+        RETURN f.path""", {"pattern": '.*address.*'}),
+    # the same, with candidates from the name index - what Trinity.name_match() does when it can
+    Query("name_regex_indexed", """
+        CALL db.index.fulltext.queryNodes($index, $tokens) YIELD node AS f
+        WHERE f:File AND f.name =~ $pattern
+        RETURN f.path""", {"pattern": '.*address.*', "index": NAME_INDEX, "tokens": pattern_tokens('.*address.*')}),
+    # stem_regex's '.*[Pp]y.*' has no 3 character literal for the index - compare on one that has
+    Query("stem_literal", """
+        MATCH (n)
+        WHERE (n:Directory OR n:File) AND n.stem =~ $pattern
+        RETURN n.path""", {"pattern": '.*test.*'}),
+    Query("stem_literal_indexed", """
+        CALL db.index.fulltext.queryNodes($index, $tokens) YIELD node AS n
+        WHERE (n:Directory OR n:File) AND n.stem =~ $pattern
+        RETURN n.path""", {"pattern": '.*test.*', "index": NAME_INDEX, "tokens": pattern_tokens('.*test.*')}),
+    Query("extension_in", """
+        MATCH (f:File)
+        WHERE f.extension IN $extensions
+        RETURN count(f)""", {"extensions": ['c', 'py', 'sh']}),
+    Query("extension_eq", """
+        MATCH (f:File)
+        WHERE f.extension = $extension
+        RETURN count(f)""", {"extension": 'py'}),
+    Query("owner_eq", """
+        MATCH (n)
+        WHERE (n:File OR n:Directory) AND n.owner = $owner
+        RETURN count(n)""", {"owner": 501}),
+]
+
+# The same questions asked of the shared dimension node model (ingest -d) - one hop from a single node
+DIMENSION_CATALOG: List[Query] = [
+    Query("dim_extension_in", """
+        MATCH (x:Extension) <- [:HAS_EXTENSION] - (f:File)
+        WHERE x.id IN $extensions
+        RETURN count(f)""", {"extensions": ['c', 'py', 'sh']}),
+    Query("dim_extension_eq", """
+        MATCH (:Extension {id: $extension}) <- [:HAS_EXTENSION] - (f:File)
+        RETURN count(f)""", {"extension": 'py'}),
+    Query("dim_owner_eq", """
+        MATCH (:Owner {id: $owner}) <- [:OWNED_BY] - (n)
+        RETURN count(n)""", {"owner": 501}),
+]
@@ -0,0 +1,105 @@
+"""
+The query bench loads a case and times the read queries in queries.CATALOG
+
+Phases:
+- cold: plan caches are cleared before every execution, so each run pays for planning
+        NOTE: the page cache cannot be cleared without a restart - cold means cold plans, not cold disk
+- warm: a few untimed runs prime the caches, then every run is timed
+
+Each query is also run once with PROFILE to capture total db hits and the plan tree.
+"""
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Dict, List, Optional
+
+from queries import CATALOG, PII_NAME_RULES, SETUP, Query
+from trinity import Trinity
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """ Linear interpolation between closest ranks - values need not be sorted """
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def total_db_hits(plan) -> int:
+    """ Sum db hits over a ProfiledPlan tree """
+    return plan.db_hits + sum(total_db_hits(c) for c in plan.children)
+
+
+def format_plan(plan, indent: int=0) -> str:
+    """ Render a ProfiledPlan tree, one operator per line """
+    lines = [f"{' ' * indent}{plan.operator_type}  rows={plan.rows}  dbHits={plan.db_hits}"]
+    for c in plan.children:
+        lines.append(format_plan(c, indent + 2))
+    return "\n".join(lines)
+
+
+class QueryBench:
+
+    def __init__(self, trinity: Trinity, iterations: int, warmup: int=3, plan_dir: Optional[str]=None):
+        self.trinity = trinity
+        self.iterations = iterations
+        self.warmup = warmup
+        self.plan_dir = plan_dir
+        self.stats = ["Query\tPhase\tRuns\tp50 ms\tp90 ms\tp99 ms\tMax ms\tdbHits"]
+
+    def setup(self) -> None:
+        """ Add the classifications and perspectives the catalog reads """
+        with self.trinity.session() as session:
+            for q in SETUP:
+                session.run(q.cypher, q.params).consume()
+        self.trinity.wrote()
+        self.trinity.classify_names(PII_NAME_RULES)
+
+    def time_query(self, session, q: Query) -> float:
+        start = timer()
+        session.run(q.cypher, q.params).consume()
+        return timer() - start
+
+    def cold(self, q: Query) -> List[float]:
+        durations = []
+        with self.trinity.session() as session:
+            for _ in range(self.iterations):
+                session.run("CALL db.clearQueryCaches()").consume()
+                durations.append(self.time_query(session, q))
+        return durations
+
+    def warm(self, q: Query) -> List[float]:
+        with self.trinity.session() as session:
+            for _ in range(self.warmup):
+                session.run(q.cypher, q.params).consume()
+            return [self.time_query(session, q) for _ in range(self.iterations)]
+
+    def profile(self, q: Query, case: str) -> int:
+        """ PROFILE the query once - return total db hits and optionally save the plan """
+        with self.trinity.session() as session:
+            plan = session.run(f"PROFILE {q.cypher}", q.params).summary().profile
+        if self.plan_dir:
+            Path(self.plan_dir).mkdir(parents=True, exist_ok=True)
+            with open(f"{self.plan_dir}/{case}_{q.name}.txt", "w") as f:
+                f.write(f"{q.cypher.strip()}\n\n{q.params}\n\n{format_plan(plan)}\n")
+        return total_db_hits(plan)
+
+    def add_stat(self, name: str, phase: str, durations: List[float], db_hits: int) -> None:
+        ms = [x * 1000 for x in durations]
+        pcts = "\t".join(f"{percentile(ms, p):.2f}" for p in (50, 90, 99))
+        self.stats.append(f"{name}\t{phase}\t{len(ms)}\t{pcts}\t{max(ms):.2f}\t{db_hits}")
+
+    def run(self, case: str, catalog: List[Query]=CATALOG) -> Dict[str, int]:
+        """ Time every catalog query on the currently loaded case. Returns db hits by query name """
+        self.setup()
+        indexed = self.trinity.has_name_index()
+        hits = {}
+        for q in catalog:
+            if "index" in q.params and not indexed:
+                print(f"  {q.name} - skipped, no name index")
+                continue
+            print(f"  {q.name}")
+            hits[q.name] = self.profile(q, case)
+            self.add_stat(f"{case}_{q.name}", "cold", self.cold(q), hits[q.name])
+            self.add_stat(f"{case}_{q.name}", "warm", self.warm(q), hits[q.name])
+        return hits
@@ -40,12 +40,14 @@ fi
     fi
 
     echo "Running Neo4j"
+    # host.docker.internal lets LOAD CSV reach ./ingest_6.py --serve on this machine - built in on macOS
     docker run -d                   \
         -p 7474:7474                \
         -p 7687:7687                \
         -v ${PROJECT_DIR}:/project  \
         -v ${DATA_DIR}:/data        \
         -v ${IMPORT_DIR}:/var/lib/neo4j/import  \
+        --add-host host.docker.internal:host-gateway  \
         --name ${CTNR_NAME}         \
         neo4j:latest
 )
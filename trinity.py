@@ -18,9 +18,204 @@ TODO: consume a TreeNode and provide processing for the following categories
 - newline finders
 - sprayers - session pool that suports unordered data, but also indexing cause it is MERGE
 """
+import json
+import re
+from array import array
+from collections import OrderedDict
+from time import monotonic
+from timeit import default_timer as timer
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
 from neo4j import GraphDatabase, basic_auth
 from neobolt.exceptions import CypherError
 
+from node import NAME_INDEX, WIDE_CHUNK, TreeNode, pattern_tokens
+
+
+class ResultCache:
+    """
+    An LRU cache of read query results, bounded by entry count and age
+
+    Entries remember the write generation they were read at and are stale once it moves on - so any write
+    through Trinity invalidates everything without having to know which queries it affected.
+
+    Rows are stored as a tuple of tuples, so a caller can't change what the next caller reads.
+    """
+    def __init__(self, size: int=256, ttl: float=300.0):
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def key(query: str, params: Optional[Dict]) -> Tuple[str, str]:
+        return query, json.dumps(params or {}, sort_keys=True, default=str)
+
+    def get(self, key: Tuple[str, str], generation: int) -> Optional[Tuple[Tuple, ...]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != generation or entry[1] < monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def put(self, key: Tuple[str, str], generation: int, rows: Tuple[Tuple, ...]) -> None:
+        self._entries[key] = (generation, monotonic() + self.ttl, rows)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Partitions are labels - labels can't be parameters, so keys are restricted to what is safe to inline
+PARTITION_KEY = re.compile(r"^[A-Za-z0-9_]+$")
+PARTITION_PREFIX = "Root_"
+# A Directory/File label in a pattern or a predicate, not yet scoped
+SCOPE_LABELS = re.compile(rf":(Directory|File)\b(?!:{PARTITION_PREFIX})")
+
+
+def partition_label(key: str) -> str:
+    """ The label marking a partition's nodes, e.g. home -> Root_home """
+    if not PARTITION_KEY.match(key or ""):
+        raise ValueError(f"Invalid partition key: {key!r} - use letters, digits and _")
+    return PARTITION_PREFIX + key
+
+
+class Prepared(NamedTuple):
+    """ A registered query: its text never changes, values come from params """
+    cypher: str
+    params: Dict  # defaults - execute() overrides them per call
+    write: bool
+
+
+class DirectoryIndex:
+    """
+    A client side copy of the directory hierarchy - ancestors, depth and lowest common ancestor without a
+    PARENT_OF* traversal on the server
+
+    Directories are few next to files (538k vs 1.37M in case_2mil), so we keep only them: a dict from id to slot
+    and two arrays by slot - the id and the parent's slot. A file's containing directories are the ancestors of
+    its parent_id. Each query walks at most the tree depth.
+
+    Writes through the watcher and MergeBuffer keep it current via update() and remove(). Removed slots are
+    reused by later additions, so a long running watcher's arrays stay as large as its peak directory count.
+    """
+    ROOT = -1
+    REMOVED = -2
+
+    def __init__(self):
+        self._slots: Dict[int, int] = {}
+        self._ids = array("q")
+        self._parents = array("l")
+        self._free: List[int] = []  # removed slots - nothing live points at them
+
+    @classmethod
+    def from_tree(cls, root: TreeNode) -> "DirectoryIndex":
+        """ Build from a dataset - every Directory node in root """
+        index = cls()
+        for node in root.iter():
+            if node.is_dir():
+                index.update(node.id, node.parent_id)
+        return index
+
+    @classmethod
+    def from_graph(cls, trinity: "Trinity") -> "DirectoryIndex":
+        """ Build with one bulk read of Directory ids and parent ids - no traversal """
+        rows = list(trinity.stream(trinity.scope("MATCH (d:Directory) RETURN d.id, d.parent_id"), fetch_size=10_000))
+        index = cls()
+        # every id first, so parents can be linked whatever order the rows arrived in
+        for dir_id, _ in rows:
+            index._slot(dir_id)
+        for dir_id, parent_id in rows:
+            index.update(dir_id, parent_id)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, dir_id: int) -> bool:
+        return dir_id in self._slots
+
+    def _slot(self, dir_id: int) -> int:
+        slot = self._slots.get(dir_id)
+        if slot is None:
+            if self._free:
+                slot = self._slots[dir_id] = self._free.pop()
+                self._ids[slot] = dir_id
+                self._parents[slot] = self.ROOT
+            else:
+                slot = self._slots[dir_id] = len(self._ids)
+                self._ids.append(dir_id)
+                self._parents.append(self.ROOT)
+        return slot
+
+    def _chain(self, slot: int) -> Iterator[int]:
+        """ Slots from slot up to its root, slot included """
+        while slot >= 0:
+            yield slot
+            slot = self._parents[slot]
+
+    def update(self, dir_id: int, parent_id: Optional[int]) -> None:
+        """ Add a directory, or move it under a new parent. A parent we have not seen yet is added as a root """
+        slot = self._slot(dir_id)
+        # older ingests store the root's parent_id as the string "None"
+        if not isinstance(parent_id, int):
+            self._parents[slot] = self.ROOT
+            return
+        parent = self._slot(parent_id)
+        if slot in self._chain(parent):
+            raise ValueError(f"Moving {dir_id} under {parent_id} would make a cycle")
+        self._parents[slot] = parent
+
+    def remove(self, dir_ids: List[int]) -> int:
+        """ Remove directories and everything below them, return how many directories went """
+        removed = {self._slots[i] for i in dir_ids if i in self._slots}
+        if not removed:
+            return 0
+        doomed = dict.fromkeys(removed, True)  # slot -> is removed or below a removed directory
+        for slot in self._slots.values():
+            path = []
+            verdict = False
+            for s in self._chain(slot):
+                if s in doomed:
+                    verdict = doomed[s]
+                    break
+                path.append(s)
+            doomed.update((s, verdict) for s in path)
+        gone = [s for s, d in doomed.items() if d]
+        for s in gone:
+            del self._slots[self._ids[s]]
+            self._parents[s] = self.REMOVED
+        # everything below a removed directory went with it, so no live slot has a gone one as its parent
+        self._free.extend(gone)
+        return len(gone)
+
+    def ancestors(self, dir_id: int) -> List[int]:
+        """ dir_id's parent, grandparent, ... up to its root. A file's containing directories: [parent_id] + this """
+        return [self._ids[s] for s in self._chain(self._slots[dir_id])][1:]
+
+    def depth(self, dir_id: int) -> int:
+        """ 0 for a root """
+        return sum(1 for _ in self._chain(self._slots[dir_id])) - 1
+
+    def contains(self, ancestor_id: int, dir_id: int) -> bool:
+        """ True if dir_id is ancestor_id or below it """
+        target = self._slots.get(ancestor_id)
+        return target is not None and target in self._chain(self._slots[dir_id])
+
+    def lca(self, a: int, b: int) -> Optional[int]:
+        """ The lowest common ancestor of two directories (either may be it), None if they are in different trees """
+        seen = set(self._chain(self._slots[a]))
+        for s in self._chain(self._slots[b]):
+            if s in seen:
+                return self._ids[s]
+        return None
+
 
 class Trinity:
     """
@@ -30,12 +225,123 @@ class Trinity:
     NOTE: we don't have to close the driver or session - the base classes override __del__() to do that.
 
     We could also have a long lived driver class that used sessions in a short-lived fashion
+
+    Read results can be cached with query() - the cache and write generation are class level so they survive
+    our short lived instances. Anything that writes must bump the generation: run() and clean() do, ingest
+    paths that use session() directly call wrote().
+
+    A Trinity made with a partition works on one scanned root of a multi-root graph. Writers tag what they write
+    with the partition label and property (partition_set()); scope() narrows Directory/File labels in a query to
+    the partition - execute(), name_match() and clean() do it for you. Writers scope their MERGEs too, so a node's
+    identity is (partition, id): the same inode under two roots on different filesystems is two nodes. Community
+    edition has no composite node keys, so a partitioned create_constraints() asserts id uniqueness per partition
+    label and drops the global Directory/File id constraints, which a multi-root graph cannot satisfy.
+
+    Hot paths register their queries by name - register(), then warm() to check and plan them all up front, then
+    execute() by name. Values are always parameters, so each name is one query text and one cached plan.
     """
+    _cache: Optional[ResultCache] = None
+    _directories: Optional[DirectoryIndex] = None
+    _prepared: Dict[str, Prepared] = {}
+    _timings: Dict[str, List[float]] = {}  # name -> [executions, total seconds, slowest seconds, cache hits]
+    _write_generation = 0
     _constraints = "CONSTRAINT ON ({var}:{label}) ASSERT {var}.id IS UNIQUE;"
-    _labels = ("Directory", "File", "Classification", "Perspective")
+    _labels = ("Directory", "File", "Classification", "Perspective", "Extension", "Owner", "Group", "Content")
+    _checkpoint_read = "MATCH (ck:Checkpoint {id: $key}) RETURN ck.line, ck.hash"
+    _checkpoint_write = "MERGE (ck:Checkpoint {id: $key}) SET ck.line = $line, ck.hash = $hash"
+    _name_index = NAME_INDEX
+    _link_children = """
+        MERGE (p:Directory {{id: $parent}})
+        {partition}
+        WITH p
+        UNWIND $ids AS cid
+        MATCH (c:{label} {{id: cid}})
+        MERGE (p) - [:PARENT_OF] -> (c)"""
+
+    _tag_root = """
+        MATCH (r:Directory {{id: $id}})
+        WHERE coalesce(r.partition, $partition) = $partition
+        {partition}
+        RETURN r.id"""
+
+    _tag_children = """
+        UNWIND $ids AS id
+        MATCH (:Directory {{id: id}}) - [:PARENT_OF] -> (c)
+        WHERE coalesce(c.partition, $partition) = $partition
+        {partition}
+        RETURN c.id, c:Directory"""
 
-    def __init__(self, url: str="bolt://localhost", user: str="neo4j", password: str="Admin1234!"):
+    def __init__(self, url: str="bolt://localhost", user: str="neo4j", password: str="Admin1234!",
+                 partition: Optional[str]=None):
         self._driver = GraphDatabase.driver(url, auth=basic_auth(user, password))
+        self.partition = partition
+        self.partition_label = partition_label(partition) if partition else None
+
+    @classmethod
+    def enable_cache(cls, size: int=256, ttl: float=300.0) -> None:
+        """ Cache query() results - up to size entries, each for at most ttl seconds """
+        cls._cache = ResultCache(size, ttl)
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        cls._cache = None
+
+    def enable_directory_index(self, root: Optional[TreeNode]=None) -> DirectoryIndex:
+        """ Keep a client side DirectoryIndex - built from the dataset root if given, else read from the graph """
+        Trinity._directories = DirectoryIndex.from_tree(root) if root else DirectoryIndex.from_graph(self)
+        return Trinity._directories
+
+    @classmethod
+    def directory_index(cls) -> Optional[DirectoryIndex]:
+        """ The DirectoryIndex writers should update, None when not enabled """
+        return cls._directories
+
+    @classmethod
+    def disable_directory_index(cls) -> None:
+        cls._directories = None
+
+    @classmethod
+    def wrote(cls) -> None:
+        """ Note a write - bumps the write generation, invalidating every cached result """
+        cls._write_generation += 1
+
+    def scope(self, query: str) -> str:
+        """ Narrow every Directory and File label in query to our partition - the query itself when unpartitioned """
+        if not self.partition:
+            return query
+        return SCOPE_LABELS.sub(rf":\1:{self.partition_label}", query)
+
+    def partition_set(self, var: str="n") -> str:
+        """ A SET clause tagging var with our partition - append it after a write's MERGE or CREATE """
+        if not self.partition:
+            return ""
+        return f"SET {var}:{self.partition_label}, {var}.partition = '{self.partition}'"
+
+    def tag_partition(self, root_id: int, batch: int=5000) -> int:
+        """
+        Tag a root directory and everything below it with our partition - for ingest strategies that load cypher
+        or csv files, which know nothing of partitions. One level of the tree at a time, batch directories per
+        query, never a PARENT_OF* traversal. Nodes already in another partition are left to it
+        :return: the number of nodes tagged
+        """
+        if not self.partition:
+            raise ValueError("tag_partition() needs a Trinity with a partition")
+        # children are found by their edges from our own, already tagged, parents - never by id alone
+        query = self.scope(self._tag_children.format(partition=self.partition_set("c")))
+        tagged = 0
+        with self.session() as session:
+            frontier = session.run(self._tag_root.format(partition=self.partition_set("r")),
+                                   {"id": root_id, "partition": self.partition}).value()
+            tagged += len(frontier)
+            while frontier:
+                children = []
+                for i in range(0, len(frontier), batch):
+                    children += session.run(query, {"ids": frontier[i:i + batch],
+                                                    "partition": self.partition}).values()
+                tagged += len(children)
+                frontier = [cid for cid, is_dir in children if is_dir]
+        self.wrote()
+        return tagged
 
     def clean(self) -> "Trinity":
         """
@@ -43,29 +349,54 @@ class Trinity:
         - Remove all existing nodes and relationships
         - Remove all constraints
 
+        With a partition, remove only the partition's nodes - in batches, so a large root doesn't need one huge
+        transaction - and keep the constraints and name index the other partitions use.
+
         NOTES:
         - Creating the same constraint multiple times does not error, dropping a non-existent constraint does.
         
         TODO: How do we disable indexing as part of an ingestion
         """
+        if self.partition:
+            return self.clean_partition()
         with self.session() as session:
             session.run("MATCH (n) DETACH DELETE n")
+        self.wrote()
+        if self._directories is not None:
+            Trinity._directories = DirectoryIndex()
         self.drop_all_constraints()
+        self.drop_name_index()
+        return self
+
+    def clean_partition(self, batch: int=10_000) -> "Trinity":
+        query = f"MATCH (n:{self.partition_label}) WITH n LIMIT $batch DETACH DELETE n RETURN count(*)"
+        with self.session() as session:
+            while session.run(query, {"batch": batch}).single()[0]:
+                pass
+        self.wrote()
+        if self._directories is not None:
+            Trinity._directories = DirectoryIndex.from_graph(self)
         return self
 
     def create_constraints(self) -> "Trinity":
-        """ Create constraints on the db """
+        """ Create constraints on the db - with a partition, Directory/File ids are only unique per partition """
+        if self.partition:
+            tree = ("Directory", "File")
+            self.drop_constraints(tree)
+            labels = [x for x in self._labels if x not in tree] + [self.partition_label]
+        else:
+            labels = self._labels
         with self.session() as session:
-            for c in [self._constraints.format(var=x.lower(), label=x) for x in self._labels]:
+            for c in [self._constraints.format(var=x.lower(), label=x) for x in labels]:
                 session.run("CREATE " + c)
         return self
 
-    def drop_constraints(self) -> "Trinity":
-        """ Drop the constraints we created from the db """
+    def drop_constraints(self, labels: Optional[Iterable[str]]=None) -> "Trinity":
+        """ Drop the constraints we created from the db - or just those on labels """
         # TODO: This can error in a way that throws an exception even though we are passing
         #       Each with session block should be wrapped in a try-catch
         with self.session() as session:
-            for c in [self._constraints.format(var=x.lower(), label=x) for x in self._labels]:
+            for c in [self._constraints.format(var=x.lower(), label=x) for x in labels or self._labels]:
                 try:
                     session.run("DROP " + c)
                 except CypherError as ce:
@@ -85,7 +416,109 @@ class Trinity:
                     print(f"Trinity.drop_all_constraints() exception: {ce}")
         return self
 
-    def session(self):
+    def create_name_index(self, timeout: int=300) -> "Trinity":
+        """
+        Create the full-text index over node name tokens (node.name_tokens(), the tokens property) and wait
+        for it to come online. Create it after ingesting - populating it afterwards is cheaper than
+        updating it on every write
+        """
+        with self.session() as session:
+            session.run("CALL db.index.fulltext.createNodeIndex($name, ['Directory', 'File'], ['tokens'], "
+                        "{analyzer: 'whitespace'})", {"name": self._name_index}).consume()
+            session.run("CALL db.awaitIndexes($timeout)", {"timeout": timeout}).consume()
+        self.wrote()
+        return self
+
+    def ensure_name_index(self) -> "Trinity":
+        """ Create the name index unless it is already there - for the paths that write tokens, after ingesting """
+        if not self.has_name_index():
+            self.create_name_index()
+        return self
+
+    def drop_name_index(self) -> "Trinity":
+        with self.session() as session:
+            try:
+                session.run("CALL db.index.fulltext.drop($name)", {"name": self._name_index}).consume()
+            except CypherError as ce:
+                if "no such" not in f"{ce}".lower():
+                    print(f"Trinity.drop_name_index() exception: {ce}")
+        self.wrote()
+        return self
+
+    def has_name_index(self) -> bool:
+        """ Whether the name index is ONLINE - read directly, the state changes without a write through us """
+        query = "CALL db.indexes() YIELD indexName, state WHERE indexName = $name RETURN state"
+        with self.session() as session:
+            return ["ONLINE"] == session.run(query, {"name": self._name_index}).value()
+
+    def has_name_tokens(self, labels: Tuple[str, ...]=("Directory", "File")) -> bool:
+        """
+        Whether any node with one of labels has tokens - only ingest 8, ingest 2 -t, MergeBuffer and the watcher
+        write them. Cached until the next write: without tokens the probe reads every node
+        """
+        label_test = self.scope(" OR ".join(f"n:{x}" for x in labels))
+        return bool(self.query(f"MATCH (n) WHERE ({label_test}) AND exists(n.tokens) RETURN n.id LIMIT 1"))
+
+    def name_match(self, pattern: str, field: str="name", labels: Tuple[str, ...]=("Directory", "File"),
+                   var: str="n") -> Tuple[str, Dict]:
+        """
+        A MATCH ... WHERE clause binding var to nodes whose field matches the regex pattern, and its params
+
+        When the pattern has a literal of 3+ alphanumerics, the name index exists and the nodes carry tokens,
+        candidates come from an index lookup of the literal's trigrams and only they are regex checked. Otherwise
+        every node is scanned - an index over nodes without tokens would find nothing.
+        stem and name share trigrams - a stem is a prefix of its name.
+            clause, params = trinity.name_match('.*address.*', labels=('File',))
+            trinity.query(clause + " RETURN n.path", params)
+        """
+        params = {"pattern": pattern, "field": field}
+        label_test = self.scope(" OR ".join(f"{var}:{x}" for x in labels))
+        tokens = pattern_tokens(pattern)
+        if tokens and field in ("name", "stem") and self.has_name_index() and self.has_name_tokens(labels):
+            params["tokens"] = tokens
+            params["index"] = self._name_index
+            return (f"CALL db.index.fulltext.queryNodes($index, $tokens) YIELD node AS {var} "
+                    f"WHERE ({label_test}) AND {var}[$field] =~ $pattern"), params
+        return f"MATCH ({var}) WHERE ({label_test}) AND {var}[$field] =~ $pattern", params
+
+    def search_names(self, pattern: str, field: str="name",
+                     labels: Tuple[str, ...]=("Directory", "File")) -> List[Tuple[int, str]]:
+        """ The (id, path) of nodes whose field matches the regex pattern - see name_match() """
+        clause, params = self.name_match(pattern, field, labels)
+        return self.query(clause + " RETURN n.id, n.path", params)
+
+    def classify_names(self, rules: Iterable[Tuple[str, str]], field: str="name",
+                       labels: Tuple[str, ...]=("File",)) -> "Trinity":
+        """
+        Classify the nodes whose field matches a rule's regex - (classification id, regex) pairs like
+        queries.PII_NAME_RULES. Each rule goes through name_match(), so it uses the name index when it can.
+        The classifications must already exist
+        """
+        with self.session() as session:
+            for classification, pattern in rules:
+                clause, params = self.name_match(pattern, field, labels, var="f")
+                session.run(f"{clause} MATCH (c:Classification {{id: $classification}}) "
+                            f"MERGE (f) - [:IS_CLASSIFIED] -> (c)",
+                            {**params, "classification": classification}).consume()
+        self.wrote()
+        return self
+
+    def link_children(self, parent_id: int, child_ids: List[int], label: str="File",
+                      batch: int=WIDE_CHUNK) -> "Trinity":
+        """
+        Link a supernode's children - node.WIDE_DIR or more - from this one writer, batch children per transaction
+
+        Each transaction looks the parent up once and holds its lock for the whole batch. Spreading the same edges
+        over concurrent writers would only have them queue on that lock.
+        """
+        query = self.scope(self._link_children.format(label=label, partition=self.partition_set("p")))
+        with self.session() as session:
+            for i in range(0, len(child_ids), batch):
+                session.run(query, {"parent": parent_id, "ids": child_ids[i:i + batch]}).consume()
+        self.wrote()
+        return self
+
+    def session(self, **config):
         """
         Get a driver session. Expected use is:
             with trinity.session() as session:
@@ -93,10 +526,154 @@ class Trinity:
         TODO: we can pass "read" or "write" to the session to control tx type
               in testing, saw no difference
         """
-        return self._driver.session()
+        return self._driver.session(**config)
+
+    def stream(self, query: str, params: Optional[Dict]=None, fetch_size: int=1000,
+               chunk_size: Optional[int]=None) -> Iterator:
+        """
+        Yield query results as they arrive instead of materializing them with value()/values()
+
+        RETURN only the properties you need - e.g. RETURN n.id, n.path rather than RETURN n - so records
+        are plain tuples instead of Node objects. Client memory stays constant however large the result.
+
+        :param query: a cypher query
+        :param params: query parameters
+        :param fetch_size: records per server round trip. Drivers before 4.0 ignore it and stream as the server sends
+        :param chunk_size: if set, yield dicts of {column: [values]} holding up to chunk_size rows each -
+            a chunk per column is what numpy.asarray() or a DataFrame wants
+        """
+        with self.session(fetch_size=fetch_size) as session:
+            result = session.run(query, params or {})
+            if not chunk_size:
+                for record in result:
+                    yield tuple(record.values())
+                return
+            keys = result.keys()
+            chunk = {k: [] for k in keys}
+            rows = 0
+            for record in result:
+                for k, v in zip(keys, record.values()):
+                    chunk[k].append(v)
+                rows += 1
+                if rows == chunk_size:
+                    yield chunk
+                    chunk = {k: [] for k in keys}
+                    rows = 0
+            if rows:
+                yield chunk
+
+    def server_config(self) -> Dict[str, str]:
+        """ The server memory settings - these decide which ingest strategies survive large datasets """
+        query = "CALL dbms.listConfig() YIELD name, value WHERE name STARTS WITH 'dbms.memory' RETURN name, value"
+        return dict(self.stream(query))
+
+    def checkpoint(self, key: str) -> Optional[Tuple[int, str]]:
+        """ The (last committed line index, batch hash) of a checkpointed ingest, None if there is none """
+        rows = list(self.stream(self._checkpoint_read, {"key": key}))
+        return rows[0] if rows else None
+
+    def save_checkpoint(self, tx, key: str, line: int, batch_hash: str) -> None:
+        """ Record a batch as committed - run it in the batch's own transaction so both commit or neither does """
+        tx.run(self._checkpoint_write, {"key": key, "line": line, "hash": batch_hash})
+
+    def clear_checkpoint(self, key: str) -> "Trinity":
+        """ Forget a checkpoint - once an ingest completes, there is nothing to resume """
+        with self.session() as session:
+            session.run("MATCH (ck:Checkpoint {id: $key}) DELETE ck", {"key": key})
+        return self
+
+    def query(self, query: str, params: Optional[Dict]=None) -> List[Tuple]:
+        """
+        Run a read query and return all rows as tuples - from the result cache when enabled and still valid
+        Use stream() for results too large to hold in memory - they should not be cached anyway
+
+        Read only: the cache can't tell what a query writes - use run() or session() for writes. Each call returns
+        a new list, but the rows in it are shared with the cache - don't mutate list values inside them
+        """
+        if self._cache is None:
+            return list(self.stream(query, params))
+        key = ResultCache.key(query, params)
+        generation = self._write_generation
+        rows = self._cache.get(key, generation)
+        if rows is None:
+            rows = tuple(tuple(row) for row in self.stream(query, params))
+            self._cache.put(key, generation, rows)
+        return list(rows)
+
+    @classmethod
+    def register(cls, queries: Iterable, write: bool=False) -> None:
+        """
+        Add named, parameterized queries to the registry
+        :param queries: anything with name, cypher and params - e.g. queries.Query
+        :param write: the queries write - execute() notes the write, reads go through query() and its cache
+        """
+        for q in queries:
+            known = cls._prepared.get(q.name)
+            if known and known.cypher != q.cypher:
+                raise ValueError(f"Query {q.name} is already registered with different cypher")
+            cls._prepared[q.name] = Prepared(q.cypher, q.params, write)
+
+    def warm(self, names: Optional[Iterable[str]]=None) -> "Trinity":
+        """
+        EXPLAIN registered queries - every one is checked to compile and its plan lands in the server's query
+        cache before the first real execution needs it
+        :param names: the queries to warm, all registered queries by default
+        """
+        with self.session() as session:
+            for name in names or list(self._prepared):
+                p = self.prepared(name)
+                try:
+                    session.run(f"EXPLAIN {self.scope(p.cypher)}", p.params).consume()
+                except CypherError as e:
+                    raise ValueError(f"Query {name} does not compile: {e}")
+        return self
+
+    def prepared(self, name: str) -> Prepared:
+        try:
+            return self._prepared[name]
+        except KeyError:
+            raise ValueError(f"Unknown query: {name} - register() it first")
+
+    def execute(self, name: str, params: Optional[Dict]=None) -> List[Tuple]:
+        """
+        Run a registered query by name, scoped to our partition, and time it. A read served from the result
+        cache is counted as a cache hit, not timed - the timings are database executions only
+        :param name: the registered name
+        :param params: override the registered default parameters
+        :return: the result rows as tuples
+        """
+        p = self.prepared(name)
+        params = {**p.params, **(params or {})}
+        cypher = self.scope(p.cypher)
+        hits = self._cache.hits if self._cache is not None else 0
+        start = timer()
+        if p.write:
+            with self.session() as session:
+                rows = [tuple(record.values()) for record in session.run(cypher, params)]
+            self.wrote()
+        else:
+            rows = self.query(cypher, params)
+        duration = timer() - start
+        stats = Trinity._timings.setdefault(name, [0, 0.0, 0.0, 0])
+        if self._cache is not None and self._cache.hits > hits:
+            stats[3] += 1
+            return rows
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] = max(stats[2], duration)
+        return rows
+
+    @classmethod
+    def timings(cls) -> Dict[str, Tuple[int, float, float, int]]:
+        """
+        {name: (executions, total seconds, slowest seconds, cache hits)} for every query run by execute() -
+        executions went to the database, cache hits did not and are not in the seconds
+        """
+        return {name: (int(n), total, slowest, int(hits)) for name, (n, total, slowest, hits) in cls._timings.items()}
 
     def run(self, stmts: str) -> "Trinity":
         with self.session() as session:
             session.run(stmts)
+        self.wrote()
         return self
 
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Verify an ingested graph against its dataset with per-directory checksums
+
+Counting labels says nothing about which nodes are wrong. Instead, for every directory we compare an order
+independent checksum of its children - (count, sum of ids, sum of a mix of id, size, modified and name length) -
+computed twice:
+- from the graph, with one aggregating query: a row per Directory, never a row per File
+- from the dataset pickle, with the same arithmetic
+
+Checksums are rolled up into subtree checksums on the client. Verification starts at the root and only descends
+into subtrees whose checksums differ; only the directories whose own children differ have their children fetched,
+in UNWIND batches, to name the exact missing, extra, changed and moved nodes.
+
+With a partitioned Trinity, the graph side is scoped to the partition.
+
+It also checks for nodes without a parent (other than the root) and for nodes with unexpected labels - e.g. the
+empty nodes a CREATE makes from a variable that is no longer bound.
+"""
+import argparse
+import pickle
+from argparse import RawDescriptionHelpFormatter
+from collections import defaultdict
+from timeit import default_timer as timer
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from generator import pickle_file
+from node import Node, TreeNode
+from trinity import Trinity
+
+PRIME = 1_000_000_007
+
+# Keep each term below 2**35, so sums over millions of children stay inside a 64 bit integer
+# noinspection SqlNoDataSourceInspection
+MIX = ("(c.id % 1000000007) * 31 + (coalesce(c.size, 0) % 1000000007) * 17 + "
+       "(coalesce(c.modified, 0) % 1000000007) * 7 + size(coalesce(c.name, ''))")
+
+# noinspection SqlNoDataSourceInspection
+DIRECTORY_SUMS = f"""
+    MATCH (d:Directory)
+    OPTIONAL MATCH (d) - [:PARENT_OF] -> (c)
+    WITH d, count(c) AS n, coalesce(sum(c.id), 0) AS ids, coalesce(sum({MIX}), 0) AS mix
+    OPTIONAL MATCH (p:Directory) - [:PARENT_OF] -> (d)
+    RETURN d.id, p.id, n, ids, mix"""
+
+# noinspection SqlNoDataSourceInspection
+CHILDREN = """
+    UNWIND $ids AS id
+    MATCH (:Directory {id: id}) - [:PARENT_OF] -> (c)
+    RETURN id, c.id, c.size, c.modified, c.name"""
+
+# noinspection SqlNoDataSourceInspection
+ORPHANS = """
+    MATCH (n)
+    WHERE (n:Directory OR n:File) AND NOT (:Directory) - [:PARENT_OF] -> (n)
+    RETURN n.id"""
+
+# Every label Trinity creates constraints for - the dataset, dimensions, classification - plus resume checkpoints
+KNOWN_LABELS = list(Trinity._labels) + ["Checkpoint"]
+
+# With a partition, {nodes} is narrowed to the partition's label
+# noinspection SqlNoDataSourceInspection
+UNLABELED = """
+    MATCH ({nodes})
+    WHERE none(label IN labels(n) WHERE label IN $known)
+    RETURN head(labels(n)), count(*)"""
+
+
+class Checksum(NamedTuple):
+    count: int = 0
+    ids: int = 0
+    mix: int = 0
+
+    def __add__(self, other: "Checksum") -> "Checksum":
+        return Checksum(self.count + other.count, self.ids + other.ids, self.mix + other.mix)
+
+
+class Report(NamedTuple):
+    missing: List[int]  # in the dataset, not in the graph
+    extra: List[int]  # in the graph, not in the dataset
+    changed: List[int]  # in both, with different properties
+    moved: List[int]  # in both, under a different parent
+    orphans: List[int]  # no parent in the graph, but not the root
+    unlabeled: Dict[Optional[str], int]  # label -> count of nodes with none of the KNOWN_LABELS
+    searched: int  # directories whose children we had to fetch
+
+    def ok(self) -> bool:
+        return not (self.missing or self.extra or self.changed or self.moved or self.orphans or self.unlabeled)
+
+
+def mix(child_id: int, size: Optional[int], modified: Optional[int], name: Optional[str]) -> int:
+    """ The MIX expression, in python """
+    return ((child_id % PRIME) * 31 + ((size or 0) % PRIME) * 17 + ((modified or 0) % PRIME) * 7 +
+            len(name or ""))
+
+
+def node_mix(node: Node) -> int:
+    return mix(node.id, node.size, node.modified, node.name)
+
+
+def dataset_sums(root: TreeNode) -> Tuple[Dict[int, Checksum], Dict[int, List[int]]]:
+    """ (direct children checksum per directory, child directory ids per directory) """
+    sums = {}
+    dirs = {}
+
+    def walk(t: TreeNode) -> None:
+        children = t.files + [d.me for d in t.dirs]
+        sums[t.me.id] = Checksum(len(children), sum(c.id for c in children), sum(node_mix(c) for c in children))
+        dirs[t.me.id] = [d.me.id for d in t.dirs]
+        for d in t.dirs:
+            walk(d)
+
+    walk(root)
+    return sums, dirs
+
+
+def graph_sums(trinity: Trinity) -> Tuple[Dict[int, Checksum], Dict[int, List[int]]]:
+    """ The same from the graph - one aggregating query, streamed """
+    sums = {}
+    dirs = defaultdict(list)
+    for dir_id, parent_id, n, ids, total in trinity.stream(trinity.scope(DIRECTORY_SUMS), fetch_size=10_000):
+        sums[dir_id] = Checksum(n, ids, total)
+        if parent_id is not None:
+            dirs[parent_id].append(dir_id)
+    return sums, dirs
+
+
+def rollup(root_id: int, sums: Dict[int, Checksum], dirs: Dict[int, List[int]]) -> Dict[int, Checksum]:
+    """ Subtree checksums - a directory's own plus all its descendants' - without recursion """
+    order = []
+    stack = [root_id]
+    seen = set()
+    while stack:
+        d = stack.pop()
+        if d in seen or d not in sums:
+            continue
+        seen.add(d)
+        order.append(d)
+        stack.extend(dirs.get(d, []))
+    totals = {}
+    for d in reversed(order):
+        totals[d] = sum((totals.get(c, Checksum()) for c in dirs.get(d, [])), sums[d])
+    return totals
+
+
+def narrow(root_id: int, expected: Dict[int, Checksum], expected_dirs: Dict[int, List[int]],
+           actual: Dict[int, Checksum], actual_totals: Dict[int, Checksum],
+           expected_totals: Dict[int, Checksum]) -> List[int]:
+    """ Walk down from the root through mismatched subtrees, return directories whose own children differ """
+    suspects = []
+    stack = [root_id]
+    while stack:
+        d = stack.pop()
+        if expected_totals.get(d) == actual_totals.get(d):
+            continue
+        if expected.get(d) != actual.get(d):
+            suspects.append(d)
+        stack.extend(expected_dirs.get(d, []))
+    return suspects
+
+
+def children(trinity: Trinity, dir_ids: List[int], batch: int=500) -> Dict[int, Dict[int, int]]:
+    """ {directory id: {child id: mix}} from the graph for just these directories """
+    result = defaultdict(dict)
+    for i in range(0, len(dir_ids), batch):
+        rows = trinity.stream(trinity.scope(CHILDREN), {"ids": dir_ids[i:i + batch]})
+        for dir_id, child_id, size, modified, name in rows:
+            result[dir_id][child_id] = mix(child_id, size, modified, name)
+    return result
+
+
+def dataset_children(root: TreeNode, dir_ids: Iterable[int]) -> Dict[int, Dict[int, int]]:
+    wanted = set(dir_ids)
+    result = {}
+    stack = [root]
+    while stack:
+        t = stack.pop()
+        if t.me.id in wanted:
+            result[t.me.id] = {c.id: node_mix(c) for c in t.files + [d.me for d in t.dirs]}
+        stack.extend(t.dirs)
+    return result
+
+
+def verify(trinity: Trinity, root: TreeNode) -> Report:
+    expected, expected_dirs = dataset_sums(root)
+    actual, actual_dirs = graph_sums(trinity)
+    root_id = root.me.id
+    suspects = narrow(root_id, expected, expected_dirs, actual,
+                      rollup(root_id, actual, actual_dirs), rollup(root_id, expected, expected_dirs))
+
+    missing, extra, changed = set(), set(), set()
+    want = dataset_children(root, suspects)
+    have = children(trinity, suspects)
+    for d in suspects:
+        w, h = want.get(d, {}), have.get(d, {})
+        missing.update(w.keys() - h.keys())
+        extra.update(h.keys() - w.keys())
+        changed.update(i for i in w.keys() & h.keys() if w[i] != h[i])
+    # a child linked under the wrong parent is missing in one place and extra in another
+    moved = missing & extra
+    missing, extra = missing - moved, extra - moved
+    # a directory's checksum covers its children, not itself - its own properties are checked by its parent,
+    # except for the root, which has none
+    if root_id not in actual:
+        missing.add(root_id)
+
+    orphans = [x for x, in trinity.stream(trinity.scope(ORPHANS)) if x != root_id]
+    nodes = f"n:{trinity.partition_label}" if trinity.partition else "n"
+    unlabeled = dict(trinity.stream(UNLABELED.format(nodes=nodes), {"known": KNOWN_LABELS}))
+    return Report(sorted(missing), sorted(extra), sorted(changed), sorted(moved), sorted(orphans), unlabeled,
+                  len(suspects))
+
+
+def print_report(report: Report, show: int=10) -> None:
+    if report.ok():
+        print("verified: graph matches the dataset")
+        return
+    for title, items in (("missing", report.missing), ("extra", report.extra), ("changed", report.changed),
+                         ("moved", report.moved), ("orphans", report.orphans)):
+        if items:
+            print(f"  {title}: {len(items)} e.g. {items[:show]}")
+    if report.unlabeled:
+        print(f"  nodes with unexpected labels: {report.unlabeled}")
+    print(f"  (fetched the children of {report.searched} directories)")
+
+
+def help() -> str:
+    return """Verify the graph against a case pickle with per-directory checksums
+
+After ingesting a case (e.g. ./bench.py -s2 -c 5000):
+  ./verify.py -c case_5000
+
+Exits with 1 if the graph differs.
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=help(), formatter_class=RawDescriptionHelpFormatter)
+    parser.add_argument('-c', '--case', required=True, help='the case pickle the graph was ingested from')
+    args = parser.parse_args()
+
+    with open(pickle_file(args.case), "rb") as f:
+        root = pickle.load(f)
+    start = timer()
+    report = verify(Trinity(), root)
+    print_report(report)
+    print(f"verified in {timer() - start:.2f} seconds")
+    if not report.ok():
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Keep the graph current with a live inotify watch of a scanned root (Linux only)
+
+generator.py -r is a one-shot snapshot. ./generator.py -r ROOT --watch keeps running instead:
+- every directory under ROOT gets an inotify watch - new directories get one as they appear
+- events are coalesced per path over a window: create + modify + delete of the same file within the window
+  nets out to a single delete (or nothing); a move within the window is one upsert of the same inode
+- net changes are applied through Trinity as batched UNWIND MERGE / DETACH DELETE transactions, at most
+  max_batch rows per transaction and at most one flush per min_interval - a git checkout storm becomes a
+  few large transactions instead of thousands of small ones
+
+NOTES:
+- ids are inodes, so a deleted path's id must be remembered - we keep a path -> id map from the initial scan.
+  A deleted or moved away directory takes its descendants' paths out of the map too - the graph delete already
+  takes the whole subtree, and a later event must not resolve to a stale id
+- the kernel queue can overflow under extreme storms (IN_Q_OVERFLOW) - we then rescan the whole root, upserting
+  what is there and deleting every known path that is not - the lost events may have been deletes
+- max watches is limited by /proc/sys/fs/inotify/max_user_watches - raise it for large trees
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from node import Node, TreeNode, name_tokens, new_node
+from trinity import Trinity
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE |
+              IN_DELETE_SELF)
+UPSERT_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+DELETE_MASK = IN_MOVED_FROM | IN_DELETE | IN_DELETE_SELF
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# noinspection SqlNoDataSourceInspection
+UPSERT = """
+    UNWIND $rows AS row
+    MERGE (n:{label} {{id: row.id}})
+    SET n += row
+    {partition}
+    WITH n, row
+    // a moved node keeps its id but changes parent - drop the stale edge
+    OPTIONAL MATCH (old:Directory) - [r:PARENT_OF] -> (n)
+    WHERE old.id <> row.parent_id
+    DELETE r
+    WITH n, row
+    MATCH (p:Directory {{id: row.parent_id}})
+    MERGE (p) - [:PARENT_OF] -> (n)"""
+
+# noinspection SqlNoDataSourceInspection
+DELETE = """
+    UNWIND $ids AS id
+    OPTIONAL MATCH (f:File {id: id})
+    OPTIONAL MATCH (:Directory {id: id}) - [:PARENT_OF*0..] -> (c)
+    DETACH DELETE f, c"""
+
+
+class Inotify:
+    """ A minimal ctypes binding - inotify is not in the standard library """
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths: Dict[int, str] = {}  # wd -> directory path
+
+    def add(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            # vanished already, or out of watches - the latter deserves a message
+            errno = ctypes.get_errno()
+            if errno == 28:  # ENOSPC
+                print(f"watcher: out of inotify watches at {path} - raise fs.inotify.max_user_watches")
+            return
+        self.paths[wd] = path
+
+    def add_tree(self, root: str) -> None:
+        self.add(root)
+        for dirpath, dirnames, _ in os.walk(root):
+            for d in dirnames:
+                self.add(os.path.join(dirpath, d))
+
+    def read(self, timeout: float) -> Iterator[Tuple[Optional[str], int]]:
+        """ Yield (path, mask) for events arriving within timeout seconds. path is None for queue overflow """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return
+        buf = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(buf[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                yield None, mask
+            elif mask & IN_IGNORED:
+                self.paths.pop(wd, None)
+            elif wd in self.paths:
+                yield os.path.join(self.paths[wd], name) if name else self.paths[wd], mask
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class Coalescer:
+    """
+    Net changes per path over a window - only the last thing that happened to a path matters
+
+    Upserts are resolved (stat'ed) at flush time, so a file created and deleted within the window
+    never reaches the graph, and a file modified a thousand times is written once.
+    """
+
+    def __init__(self, ids: Dict[str, int]):
+        self.ids = ids  # path -> id for everything we know is in the graph
+        self.pending: Dict[str, bool] = {}  # path -> True for upsert, False for delete
+        self.first = None
+
+    def add(self, path: str, upsert: bool) -> None:
+        if self.first is None:
+            self.first = timer()
+        self.pending[path] = upsert
+
+    def rescan(self, root: Path) -> None:
+        """ Queue everything under root as upserts, and every known path no longer there as a delete """
+        seen = {str(root)}
+        for item in root.rglob("*"):
+            seen.add(str(item))
+            self.add(str(item), True)
+        for path in self.ids.keys() - seen:
+            self.add(path, False)
+
+    def age(self) -> float:
+        return timer() - self.first if self.first is not None else 0.0
+
+    def drain(self) -> Tuple[List[Node], List[int]]:
+        """ Resolve pending changes into (nodes to upsert, ids to delete) """
+        upserts = {}
+        deletes = set()
+        gone = []
+        for path, upsert in self.pending.items():
+            node = None
+            if upsert:
+                try:
+                    node = new_node(Path(path))
+                except OSError:
+                    pass  # gone again before we got to it
+            if node:
+                upserts[node.id] = node
+                old = self.ids.get(path)
+                if old is not None and old != node.id:
+                    deletes.add(old)  # replaced by a different inode
+                self.ids[path] = node.id
+            elif path in self.ids:
+                deletes.add(self.ids.pop(path))
+                gone.append(path + os.sep)
+        if gone:
+            # forget what was below deleted directories - unless it was (re)written in this same drain
+            prefixes = tuple(gone)
+            for path in [p for p, i in self.ids.items() if p.startswith(prefixes) and i not in upserts]:
+                del self.ids[path]
+        self.pending = {}
+        self.first = None
+        # a move shows up as a delete of the old path and an upsert of the new one - same inode, so just upsert
+        return list(upserts.values()), sorted(deletes - set(upserts))
+
+
+def node_row(node: Node) -> Dict:
+    row = node._asdict()
+    row["path"] = str(row["path"])
+    row["tokens"] = name_tokens(node.name)
+    return row
+
+
+def apply(trinity: Trinity, upserts: List[Node], deletes: List[int], max_batch: int) -> None:
+    """ Write net changes in transactions of at most max_batch rows - parents before children """
+    with trinity.session() as session:
+        for i in range(0, len(deletes), max_batch):
+            session.run(trinity.scope(DELETE), {"ids": deletes[i:i + max_batch]}).consume()
+        # shorter paths first, so a new directory exists before its new children look for it
+        upserts = sorted(upserts, key=lambda n: len(str(n.path)))
+        for label, nodes in (("Directory", [n for n in upserts if n.is_dir()]),
+                             ("File", [n for n in upserts if not n.is_dir()])):
+            for i in range(0, len(nodes), max_batch):
+                rows = [node_row(n) for n in nodes[i:i + max_batch]]
+                session.run(trinity.scope(UPSERT.format(label=label, partition=trinity.partition_set("n"))),
+                            {"rows": rows}).consume()
+    trinity.wrote()
+    directories = trinity.directory_index()
+    if directories is not None:
+        directories.remove(deletes)
+        for n in upserts:
+            if n.is_dir():
+                directories.update(n.id, n.parent_id)
+
+
+def scan_ids(root: TreeNode) -> Dict[str, int]:
+    return {str(n.path): n.id for n in root.iter()}
+
+
+def watch(p: Path, root: TreeNode, window: float=1.0, min_interval: float=1.0, max_batch: int=5000,
+          trinity: Optional[Trinity]=None) -> None:
+    """
+    Watch p forever, applying coalesced changes to the graph
+    :param p: the directory to watch - it should already be ingested
+    :param root: a fresh scan of p - the path -> id map for deletes
+    :param window: seconds to coalesce events after the first one arrives
+    :param min_interval: minimum seconds between flushes - bounds the write rate
+    :param max_batch: maximum rows per transaction
+    """
+    trinity = (trinity or Trinity()).ensure_name_index()
+    inotify = Inotify()
+    inotify.add_tree(str(p))
+    coalescer = Coalescer(scan_ids(root))
+    last_flush = 0.0
+    print(f"watcher: watching {len(inotify.paths)} directories under {p}")
+    try:
+        while True:
+            for path, mask in inotify.read(window / 4):
+                if path is None:
+                    print("watcher: event queue overflowed - rescanning")
+                    coalescer.rescan(p)
+                    continue
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    # a new directory may have filled up before its watch existed
+                    inotify.add_tree(path)
+                    for item in Path(path).rglob("*"):
+                        coalescer.add(str(item), True)
+                if mask & UPSERT_MASK:
+                    coalescer.add(path, True)
+                elif mask & DELETE_MASK:
+                    coalescer.add(path, False)
+            full = len(coalescer.pending) >= max_batch
+            if coalescer.pending and (coalescer.age() >= window or full) and timer() - last_flush >= min_interval:
+                upserts, deletes = coalescer.drain()
+                apply(trinity, upserts, deletes, max_batch)
+                last_flush = timer()
+                print(f"watcher: upserted {len(upserts)}, deleted {len(deletes)}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        inotify.close()